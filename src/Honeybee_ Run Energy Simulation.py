@@ -46,6 +46,8 @@ Provided by Honeybee 0.0.62
         +++++++++++++++: ...
         _writeIdf: Set to "True" to have the component take your HBZones and other inputs and write them into an IDF file.  The file path of the resulting file will appear in the idfFileAddress output of this component.  Note that only setting this to "True" and not setting the output below to "True" will not automatically run the IDF through EnergyPlus for you.
         runEnergyPlus_: Set to "True" to have the component run your IDF through EnergyPlus once it has finished writing it.  This will ensure that a CSV result file appears in the resultFileAddress output. Set to 2 if you want the analysis to run in background. This option is useful for parametric runs when you don't want to see command shells.
+        bypassCache_: Set to "True" to run EnergyPlus even if the same IDF and weather file have already been run.  By default, the results of a previous run of the same IDF, weather file and EnergyPlus version are restored from the run cache in the Honeybee default folder instead of running the simulation again.
+        zoneMultipliers_: Set to "True" to model identical zones (e.g. the zones of the typical floors of a tower) as one zone with an EnergyPlus zone multiplier.  Zones are identical if they have the same geometry and orientation, constructions, boundary conditions, schedules, loads and HVAC.  Surfaces that are adjacent to a collapsed zone become adiabatic.  The results of each modeled zone are copied to all the zones of its group by the Read EP Result components.  Note that the differences in shading by the context are ignored.  Default: False.
         +++++++++++++++: ...
         _workingDir_: An optional working directory to a folder on your system, into which your IDF and result files will be written.  NOTE THAT DIRECTORIES INPUT HERE SHOULD NOT HAVE ANY SPACES OR UNDERSCORES IN THE FILE PATH.
         _idfFileName_: Optional text which will be used to name your IDF and result files.  Change this to aviod over-writing results of previous energy simulations.
@@ -62,11 +64,11 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_ Run Energy Simulation"
 ghenv.Component.NickName = 'runEnergySimulation'
-ghenv.Component.Message = 'VER 0.0.62\nOCT_11_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nAPR_25_2016
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUL_24_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
@@ -80,12 +82,76 @@ import Grasshopper.Kernel as gh
 import math
 import shutil
 import collections
-import subprocess
 import copy
+import re
 
 rc.Runtime.HostUtils.DisplayOleAlerts(False)
 
 
+class IDFFileBuffer(object):
+    """Collect the strings of an idf file in memory and write them to disk in large chunks.
+    
+    It can be used in place of the file object so writing a model with thousands of surfaces
+    doesn't end up in thousands of small writes.
+    """
+    
+    def __init__(self, filePath, bufferSize = 1048576):
+        self.filePath = filePath
+        self.bufferSize = bufferSize
+        self._parts = []
+        self._size = 0
+        self._file = open(filePath, "w")
+    
+    def write(self, string):
+        if not isinstance(string, basestring):
+            raise TypeError("expected a string, got " + type(string).__name__)
+        self._parts.append(string)
+        self._size += len(string)
+        if self._size >= self.bufferSize: self.flush()
+    
+    def flush(self):
+        if len(self._parts) != 0:
+            self._file.write("".join(self._parts))
+            self._parts = []
+            self._size = 0
+        self._file.flush()
+    
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class EPObjectCollection(object):
+    """An ordered collection of unique names of EnergyPlus objects that should be written to the idf file.
+    
+    Membership checks don't depend on the size of the collection and new names can be added
+    while iterating through the collection (e.g. week schedules of a yearly schedule).
+    """
+    
+    def __init__(self, names = None):
+        self._names = []
+        self._lookup = set()
+        if names:
+            for name in names: self.append(name)
+    
+    def append(self, name):
+        if name in self._lookup: return
+        self._lookup.add(name)
+        self._names.append(name)
+    
+    def __contains__(self, name):
+        return name in self._lookup
+    
+    def __len__(self):
+        return len(self._names)
+    
+    def __iter__(self):
+        count = 0
+        while count < len(self._names):
+            yield self._names[count]
+            count += 1
+
+
 class WriteIDF(object):
     # Add all HBcontext surfaces from both HBContext_ and HB generator here so that if user connects the same
     # HBcontext surfaces to both HB generator and HBcontext duplicate surfaces will be detected and an error thrown.
@@ -104,6 +170,11 @@ class WriteIDF(object):
     def __init__(self, workingDir):
         self.fileBasedSchedules = {}
         self.workingDir = workingDir
+        # ScheduleTypeLimits from the library that are referenced by the written schedules
+        self.scheduleTypeLimits = EPObjectCollection()
+    
+    def EPVerticesStr(self, coordinates):
+        return '\t' + ',\n\t'.join([`pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` for pt in coordinates]) + ';\n\n'
         
     def EPZone(self, zone):
         
@@ -113,22 +184,31 @@ class WriteIDF(object):
                 '\t' + `zone.origin.X` + ',\t!- X Origin {m}\n' + \
                 '\t' + `zone.origin.Y` + ',\t!- Y Origin {m}\n' + \
                 '\t' + `zone.origin.Z` + ',\t!- Z Origin {m}\n'
-                
+        
+        # zones that represent a group of identical zones (see hb_EPZoneMultipliers)
+        multiplier = getattr(zone, 'multiplier', 1)
+        if multiplier > 1: multiplierStr = `multiplier`
+        else: multiplierStr = ''
+        
         try:
             if zone.isPlenum:
                 return zoneStr + \
                 '\t1,\t!- Type\n' + \
-                '\t,\t!- Multiplier\n' + \
+                '\t' + multiplierStr + ',\t!- Multiplier\n' + \
                 '\t,\t!- Ceiling Height\n' + \
                 '\t,\t!- Volume\n' + \
                 '\t,\t!- Floor Area\n' + \
                 '\t,\t!- Zone Inside Convection Algorithm\n' + \
                 '\t,\t!- Zone Outside Convection Algorithm\n' + \
                 '\tNo;\t!- Part of Total Floor Area\n'                
-            else:
-                return zoneStr + '\t1;\t!- Type\n'
         except:
             #older versions
+            pass
+        
+        if multiplierStr:
+            return zoneStr + '\t1,\t!- Type\n' + \
+                '\t' + multiplierStr + ';\t!- Multiplier\n'
+        else:
             return zoneStr + '\t1;\t!- Type\n'
             
     def EPZoneSurface (self, surface):
@@ -149,13 +229,7 @@ class WriteIDF(object):
                 '\t' + surface.groundViewFactor + ',\t!- View Factor to Ground\n' + \
                 '\t' + `len(coordinates)` + ',\t!- Number of Vertices\n'
         
-            str_2 = '\t';
-            
-            for ptCount, pt in enumerate(coordinates):
-                if ptCount < len (coordinates) - 1:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ',\n\t'
-                else:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ';\n\n'
+            str_2 = self.EPVerticesStr(coordinates)
             
             fullString = str_1 + str_2
             
@@ -179,163 +253,10 @@ class WriteIDF(object):
         ddyfile.close()
         return designDayLines
     
-    def writeDDObjStr(self, ddName, designType, month, day, dbTemp, dbTempRange, wbTemp, enth, humidConditType, pressure, windSpeed, windDir, ashraeSkyClearness):
-        ddStr =  '! ' + ddName + '\n' + \
-            'SizingPeriod:DesignDay,\n' + \
-            '\t' + ddName + ',     !- Name\n' + \
-            '\t' + str(month) + ',      !- Month\n' + \
-            '\t' + str(day) + ',      !- Day of Month\n' + \
-            '\t' + designType + ',!- Day Type\n' + \
-            '\t' + str(dbTemp) + ',      !- Maximum Dry-Bulb Temperature {C}\n' + \
-            '\t' + str(dbTempRange) + ',      !- Daily Dry-Bulb Temperature Range {C}\n' + \
-            '\t' + 'DefaultMultipliers, !- Dry-Bulb Temperature Range Modifier Type\n' + \
-            '\t' + ',      !- Dry-Bulb Temperature Range Modifier Schedule Name\n' + \
-            '\t' + humidConditType + ',      !- Humidity Condition Type\n' + \
-            '\t' + str(wbTemp) + ',      !- Wetbulb or Dewpoint at Maximum Dry-Bulb {C}\n' + \
-            '\t' + ',      !- Humidity Indicating Day Schedule Name\n' + \
-            '\t' + ',      !- Humidity Ratio at Maximum Dry-Bulb {kgWater/kgDryAir}\n' + \
-            '\t' + str(enth) + ',      !- Enthalpy at Maximum Dry-Bulb {J/kg}\n' + \
-            '\t' + ',      !- Daily Wet-Bulb Temperature Range {deltaC}\n' + \
-            '\t' + str(pressure) + ',      !- Barometric Pressure {Pa}\n' + \
-            '\t' + str(windSpeed) + ',      !- Wind Speed {m/s} design conditions vs. traditional 6.71 m/s (15 mph)\n' + \
-            '\t' + str(windDir) + ',      !- Wind Direction {Degrees; N=0, S=180}\n' + \
-            '\t' + 'No,      !- Rain {Yes/No}\n' + \
-            '\t' + 'No,      !- Snow on ground {Yes/No}\n' + \
-            '\t' + 'No,      !- Daylight Savings Time Indicator\n' + \
-            '\t' + 'ASHRAEClearSky' + ', !- Solar Model Indicator\n' + \
-            '\t' + ',      !- Beam Solar Day Schedule Name\n' + \
-            '\t' + ',      !- Diffuse Solar Day Schedule Name\n' + \
-            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Beam Irradiance (taub)\n' + \
-            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Diffuse Irradiance (taud)\n' + \
-            '\t' + str(ashraeSkyClearness) + ';      !- Clearness {0.0 to 1.1}\n' + '\n'
-        
-        return ddStr
-    
     def createDdyFromEPW(self, epwFileAddress, workingDir, lb_preparation, lb_comfortModels):
-        # Extract the relevant data from the EPW.
-        # We need the following: dbTemp, dewPoint, rH, windSpeed, windDir, windDir, wetBulb, enthalpy
-        dbTemp = []
-        dewPoint = []
-        rH = []
-        windSpeed = []
-        windDir = []
-        barPress = []
-        wetBulb = []
-        epwfile = open(epwFileAddress,"r")
-        for count, line in enumerate(epwfile):
-            if count > 7:
-                dbTemp.append(float(line.split(',')[6]))
-                dewPoint.append(float(line.split(',')[7]))
-                rH.append(float(line.split(',')[8]))
-                barPress.append(float(line.split(',')[9]))
-                windSpeed.append(float(line.split(',')[21]))
-                windDir.append(float(line.split(',')[20]))
-        epwfile.close()
-        hR, enthalpy, pP, sP = lb_comfortModels.calcHumidRatio(dbTemp, rH, barPress)
-        for i, tem in enumerate(dbTemp):
-            wetBulb.append(lb_comfortModels.findWetBulb(tem, rH[i], barPress[i]))
-        
-        # Find the conditions for the most extreme hours in the epw.  These are the 7 extreme conditions we need:
-            # 1 - Winnter Design Day - Min Dry Bulb (Sensible Heating)
-            # 2 - Winter Design Day - Min Dew Point (Humidification)
-            # 3 - Winter Design Day = Max Wind Speed when temperature is less than 1 standard deviation of annual mean.
-            # 4 - Summer Design Day - Max Dry Bulb (Sensible Cooling)
-            # 5 - Summer Design Day - Max Wet Bulb (Dehumidification)
-            # 6 - Summer Design Day - Max Dew Point (Dehumidification)
-            # 7 - Summer Design Day - Max Enthalpy (Dehumidification)
-        sortedDB, corrWB = zip(*sorted(zip(dbTemp, wetBulb)))
-        minDB = sortedDB[34] # Design Condition 1
-        WBforMinDB = corrWB[34]
-        maxDB = sortedDB[-35] # Design Condition 4
-        WBforMaxDB = corrWB[-35]
-        sortedDP, corrDB = zip(*sorted(zip(dewPoint, dbTemp)))
-        minDP = sortedDP[34] # Design Condition 2
-        DBforMinDP = corrDB[34]
-        maxDP = sortedDP[-35] # Design Condition 6
-        DBforMaxDP = corrDB[-35]
-        sortedWB, corresDB = zip(*sorted(zip(wetBulb, dbTemp)))
-        maxWB = sortedWB[-35] # Design Condition 5
-        DBforMaxWB = corresDB[-35]
-        sortedEnth, correspondDB = zip(*sorted(zip(enthalpy, dbTemp)))
-        maxEnth = int(sortedEnth[-35] * 1000) # Design Condition 7
-        DBforMaxEnth = correspondDB[-35]
-        
-        coldStdDevTemp = sortedDB[1384]
-        hotStdDevTemp = sortedDB[-1385]
-        winSpBelowTemp = []
-        windDirBelowTemp = []
-        winSpAboveTemp = []
-        windDirAboveTemp = []
-        for i, tem in enumerate(dbTemp):
-            if tem < coldStdDevTemp:
-                winSpBelowTemp.append(windSpeed[i])
-                windDirBelowTemp.append(windDir[i])
-            elif tem > hotStdDevTemp:
-                winSpAboveTemp.append(windSpeed[i])
-                windDirAboveTemp.append(windDir[i])
-        winSpBelowTemp.sort()
-        coldMonWind = winSpBelowTemp[922]
-        coldMonWinDir = int(sum(windDirBelowTemp)/len(windDirBelowTemp))
-        maxWind = winSpBelowTemp[-5] # Design Condition 3
-        winSpAboveTemp.sort()
-        hotMonWind = winSpAboveTemp[922]
-        hotMonWinDir = int(sum(windDirAboveTemp)/len(windDirAboveTemp))
-        
-        # Calculate a few other required values from the epw data.
-        # Like average annual pressure and coldest/hottest month.
-        # and average wind speed/direction during these months.
-        avgEpwParPress = int(sum(barPress)/len(barPress))
-        
-        def binAndAvgByMonth(dataSet):
-            avgMonthData = []
-            binnedMonthData = []
-            for mon in range(12):
-                binnedMonthData.append([])
-            for i, x in enumerate(dataSet):
-                d, m, t = lb_preparation.hour2Date(i, True)
-                binnedMonthData[m].append(x)
-            for dataList in binnedMonthData:
-                avgMonthData.append(sum(dataList)/len(dataList))
-            return avgMonthData, binnedMonthData
-        
-        def partitionList(l, n):
-            for i in range(0, len(l), n):
-                yield l[i:i+n]
-        
-        avgMonTemps, binMonTemps = binAndAvgByMonth(dbTemp)
-        monNums = range(12)
-        avgMonTempsSort, monNumsSort = zip(*sorted(zip(avgMonTemps, monNums)))
-        coldMonth = monNumsSort[0]
-        hotMonth = monNumsSort[-1]
-        allHotMonthTemps = binMonTemps[hotMonth]
-        dayHotMonTemps = partitionList(allHotMonthTemps, 24)
-        dailyTempDiff = []
-        for day in dayHotMonTemps:
-            day.sort()
-            dailyTempDiff.append(day[-1]-day[0])
-        hotDayDBTempRange = (int((sum(dailyTempDiff)/len(dailyTempDiff))*100))/100
-        
-        
-        # Assemble a list of design condition strings to write into the ddy file.
-        ddStrs = []
-        ddStrs.append(self.writeDDObjStr('Ann Htg 99.6% Condns DB', 'WinterDesignDay', coldMonth+1, 21, minDB, 0, minDB, '', 'Wetbulb', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
-        ddStrs.append(self.writeDDObjStr('Ann Hum_n 99.6% Condns DP=>MCDB', 'WinterDesignDay', coldMonth+1, 21, DBforMinDP, 0, minDP, '', 'Dewpoint', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
-        ddStrs.append(self.writeDDObjStr('Ann Htg Wind 99.6% Condns WS=>MCDB', 'WinterDesignDay', coldMonth+1, 21, coldStdDevTemp, 0, coldStdDevTemp, '', 'Wetbulb', avgEpwParPress, maxWind, coldMonWinDir, 0))
-        
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DB=>MWB', 'SummerDesignDay', hotMonth+1, 21, maxDB, hotDayDBTempRange, WBforMaxDB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns WB=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxWB, hotDayDBTempRange, maxWB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DP=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxDP, hotDayDBTempRange, maxDP, '', 'Dewpoint', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns Enth=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxEnth, hotDayDBTempRange, '', maxEnth, 'Enthalpy', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        
-        # Write the design day objects into a .ddy file.
-        epwFileName = epwFileAddress.split('\\')[-1].split('.')[0]
-        ddyfile = workingDir + '\\' + epwFileName + '.ddy'
-        ddyFile = open(ddyfile, "w")
-        for sizingObj in ddStrs:
-            ddyFile.write(sizingObj)
-        ddyFile.close()
-        
-        return ddyfile
+        # the design days are cached for each epw file
+        hb_designDays = sc.sticky["honeybee_EPDesignDays"]()
+        return hb_designDays.createDdyFromEPW(epwFileAddress, workingDir, lb_preparation, lb_comfortModels)
     
     def checkCoordinates(self, coordinates):
         # check if coordinates are so close or duplicated
@@ -397,12 +318,7 @@ class WriteIDF(object):
                         '\t' + `childSrf.Multiplier`+ ',\t!- Multiplier\n' + \
                         '\t' + `len(glzCoordinates)` + ',\t!- Number of Vertices\n'
                 
-                    str_2 = '\t';
-                    for ptCount, pt in enumerate(glzCoordinates):
-                        if ptCount < len (glzCoordinates) - 1:
-                            str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ',\n\t'
-                        else:
-                            str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ';\n\n'
+                    str_2 = self.EPVerticesStr(glzCoordinates)
                     
                     glzStr += str_1 + str_2
                 
@@ -436,12 +352,7 @@ class WriteIDF(object):
                     '\t' + surface.name + ',\t!- Name\n' + \
                     '\t' + scheduleName + ',\t!- Transmittance Schedule Name\n' + \
                     '\t' + `len(coordinates)` + ',\t!- Number of Vertices\n'    
-            str_2 = '\t';
-            for ptCount, pt in enumerate(coordinates):
-                if ptCount < len (coordinates) - 1:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ',\n\t'
-                else:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ';\n\n'
+            str_2 = self.EPVerticesStr(coordinates)
             
             fullString = fullString + str_1 + str_2
         return fullString
@@ -1079,6 +990,37 @@ class WriteIDF(object):
         '\t' + sensibleHeatFraction + ',!- Sensible Heat Fraction\n' + \
         '\t' + activityScheduleName + ';!- Activity Level Schedule Name\n'
     
+    def EPLibObjectStr(self, objectData, objectName):
+        # objectData is a library dictionary as {0: objectType, 1: (value, comment), ...}
+        numberOfLayers = len(objectData.keys())
+        if numberOfLayers == 1:
+            return objectData[0] + ",\n  " + objectName + ";   !- name\n\n"
+        
+        lines = [objectData[0] + ",", "  " + objectName + ",   !- name"]
+        for layer in range(1, numberOfLayers - 1):
+            lines.append("  " + str(objectData[layer][0]) + ",   !- " + objectData[layer][1])
+        
+        lastLayer = numberOfLayers - 1
+        lines.append("  " + str(objectData[lastLayer][0]) + ";   !- " + objectData[lastLayer][1])
+        return "\n".join(lines) + "\n\n"
+    
+    def addScheduleTypeLimits(self, scheduleTypeLimitsName):
+        scheduleTypeLimitsName = str(scheduleTypeLimitsName).strip().upper()
+        if scheduleTypeLimitsName in sc.sticky["honeybee_ScheduleTypeLimitsLib"].keys():
+            self.scheduleTypeLimits.append(scheduleTypeLimitsName)
+    
+    def collectScheduleTypeLimits(self, idfString):
+        # find the type limits that are referenced in a string that is written to the idf file
+        for line in idfString.split("\n"):
+            for field in re.split("[,;]", line.split("!")[0]):
+                if field.strip() != "": self.addScheduleTypeLimits(field)
+    
+    def EPScheduleTypeLimitsStr(self):
+        scheduleTypeLimitsStr = ""
+        for scheduleTypeLimitsName in self.scheduleTypeLimits:
+            scheduleTypeLimitsStr += self.EPLibObjectStr(sc.sticky["honeybee_ScheduleTypeLimitsLib"][scheduleTypeLimitsName], scheduleTypeLimitsName)
+        return scheduleTypeLimitsStr
+    
     def EPMaterialStr(self, materialName):
         materialData = None
         materialName = materialName.strip()
@@ -1088,18 +1030,7 @@ class WriteIDF(object):
             materialData = sc.sticky ["honeybee_materialLib"][materialName]
         
         if materialData!=None:
-            numberOfLayers = len(materialData.keys())
-            materialStr = materialData[0] + ",\n"
-            
-            # add the name
-            materialStr =  materialStr + "  " + materialName + ",   !- name\n"
-            for layer in range(1, numberOfLayers):
-                if layer < numberOfLayers-1:
-                    materialStr =  materialStr + "  " + str(materialData[layer][0]) + ",   !- " +  materialData[layer][1] + "\n"
-                else:
-                    materialStr =  materialStr + "  " + str(materialData[layer][0]) + ";   !- " +  materialData[layer][1] + "\n\n"
-            
-            return materialStr
+            return self.EPLibObjectStr(materialData, materialName)
         else:
             warning = "Failed to find " + materialName + " in library."
             print warning
@@ -1112,20 +1043,8 @@ class WriteIDF(object):
             constructionData = sc.sticky ["honeybee_constructionLib"][constructionName]
         
         if constructionData!=None:
-            materials = []
-            numberOfLayers = len(constructionData.keys())
-            constructionStr = constructionData[0] + ",\n"
-            # add the name
-            constructionStr =  constructionStr + "  " + constructionName + ",   !- name\n"
-            
-            for layer in range(1, numberOfLayers):
-                if layer < numberOfLayers-1:
-                    constructionStr =  constructionStr + "  " + constructionData[layer][0] + ",   !- " +  constructionData[layer][1] + "\n"
-                else:
-                    constructionStr =  constructionStr + "  " + constructionData[layer][0] + ";   !- " +  constructionData[layer][1] + "\n\n"
-                materials.append(constructionData[layer][0])
-                
-            return constructionStr, materials
+            materials = [constructionData[layer][0] for layer in range(1, len(constructionData.keys()))]
+            return self.EPLibObjectStr(constructionData, constructionName), materials
         else:
             warning = "Failed to find " + constructionName + " in library."
             print warning
@@ -1180,6 +1099,9 @@ class WriteIDF(object):
                         try: numOfHours *= int(line.split(",")[0])
                         except: pass
             
+            # the default type limit should be written from the library
+            if schTypeLimitStr == "\n": self.addScheduleTypeLimits(schTypeLimitName)
+            
             # scheduleStr writes the section Schedule:File in the EnergyPlus file
             # for custom schedules.
             scheduleStr = schTypeLimitStr + \
@@ -1200,19 +1122,11 @@ class WriteIDF(object):
             scheduleData = sc.sticky["honeybee_ScheduleTypeLimitsLib"][scheduleName]
         
         if scheduleData!=None:
-            numberOfLayers = len(scheduleData.keys())
-            scheduleStr = scheduleData[0] + ",\n"
-            if numberOfLayers == 1:
-                return scheduleStr  + "  " +  scheduleName + ";   !- name\n\n"
-            # add the name
-            scheduleStr =  scheduleStr  + "  " +  scheduleName + ",   !- name\n"
-            
-            for layer in range(1, numberOfLayers):
-                if layer < numberOfLayers - 1:
-                    scheduleStr =  scheduleStr + "  " + scheduleData[layer][0] + ",   !- " +  scheduleData[layer][1] + "\n"
-                else:
-                    scheduleStr =  scheduleStr + "  " + str(scheduleData[layer][0]) + ";   !- " +  scheduleData[layer][1] + "\n\n"
-            return scheduleStr
+            # collect the type limits of the schedule so they can be written later
+            for layer in range(1, len(scheduleData.keys())):
+                if "schedule type limits" in scheduleData[layer][1].lower():
+                    self.addScheduleTypeLimits(scheduleData[layer][0])
+            return self.EPLibObjectStr(scheduleData, scheduleName)
     
     def requestSrfeio(self):
         return '\nOutput:Surfaces:List,\n' + \
@@ -1517,15 +1431,10 @@ class RunIDF(object):
         batchfile.close()
         
         #execute the batch file
-        if runInBackground:		
-            self.runCmd(batchFileAddress)		
-        else:		
-            os.system(batchFileAddress)		
-    
-    def runCmd(self, batchFileAddress, shellKey = True):
-        batchFileAddress.replace("\\", "/")		
-        p = subprocess.Popen(["cmd /c ", batchFileAddress], shell=shellKey, stdout=subprocess.PIPE, stderr=subprocess.PIPE)		
-        out, err = p.communicate()
+        pool = sc.sticky["honeybee_ProcessPool"](shell = runInBackground)
+        job = pool.run([batchFileAddress])[0]
+        if not job.succeeded:
+            print "Failed to run EnergyPlus batch file:\n" + pool.report([job])
 
 
 sc.sticky["honeybee_WriteIDF"] = WriteIDF
@@ -1534,7 +1443,7 @@ sc.sticky["honeybee_RunIDF"] = RunIDF
 
 def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext,
          simulationOutputs, writeIdf, runEnergyPlus, workingDir, idfFileName,
-         meshSettings):
+         meshSettings, bypassCache = False, zoneMultipliers = False):
     
     # import the classes
     w = gh.GH_RuntimeMessageLevel.Warning
@@ -1646,8 +1555,19 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     reEvaluate = hb_reEvaluateHBZones(thermalZonesPyClasses, meshSettings)
     reEvaluate.evaluateZones()
     
+    # collapse identical zones into one zone with a multiplier
+    hb_zoneMultipliers = sc.sticky["honeybee_EPZoneMultipliers"]()
+    if zoneMultipliers:
+        zoneGroups = hb_zoneMultipliers.groupZones(thermalZonesPyClasses)
+        thermalZonesPyClasses = hb_zoneMultipliers.collapseZones(zoneGroups)
+        print "%d zones are modeled as %d zones with zone multipliers."%(sum(len(g[1]) for g in zoneGroups), len(zoneGroups))
+    else:
+        zoneGroups = [[zone, [zone]] for zone in thermalZonesPyClasses]
+    # the map file of the collapsed zones is also removed from previous runs here
+    hb_zoneMultipliers.writeMap(zoneGroups, workingDir)
+    
     idfFileFullName = workingDir + "\\" + idfFileName
-    idfFile = open(idfFileFullName, "w")
+    idfFile = IDFFileBuffer(idfFileFullName)
     
     ################## HEADER ###################
     print "[1 of 8] Writing simulation parameters..."
@@ -1725,19 +1645,14 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
         for count, hol in enumerate(holidays):
             idfFile.write(hb_writeIDF.EPHoliday(hol, count))
     
-    # for now I write all the type limits but it can be cleaner
-    scheduleTypeLimits = set([key.upper() for key in sc.sticky["honeybee_ScheduleTypeLimitsLib"].keys()])
-    
-    for scheduleTypeLimit in scheduleTypeLimits:
-        try: idfFile.write(hb_writeIDF.EPSCHStr(scheduleTypeLimit))
-        except: pass
+    # type limits are written after the schedules and only if they are referenced
     
     # Geometry rules
     idfFile.write(hb_writeIDF.EPGeometryRules())
 
-    EPConstructionsCollection = []
-    EPMaterialCollection = []
-    EPScheduleCollection = []
+    EPConstructionsCollection = EPObjectCollection()
+    EPMaterialCollection = EPObjectCollection()
+    EPScheduleCollection = EPObjectCollection()
     shdCntrlCollection = []
     
     # Shading Surfaces
@@ -2287,6 +2202,7 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     if additionalStrings_ != []:
         idfFile.write("\n")
         for string in additionalStrings_:
+            hb_writeIDF.collectScheduleTypeLimits(string)
             if ":" in string and not '!' in string:
                 idfFile.write("\n")
                 idfFile.write("\n")
@@ -2301,6 +2217,9 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
                 idfFile.write("\n")
         idfFile.write("\n")
     
+    # write the type limits of the schedules
+    idfFile.write(hb_writeIDF.EPScheduleTypeLimitsStr())
+    
     ################## FOOTER ###################
     # write output lines
     # request surface information in the eio file.
@@ -2345,8 +2264,16 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     studyFolder = None
     if runEnergyPlus:
         print "Analysis is running!..."
-        # write the batch file
-        hb_runIDF.writeBatchFile(workingDir, idfFileName, epwFileAddress, sc.sticky["honeybee_folders"]["EPPath"], runEnergyPlus > 1)
+        # check the run cache for the results of the same idf and epw files
+        hb_runCache = sc.sticky["honeybee_EPRunCache"]()
+        cacheKey = hb_runCache.getKey(idfFileFullName, epwFileAddress, sc.sticky["honeybee_folders"]["EPVersion"])
+        fullPath = idfFileFullName.replace('.idf', '')
+        if not bypassCache and hb_runCache.restore(cacheKey, fullPath):
+            print "The same simulation has already been run. Results are restored from the run cache."
+        else:
+            # write the batch file
+            hb_runIDF.writeBatchFile(workingDir, idfFileName, epwFileAddress, sc.sticky["honeybee_folders"]["EPPath"], runEnergyPlus > 1)
+            hb_runCache.store(cacheKey, fullPath)
         resultFileFullName = idfFileFullName.replace('.idf', '.csv')
         eioFileFullName = idfFileFullName.replace('.idf', '.eio')
         performanceSummaryReport = idfFileFullName.replace('.idf', 'Table.html');
@@ -2368,7 +2295,7 @@ if _writeIdf == True and _epwFile and _HBZones and _HBZones[0]!=None:
     
     result = main(north_, _epwFile, _energySimPar_, _analysisPeriod_, _HBZones,
                   HBContext_, simulationOutputs_, _writeIdf, runEnergyPlus_,
-                  _workingDir_, _idfFileName_, meshSettings_)
+                  _workingDir_, _idfFileName_, meshSettings_, bypassCache_, zoneMultipliers_)
     if result!= -1:
         idfFileAddress, resultFileAddress, eioFileAddress, htmlReport, studyFolder = result
         if runEnergyPlus_:
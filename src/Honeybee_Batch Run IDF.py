@@ -0,0 +1,181 @@
+# This is a component for running a number of previoulsy-generated .idf files through EnergyPlus in parallel.
+#
+# Honeybee: A Plugin for Environmental Analysis (GPL) started by Mostapha Sadeghipour Roudsari
+#
+# This file is part of Honeybee.
+#
+# Copyright (c) 2013-2017, Mostapha Sadeghipour Roudsari <mostapha@ladybug.tools>
+# Honeybee is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# Honeybee is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Honeybee; If not, see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+
+
+"""
+Use this component to run a number of previoulsy-generated .idf files through EnergyPlus in parallel.
+Each run is executed in its own folder and a batchManifest.json file that maps the idf files and parameters of each run to its result files is written to the working directory.
+
+-
+Provided by Honeybee 0.0.62
+
+    Args:
+        _idfFilePaths: A list of idf files (e.g. sample1.idf).  If only one idf file is connected, it will be run once for each set of parameters_.
+        _epwFileAddress: Address to epw weather file.
+        parameters_: An optional list of parameters for each run as text (e.g. "glazingRatio=0.4, north=90").  Each $name in the idf file (e.g. $glazingRatio) will be replaced with the value of the parameter before the run.  The number of parameter sets should either match the number of idf files or there should be only one idf file.
+        workingDir_: An optional working directory for the runs.  The default is a batchRuns folder next to the first idf file.  The path should not include white spaces.
+        cpuCount_: Number of runs that are executed in parallel.  The default is the number of processors of this machine.
+        maxRetries_: Number of times that a run which failed without a fatal error (e.g. the process could not start) is run again.  Default: 1.
+        _runIt: Set to 'True' to run the simulations.  You can also connect a 2 to run the simulations in the background.
+    Returns:
+        report: Report!
+        manifestFile: The address of the json file with the status and the result files of each run.
+        resultFileAddress: The address of the EnergyPlus csv result file of each run.
+        errFileAddress: The address of the EnergyPlus err file of each run.
+"""
+
+ghenv.Component.Name = "Honeybee_Batch Run IDF"
+ghenv.Component.NickName = 'BatchRunIDF'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
+ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
+ghenv.Component.Category = "Honeybee"
+ghenv.Component.SubCategory = "10 | Energy | Energy"
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
+#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+ghenv.Component.AdditionalHelpFromDocStrings = "0"
+
+
+import scriptcontext as sc
+import os
+import Grasshopper.Kernel as gh
+
+
+def checkTheInputs(idfFilePaths, epwWeatherFile, parameters):
+    w = gh.GH_RuntimeMessageLevel.Warning
+    if not os.path.isfile(epwWeatherFile) or not epwWeatherFile.lower().endswith('.epw'):
+        msg = "EPW weather file is not a valid epw file!"
+        print msg
+        ghenv.Component.AddRuntimeMessage(w, msg)
+        return -1
+
+    for idfFilePath in idfFilePaths:
+        if not os.path.isfile(idfFilePath) or not idfFilePath.lower().endswith('.idf'):
+            msg = idfFilePath + " is not a valid IDF file!"
+            print msg
+            ghenv.Component.AddRuntimeMessage(w, msg)
+            return -1
+
+    if len(parameters) != 0 and len(idfFilePaths) != 1 and len(parameters) != len(idfFilePaths):
+        msg = "The number of parameters_ should match the number of idf files or there should be only one idf file."
+        print msg
+        ghenv.Component.AddRuntimeMessage(w, msg)
+        return -1
+
+    # make sure EnergyPlus folder is found
+    EPPath = sc.sticky["honeybee_folders"]["EPPath"]
+
+    if EPPath == None:
+        # give a warning to the user
+        msg= "Honeybee cannot find a compatible EnergyPlus folder on your system.\n" + \
+             "Make sure you have EnergyPlus installed on your system.\n" + \
+             "You won't be able to run energy simulations without EnergyPlus.\n" +\
+             "Check Honeybee_Honeybee component for more information."
+        print msg
+        ghenv.Component.AddRuntimeMessage(w, msg)
+        return -1
+    else:
+        return EPPath
+
+def parseParameters(parameterStr):
+    # "glazingRatio=0.4, north=90" > {"glazingRatio": "0.4", "north": "90"}
+    parameters = {}
+    for item in parameterStr.split(','):
+        if '=' not in item: continue
+        name, value = item.split('=', 1)
+        parameters[name.strip().lstrip('$')] = value.strip()
+    return parameters
+
+def main(idfFilePaths, epwFileAddress, parameters, workingDir, cpuCount, maxRetries, runIt):
+    EPPath = checkTheInputs(idfFilePaths, epwFileAddress, parameters)
+    if EPPath == -1: return -1
+
+    if not workingDir:
+        workingDir = os.path.join(os.path.dirname(idfFilePaths[0]), "batchRuns")
+
+    if ' ' in workingDir:
+        warning = "A white space was found in the workingDir_ path.  EnergyPlus cannot run out of directories with white spaces.\n" + \
+        "Set the workingDir_ on this component to be a directory without a white space and try again."
+        print warning
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, warning)
+        return -1
+
+    try: maxRetries = int(maxRetries)
+    except: maxRetries = 1
+
+    runner = sc.sticky["honeybee_EPBatchRunner"](EPPath, epwFileAddress, workingDir, cpuCount, maxRetries, \
+                                                 shell = runIt > 1, cancelCallback = gh.GH_Document.IsEscapeKeyDown)
+
+    if len(parameters) == 0:
+        for idfFilePath in idfFilePaths: runner.addRun(idfFilePath)
+    else:
+        for count, parameterStr in enumerate(parameters):
+            if len(idfFilePaths) == 1: idfFilePath = idfFilePaths[0]
+            else: idfFilePath = idfFilePaths[count]
+            name = os.path.splitext(os.path.basename(idfFilePath))[0] + "_" + str(count)
+            runner.addRun(idfFilePath, parseParameters(parameterStr), name)
+
+    print '...'
+    print 'RUNNING %d SIMULATION(S) ON %d CPU(S)'%(len(runner.runs), runner.cpuCount)
+    print '...'
+
+    runs = runner.run()
+    print runner.report(runs)
+
+    failedRuns = [run for run in runs if run.status != "success"]
+    if len(failedRuns) != 0:
+        warning = "%d of %d simulations did not run successfully. Check the report for more information."%(len(failedRuns), len(runs))
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+
+    resultFiles = [run.resultFiles.get('csv') for run in runs]
+    errFiles = [run.resultFiles.get('err') for run in runs]
+
+    return runner.manifestFilePath, resultFiles, errFiles
+
+
+
+#Honeybee check.
+initCheck = True
+w = gh.GH_RuntimeMessageLevel.Warning
+if not sc.sticky.has_key('honeybee_release') == True:
+    initCheck = False
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(w, "You should first let Honeybee fly...")
+else:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): initCheck = False
+        if sc.sticky['honeybee_release'].isInputMissing(ghenv.Component): initCheck = False
+    except:
+        initCheck = False
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        "Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(w, warning)
+
+
+
+if initCheck and _runIt > 0 and len(_idfFilePaths) != 0 and _idfFilePaths[0] != None:
+    results = main(_idfFilePaths, _epwFileAddress, parameters_, workingDir_, cpuCount_, maxRetries_, _runIt)
+
+    if results != -1:
+        manifestFile, resultFileAddress, errFileAddress = results
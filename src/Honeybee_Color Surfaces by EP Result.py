@@ -53,11 +53,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Color Surfaces by EP Result"
 ghenv.Component.NickName = 'ColorSurfaces'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_21_2016
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nNOV_20_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "5"
 except: pass
@@ -113,7 +113,7 @@ def copyHBZoneData():
     for HZone in _HBZones:
         zoneBreps.append(HZone)
         zoneCentPts.append(HZone.GetBoundingBox(False).Center)
-        zone = hb_hive.visualizeFromHoneybeeHive([HZone])[0]
+        zone = hb_hive.callFromHoneybeeHive([HZone], readOnly = True)[0]
         for srf in zone.surfaces:
             surfaceNames.append(srf.name)
             if srf.hasChild:
@@ -50,11 +50,11 @@ Provided by Ladybug 0.0.57
 
 ghenv.Component.Name = "Honeybee_Convert EnergyPlus Schedule to Values"
 ghenv.Component.NickName = 'convertEPSCHValues'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "07 | Energy | Schedule"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "1"
 except: pass
@@ -176,7 +176,7 @@ def getNationalHols(country, weekStartWith):
     
     return countries[country]
 
-def addHolidays(startVals, holidayValues, weekStartWith, epwFile, customHolidays, lb_preparation):
+def getHolidays(weekStartWith, epwFile, customHolidays, lb_preparation):
     holidayDOYs = []
     if epwFile:
         #get the base code from EPW
@@ -232,12 +232,6 @@ def addHolidays(startVals, holidayValues, weekStartWith, epwFile, customHolidays
             if item-1 not in holidayDOYs:
                 holidayDOYs.append(item-1)
     
-    # Edit the list of schedule values.
-    for day in holidayDOYs:
-        for interval in holidayValues:
-            if day >= interval[0]-1 and day <= interval[1]-1:
-                startVals[day] = interval[2]
-    
     # Build up a list of holidays
     def fromDayToDate(day, months):
         dateDay = date.fromordinal(date(2015, 1, 1).toordinal() + day) # 2015 is not leap year
@@ -249,7 +243,7 @@ def addHolidays(startVals, holidayValues, weekStartWith, epwFile, customHolidays
     for day in holidayDOYs:
         holidayDates.append(fromDayToDate(day, monthsDict))
     
-    return startVals, holidayDates
+    return holidayDOYs, holidayDates
 
 
 
@@ -312,15 +306,17 @@ def main(schName, startDayOfTheWeek, epwFile, customHol):
             return -1
         else:
             dataGotten = True
-            values = readSchedules.getScheduleValues()
+            # Check for any holidays.
+            holidayDOYs = []
+            if epwFile or customHol != []:
+                holidayDOYs, holidays = getHolidays(startDayOfTheWeek, epwFile, customHol, lb_preparation)
+            
+            # holidays are applied the same way as they are for the simulation
+            values = readSchedules.getScheduleValues(holidays = [day + 1 for day in holidayDOYs])
+            if readSchedules.schType not in ("schedule:year", "schedule:compact"):
+                holidays = []
     
     if dataGotten == True:
-        # Check for any holidays.
-        if epwFile or customHol != []:
-            if len(values) == 365 and not schName.lower().endswith(".csv"):
-                holidayValues = readSchedules.getHolidaySchedValues(schName)
-                values, holidays = addHolidays(values, holidayValues, startDayOfTheWeek, epwFile, customHol, lb_preparation)
-        
         strToBeFound = 'key:location/dataType/units/frequency/startsAt/endsAt'
         d, m, t = lb_preparation.hour2Date(readSchedules.startHOY, True)
         startDate = m+1, d, t
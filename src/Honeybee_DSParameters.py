@@ -34,15 +34,16 @@ Provided by Honeybee 0.0.62
         _adaptiveZone_: Set the Boolean to True if the user can adapt his/her view within the space. "The concept is based on the hypothesis that if a user is free to look in different directions or place him or herself in different positions within a space, he or she is going to pick the most comfortable one." Read more here > http://daysim.ning.com/page/daysim-header-file-deyword-adaptive-zone
         _dgp_imageSize_: The size of the image to be used for daylight glare probability in pixels. Defult value is 250 px.
         onlyRunGlareAnalysis_: Set to False if you want the component run both annual glare analysis and calculate annula illuminance levels. Default is True.
+        writeBinaryIll_: Set to True to write a binary copy of the .ill files (*.illb) after the study. Binary files make reading the results for a single hour or a single test point much faster but need extra disk space. Default is False.
 """
 
 ghenv.Component.Name = "Honeybee_DSParameters"
 ghenv.Component.NickName = 'DSParameters'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "03 | Daylight | Recipes"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
@@ -56,7 +57,7 @@ import Rhino as rc
 
 class SetDSParameters:
     
-    def __init__(self, outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, adaptiveZone, dgp_imageSize, onlyRunGlareAnalysis):
+    def __init__(self, outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, adaptiveZone, dgp_imageSize, onlyRunGlareAnalysis, writeBinaryIll = False):
         
         if len(outputUnits)!=0 and outputUnits[0]!=None: self.outputUnits = outputUnits
         else: self.outputUnits = [2]
@@ -94,6 +95,9 @@ class SetDSParameters:
         if not dgp_imageSize: dgp_imageSize = 250
         self.dgp_imageSize = dgp_imageSize
         
+        # write binary copy of .ill files after the study (*.illb)
+        self.writeBinaryIll = bool(writeBinaryIll)
+        
         if dynamicSHDGroup_1 == None and dynamicSHDGroup_2==None:
             
             class dynamicSHDRecipe(object):
@@ -134,7 +138,7 @@ class SetDSParameters:
 
 
 
-def main(outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, adaptiveZone, dgp_imageSize, onlyRunGlareAnalysis = True):
+def main(outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, adaptiveZone, dgp_imageSize, onlyRunGlareAnalysis = True, writeBinaryIll = False):
     msg = None
     
     # make sure shading groups don't have similar names
@@ -153,14 +157,14 @@ def main(outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, ada
     except:
         pass            
         
-    DSParameters = SetDSParameters(outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, adaptiveZone, dgp_imageSize, onlyRunGlareAnalysis)
+    DSParameters = SetDSParameters(outputUnits, dynamicSHDGroup_1,  dynamicSHDGroup_2, RhinoViewsName, adaptiveZone, dgp_imageSize, onlyRunGlareAnalysis, writeBinaryIll)
     
     return msg, DSParameters
 
 
 
 _adaptiveZone_ = False
-msg, DSParameters = main(_outputUnits_, dynamicSHDGroup_1_,  dynamicSHDGroup_2_, _RhinoViewsName, _adaptiveZone_, _dgp_imageSize_, onlyRunGlareAnalysis_)
+msg, DSParameters = main(_outputUnits_, dynamicSHDGroup_1_,  dynamicSHDGroup_2_, _RhinoViewsName, _adaptiveZone_, _dgp_imageSize_, onlyRunGlareAnalysis_, writeBinaryIll_)
 
 if msg != None:
     ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Error, msg)                
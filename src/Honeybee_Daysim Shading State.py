@@ -36,11 +36,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Daysim Shading State"
 ghenv.Component.NickName = 'DSShadingState'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "03 | Daylight | Recipes"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -72,7 +72,7 @@ def main(shdHBObjects, minIll, maxIll):
     # check if the objects are valid Honeybee objects
     # call the objects from the lib
     hb_hive = sc.sticky["honeybee_Hive"]()
-    HBObjectsFromHive = hb_hive.callFromHoneybeeHive(shdHBObjects)
+    HBObjectsFromHive = hb_hive.callFromHoneybeeHive(shdHBObjects, readOnly = True)
     
     if len(HBObjectsFromHive)==0 or len(HBObjectsFromHive)!= len(shdHBObjects):
         msg = "At the minimum one of the shdHBObjects is not a valid Honeybee object."
@@ -70,7 +70,7 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Energy Shade Benefit Evaluator"
 ghenv.Component.NickName = 'EnergyShadeBenefit'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
@@ -81,7 +81,7 @@ except: pass
 
 import rhinoscriptsyntax as rs
 import Rhino as rc
-import collections
+import itertools
 import System.Threading.Tasks as tasks
 import System
 import scriptcontext as sc
@@ -537,69 +537,152 @@ def checkSkyResolution(skyResolution, allDataDict, analysisPeriod, latitude, lon
     return allDataDict, finalSunVecs
 
 
-def nonparallel_projection(analysisMesh, sunLines, windowTestPts):
-    #Intersect the sun lines with the test mesh
-    faceInt = []
-    for face in range(analysisMesh.Faces.Count): faceInt.append([])
+class ShadeCellIndex(object):
+    """Uniform grid over the faces of a shade mesh as seen along one sun vector.
+    
+    The faces are projected on the plane perpendicular to the sun vector and binned
+    in a grid, so the face that the sun ray of a window point hits first is found by
+    testing the few faces in the grid cell of the projected point instead of
+    intersecting a line with the whole shade mesh.
+    """
+    tolerance = 1e-9
+    
+    def __init__(self, meshTriangles, sunVector, maxDistance):
+        length = sunVector.Length
+        dx, dy, dz = sunVector.X/length, sunVector.Y/length, sunVector.Z/length
+        
+        #Build two axes perpendicular to the sun vector.
+        if abs(dx) < 0.9: hx, hy, hz = 1, 0, 0
+        else: hx, hy, hz = 0, 1, 0
+        ux, uy, uz = dy*hz - dz*hy, dz*hx - dx*hz, dx*hy - dy*hx
+        uLength = math.sqrt(ux*ux + uy*uy + uz*uz)
+        ux, uy, uz = ux/uLength, uy/uLength, uz/uLength
+        vx, vy, vz = dy*uz - dz*uy, dz*ux - dx*uz, dx*uy - dy*ux
+        self.axes = (ux, uy, uz, vx, vy, vz, dx, dy, dz)
+        self.maxDistance = maxDistance
+        
+        #Project the triangles of the mesh.  Triangles that are edge-on to the sun cannot be hit.
+        self.triangles = []
+        for faceIndex, a, b, c in meshTriangles:
+            ax, ay, ad = self.project(a)
+            bx, by, bd = self.project(b)
+            cx, cy, cd = self.project(c)
+            denom = (by - cy)*(ax - cx) + (cx - bx)*(ay - cy)
+            if denom == 0: continue
+            self.triangles.append((faceIndex, ax, ay, bx, by, cx, cy, ad, bd, cd, 1.0/denom))
+        
+        #Bin the projected triangles into a grid with about one triangle per cell.
+        self.gridSize = max(1, int(math.sqrt(len(self.triangles))))
+        self.cells = [[] for i in range(self.gridSize * self.gridSize)]
+        if len(self.triangles) == 0: return
+        
+        self.minX = min(min(tri[1], tri[3], tri[5]) for tri in self.triangles)
+        self.minY = min(min(tri[2], tri[4], tri[6]) for tri in self.triangles)
+        maxX = max(max(tri[1], tri[3], tri[5]) for tri in self.triangles)
+        maxY = max(max(tri[2], tri[4], tri[6]) for tri in self.triangles)
+        self.cellX = (maxX - self.minX)/self.gridSize or 1
+        self.cellY = (maxY - self.minY)/self.gridSize or 1
+        
+        for triCount, tri in enumerate(self.triangles):
+            i0, j0 = self.cellIndex(min(tri[1], tri[3], tri[5]), min(tri[2], tri[4], tri[6]))
+            i1, j1 = self.cellIndex(max(tri[1], tri[3], tri[5]), max(tri[2], tri[4], tri[6]))
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    self.cells[i * self.gridSize + j].append(triCount)
+    
+    @staticmethod
+    def getMeshTriangles(mesh):
+        #Split the faces of the mesh into triangles that keep the index of their face.
+        verts = [(pt.X, pt.Y, pt.Z) for pt in mesh.Vertices]
+        meshTriangles = []
+        for faceIndex in range(mesh.Faces.Count):
+            face = mesh.Faces[faceIndex]
+            meshTriangles.append((faceIndex, verts[face.A], verts[face.B], verts[face.C]))
+            if face.IsQuad: meshTriangles.append((faceIndex, verts[face.A], verts[face.C], verts[face.D]))
+        return meshTriangles
+    
+    def project(self, point):
+        ux, uy, uz, vx, vy, vz, dx, dy, dz = self.axes
+        x, y, z = point
+        return x*ux + y*uy + z*uz, x*vx + y*vy + z*vz, x*dx + y*dy + z*dz
+    
+    def cellIndex(self, x, y):
+        i = min(max(int((x - self.minX)/self.cellX), 0), self.gridSize - 1)
+        j = min(max(int((y - self.minY)/self.cellY), 0), self.gridSize - 1)
+        return i, j
+    
+    def firstFaceHit(self, point):
+        """Return the index of the first face hit by the sun ray from the point or -1."""
+        if len(self.triangles) == 0: return -1
+        px, py, pd = self.project((point.X, point.Y, point.Z))
+        i = int(math.floor((px - self.minX)/self.cellX))
+        j = int(math.floor((py - self.minY)/self.cellY))
+        if i < 0 or j < 0 or i > self.gridSize or j > self.gridSize: return -1
+        i, j = min(i, self.gridSize - 1), min(j, self.gridSize - 1)
+        
+        bestDist = None
+        bestFace = -1
+        tol = self.tolerance
+        for triCount in self.cells[i * self.gridSize + j]:
+            faceIndex, ax, ay, bx, by, cx, cy, ad, bd, cd, invDenom = self.triangles[triCount]
+            l1 = ((by - cy)*(px - cx) + (cx - bx)*(py - cy)) * invDenom
+            if l1 < -tol: continue
+            l2 = ((cy - ay)*(px - cx) + (ax - cx)*(py - cy)) * invDenom
+            if l2 < -tol: continue
+            l3 = 1 - l1 - l2
+            if l3 < -tol: continue
+            dist = l1*ad + l2*bd + l3*cd - pd
+            if dist < 0 or dist > self.maxDistance: continue
+            if bestDist == None or dist < bestDist or (dist == bestDist and faceIndex < bestFace):
+                bestDist = dist
+                bestFace = faceIndex
+        
+        return bestFace
+
+
+def projectSunRays(analysisMesh, windowTestPts, sunVectors, lineLength, contextMesh):
+    #Count the window points whose sun ray is blocked by each face of the shade for each hour.
+    #Each hour is handled by one task that only writes its own result so the result does not depend on the order of the tasks.
+    meshTriangles = ShadeCellIndex.getMeshTriangles(analysisMesh)
+    hourFaceCounts = [None] * len(sunVectors)
+    
+    def intersect(hour):
+        vec = sunVectors[hour]
+        cellIndex = ShadeCellIndex(meshTriangles, vec, lineLength * vec.Length)
+        faceCounts = {}
+        for pt in windowTestPts:
+            #Discount the sun vector if it intersects the context.
+            if contextMesh != None and rc.Geometry.Intersect.Intersection.MeshRay(contextMesh, rc.Geometry.Ray3d(pt, vec)) >= 0: continue
+            faceIndex = cellIndex.firstFaceHit(pt)
+            if faceIndex != -1: faceCounts[faceIndex] = faceCounts.get(faceIndex, 0) + 1
+        hourFaceCounts[hour] = faceCounts
     
-    for ptCount, pt in enumerate(windowTestPts):
-        try:
-            for hour, sunLine in enumerate(sunLines[ptCount]):
-                if sunLine != 0:
-                    intPt, i = rc.Geometry.Intersect.Intersection.MeshLine(analysisMesh, sunLine)
-                    if len(intPt)!=0: faceInt[i[0]].append(hour)
-                else: pass
-        except Exception, e:
-            print `e`
-    
-    return faceInt
-
-
-def parallel_projection(analysisMesh, sunLines, windowTestPts):
-    #Intersect the sun lines with the test mesh using parallel processing
-    faceInt = []
-    for face in range(analysisMesh.Faces.Count): faceInt.append([]) #place holder for result
-    
-    def intersect(i):
-        try:
-            for hour, sunLine in enumerate(sunLines[i]):
-                if sunLine != 0:
-                    intPt, indx = rc.Geometry.Intersect.Intersection.MeshLine(analysisMesh, sunLine)
-                    if len(intPt)!=0: faceInt[indx[0]].append(hour)
-                else: pass
-        except Exception, e:
-            print `e`
-    
-    tasks.Parallel.ForEach(range(len(windowTestPts)), intersect)
+    if parallel_ == True:
+        tasks.Parallel.ForEach(range(len(sunVectors)), intersect)
+    else:
+        for hour in range(len(sunVectors)): intersect(hour)
     
-    return faceInt
+    return hourFaceCounts
 
 
 def valCalc(percentBlocked, ECool, EBeam, cellArea, extraDivisor):
-    #Multiply the Energy by the Percentage Blocked by the Shade
-    ECoolPercent = [a*b for a,b in zip(ECool,percentBlocked)]
-    EBeamPercent = [a*b for a,b in zip(EBeam,percentBlocked)]
-    
-    #Calculate the Thermal Effect of the Shade
-    NegBeam = []
-    for item in EBeamPercent:
-        NegBeam.append(item*(-1))
-    
-    BeamEffectCool = [item1 for item1, item2 in zip(EBeamPercent , ECoolPercent) if item1 < item2]
-    DeltaCool1 = sum(BeamEffectCool)
-    
-    BeamEffectHeat = [item1 for item1, item2 in zip(NegBeam , ECoolPercent) if item1 > item2]
-    DeltaHeat1 = sum(BeamEffectHeat)
-    
-    BeamEffectMid = [item1 for item1, item2, item3 in zip(ECoolPercent , EBeamPercent , NegBeam) if item1 < item2 and item1 > item3]
-    DeltaMidCoolList = []
-    DeltaMidHeatList = []
-    for item in BeamEffectMid:
-        if item > 0: DeltaMidCoolList.append(item)
-        else: DeltaMidHeatList.append(item)
-    
-    DeltaMidCool = sum(DeltaMidCoolList)
-    DeltaMidHeat = sum(DeltaMidHeatList)
+    #Multiply the Energy by the Percentage Blocked by the Shade and calculate the Thermal Effect of the Shade in one pass over the hours.
+    #Hours when the cell blocks no sun have no effect and are skipped.
+    DeltaCool1 = 0
+    DeltaHeat1 = 0
+    DeltaMidCool = 0
+    DeltaMidHeat = 0
+    for blocked, eCool, eBeam in itertools.izip(percentBlocked, ECool, EBeam):
+        if blocked == 0: continue
+        ECoolPercent = eCool*blocked
+        EBeamPercent = eBeam*blocked
+        NegBeam = EBeamPercent*(-1)
+        
+        if EBeamPercent < ECoolPercent: DeltaCool1 += EBeamPercent
+        if NegBeam > ECoolPercent: DeltaHeat1 += NegBeam
+        if ECoolPercent < EBeamPercent and ECoolPercent > NegBeam:
+            if ECoolPercent > 0: DeltaMidCool += ECoolPercent
+            else: DeltaMidHeat += ECoolPercent
     
     deltaCooling = DeltaCool1 + DeltaMidCool
     deltaHeating = DeltaHeat1 + DeltaMidHeat
@@ -633,47 +716,27 @@ def evaluateShade(coolingLoad, heatingLoad, beamGain, analysisMesh, analysisArea
     #Multiply the largest dimension of the bounding box by 2 to ensure that the lines are definitely long enough to intersect the shade.
     lineLength = (max(boundBox.Max - boundBox.Min)) * 2
     
-    #Generate the sun lines for intersection and discount the vector if it intersects a context.
-    sunLines = []
+    #Mesh the context that could block the sun vectors.
+    contextMesh = None
     if context_:
         contextMeshes = []
         for brep in context_:
             contextMeshes.extend(rc.Geometry.Mesh.CreateFromBrep(brep, rc.Geometry.MeshingParameters.Default))
         contextMesh = joinMesh(contextMeshes)
-    else: pass
-    
-    for pt in windowTestPts: sunLines.append([]) 
-    
-    for ptCount, pt in enumerate(windowTestPts):
-        for vec in sunVectors:
-            if context_:
-                if rc.Geometry.Intersect.Intersection.MeshRay(contextMesh, rc.Geometry.Ray3d(pt, vec)) < 0:
-                    sunLines[ptCount].append(rc.Geometry.Line(pt, lineLength * vec))
-                else: sunLines[ptCount].append(0)
-            else:
-                sunLines[ptCount].append(rc.Geometry.Line(pt, lineLength * vec))
-            
     
-    #If parallel is true, then run the intersection through the parallel function.  If not, run it through the normal function.
-    if parallel_ == True:
-        faceInt = parallel_projection(analysisMesh, sunLines, windowTestPts)
-    else:
-        faceInt = nonparallel_projection(analysisMesh, sunLines, windowTestPts)
+    #Intersect the sun rays of the window points with the shade for each hour.
+    hourFaceCounts = projectSunRays(analysisMesh, windowTestPts, sunVectors, lineLength, contextMesh)
     
     #Convert the Number Of Intersections for Each Mesh Face into a Percent of Sun Blocked by Each Mesh Face for Each Hour of the Year.
     percentBlocked = []
     for face in range(analysisMesh.Faces.Count):
         percentBlocked.append(len(sunVectors) *[0])
     
-    testPtsCount = len(windowTestPts) 
-    # for each mesh surface,
-    for faceCount, faceData in enumerate(faceInt):
-        # check the number of intersections for each hour
-        counter= collections.Counter(faceData)
-        
-        for hour in counter.keys():
-             # store the result in the new percentBlocked list
-             percentBlocked[faceCount][hour] = counter[hour]/testPtsCount
+    testPtsCount = len(windowTestPts)
+    for hour, faceCounts in enumerate(hourFaceCounts):
+        for faceCount, count in faceCounts.items():
+            # store the result in the new percentBlocked list
+            percentBlocked[faceCount][hour] = count/testPtsCount
     
     #Calculate ECool and EBeam, which signify the cooling energy at stake and the solar energy at stake respectively.
     ECool = [a-b for a,b in zip(coolingLoad,heatingLoad)]
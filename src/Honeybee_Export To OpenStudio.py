@@ -53,6 +53,7 @@ Provided by Honeybee 0.0.62
             1 = Run the OSM and IDF through EnergyPlus with a command prompt window that displays the progress of the simulation
             2 = Run the OSM and IDF through EnergyPlus in the background (without the command line popup window).
             3 = Generate an IDF from the OSM file but do not run it through EnergyPlus
+        bypassCache_: Set to "True" to run EnergyPlus even if the same IDF and weather file have already been run.  By default, the results of a previous run of the same IDF, weather file and EnergyPlus version are restored from the run cache in the Honeybee default folder instead of running the simulation again.
         openOpenStudio_: Set to "True" to open the OSM file in the OpenStudio interface.  This is useful if you want to visualize the HVAC system in OpenStudio, you want to edit the HVAC further in OpenStudio, or just want to run the simulation from OpenStudio instead of Rhino/GH.  Note that, for this to work, you must have .osm files associated with the OpenStudio application.
         fileName_: Optional text which will be used to name your OSM, IDF and result files.  Change this to aviod over-writing results of previous energy simulations.
         workingDir_: An optional working directory to a folder on your system, into which your OSM, IDF and result files will be written.  NOTE THAT DIRECTORIES INPUT HERE SHOULD NOT HAVE ANY SPACES OR UNDERSCORES IN THE FILE PATH.
@@ -71,11 +72,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Export To OpenStudio"
 ghenv.Component.NickName = 'exportToOpenStudio'
-ghenv.Component.Message = 'VER 0.0.62\nOCT_17_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJUL_18_2017
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUL_24_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
@@ -91,7 +92,6 @@ from pprint import pprint
 import shutil
 import copy
 import math
-import subprocess
 import operator
 
 rc.Runtime.HostUtils.DisplayOleAlerts(False)
@@ -326,161 +326,10 @@ class WriteOPS(object):
         
         return ddFound
     
-    def writeDDObjStr(self, ddName, designType, month, day, dbTemp, dbTempRange, wbTemp, enth, humidConditType, pressure, windSpeed, windDir, ashraeSkyClearness):
-        ddStr =  '! ' + ddName + '\n' + \
-            'SizingPeriod:DesignDay,\n' + \
-            '\t' + ddName + ',     !- Name\n' + \
-            '\t' + str(month) + ',      !- Month\n' + \
-            '\t' + str(day) + ',      !- Day of Month\n' + \
-            '\t' + designType + ',!- Day Type\n' + \
-            '\t' + str(dbTemp) + ',      !- Maximum Dry-Bulb Temperature {C}\n' + \
-            '\t' + str(dbTempRange) + ',      !- Daily Dry-Bulb Temperature Range {C}\n' + \
-            '\t' + 'DefaultMultipliers, !- Dry-Bulb Temperature Range Modifier Type\n' + \
-            '\t' + ',      !- Dry-Bulb Temperature Range Modifier Schedule Name\n' + \
-            '\t' + humidConditType + ',      !- Humidity Condition Type\n' + \
-            '\t' + str(wbTemp) + ',      !- Wetbulb or Dewpoint at Maximum Dry-Bulb {C}\n' + \
-            '\t' + ',      !- Humidity Indicating Day Schedule Name\n' + \
-            '\t' + ',      !- Humidity Ratio at Maximum Dry-Bulb {kgWater/kgDryAir}\n' + \
-            '\t' + str(enth) + ',      !- Enthalpy at Maximum Dry-Bulb {J/kg}\n' + \
-            '\t' + ',      !- Daily Wet-Bulb Temperature Range {deltaC}\n' + \
-            '\t' + str(pressure) + ',      !- Barometric Pressure {Pa}\n' + \
-            '\t' + str(windSpeed) + ',      !- Wind Speed {m/s} design conditions vs. traditional 6.71 m/s (15 mph)\n' + \
-            '\t' + str(windDir) + ',      !- Wind Direction {Degrees; N=0, S=180}\n' + \
-            '\t' + 'No,      !- Rain {Yes/No}\n' + \
-            '\t' + 'No,      !- Snow on ground {Yes/No}\n' + \
-            '\t' + 'No,      !- Daylight Savings Time Indicator\n' + \
-            '\t' + 'ASHRAEClearSky' + ', !- Solar Model Indicator\n' + \
-            '\t' + ',      !- Beam Solar Day Schedule Name\n' + \
-            '\t' + ',      !- Diffuse Solar Day Schedule Name\n' + \
-            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Beam Irradiance (taub)\n' + \
-            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Diffuse Irradiance (taud)\n' + \
-            '\t' + str(ashraeSkyClearness) + ';      !- Clearness {0.0 to 1.1}\n' + '\n'
-        
-        return ddStr
-    
     def createDdyFromEPW(self, epwWeatherFile, workingDir, lb_preparation, lb_comfortModels):
-        # Extract the relevant data from the EPW.
-        # We need the following: dbTemp, dewPoint, rH, windSpeed, windDir, windDir, wetBulb, enthalpy
-        dbTemp = []
-        dewPoint = []
-        rH = []
-        windSpeed = []
-        windDir = []
-        barPress = []
-        wetBulb = []
-        epwfile = open(epwWeatherFile,"r")
-        for count, line in enumerate(epwfile):
-            if count > 7:
-                dbTemp.append(float(line.split(',')[6]))
-                dewPoint.append(float(line.split(',')[7]))
-                rH.append(float(line.split(',')[8]))
-                barPress.append(float(line.split(',')[9]))
-                windSpeed.append(float(line.split(',')[21]))
-                windDir.append(float(line.split(',')[20]))
-        epwfile.close()
-        hR, enthalpy, pP, sP = lb_comfortModels.calcHumidRatio(dbTemp, rH, barPress)
-        for i, tem in enumerate(dbTemp):
-            wetBulb.append(lb_comfortModels.findWetBulb(tem, rH[i], barPress[i]))
-        
-        # Find the conditions for the most extreme hours in the epw.  These are the 7 extreme conditions we need:
-            # 1 - Winnter Design Day - Min Dry Bulb (Sensible Heating)
-            # 2 - Winter Design Day - Min Dew Point (Humidification)
-            # 3 - Winter Design Day = Max Wind Speed when temperature is less than 1 standard deviation of annual mean.
-            # 4 - Summer Design Day - Max Dry Bulb (Sensible Cooling)
-            # 5 - Summer Design Day - Max Wet Bulb (Dehumidification)
-            # 6 - Summer Design Day - Max Dew Point (Dehumidification)
-            # 7 - Summer Design Day - Max Enthalpy (Dehumidification)
-        sortedDB, corrWB = zip(*sorted(zip(dbTemp, wetBulb)))
-        minDB = sortedDB[34] # Design Condition 1
-        WBforMinDB = corrWB[34]
-        maxDB = sortedDB[-35] # Design Condition 4
-        WBforMaxDB = corrWB[-35]
-        sortedDP, corrDB = zip(*sorted(zip(dewPoint, dbTemp)))
-        minDP = sortedDP[34] # Design Condition 2
-        DBforMinDP = corrDB[34]
-        maxDP = sortedDP[-35] # Design Condition 6
-        DBforMaxDP = corrDB[-35]
-        sortedWB, corresDB = zip(*sorted(zip(wetBulb, dbTemp)))
-        maxWB = sortedWB[-35] # Design Condition 5
-        DBforMaxWB = corresDB[-35]
-        sortedEnth, correspondDB = zip(*sorted(zip(enthalpy, dbTemp)))
-        maxEnth = int(sortedEnth[-35] * 1000) # Design Condition 7
-        DBforMaxEnth = correspondDB[-35]
-        
-        coldStdDevTemp = sortedDB[1384]
-        hotStdDevTemp = sortedDB[-1385]
-        winSpBelowTemp = []
-        windDirBelowTemp = []
-        winSpAboveTemp = []
-        windDirAboveTemp = []
-        for i, tem in enumerate(dbTemp):
-            if tem < coldStdDevTemp:
-                winSpBelowTemp.append(windSpeed[i])
-                windDirBelowTemp.append(windDir[i])
-            elif tem > hotStdDevTemp:
-                winSpAboveTemp.append(windSpeed[i])
-                windDirAboveTemp.append(windDir[i])
-        winSpBelowTemp.sort()
-        coldMonWind = winSpBelowTemp[922]
-        coldMonWinDir = int(sum(windDirBelowTemp)/len(windDirBelowTemp))
-        maxWind = winSpBelowTemp[-5] # Design Condition 3
-        winSpAboveTemp.sort()
-        hotMonWind = winSpAboveTemp[922]
-        hotMonWinDir = int(sum(windDirAboveTemp)/len(windDirAboveTemp))
-        
-        # Calculate a few other required values from the epw data.
-        # Like average annual pressure and coldest/hottest month.
-        # and average wind speed/direction during these months.
-        avgEpwParPress = int(sum(barPress)/len(barPress))
-        
-        def binAndAvgByMonth(dataSet):
-            avgMonthData = []
-            binnedMonthData = []
-            for mon in range(12):
-                binnedMonthData.append([])
-            for i, x in enumerate(dataSet):
-                d, m, t = lb_preparation.hour2Date(i, True)
-                binnedMonthData[m].append(x)
-            for dataList in binnedMonthData:
-                avgMonthData.append(sum(dataList)/len(dataList))
-            return avgMonthData, binnedMonthData
-        
-        def partitionList(l, n):
-            for i in range(0, len(l), n):
-                yield l[i:i+n]
-        
-        avgMonTemps, binMonTemps = binAndAvgByMonth(dbTemp)
-        monNums = range(12)
-        avgMonTempsSort, monNumsSort = zip(*sorted(zip(avgMonTemps, monNums)))
-        coldMonth = monNumsSort[0]
-        hotMonth = monNumsSort[-1]
-        allHotMonthTemps = binMonTemps[hotMonth]
-        dayHotMonTemps = partitionList(allHotMonthTemps, 24)
-        dailyTempDiff = []
-        for day in dayHotMonTemps:
-            day.sort()
-            dailyTempDiff.append(day[-1]-day[0])
-        hotDayDBTempRange = (int((sum(dailyTempDiff)/len(dailyTempDiff))*100))/100
-        
-        
-        # Assemble a list of design condition strings to write into the ddy file.
-        ddStrs = []
-        ddStrs.append(self.writeDDObjStr('Ann Htg 99.6% Condns DB', 'WinterDesignDay', coldMonth+1, 21, minDB, 0, minDB, '', 'Wetbulb', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
-        ddStrs.append(self.writeDDObjStr('Ann Hum_n 99.6% Condns DP=>MCDB', 'WinterDesignDay', coldMonth+1, 21, DBforMinDP, 0, minDP, '', 'Dewpoint', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
-        ddStrs.append(self.writeDDObjStr('Ann Htg Wind 99.6% Condns WS=>MCDB', 'WinterDesignDay', coldMonth+1, 21, coldStdDevTemp, 0, coldStdDevTemp, '', 'Wetbulb', avgEpwParPress, maxWind, coldMonWinDir, 0))
-        
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DB=>MWB', 'SummerDesignDay', hotMonth+1, 21, maxDB, hotDayDBTempRange, WBforMaxDB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns WB=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxWB, hotDayDBTempRange, maxWB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DP=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxDP, hotDayDBTempRange, maxDP, '', 'Dewpoint', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns Enth=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxEnth, hotDayDBTempRange, '', maxEnth, 'Enthalpy', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        
-        # Write the design day objects into a .ddy file.
-        epwFileName = epwWeatherFile.split('\\')[-1].split('.')[0]
-        self.ddyFile = workingDir + '\\' + epwFileName + '.ddy'
-        ddyFile = open(self.ddyFile, "w")
-        for sizingObj in ddStrs:
-            ddyFile.write(sizingObj)
-        ddyFile.close()
+        # the design days are cached for each epw file
+        hb_designDays = sc.sticky["honeybee_EPDesignDays"]()
+        self.ddyFile = hb_designDays.createDdyFromEPW(epwWeatherFile, workingDir, lb_preparation, lb_comfortModels)
     
     def isConstructionInLib(self, constructionName):
         return constructionName in self.constructionList
@@ -4364,7 +4213,7 @@ class RunOPS(object):
         fiw.close()
     
     
-    def runAnalysis(self, osmFile, runEnergyPlus):
+    def runAnalysis(self, osmFile, runEnergyPlus, bypassCache = False):
         
         # Preparation
         workingDir, fileName = os.path.split(osmFile)
@@ -4377,12 +4226,12 @@ class RunOPS(object):
         print 'OSM > IDF: ' + str(idfPath)
         
         if runEnergyPlus < 3:
-            resultFile = self.writeBatchFile(idfFolder, "ModelToIdf\\in.idf", self.weatherFile, runEnergyPlus > 1)
+            resultFile = self.writeBatchFile(idfFolder, "ModelToIdf\\in.idf", self.weatherFile, runEnergyPlus > 1, bypassCache)
             return os.path.join(idfFolder, "ModelToIdf", "in.idf"), resultFile
         else:
             return os.path.join(idfFolder, "ModelToIdf", "in.idf"), None
     
-    def writeBatchFile(self, workingDir, idfFileName, epwFileAddress, runInBackground = False):
+    def writeBatchFile(self, workingDir, idfFileName, epwFileAddress, runInBackground = False, bypassCache = False):
         """
         This is here as an alternate until I can get RunManager to work
         """
@@ -4394,6 +4243,15 @@ class RunOPS(object):
         if not workingDir.EndsWith('\\'): workingDir = workingDir + '\\'
         
         fullPath = workingDir + shIdfFileName
+        resultFiles = fullPath + "Zsz.csv",fullPath+".sql",fullPath+".csv", fullPath+".rdd", fullPath+".eio", fullPath+"Table.html"
+        
+        # check the run cache for the results of the same idf and epw files
+        hb_runCache = sc.sticky["honeybee_EPRunCache"]()
+        cacheKey = hb_runCache.getKey(fullPath + '.idf', epwFileAddress, sc.sticky["honeybee_folders"]["EPVersion"])
+        if not bypassCache and hb_runCache.restore(cacheKey, fullPath):
+            print "The same simulation has already been run. Results are restored from the run cache."
+            return resultFiles
+        
         folderName = workingDir.replace( (workingDrive + '\\'), '')
         batchStr = workingDrive + '\ncd\\' +  folderName + '\n"' + EPDirectory + \
                 'Epl-run" ' + fullPath + ' ' + fullPath + ' idf ' + epwFileAddress + ' EP N nolimit N N 0 Y'
@@ -4404,20 +4262,17 @@ class RunOPS(object):
         batchfile.close()
         
         #execute the batch file
-        if runInBackground:
-            self.runCmd(batchFileAddress)
-        else:
-            os.system(batchFileAddress)
+        pool = sc.sticky["honeybee_ProcessPool"](shell = runInBackground)
+        job = pool.run([batchFileAddress])[0]
+        if not job.succeeded:
+            print "Failed to run EnergyPlus batch file:\n" + pool.report([job])
+        
+        hb_runCache.store(cacheKey, fullPath)
         
-        return fullPath + "Zsz.csv",fullPath+".sql",fullPath+".csv", fullPath+".rdd", fullPath+".eio", fullPath+"Table.html"
+        return resultFiles
     
-    def runCmd(self, batchFileAddress, shellKey = True):
-        batchFileAddress.replace("\\", "/")
-        p = subprocess.Popen(["cmd /c ", batchFileAddress], shell=shellKey, stdout=subprocess.PIPE, stderr=subprocess.PIPE)		
-        out, err = p.communicate()
-
 
-def main(HBZones, HBContext, north, epwWeatherFile, analysisPeriod, simParameters, simulationOutputs, runIt, openOpenStudio, workingDir = "C:\ladybug", fileName = "openStudioModel.osm"):
+def main(HBZones, HBContext, north, epwWeatherFile, analysisPeriod, simParameters, simulationOutputs, runIt, openOpenStudio, workingDir = "C:\ladybug", fileName = "openStudioModel.osm", bypassCache = False):
     # check the release
     w = gh.GH_RuntimeMessageLevel.Warning
     
@@ -4709,7 +4564,7 @@ def main(HBZones, HBContext, north, epwWeatherFile, analysisPeriod, simParameter
         hb_runOPS = RunOPS(model, epwWeatherFile, HBZones, hb_writeOPS.simParameters, openStudioLibFolder, csvSchedules, \
             csvScheduleCount, additionalcsvSchedules, shadeCntrlToReplace, replaceShdCntrl, windowSpectralData, waterSourceVRFs)
         
-        idfFile, resultFile = hb_runOPS.runAnalysis(fname, runIt)
+        idfFile, resultFile = hb_runOPS.runAnalysis(fname, runIt, bypassCache)
         if runIt < 3:
             try:
                 errorFileFullName = idfFile.replace('.idf', '.err')
@@ -4736,7 +4591,7 @@ def main(HBZones, HBContext, north, epwWeatherFile, analysisPeriod, simParameter
 if _HBZones and _HBZones[0]!=None and _epwWeatherFile and _writeOSM and openStudioIsReady:
     results = main(_HBZones, HBContext_, north_, _epwWeatherFile,
                   _analysisPeriod_, _energySimPar_, simulationOutputs_,
-                  runSimulation_, openOpenStudio_, workingDir_, fileName_)
+                  runSimulation_, openOpenStudio_, workingDir_, fileName_, bypassCache_)
     if results!=-1:
         osmFileAddress, idfFileAddress, resultsFiles, studyFolder, model = results
         try:
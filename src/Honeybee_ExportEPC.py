@@ -36,11 +36,11 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_ExportEPC"
 ghenv.Component.NickName = 'Export to EPC'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "13 | WIP"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -72,7 +72,7 @@ def main(HBZones):
     hb_hive = sc.sticky["honeybee_Hive"]()
     
     # Call Honeybee zones from the lib
-    HBZones = hb_hive.callFromHoneybeeHive(HBZones)
+    HBZones = hb_hive.callFromHoneybeeHive(HBZones, readOnly = True)
     
     # create an empty dictionary
     # the structure should be as {type : {construction: { orientation : {area of opaque : area , area of glass : area}}}
@@ -39,11 +39,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Generate Cumulative Sky"
 ghenv.Component.NickName = 'genCumSky'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "02 | Daylight | Light Source"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "1"
 except: pass
@@ -112,7 +112,8 @@ def main(weatherFile, analysisPeriod):
     
     if weatherFile != None and weatherFile[-3:] == 'epw':
         # import data from epw file data
-        locName, lat, lngt, timeZone, elev, locationStr = lb_preparation.epwLocation(weatherFile)
+        epwData = sc.sticky["honeybee_EPWData"].fromFile(weatherFile)
+        locName, lat, lngt, timeZone, elev = epwData.location
         newLocName = lb_preparation.removeBlank(locName)
         if len(list(newLocName)) > 15:
             newName = list(newLocName)[:-15]
@@ -38,11 +38,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Get Zone EnergyPlus Schedules"
 ghenv.Component.NickName = 'getHBZoneEPSchedules'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "05 | Energy | Building Program"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -71,7 +71,7 @@ def main(HBZone):
     
     # get Honeybee zone
     hb_hive = sc.sticky["honeybee_Hive"]()
-    HBZoneObject = hb_hive.callFromHoneybeeHive([HBZone])[0]
+    HBZoneObject = hb_hive.callFromHoneybeeHive([HBZone], readOnly = True)[0]
     
     try:
         schedules = HBZoneObject.getCurrentSchedules(True, ghenv.Component)
@@ -47,7 +47,7 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Honeybee"
 ghenv.Component.NickName = 'Honeybee'
-ghenv.Component.Message = 'VER 0.0.62\nOCT_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.icon
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "00 | Honeybee"
@@ -72,6 +72,11 @@ import System.Threading.Tasks as tasks
 import System
 import time
 import itertools
+import collections
+import bisect
+import heapq
+import struct
+import hashlib
 import datetime
 import json
 import copy
@@ -82,6 +87,9 @@ import uuid
 import re
 import random
 import zipfile
+import threading
+import Queue
+from array import array
 
 PI = math.pi
 
@@ -381,10 +389,11 @@ class PrepareTemplateEPLibFiles(object):
     def __init__(self, downloadTemplate = False, workingDir = None):
         
         if not workingDir: workingDir = sc.sticky["Honeybee_DefaultFolder"]
-        if not sc.sticky.has_key("honeybee_constructionLib"): sc.sticky ["honeybee_constructionLib"] = {}
-        if not sc.sticky.has_key("honeybee_materialLib"): sc.sticky ["honeybee_materialLib"] = {}
-        if not sc.sticky.has_key("honeybee_windowMaterialLib"): sc.sticky ["honeybee_windowMaterialLib"] = {}
-        if not sc.sticky.has_key("honeybee_ScheduleLib"): sc.sticky["honeybee_ScheduleLib"] = {}
+        # materials, constructions and schedules are parsed on demand
+        for libName in ("honeybee_constructionLib", "honeybee_materialLib", \
+                        "honeybee_windowMaterialLib", "honeybee_ScheduleLib"):
+            if not hasattr(sc.sticky.get(libName), "addObjectIndex"):
+                sc.sticky[libName] = HB_LazyEPLibrary(sc.sticky.get(libName))
         if not sc.sticky.has_key("honeybee_ScheduleTypeLimitsLib"): sc.sticky["honeybee_ScheduleTypeLimitsLib"] = {}
         if not sc.sticky.has_key("honeybee_WindowPropLib"): sc.sticky["honeybee_WindowPropLib"] = {}
         if not sc.sticky.has_key("honeybee_SpectralDataLib"): sc.sticky["honeybee_SpectralDataLib"] = {}
@@ -400,10 +409,10 @@ class PrepareTemplateEPLibFiles(object):
         client.DownloadFile(url, localFilePath)
     
     def cleanHBLib(self):
-        sc.sticky ["honeybee_constructionLib"] = {}
-        sc.sticky ["honeybee_materialLib"] = {}
-        sc.sticky ["honeybee_windowMaterialLib"] = {}
-        sc.sticky["honeybee_ScheduleLib"] = {}
+        sc.sticky ["honeybee_constructionLib"] = HB_LazyEPLibrary()
+        sc.sticky ["honeybee_materialLib"] = HB_LazyEPLibrary()
+        sc.sticky ["honeybee_windowMaterialLib"] = HB_LazyEPLibrary()
+        sc.sticky["honeybee_ScheduleLib"] = HB_LazyEPLibrary()
         sc.sticky["honeybee_ScheduleTypeLimitsLib"] = {}
         sc.sticky["honeybee_WindowPropLib"] = {}
         sc.sticky["honeybee_SpectralDataLib"] = {}
@@ -529,19 +538,139 @@ class PrepareTemplateEPLibFiles(object):
         return libFilePaths
 
 
+class HB_LazyEPLibrary(object):
+    """
+    A dictionary of EnergyPlus objects which are parsed on demand.
+    
+    The library keeps an index of object names to the position of the object in
+    the source idf file. The object is read and parsed only the first time it is
+    requested and is kept in memory after that. Objects which are added directly
+    are stored the same way as a normal dictionary.
+    
+    Usage:
+        constructionLib = HB_LazyEPLibrary()
+        constructionLib.addObjectIndex("EXTERIOR WALL", idfFile, 1024, 1310)
+        constructionLib["EXTERIOR WALL"]
+    """
+    
+    def __init__(self, data = None):
+        self.index = {} # name: (filePath, start, end)
+        self.data = {}
+        if data: self.update(data)
+    
+    def addObjectIndex(self, name, filePath, start, end):
+        self.index[name] = filePath, start, end
+        self.data.pop(name, None)
+    
+    @staticmethod
+    def readObjectString(filePath, start, end):
+        with open(filePath, "rb") as epFile:
+            epFile.seek(start)
+            return epFile.read(end - start).replace("\r\n", "\n")
+    
+    def __getitem__(self, name):
+        try:
+            return self.data[name]
+        except KeyError:
+            try:
+                filePath, start, end = self.index[name]
+            except KeyError:
+                # the object might have just been parsed by another thread
+                return self.data[name]
+        
+        shortKey, objName, EPObject = \
+            HB_GetEPLibraries.parseEPObject(self.readObjectString(filePath, start, end))
+        
+        self.data[name] = EPObject
+        self.index.pop(name, None)
+        return EPObject
+    
+    def __setitem__(self, name, EPObject):
+        self.data[name] = EPObject
+        self.index.pop(name, None)
+    
+    def __delitem__(self, name):
+        if name in self.data: del self.data[name]
+        else: del self.index[name]
+    
+    def __contains__(self, name):
+        return name in self.data or name in self.index
+    
+    def has_key(self, name):
+        return name in self
+    
+    def __len__(self):
+        return len(self.data) + len(self.index)
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __repr__(self):
+        return "HB_LazyEPLibrary(%d objects, %d parsed)"%(len(self), len(self.data))
+    
+    def keys(self):
+        return self.data.keys() + self.index.keys()
+    
+    def values(self):
+        return [self[name] for name in self.keys()]
+    
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
+    
+    def iterkeys(self):
+        return iter(self.keys())
+    
+    def itervalues(self):
+        for name in self.keys(): yield self[name]
+    
+    def iteritems(self):
+        for name in self.keys(): yield name, self[name]
+    
+    def get(self, name, default = None):
+        try: return self[name]
+        except KeyError: return default
+    
+    def pop(self, name, *default):
+        try:
+            EPObject = self[name]
+        except KeyError:
+            if default: return default[0]
+            raise
+        del self.data[name]
+        return EPObject
+    
+    def clear(self):
+        self.index = {}
+        self.data = {}
+    
+    def copy(self):
+        library = HB_LazyEPLibrary()
+        library.index = dict(self.index)
+        library.data = dict(self.data)
+        return library
+    
+    def update(self, other):
+        if hasattr(other, "addObjectIndex"):
+            # merge another lazy library without parsing the objects
+            for name, position in other.index.items():
+                self.addObjectIndex(name, *position)
+            for name, EPObject in other.data.items():
+                self[name] = EPObject
+        else:
+            for name in other.keys():
+                self[name] = other[name]
+
+
 class HB_GetEPLibraries:
     
+    # change the version if the structure of the libraries changes
+    snapshotVersion = 2
+    
+    # libraries which are indexed and parsed on demand
+    lazyLibraries = ("Material", "WindowMaterial", "Construction", "Schedule")
+    
     def __init__(self):
-        self.libraries = {
-            "Material": {},
-            "WindowMaterial": {},
-            "Construction": {},
-            "Schedule" : {},
-            "ScheduleTypeLimits": {},
-            "ThermMaterial": {},
-            "WindowProperty": {},
-            "MaterialProperty": {}
-            }
+        self.cleanHBLibs()
     
     def getEPMaterials(self):
         return self.libraries["Material"]
@@ -567,11 +696,19 @@ class HB_GetEPLibraries:
     def getTHERMMaterials(self):
         return self.libraries["ThermMaterial"]
     
-    def importEPLibrariesFromFile(self, EPfile, isMatFile, cleanCurrentLib = True, report = True):
+    def importEPLibrariesFromFile(self, EPfile, isMatFile, cleanCurrentLib = True, report = True, lazy = False):
+        """
+        Import EnergyPlus objects from an idf file or THERM materials from a csv file.
+        If lazy is True materials, constructions and schedules are only indexed
+        and will be parsed from the file the first time they are requested.
+        """
         if not os.path.isfile(EPfile):
             raise Exception("Can't find EP library! at %s"%EPfile)
         
-        if isMatFile == False:
+        if isMatFile == False and lazy:
+            print "Indexing EP materials, constructions, schedules and material properties from %s"%EPfile
+            self.indexEPConstructionsMaterialsAndSchedules(EPfile, cleanCurrentLib)
+        elif isMatFile == False:
             print "Loading EP materials, constructions, schedules and material properties from %s"%EPfile
             EPObjects = self.getEnergyPlusObjectsFromFile(EPfile)
             self.loadEPConstructionsMaterialsAndSchedules(EPObjects, cleanCurrentLib)
@@ -582,12 +719,69 @@ class HB_GetEPLibraries:
         if report:
             self.report()
     
+    def getSnapshotKey(self, libFilePaths):
+        """
+        Return a key for a snapshot based on the version, the path and the content of
+        library files. Lazy libraries in the snapshot keep the full path to the files
+        so the snapshot can't be used if the files are moved.
+        """
+        fileHashes = []
+        for path in libFilePaths:
+            with open(path, "rb") as libFile:
+                fileHashes.append((os.path.normcase(os.path.abspath(path)), hashlib.md5(libFile.read()).hexdigest()))
+        
+        return self.snapshotVersion, fileHashes
+    
+    def importEPLibrariesFromSnapshot(self, snapshotFile, snapshotKey):
+        """
+        Load the libraries from a snapshot file. Returns False if the snapshot
+        doesn't exist or has been written for different library files.
+        """
+        if not os.path.isfile(snapshotFile): return False
+        
+        try:
+            with open(snapshotFile, "rb") as inf:
+                # the key is pickled separately so the libraries are only loaded if it matches
+                if pickle.load(inf) != snapshotKey: return False
+                librariesData = pickle.load(inf)
+        except Exception, e:
+            print "Failed to load EP libraries snapshot: %s"%str(e)
+            return False
+        
+        self.cleanHBLibs()
+        for shortKey, libraryData in librariesData.items():
+            if shortKey in self.lazyLibraries:
+                # lazy libraries are stored as their index and parsed objects
+                self.libraries[shortKey].index, self.libraries[shortKey].data = libraryData
+            else:
+                self.libraries[shortKey] = libraryData
+        return True
+    
+    def writeSnapshot(self, snapshotFile, snapshotKey):
+        """Write current libraries to a snapshot file to be loaded in the next run."""
+        tempFilePath = snapshotFile + ".tmp"
+        try:
+            with open(tempFilePath, "wb") as outf:
+                pickle.dump(snapshotKey, outf, pickle.HIGHEST_PROTOCOL)
+                librariesData = {}
+                for shortKey, library in self.libraries.items():
+                    if shortKey in self.lazyLibraries:
+                        librariesData[shortKey] = library.index, library.data
+                    else:
+                        librariesData[shortKey] = library
+                pickle.dump(librariesData, outf, pickle.HIGHEST_PROTOCOL)
+            
+            if os.path.isfile(snapshotFile): os.remove(snapshotFile)
+            os.rename(tempFilePath, snapshotFile)
+        except Exception, e:
+            print "Failed to write EP libraries snapshot: %s"%str(e)
+    
     def cleanHBLibs(self):
         self.libraries = {
-            "Material": {},
-            "WindowMaterial": {},
-            "Construction": {},
-            "Schedule" : {},
+            "Material": HB_LazyEPLibrary(),
+            "WindowMaterial": HB_LazyEPLibrary(),
+            "Construction": HB_LazyEPLibrary(),
+            "Schedule" : HB_LazyEPLibrary(),
             "ScheduleTypeLimits": {},
             "ThermMaterial": {},
             "WindowProperty": {},
@@ -601,65 +795,125 @@ class HB_GetEPLibraries:
         if cleanCurrentLib: self.cleanHBLibs()
         
         for EPObjectStr in EPObjectsString:
-            rawLines = EPObjectStr.strip().split("\n")
-            lines = []
-            for line in rawLines:
-                if line.strip() == '' or line.startswith('!'): continue
-                lines.append(line)
+            EPObject = self.parseEPObject(EPObjectStr)
+            if EPObject == None: continue
             
-            if not lines:
-                continue
+            shortKey, name, objectDict = EPObject
+            if shortKey in self.libraries:
+                self.libraries[shortKey][name] = objectDict
+    
+    def indexEPConstructionsMaterialsAndSchedules(self, EPfile, cleanCurrentLib = True):
+        """
+        Index materials, constructions and schedules of an idf file and load the rest of
+        the objects. Indexed objects are parsed on demand by HB_LazyEPLibrary.
+        """
+        if cleanCurrentLib: self.cleanHBLibs()
+        
+        # read the file as binary so the positions match the file on disk
+        with open(EPfile, "rb") as epFile:
+            epFileString = epFile.read()
+        
+        for match in re.finditer(r'(.[^;]*;)', epFileString + "\n", re.MULTILINE):
+            EPObjectStr = match.group(1).replace("\r\n", "\n")
+            lines = self.getEPObjectLines(EPObjectStr)
             
-            if lines[0].startswith('MaterialProperty:GlazingSpectralData'):
-                key = 'MaterialProperty:GlazingSpectralData'
-                shortKey = 'MaterialProperty'
-                name = lines[1].split(",")[0].strip().upper()
-                self.libraries[shortKey][name] = dict() # create an empty dictonary
-                self.libraries[shortKey][name][0] = key
-                # store the data into the dictionary
-                for lineCount, line in enumerate(lines):
-                    objValue = line.split("!")[0].strip()
-                    try: objDescription = line.split("!")[1].strip()
-                    except:  objDescription = ""
-                    if lineCount == 0:
-                        self.libraries[shortKey][name][lineCount] = objValue[:-1]
-                    elif lineCount == 1:
-                        pass # name is already there as the key
-                    elif objValue.endswith(","):
-                        self.libraries[shortKey][name][lineCount-1] = objValue[:-1], objDescription
-                    elif objValue.endswith(";"):
-                        self.libraries[shortKey][name][lineCount-1] = objValue[:-1], objDescription
+            if not lines or lines[0].startswith('MaterialProperty:GlazingSpectralData'):
+                shortKey = None
             else:
-                if len(lines) < 2: continue
-                
-                if lines[0].split(",")[0].strip().isupper():
-                    key = lines[0].split(",")[0].strip().title()
+                EPObjectKey = self.getEPObjectKeyAndName(lines)
+                if EPObjectKey == None: continue
+                key, shortKey, name = EPObjectKey
+            
+            if shortKey in self.lazyLibraries:
+                self.libraries[shortKey].addObjectIndex(name, EPfile, match.start(1), match.end(1))
+            else:
+                EPObject = self.parseEPObject(EPObjectStr)
+                if EPObject != None and EPObject[0] in self.libraries:
+                    self.libraries[EPObject[0]][EPObject[1]] = EPObject[2]
+    
+    @staticmethod
+    def getEPObjectLines(EPObjectStr):
+        rawLines = EPObjectStr.strip().split("\n")
+        lines = []
+        for line in rawLines:
+            if line.strip() == '' or line.startswith('!'): continue
+            lines.append(line)
+        return lines
+    
+    @staticmethod
+    def getEPObjectKeyAndName(lines):
+        """Return key, short key and name of an EnergyPlus object from its lines."""
+        if len(lines) < 2: return None
+        
+        if lines[0].split(",")[0].strip().isupper():
+            key = lines[0].split(",")[0].strip().title()
+        else:
+            key = lines[0].split(",")[0].strip()
+        shortKey = key.split(":")[0]
+        
+        name = lines[1].split(",")[0].strip().upper()
+        # it's a two line object such as Any Number scheduleTypeLimit
+        if lines[2:] == []:
+            name = lines[1].split(";")[0].strip().upper() # name is the last input
+        
+        return key, shortKey, name
+    
+    @staticmethod
+    def parseEPObject(EPObjectStr):
+        """
+        Parse an EnergyPlus object string.
+        
+        Returns:
+            shortKey, name and the object as a dictionary or None if the string
+            is not a valid object.
+        """
+        lines = HB_GetEPLibraries.getEPObjectLines(EPObjectStr)
+        
+        if not lines:
+            return None
+        
+        EPObject = dict() # create an empty dictonary
+        if lines[0].startswith('MaterialProperty:GlazingSpectralData'):
+            key = 'MaterialProperty:GlazingSpectralData'
+            shortKey = 'MaterialProperty'
+            name = lines[1].split(",")[0].strip().upper()
+            EPObject[0] = key
+            # store the data into the dictionary
+            for lineCount, line in enumerate(lines):
+                objValue = line.split("!")[0].strip()
+                try: objDescription = line.split("!")[1].strip()
+                except:  objDescription = ""
+                if lineCount == 0:
+                    EPObject[lineCount] = objValue[:-1]
+                elif lineCount == 1:
+                    pass # name is already there as the key
+                elif objValue.endswith(","):
+                    EPObject[lineCount-1] = objValue[:-1], objDescription
+                elif objValue.endswith(";"):
+                    EPObject[lineCount-1] = objValue[:-1], objDescription
+        else:
+            EPObjectKey = HB_GetEPLibraries.getEPObjectKeyAndName(lines)
+            if EPObjectKey == None: return None
+            
+            key, shortKey, name = EPObjectKey
+            values = lines[2:]
+            
+            EPObject[0] = key
+            
+            count = 1
+            delimiter = ","
+            for value in values:
+                if not len(value.strip()): continue #pass empty lines
+                if count==len(values): delimiter = ";"
+                v = value.split(delimiter)[0].strip() # find the  value
+                if value.find("!")!= -1:
+                    c = value.split("!")[-1].rstrip() # find the  value
                 else:
-                    key = lines[0].split(",")[0].strip()
-                shortKey = key.split(":")[0]
-                
-                name = lines[1].split(",")[0].strip().upper()
-                values = lines[2:]
-                # it's a two line object such as Any Number scheduleTypeLimit
-                if values == []:
-                    name = lines[1].split(";")[0].strip().upper() # name is the last input
-                    
-                if shortKey in self.libraries:
-                    self.libraries[shortKey][name] = dict() # create an empty dictonary
-                    self.libraries[shortKey][name][0] = key
-                    
-                    count = 1
-                    delimiter = ","
-                    for value in values:
-                        if not len(value.strip()): continue #pass empty lines
-                        if count==len(values): delimiter = ";"
-                        v = value.split(delimiter)[0].strip() # find the  value
-                        if value.find("!")!= -1:
-                            c = value.split("!")[-1].rstrip() # find the  value
-                        else:
-                            c = ""
-                        self.libraries[shortKey][name][count] = v, c
-                        count += 1
+                    c = ""
+                EPObject[count] = v, c
+                count += 1
+        
+        return shortKey, name, EPObject
     
     def report(self): 
         # Report findings
@@ -1602,6 +1856,1278 @@ class hb_MSHToRAD(object):
     
         return matFile, radFile
 
+class hb_Job(object):
+    """A command that is executed by hb_ProcessPool.
+
+    Args:
+        command: Command or batch file to be executed.
+        name: Optional name for the job. Default is the command.
+    """
+    def __init__(self, command, name = None):
+        self.command = command
+        self.name = name or command
+        self.process = None
+        self.returnCode = None
+        self.stdout = ''
+        self.stderr = ''
+        self.startTime = None
+        self.endTime = None
+        self.cancelled = False
+    
+    @property
+    def wallTime(self):
+        """Wall time of the job in seconds."""
+        if self.startTime is None or self.endTime is None: return None
+        return self.endTime - self.startTime
+    
+    @property
+    def succeeded(self):
+        return not self.cancelled and self.returnCode == 0
+    
+    def __repr__(self):
+        if self.cancelled: status = "cancelled"
+        elif self.returnCode is None: status = "not finished"
+        else: status = "exit code %d, %.2f s"%(self.returnCode, self.wallTime)
+        return "%s (%s)"%(self.name, status)
+
+
+class hb_ProcessPool(object):
+    """Run a number of commands in parallel with a bounded number of processes.
+    
+    A new job is launched as soon as a running job exits. Each running job is
+    waited on by a separate thread which reports back when the process exits, so
+    there is no polling and no sleeping between launches. run only returns after
+    all the processes have exited so the result files can be read right after.
+    
+    Args:
+        maxPRuns: Maximum number of processes that run in parallel (default: 1).
+        shell: Set to True if you do NOT want to see the cmd window while the
+            analysis is running.
+        captureStdout: Set to True to capture stdout of each job in job.stdout
+            instead of writing it to the cmd window. Default is True for jobs that
+            run in the background (shell = True) and False otherwise.
+        captureStderr: Set to True to capture stderr of each job (default: True).
+        cancelCallback: An optional function with no arguments which returns True
+            if the remaining jobs should be cancelled (e.g. a check for the escape
+            key). It is checked every cancelCheckInterval seconds.
+    
+    Usage:
+        pool = hb_ProcessPool(maxPRuns = 4, shell = True)
+        jobs = pool.run(batchFileNames)
+        failedJobs = [job for job in jobs if not job.succeeded]
+    """
+    cancelCheckInterval = 0.5
+    
+    def __init__(self, maxPRuns = 1, shell = False, captureStdout = None, captureStderr = True, cancelCallback = None):
+        try: maxPRuns = int(maxPRuns)
+        except: maxPRuns = 1
+        self.maxPRuns = max(1, maxPRuns)
+        self.shell = shell
+        if captureStdout is None: captureStdout = shell
+        self.captureStdout = captureStdout
+        self.captureStderr = captureStderr
+        self.cancelCallback = cancelCallback
+        self.cancelled = False
+        self.__running = []
+        self.__lock = threading.Lock()
+    
+    def run(self, commands):
+        """Run the commands and wait for all of them to finish.
+        
+        The method only returns after all the processes have exited or have been
+        killed after cancelling.
+        
+        Args:
+            commands: A list of commands (or hb_Job objects).
+        Returns:
+            A list of hb_Job objects in the same order as the input commands.
+        """
+        jobs = [command if isinstance(command, hb_Job) else hb_Job(command) for command in commands]
+        pending = list(reversed(jobs))
+        finishedJobs = Queue.Queue()
+        self.cancelled = False
+        
+        while pending and len(self.__running) < self.maxPRuns:
+            self.__launch(pending.pop(), finishedJobs)
+        
+        while self.__running:
+            if self.cancelCallback is None:
+                job = finishedJobs.get()
+            else:
+                try:
+                    job = finishedJobs.get(timeout = self.cancelCheckInterval)
+                except Queue.Empty:
+                    if not self.cancelled and self.cancelCallback():
+                        self.cancel()
+                    continue
+            
+            with self.__lock:
+                self.__running.remove(job)
+            
+            if self.cancelled:
+                for pendingJob in pending: pendingJob.cancelled = True
+                pending = []
+            elif pending:
+                self.__launch(pending.pop(), finishedJobs)
+        
+        return jobs
+    
+    def cancel(self):
+        """Kill the running jobs and do not launch the pending ones."""
+        self.cancelled = True
+        with self.__lock:
+            runningJobs = list(self.__running)
+        for job in runningJobs:
+            job.cancelled = True
+            self.__kill(job)
+    
+    def __launch(self, job, finishedJobs):
+        job.startTime = time.time()
+        with self.__lock:
+            self.__running.append(job)
+        try:
+            stdout = subprocess.PIPE if self.captureStdout else None
+            stderr = subprocess.PIPE if self.captureStderr else None
+            job.process = subprocess.Popen(job.command.replace("\\", "/"), shell = self.shell, \
+                                           stdout = stdout, stderr = stderr)
+        except Exception, e:
+            job.returnCode = -1
+            job.stderr = str(e)
+            job.endTime = time.time()
+            finishedJobs.put(job)
+            return
+        
+        watcher = threading.Thread(target = self.__wait, args = (job, finishedJobs))
+        watcher.daemon = True
+        watcher.start()
+    
+    @staticmethod
+    def __wait(job, finishedJobs):
+        try:
+            out, err = job.process.communicate()
+            job.stdout = out or ''
+            job.stderr = err or ''
+        except Exception, e:
+            job.stderr = str(e)
+        # make sure the process has exited before the job is reported as finished
+        job.returnCode = job.process.wait()
+        job.endTime = time.time()
+        finishedJobs.put(job)
+    
+    @staticmethod
+    def __kill(job):
+        if job.process is None or job.process.poll() is not None: return
+        try:
+            if os.name == 'nt':
+                # batch files start child processes that should be killed too.
+                subprocess.call("taskkill /F /T /PID %d"%job.process.pid, shell = True)
+            else:
+                job.process.kill()
+        except Exception, e:
+            print "Failed to cancel %s: %s"%(job.name, str(e))
+    
+    @staticmethod
+    def report(jobs):
+        """Return a report of the failed jobs and the wall time of all the jobs."""
+        lines = []
+        for job in jobs:
+            lines.append(repr(job))
+            if job.succeeded: continue
+            for output in (job.stdout, job.stderr):
+                if output.strip():
+                    lines.append("    " + output.strip().replace("\n", "\n    "))
+        return "\n".join(lines)
+
+
+class hb_EPBatchRun(object):
+    """One EnergyPlus run of hb_EPBatchRunner.
+    
+    Args:
+        name: Name of the run. It is also used for the run folder and the result files.
+        idfFilePath: Path to the idf file.
+        parameters: An optional dictionary of parameters. Each $name in the idf file
+            is replaced with the value of the parameter before the run.
+    """
+    def __init__(self, name, idfFilePath, parameters = None):
+        self.name = name
+        self.idfFilePath = idfFilePath
+        self.parameters = parameters or {}
+        self.runDir = None
+        self.status = "pending"
+        self.attempts = 0
+        self.returnCode = None
+        self.wallTime = None
+        self.warnings = 0
+        self.severeErrors = 0
+        self.fatalErrors = 0
+        self.completed = False
+    
+    @property
+    def resultFiles(self):
+        """Paths to the result files of the run that exist."""
+        resultFiles = {}
+        if self.runDir is None: return resultFiles
+        for extension in ('csv', 'err', 'eso', 'sql', 'eio', 'rdd', 'html'):
+            if extension == 'html': filePath = os.path.join(self.runDir, self.name + 'Table.html')
+            else: filePath = os.path.join(self.runDir, self.name + '.' + extension)
+            if os.path.isfile(filePath): resultFiles[extension] = filePath
+        return resultFiles
+    
+    def readErrFile(self):
+        """Count the warnings and errors in the err file of the run."""
+        self.warnings = self.severeErrors = self.fatalErrors = 0
+        self.completed = False
+        errFilePath = os.path.join(self.runDir, self.name + '.err')
+        if not os.path.isfile(errFilePath): return False
+        with open(errFilePath, 'r') as errFile:
+            for line in errFile:
+                if "**  Fatal  **" in line: self.fatalErrors += 1
+                elif "** Severe  **" in line: self.severeErrors += 1
+                elif "** Warning **" in line: self.warnings += 1
+                elif "EnergyPlus Completed Successfully" in line: self.completed = True
+        return True
+    
+    def toDict(self):
+        return {"name": self.name,
+                "idf": self.idfFilePath,
+                "parameters": self.parameters,
+                "runDir": self.runDir,
+                "status": self.status,
+                "attempts": self.attempts,
+                "returnCode": self.returnCode,
+                "wallTime": self.wallTime,
+                "warnings": self.warnings,
+                "severeErrors": self.severeErrors,
+                "fatalErrors": self.fatalErrors,
+                "resultFiles": self.resultFiles}
+    
+    def __repr__(self):
+        return "%s (%s, %d severe error(s), %d attempt(s))"%(self.name, self.status, self.severeErrors, self.attempts)
+
+
+class hb_EPBatchRunner(object):
+    """Run a number of idf files with EnergyPlus on local processes.
+    
+    Each run is copied to its own folder under workingDir so runs don't overwrite
+    each other's intermediate files, and the runs are executed by hb_ProcessPool.
+    Runs that fail without a fatal error in the err file (e.g. the process could
+    not start or a file was locked) are retried up to maxRetries times. A json
+    manifest that maps the idf files and parameters of each run to its status and
+    result files is written to workingDir.
+    
+    Args:
+        EPDirectory: EnergyPlus folder.
+        epwFileAddress: Path to the epw weather file.
+        workingDir: Folder for the runs.
+        cpuCount: Number of runs in parallel. Default is the number of processors.
+        maxRetries: Number of times that a run which failed without a fatal error is retried.
+        shell: Set to True to run EnergyPlus in the background.
+        cancelCallback: An optional function which returns True if the remaining runs should be cancelled.
+    
+    Usage:
+        runner = hb_EPBatchRunner(EPPath, epwFile, workingDir, cpuCount = 4)
+        runner.addRun("base.idf", {"glazingRatio": 0.4}, "wwr_40")
+        runs = runner.run()
+    """
+    manifestFileName = "batchManifest.json"
+    
+    def __init__(self, EPDirectory, epwFileAddress, workingDir, cpuCount = None, maxRetries = 1, \
+                 shell = True, cancelCallback = None):
+        self.EPDirectory = EPDirectory
+        self.epwFileAddress = epwFileAddress
+        self.workingDir = workingDir
+        if cpuCount is None: cpuCount = System.Environment.ProcessorCount
+        self.cpuCount = max(1, int(cpuCount))
+        self.maxRetries = max(0, int(maxRetries))
+        self.shell = shell
+        self.cancelCallback = cancelCallback
+        self.runs = []
+        self.manifestFilePath = os.path.join(workingDir, self.manifestFileName)
+    
+    def addRun(self, idfFilePath, parameters = None, name = None):
+        """Add an idf file and an optional dictionary of parameters to the batch."""
+        if name is None:
+            name = os.path.splitext(os.path.basename(idfFilePath))[0]
+        # EnergyPlus can't run from paths with white spaces.
+        name = re.sub(r'[^\w.-]', '_', name)
+        names = set(run.name for run in self.runs)
+        uniqueName, count = name, 1
+        while uniqueName in names:
+            uniqueName = name + "_" + str(count)
+            count += 1
+        
+        run = hb_EPBatchRun(uniqueName, idfFilePath, parameters)
+        self.runs.append(run)
+        return run
+    
+    @staticmethod
+    def applyParameters(idfStr, parameters):
+        """Replace $name in the idf string with the value of each parameter."""
+        if not parameters: return idfStr
+        def replace(match):
+            name = match.group(1)
+            if name in parameters: return str(parameters[name])
+            return match.group(0)
+        return re.sub(r'\$(\w+)', replace, idfStr)
+    
+    def prepareRun(self, run):
+        """Write the idf file and the batch file of the run to its own folder."""
+        run.runDir = os.path.join(self.workingDir, run.name)
+        if not os.path.isdir(run.runDir): os.makedirs(run.runDir)
+        
+        # remove the results of the earlier attempts
+        for fileName in os.listdir(run.runDir):
+            filePath = os.path.join(run.runDir, fileName)
+            if os.path.isfile(filePath): os.remove(filePath)
+        
+        with open(run.idfFilePath, 'r') as inf:
+            idfStr = self.applyParameters(inf.read(), run.parameters)
+        fullPath = os.path.join(run.runDir, run.name)
+        with open(fullPath + '.idf', 'w') as outf:
+            outf.write(idfStr)
+        
+        batchStr = run.runDir[:2] + '\ncd "' + run.runDir + '"\n"' + self.EPDirectory + \
+                   '\\Epl-run" ' + fullPath + ' ' + fullPath + ' idf ' + self.epwFileAddress + ' EP N nolimit N N 0 Y'
+        batchFileAddress = fullPath + '.bat'
+        with open(batchFileAddress, 'w') as batchFile:
+            batchFile.write(batchStr)
+        
+        return hb_Job(batchFileAddress, run.name)
+    
+    def run(self):
+        """Run all the runs and write the manifest.
+        
+        Returns:
+            The list of hb_EPBatchRun objects with their status.
+        """
+        if not os.path.isdir(self.workingDir): os.makedirs(self.workingDir)
+        
+        pendingRuns = list(self.runs)
+        for attempt in range(self.maxRetries + 1):
+            if not pendingRuns: break
+            
+            jobs = [self.prepareRun(run) for run in pendingRuns]
+            pool = hb_ProcessPool(self.cpuCount, self.shell, cancelCallback = self.cancelCallback)
+            pool.run(jobs)
+            
+            retryRuns = []
+            for run, job in zip(pendingRuns, jobs):
+                run.attempts += 1
+                run.returnCode = job.returnCode
+                run.wallTime = job.wallTime
+                hasErrFile = run.readErrFile()
+                
+                if job.cancelled:
+                    run.status = "cancelled"
+                elif run.completed and job.returnCode == 0:
+                    run.status = "success"
+                elif hasErrFile and run.fatalErrors != 0:
+                    # EnergyPlus failed because of the model. Running it again won't help.
+                    run.status = "failed"
+                else:
+                    run.status = "failed"
+                    retryRuns.append(run)
+            
+            if pool.cancelled: break
+            pendingRuns = retryRuns
+        
+        self.writeManifest()
+        return self.runs
+    
+    def writeManifest(self):
+        manifest = {"epw": self.epwFileAddress,
+                    "EPDirectory": self.EPDirectory,
+                    "runs": [run.toDict() for run in self.runs]}
+        tempFilePath = self.manifestFilePath + ".tmp"
+        with open(tempFilePath, 'w') as outf:
+            json.dump(manifest, outf, indent = 2)
+        if os.path.isfile(self.manifestFilePath): os.remove(self.manifestFilePath)
+        os.rename(tempFilePath, self.manifestFilePath)
+        return self.manifestFilePath
+    
+    @staticmethod
+    def report(runs):
+        """Return a report with the status of each run."""
+        return "\n".join(repr(run) for run in runs)
+
+
+class hb_EPRunCache(object):
+    """A cache of EnergyPlus results keyed by the content of the simulation inputs.
+    
+    The key of a run is the md5 hash of the EnergyPlus version, the idf file, the
+    epw file and any csv file that is referenced in the idf file (e.g. by
+    Schedule:File). The result files of completed runs are copied to a folder for
+    each key under cacheDir. If the same inputs are run again, the result files are
+    copied back to the run folder instead of running EnergyPlus.
+    
+    The least recently used runs are removed once the cache is larger than maxSize.
+    
+    Args:
+        cacheDir: Folder of the cache. Default is runCache in the Honeybee default folder.
+        maxSize: Maximum size of the cache in MB (default: 2048).
+    
+    Usage:
+        runCache = hb_EPRunCache()
+        key = runCache.getKey(idfFilePath, epwFilePath, EPVersion)
+        if not runCache.restore(key, fullPath):
+            # run EnergyPlus
+            runCache.store(key, fullPath)
+    """
+    # result files of Epl-run are named as the idf file + one of these suffixes.
+    resultSuffixes = ('.csv', '.eio', '.err', '.sql', '.eso', '.rdd', '.mdd', '.mtr', '.bnd', '.end',
+                      'Table.html', 'Meter.csv', 'Zsz.csv', 'Ssz.csv')
+    markerFileName = 'complete.json'
+    
+    def __init__(self, cacheDir = None, maxSize = 2048):
+        if cacheDir is None:
+            cacheDir = os.path.join(sc.sticky["Honeybee_DefaultFolder"], "runCache")
+        self.cacheDir = cacheDir
+        self.maxSize = maxSize * 1024 * 1024
+    
+    @staticmethod
+    def getKey(idfFilePath, epwFilePath, EPVersion):
+        """Return the md5 hash of the version, the idf and epw files and the csv files referenced in the idf."""
+        key = hashlib.md5(str(EPVersion))
+        with open(idfFilePath, 'rb') as idfFile:
+            idfStr = idfFile.read()
+        key.update(hashlib.md5(idfStr).digest())
+        with open(epwFilePath, 'rb') as epwFile:
+            key.update(hashlib.md5(epwFile.read()).digest())
+        
+        for csvFilePath in sorted(set(re.findall(r'([^,;\s]+\.csv)\s*[,;]', idfStr, re.IGNORECASE))):
+            if not os.path.isabs(csvFilePath):
+                csvFilePath = os.path.join(os.path.dirname(idfFilePath), csvFilePath)
+            if os.path.isfile(csvFilePath):
+                with open(csvFilePath, 'rb') as csvFile:
+                    key.update(hashlib.md5(csvFile.read()).digest())
+        
+        return key.hexdigest()
+    
+    @staticmethod
+    def isCompleted(fullPath):
+        """Check the err file of the run for a successful simulation without fatal errors."""
+        errFilePath = fullPath + '.err'
+        if not os.path.isfile(errFilePath): return False
+        with open(errFilePath, 'r') as errFile:
+            errStr = errFile.read()
+        return "EnergyPlus Completed Successfully" in errStr and "**  Fatal  **" not in errStr
+    
+    def restore(self, key, fullPath):
+        """Copy the cached result files of the key next to fullPath (the idf file path without .idf).
+        
+        Returns:
+            A list of the restored files. The list is empty if the key is not in the cache.
+        """
+        entryDir = os.path.join(self.cacheDir, key)
+        markerFile = os.path.join(entryDir, self.markerFileName)
+        if not os.path.isfile(markerFile): return []
+        
+        try:
+            with open(markerFile, 'r') as inf:
+                suffixes = json.load(inf)["suffixes"]
+            restoredFiles = []
+            for suffix in suffixes:
+                shutil.copyfile(os.path.join(entryDir, 'result' + suffix), fullPath + suffix)
+                restoredFiles.append(fullPath + suffix)
+        except Exception, e:
+            print "Failed to restore the results from the run cache:\n" + `e`
+            return []
+        
+        # mark the run as recently used
+        os.utime(markerFile, None)
+        return restoredFiles
+    
+    def store(self, key, fullPath):
+        """Copy the result files of a completed run to the cache and remove the least recently used runs if needed."""
+        if not self.isCompleted(fullPath): return False
+        
+        entryDir = os.path.join(self.cacheDir, key)
+        if os.path.isfile(os.path.join(entryDir, self.markerFileName)): return True
+        
+        tempDir = entryDir + '.tmp'
+        try:
+            if os.path.isdir(tempDir): shutil.rmtree(tempDir)
+            os.makedirs(tempDir)
+            suffixes = []
+            for suffix in self.resultSuffixes:
+                if os.path.isfile(fullPath + suffix):
+                    shutil.copyfile(fullPath + suffix, os.path.join(tempDir, 'result' + suffix))
+                    suffixes.append(suffix)
+            with open(os.path.join(tempDir, self.markerFileName), 'w') as outf:
+                json.dump({"suffixes": suffixes}, outf)
+            if os.path.isdir(entryDir): shutil.rmtree(entryDir)
+            os.rename(tempDir, entryDir)
+        except Exception, e:
+            print "Failed to add the results to the run cache:\n" + `e`
+            return False
+        
+        self.evict(keep = key)
+        return True
+    
+    def evict(self, keep = None):
+        """Remove the least recently used runs until the cache is smaller than maxSize.
+        
+        The run of the keep key is not removed.
+        """
+        if not os.path.isdir(self.cacheDir): return
+        
+        entries = []
+        totalSize = 0
+        for key in os.listdir(self.cacheDir):
+            entryDir = os.path.join(self.cacheDir, key)
+            markerFile = os.path.join(entryDir, self.markerFileName)
+            if not os.path.isfile(markerFile): continue
+            size = sum(os.path.getsize(os.path.join(entryDir, fileName)) for fileName in os.listdir(entryDir))
+            totalSize += size
+            if key != keep: entries.append((os.path.getmtime(markerFile), size, entryDir))
+        
+        entries.sort()
+        for lastUsed, size, entryDir in entries:
+            if totalSize <= self.maxSize: break
+            try:
+                shutil.rmtree(entryDir)
+                totalSize -= size
+            except Exception, e:
+                print "Failed to remove " + entryDir + " from the run cache:\n" + `e`
+
+
+class hb_EPZoneMultipliers(object):
+    """Collapse identical zones into one zone with an EnergyPlus zone multiplier.
+    
+    Two zones are identical if the geometry of one is a translated copy of the other
+    (same shape and orientation) and they have the same constructions, boundary
+    conditions, schedules, loads, HVAC and other zone properties. Only the first zone
+    of each group is written to the idf file with the number of zones in the group as
+    its multiplier. The neighbours of the collapsed zones are not modeled so the
+    surfaces of the written zones that are adjacent to a collapsed zone become adiabatic.
+    
+    The names of the collapsed zones and their surfaces are saved in a json file next
+    to the idf file (mapFileName) and hb_EPResultReader.fromResultFile uses it to copy
+    the results of each written zone to all the zones of its group.
+    
+    Note that the context and the solar radiation that each zone receives are not
+    compared, which is the main assumption of using zone multipliers.
+    
+    Args:
+        tolerance: Tolerance to compare the vertices of the zones (default: 0.001).
+    
+    Usage:
+        zoneMultipliers = hb_EPZoneMultipliers()
+        groups = zoneMultipliers.groupZones(HBZones)
+        HBZones = zoneMultipliers.collapseZones(groups)
+        zoneMultipliers.writeMap(groups, workingDir)
+    """
+    mapFileName = "zoneMultipliers.json"
+    
+    # zone attributes that are not compared or are compared separately.
+    zoneKeyExceptions = set(('name', 'ID', 'num', 'geometry', 'origin', 'cenPt', 'surfaces', 'illumCntrlSensorPt'))
+    
+    surfaceKeyAttributes = ('type', 'BC', 'construction', 'EPConstruction', 'RadMaterial', 'sunExposure', \
+                            'windExposure', 'groundViewFactor', 'shadingControlName', 'frameName', 'Multiplier')
+    
+    def __init__(self, tolerance = 0.001):
+        self.tolerance = tolerance
+    
+    def valueKey(self, value, depth = 0):
+        """Return a hashable key for the value of an attribute.
+        
+        Python objects (e.g. the HVAC system of a zone) are compared by their attributes
+        up to three levels deep.
+        """
+        if value is None or isinstance(value, (bool, int, long, str, unicode)):
+            return value
+        elif isinstance(value, float):
+            return round(value, 6)
+        elif isinstance(value, (list, tuple)):
+            return tuple(self.valueKey(v, depth) for v in value)
+        elif isinstance(value, dict):
+            return tuple(sorted((str(k), self.valueKey(v, depth)) for k, v in value.items()))
+        elif depth < 3 and hasattr(value, '__dict__'):
+            try: return self.attributesKey(value, (), depth + 1)
+            except TypeError: pass
+        return type(value).__name__
+    
+    def attributesKey(self, obj, exceptions, depth = 0):
+        return tuple(sorted((name, self.valueKey(value, depth)) for name, value in vars(obj).items() \
+                            if name not in exceptions))
+    
+    def pointKey(self, pt, reference):
+        return (int(round((pt.X - reference.X) / self.tolerance)), \
+                int(round((pt.Y - reference.Y) / self.tolerance)), \
+                int(round((pt.Z - reference.Z) / self.tolerance)))
+    
+    def getReferencePoint(self, zone):
+        """Return the minimum corner of the vertices of the zone."""
+        points = [pt for surface in zone.surfaces for pt in surface.coordinates]
+        return rc.Geometry.Point3d(min(pt.X for pt in points), min(pt.Y for pt in points), min(pt.Z for pt in points))
+    
+    def getSurfaceKey(self, surface, reference):
+        key = [tuple(self.pointKey(pt, reference) for pt in surface.coordinates)]
+        for attr in self.surfaceKeyAttributes:
+            key.append(self.valueKey(getattr(surface, attr, None)))
+        if surface.hasChild:
+            key.append(tuple(sorted(self.getSurfaceKey(childSrf, reference) for childSrf in surface.childSrfs)))
+        return tuple(key)
+    
+    def isExcluded(self, zone):
+        """Zones that are referenced by other objects by name are never collapsed."""
+        if getattr(zone, 'mixAir', False): return True
+        for surface in zone.surfaces:
+            if getattr(surface, 'containsPVgen', False): return True
+        return False
+    
+    def getZoneKey(self, zone):
+        if len(zone.surfaces) == 0 or self.isExcluded(zone):
+            return ("zone", zone.name)
+        
+        reference = self.getReferencePoint(zone)
+        sensorKey = None
+        if zone.illumCntrlSensorPt is not None:
+            sensorKey = self.pointKey(zone.illumCntrlSensorPt, reference)
+        surfaceKeys = tuple(sorted(self.getSurfaceKey(surface, reference) for surface in zone.surfaces))
+        
+        return self.attributesKey(zone, self.zoneKeyExceptions), sensorKey, surfaceKeys
+    
+    def getSortedSurfaces(self, zone):
+        """Return surfaces and their child surfaces sorted in the same order for identical zones."""
+        reference = self.getReferencePoint(zone)
+        surfaces = []
+        for key, surface in sorted(((self.getSurfaceKey(srf, reference), srf) for srf in zone.surfaces), key = lambda s: s[0]):
+            surfaces.append(surface)
+            if surface.hasChild:
+                childSrfs = sorted(((self.getSurfaceKey(child, reference), child) for child in surface.childSrfs), key = lambda s: s[0])
+                surfaces.extend(child for key, child in childSrfs)
+        return surfaces
+    
+    def groupZones(self, zones):
+        """Group identical zones.
+        
+        Returns:
+            A list of [representative zone, zones of the group] in the order of the
+            representative zones. Each representative zone is also the first zone of
+            its group.
+        """
+        groups = collections.OrderedDict()
+        for zone in zones:
+            groups.setdefault(self.getZoneKey(zone), []).append(zone)
+        return [[groupZones[0], groupZones] for groupZones in groups.values()]
+    
+    def collapseZones(self, groups):
+        """Set the multiplier of the representative zones and return them.
+        
+        Surfaces that are adjacent to a zone that is not written to the idf file are
+        set to be adiabatic.
+        """
+        zones = [representative for representative, groupZones in groups]
+        zoneNames = set(zone.name for zone in zones)
+        for representative, groupZones in groups:
+            representative.multiplier = len(groupZones)
+            for surface in representative.surfaces:
+                if surface.BC.lower() != "surface" or surface.BCObject.parent.name in zoneNames:
+                    continue
+                surface.setBC("Adiabatic")
+                surface.setBCObjectToOutdoors()
+                surface.setSunExposure()
+                surface.setWindExposure()
+                if surface.hasChild:
+                    for childSrf in surface.childSrfs:
+                        childSrf.setBCObjectToOutdoors()
+        return zones
+    
+    def writeMap(self, groups, folder):
+        """Write the names of the collapsed zones and surfaces to folder.
+        
+        The file is removed if no zone is collapsed. Returns the path to the file or None.
+        """
+        mapFilePath = os.path.join(folder, self.mapFileName)
+        zoneMap = []
+        for representative, groupZones in groups:
+            if len(groupZones) == 1: continue
+            representativeSurfaces = self.getSortedSurfaces(representative)
+            for zone in groupZones[1:]:
+                surfaceMap = dict((repSrf.name.upper(), srf.name.upper()) for repSrf, srf in \
+                                  zip(representativeSurfaces, self.getSortedSurfaces(zone)))
+                zoneMap.append({"name": zone.name.upper(), "representative": representative.name.upper(), \
+                                "surfaces": surfaceMap})
+        
+        if len(zoneMap) == 0:
+            if os.path.isfile(mapFilePath): os.remove(mapFilePath)
+            return None
+        
+        zoneOrder = [zone.name.upper() for representative, groupZones in groups for zone in groupZones]
+        with open(mapFilePath, 'w') as mapFile:
+            json.dump({"version": 1, "zones": zoneMap, "zoneOrder": zoneOrder}, mapFile)
+        return mapFilePath
+    
+    @classmethod
+    def loadMap(cls, resultFilePath):
+        """Load the zone multipliers map of a simulation from the folder of the result file."""
+        mapFilePath = os.path.join(os.path.dirname(resultFilePath), cls.mapFileName)
+        if not os.path.isfile(mapFilePath): return None
+        try:
+            with open(mapFilePath, 'r') as mapFile:
+                return json.load(mapFile)
+        except Exception, e:
+            print "Failed to load the zone multipliers file:\n" + `e`
+            return None
+    
+    @classmethod
+    def expandZoneLists(cls, resultFilePath, zoneNames, *zoneLists):
+        """Add the collapsed zones to the lists of zone data that are read from the eio file.
+        
+        Args:
+            resultFilePath: Path to the result file of the simulation.
+            zoneNames: Zone names of the eio file (e.g. [" ZONE1", " ZONE2"]).
+            zoneLists: Lists with one item for each zone (e.g. floor areas). The item
+                of the representative zone is copied for each zone of its group. Lists of
+                surface names are renamed to the surfaces of each zone.
+        Returns:
+            zoneNames and zoneLists with all the zones in the original order of the zones.
+        """
+        zoneMap = cls.loadMap(resultFilePath)
+        if not zoneMap: return [zoneNames] + list(zoneLists)
+        
+        representatives = dict((zone["name"], zone) for zone in zoneMap["zones"])
+        zoneIndex = dict((name.strip().upper(), count) for count, name in enumerate(zoneNames))
+        
+        # zones of the original model that are in the eio file and then the rest of the eio zones
+        zoneOrder = [name for name in zoneMap["zoneOrder"] \
+                     if name in zoneIndex or representatives.get(name, {}).get("representative") in zoneIndex]
+        zoneOrder.extend(name.strip().upper() for name in zoneNames if name.strip().upper() not in zoneMap["zoneOrder"])
+        
+        newLists = [[] for l in range(len(zoneLists) + 1)]
+        for name in zoneOrder:
+            if name in zoneIndex:
+                count = zoneIndex[name]
+                newLists[0].append(zoneNames[count])
+                for newList, zoneList in zip(newLists[1:], zoneLists):
+                    newList.append(zoneList[count])
+                continue
+            
+            zone = representatives[name]
+            count = zoneIndex[zone["representative"]]
+            prefix = zoneNames[count][:len(zoneNames[count]) - len(zoneNames[count].lstrip())]
+            newLists[0].append(prefix + name)
+            for newList, zoneList in zip(newLists[1:], zoneLists):
+                item = zoneList[count]
+                if isinstance(item, list):
+                    item = [zone["surfaces"].get(i.strip().upper(), i) if isinstance(i, str) else i for i in item]
+                newList.append(item)
+        
+        return newLists
+
+
+class hb_EPZoneMultiplierReader(object):
+    """Read the results of a simulation with collapsed zones as if all the zones were modeled.
+    
+    A column is added to the header for each collapsed zone and surface with the key
+    of the zone or surface and the values of its representative. Columns of objects
+    that are named after the zone (e.g. "ZONE1 IDEAL LOADS AIR SYSTEM") are copied too.
+    All the other attributes are read from the original reader.
+    
+    Args:
+        reader: A result reader (e.g. hb_EPResultReader).
+        zoneMap: The zone multipliers map from hb_EPZoneMultipliers.loadMap.
+    """
+    
+    def __init__(self, reader, zoneMap):
+        self.reader = reader
+        zoneCopies = {}
+        surfaceCopies = {}
+        for zone in zoneMap["zones"]:
+            zoneCopies.setdefault(zone["representative"], []).append(zone["name"])
+            for repSrfName, srfName in zone["surfaces"].items():
+                surfaceCopies.setdefault(repSrfName, []).append(srfName)
+        
+        # [index of the column in the original reader] for each column
+        self.sourceColumns = []
+        self.header = []
+        for columnCount, column in enumerate(reader.header):
+            self.header.append(column)
+            self.sourceColumns.append(columnCount)
+            for newColumn in self.copyColumn(column, zoneCopies, surfaceCopies):
+                self.header.append(newColumn)
+                self.sourceColumns.append(columnCount)
+        self.columns = [hb_EPResultReader.parseColumnHeader(column) for column in self.header]
+    
+    @staticmethod
+    def copyColumn(column, zoneCopies, surfaceCopies):
+        if ':' not in column: return []
+        key, rest = column.rsplit(':', 1)
+        keyUpper = key.strip().upper()
+        
+        copies = surfaceCopies.get(keyUpper) or zoneCopies.get(keyUpper)
+        if copies:
+            return [name + ':' + rest for name in copies]
+        
+        for representative, names in zoneCopies.items():
+            if keyUpper.startswith(representative + ' '):
+                return [name + key.strip()[len(representative):] + ':' + rest for name in names]
+        return []
+    
+    def __getattr__(self, name):
+        return getattr(self.reader, name)
+    
+    def findColumns(self, variable = None, key = None, timestep = None):
+        indices = []
+        for columnCount, (v, k, u, t) in enumerate(self.columns):
+            if variable is not None and v.upper() != variable.upper(): continue
+            if key is not None and k.upper() != key.upper(): continue
+            if timestep is not None and t.upper() != timestep.upper(): continue
+            indices.append(columnCount)
+        return indices
+    
+    def readColumns(self, columnIndices, *args, **kwargs):
+        columnIndices = sorted(set(columnIndices))
+        data = self.reader.readColumns(set(self.sourceColumns[c] for c in columnIndices), *args, **kwargs)
+        columns = {}
+        for columnCount in columnIndices:
+            # copy the values so each column can be changed separately
+            columns[columnCount] = array('d', data[self.sourceColumns[columnCount]])
+        return columns
+    
+    def readColumn(self, columnIndex, *args, **kwargs):
+        return self.readColumns([columnIndex], *args, **kwargs)[columnIndex]
+    
+    def hasGaps(self, columnIndex):
+        return self.reader.hasGaps(self.sourceColumns[columnIndex])
+
+
+class hb_EPWData(object):
+    """Hourly data of an epw weather file as typed columns.
+    
+    The epw file is parsed once into an array('d') for each field. The arrays are saved
+    to a binary sidecar file next to the epw file (epwName.hbepw) or to the epwCache folder
+    of the Honeybee default folder if the folder of the epw is read-only. The sidecar is
+    rebuilt if the size or the modification time of the epw file changes. Loaded files are
+    also kept in memory so the components that use the same weather file don't read it again.
+    
+    Usage:
+        epwData = hb_EPWData.fromFile(epwFileAddress)
+        locName, lat, lngt, timeZone, elev = epwData.location
+        dryBulbTemp = epwData.getValues("dryBulbTemperature")
+        # values for the hours of January
+        directNormalRad = epwData.getValues("directNormalRadiation", 1, 744)
+        # values with a Ladybug header
+        windSpeed = epwData.getLBData("windSpeed")
+    """
+    # change the version if the format of the sidecar files changes
+    version = 1
+    # name: (column in the epw file, data type in Ladybug headers, units)
+    fields = collections.OrderedDict([
+        ("dryBulbTemperature", (6, "Dry Bulb Temperature", "C")),
+        ("dewPointTemperature", (7, "Dew Point Temperature", "C")),
+        ("relativeHumidity", (8, "Relative Humidity", "%")),
+        ("atmosphericPressure", (9, "Barometric Pressure", "Pa")),
+        ("extraterrestrialHorizontalRadiation", (10, "Extraterrestrial Horizontal Radiation", "Wh/m2")),
+        ("extraterrestrialDirectNormalRadiation", (11, "Extraterrestrial Direct Normal Radiation", "Wh/m2")),
+        ("horizontalInfraredRadiation", (12, "Horizontal Infrared Radiation Intensity", "Wh/m2")),
+        ("globalHorizontalRadiation", (13, "Global Horizontal Radiation", "Wh/m2")),
+        ("directNormalRadiation", (14, "Direct Normal Radiation", "Wh/m2")),
+        ("diffuseHorizontalRadiation", (15, "Diffuse Horizontal Radiation", "Wh/m2")),
+        ("globalHorizontalIlluminance", (16, "Global Horizontal Illuminance", "lux")),
+        ("directNormalIlluminance", (17, "Direct Normal Illuminance", "lux")),
+        ("diffuseHorizontalIlluminance", (18, "Diffuse Horizontal Illuminance", "lux")),
+        ("zenithLuminance", (19, "Zenith Luminance", "Cd/m2")),
+        ("windDirection", (20, "Wind Direction", "degrees")),
+        ("windSpeed", (21, "Wind Speed", "m/s")),
+        ("totalSkyCover", (22, "Total Sky Cover", "tenth")),
+        ("opaqueSkyCover", (23, "Opaque Sky Cover", "tenth")),
+        ("visibility", (24, "Visibility", "km")),
+        ("ceilingHeight", (25, "Ceiling Height", "m"))
+        ])
+    # {normalized path of the epw file: hb_EPWData}
+    loaded = {}
+    
+    def __init__(self, epwFileAddress, headline, columns):
+        self.epwFileAddress = epwFileAddress
+        self.headline = headline
+        self.columns = columns
+    
+    @staticmethod
+    def parseLocation(headline):
+        """Return locName, lat, lngt, timeZone, elev from the first line of an epw file as strings."""
+        csheadline = headline.split(',')
+        while 1>0: #remove empty cells from the end of the list if any
+            try: float(csheadline[-1]); break
+            except: csheadline.pop()
+        locName = ''
+        for hLine in range(1,4):
+            if csheadline[hLine] != '-':
+                locName = locName + csheadline[hLine].strip() + '_'
+        locName = locName[:-1].strip()
+        lat = csheadline[-4]
+        lngt = csheadline[-3]
+        timeZone = csheadline[-2]
+        elev = csheadline[-1].strip()
+        return locName, lat, lngt, timeZone, elev
+    
+    @property
+    def location(self):
+        """locName, lat, lngt, timeZone, elev as strings."""
+        return self.parseLocation(self.headline)
+    
+    @property
+    def locationName(self):
+        return self.location[0]
+    
+    @property
+    def latitude(self):
+        return float(self.location[1])
+    
+    @property
+    def longitude(self):
+        return float(self.location[2])
+    
+    @property
+    def timeZone(self):
+        return float(self.location[3])
+    
+    @property
+    def elevation(self):
+        return float(self.location[4])
+    
+    @classmethod
+    def fromFile(cls, epwFileAddress, cacheDir = None):
+        """Load the data of an epw file from memory, from the sidecar file or by parsing the epw file."""
+        fileStat = os.stat(epwFileAddress)
+        fileId = [fileStat.st_size, fileStat.st_mtime]
+        filePath = os.path.normcase(os.path.abspath(epwFileAddress))
+        
+        if filePath in cls.loaded and cls.loaded[filePath].fileId == fileId:
+            return cls.loaded[filePath]
+        
+        sidecarFiles = cls.getSidecarFilePaths(epwFileAddress, cacheDir)
+        epwData = None
+        for sidecarFile in sidecarFiles:
+            if os.path.isfile(sidecarFile):
+                epwData = cls.readSidecar(sidecarFile, epwFileAddress, fileId)
+                if epwData is not None: break
+        
+        if epwData is None:
+            epwData = cls.parseEPW(epwFileAddress)
+            for sidecarFile in sidecarFiles:
+                if epwData.writeSidecar(sidecarFile, fileId): break
+        
+        epwData.fileId = fileId
+        cls.loaded[filePath] = epwData
+        return epwData
+    
+    @staticmethod
+    def getSidecarFilePaths(epwFileAddress, cacheDir = None):
+        if cacheDir is None:
+            cacheDir = os.path.join(sc.sticky["Honeybee_DefaultFolder"], "epwCache")
+        epwFileAddress = os.path.abspath(epwFileAddress)
+        epwName = os.path.splitext(os.path.basename(epwFileAddress))[0]
+        pathKey = hashlib.md5(os.path.normcase(epwFileAddress)).hexdigest()[:8]
+        return [os.path.splitext(epwFileAddress)[0] + '.hbepw',
+                os.path.join(cacheDir, epwName + '_' + pathKey + '.hbepw')]
+    
+    @classmethod
+    def parseEPW(cls, epwFileAddress):
+        fieldColumns = [fieldData[0] for fieldData in cls.fields.values()]
+        columns = [array('d') for fieldColumn in fieldColumns]
+        with open(epwFileAddress, 'r') as epwfile:
+            headline = epwfile.readline()
+            for count, line in enumerate(epwfile):
+                # the first 8 lines of the epw file are the header
+                if count < 7 or line.strip() == '': continue
+                data = line.split(',')
+                for column, fieldColumn in zip(columns, fieldColumns):
+                    column.append(float(data[fieldColumn]))
+        
+        return cls(epwFileAddress, headline, dict(zip(cls.fields.keys(), columns)))
+    
+    @classmethod
+    def readSidecar(cls, sidecarFile, epwFileAddress, fileId):
+        """Read the columns from a sidecar file. Returns None if the file is outdated or invalid."""
+        try:
+            with open(sidecarFile, 'rb') as inf:
+                header = json.loads(inf.readline())
+                if header["version"] != cls.version or header["fileId"] != fileId \
+                    or header["fields"] != cls.fields.keys():
+                    return None
+                columns = {}
+                for fieldName in header["fields"]:
+                    column = array('d')
+                    column.fromfile(inf, header["count"])
+                    columns[fieldName] = column
+        except Exception, e:
+            print "Failed to read " + sidecarFile + ":\n" + `e`
+            return None
+        
+        return cls(epwFileAddress, header["headline"], columns)
+    
+    def writeSidecar(self, sidecarFile, fileId):
+        """Write the columns to a sidecar file. Returns False if the file can't be written."""
+        header = {"version": self.version,
+                  "fileId": fileId,
+                  "headline": self.headline,
+                  "count": len(self.columns["dryBulbTemperature"]),
+                  "fields": self.fields.keys()}
+        try:
+            if not os.path.isdir(os.path.dirname(sidecarFile)):
+                os.makedirs(os.path.dirname(sidecarFile))
+            with open(sidecarFile, 'wb') as outf:
+                outf.write(json.dumps(header) + '\n')
+                for fieldName in self.fields.keys():
+                    self.columns[fieldName].tofile(outf)
+        except Exception:
+            return False
+        return True
+    
+    def getValues(self, fieldName, startHOY = 1, endHOY = None):
+        """Return the values of a field for the hours of the year from startHOY to endHOY as an array.
+        
+        If startHOY is larger than endHOY the period passes the end of the year.
+        """
+        values = self.columns[fieldName]
+        if endHOY is None: endHOY = len(values)
+        if startHOY <= endHOY:
+            return values[startHOY - 1:endHOY]
+        return values[startHOY - 1:] + values[:endHOY]
+    
+    def getValuesAtHours(self, fieldName, HOYs):
+        values = self.columns[fieldName]
+        return array('d', [values[HOY - 1] for HOY in HOYs])
+    
+    def getLBData(self, fieldName):
+        """Return the values of a field for the whole year as a list with a Ladybug header."""
+        column, dataType, units = self.fields[fieldName]
+        return ['key:location/dataType/units/frequency/startsAt/endsAt', self.locationName, \
+                dataType, units, 'Hourly', (1, 1, 1), (12, 31, 24)] + \
+                self.columns[fieldName].tolist()
+    
+    def getLocationStr(self):
+        """Return the location as an EnergyPlus Site:Location string (same as lb_preparation.epwLocation)."""
+        locName, lat, lngt, timeZone, elev = self.location
+        return "Site:Location,\n" + \
+            locName + ',\n' + \
+            lat+',      !Latitude\n' + \
+            lngt+',     !Longitude\n' + \
+            timeZone+',     !Time Zone\n' + \
+            elev + ';       !Elevation'
+
+
+class hb_EPDesignDays(object):
+    """Generate EnergyPlus design days from the hourly data of an epw file.
+    
+    This is used when there is no ddy file next to the epw. The epw is read once into
+    typed columns (see hb_EPWData) and the extreme hours are found with partial selection
+    (heapq) instead of sorting all the hours of the year. The wet bulb temperatures are calculated in
+    parallel.
+    
+    The generated ddy file is cached next to the epw file as epwName_<hash>.ddy where hash
+    is the md5 hash of the epw file so repeated runs with the same weather file don't
+    analyze the file again. If the folder of the epw file is read-only the ddy file is
+    cached in the ddyCache folder of the Honeybee default folder.
+    
+    Usage:
+        hb_designDays = hb_EPDesignDays()
+        ddyFile = hb_designDays.createDdyFromEPW(epwFileAddress, workingDir, lb_preparation, lb_comfortModels)
+    """
+    # change the version if the design days are calculated differently
+    version = 1
+    # {(epwFileAddress, size, modified time): key}
+    keys = {}
+    # month of each hour of the year as it is binned by lb_preparation.hour2Date(HOY, True)
+    monthOfHours = None
+    
+    def __init__(self, cacheDir = None):
+        if cacheDir is None:
+            cacheDir = os.path.join(sc.sticky["Honeybee_DefaultFolder"], "ddyCache")
+        self.cacheDir = cacheDir
+    
+    @classmethod
+    def getKey(cls, epwFileAddress):
+        """Return the md5 hash of the epw file and the version of the design day calculation."""
+        fileStat = os.stat(epwFileAddress)
+        fileId = (os.path.normcase(os.path.abspath(epwFileAddress)), fileStat.st_size, fileStat.st_mtime)
+        if fileId not in cls.keys:
+            key = hashlib.md5(str(cls.version))
+            with open(epwFileAddress, 'rb') as epwFile:
+                key.update(epwFile.read())
+            cls.keys[fileId] = key.hexdigest()
+        return cls.keys[fileId]
+    
+    def getCachedDdyFilePaths(self, epwFileAddress):
+        key = self.getKey(epwFileAddress)
+        ddyFileName = os.path.splitext(os.path.basename(epwFileAddress))[0] + '_' + key[:12] + '.ddy'
+        return [os.path.join(os.path.dirname(os.path.abspath(epwFileAddress)), ddyFileName),
+                os.path.join(self.cacheDir, ddyFileName)]
+    
+    @staticmethod
+    def readEPWColumns(epwFileAddress):
+        """Return the columns of the epw that are needed for the design days as arrays.
+        
+        Returns:
+            dbTemp, dewPoint, rH, barPress, windDir, windSpeed
+        """
+        epwData = hb_EPWData.fromFile(epwFileAddress)
+        return [epwData.columns[fieldName] for fieldName in ("dryBulbTemperature", "dewPointTemperature", \
+                "relativeHumidity", "atmosphericPressure", "windDirection", "windSpeed")]
+    
+    @classmethod
+    def getMonthOfHours(cls, lb_preparation):
+        if cls.monthOfHours is None:
+            cls.monthOfHours = [lb_preparation.hour2Date(HOY, True)[1] for HOY in range(8760)]
+        return cls.monthOfHours
+    
+    @staticmethod
+    def nthSmallest(n, values):
+        # same as sorted(values)[n]
+        return heapq.nsmallest(n + 1, values)[-1]
+    
+    @staticmethod
+    def nthLargest(n, values):
+        # same as sorted(values)[-n-1]
+        return heapq.nlargest(n + 1, values)[-1]
+    
+    def writeDDObjStr(self, ddName, designType, month, day, dbTemp, dbTempRange, wbTemp, enth, humidConditType, pressure, windSpeed, windDir, ashraeSkyClearness):
+        ddStr =  '! ' + ddName + '\n' + \
+            'SizingPeriod:DesignDay,\n' + \
+            '\t' + ddName + ',     !- Name\n' + \
+            '\t' + str(month) + ',      !- Month\n' + \
+            '\t' + str(day) + ',      !- Day of Month\n' + \
+            '\t' + designType + ',!- Day Type\n' + \
+            '\t' + str(dbTemp) + ',      !- Maximum Dry-Bulb Temperature {C}\n' + \
+            '\t' + str(dbTempRange) + ',      !- Daily Dry-Bulb Temperature Range {C}\n' + \
+            '\t' + 'DefaultMultipliers, !- Dry-Bulb Temperature Range Modifier Type\n' + \
+            '\t' + ',      !- Dry-Bulb Temperature Range Modifier Schedule Name\n' + \
+            '\t' + humidConditType + ',      !- Humidity Condition Type\n' + \
+            '\t' + str(wbTemp) + ',      !- Wetbulb or Dewpoint at Maximum Dry-Bulb {C}\n' + \
+            '\t' + ',      !- Humidity Indicating Day Schedule Name\n' + \
+            '\t' + ',      !- Humidity Ratio at Maximum Dry-Bulb {kgWater/kgDryAir}\n' + \
+            '\t' + str(enth) + ',      !- Enthalpy at Maximum Dry-Bulb {J/kg}\n' + \
+            '\t' + ',      !- Daily Wet-Bulb Temperature Range {deltaC}\n' + \
+            '\t' + str(pressure) + ',      !- Barometric Pressure {Pa}\n' + \
+            '\t' + str(windSpeed) + ',      !- Wind Speed {m/s} design conditions vs. traditional 6.71 m/s (15 mph)\n' + \
+            '\t' + str(windDir) + ',      !- Wind Direction {Degrees; N=0, S=180}\n' + \
+            '\t' + 'No,      !- Rain {Yes/No}\n' + \
+            '\t' + 'No,      !- Snow on ground {Yes/No}\n' + \
+            '\t' + 'No,      !- Daylight Savings Time Indicator\n' + \
+            '\t' + 'ASHRAEClearSky' + ', !- Solar Model Indicator\n' + \
+            '\t' + ',      !- Beam Solar Day Schedule Name\n' + \
+            '\t' + ',      !- Diffuse Solar Day Schedule Name\n' + \
+            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Beam Irradiance (taub)\n' + \
+            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Diffuse Irradiance (taud)\n' + \
+            '\t' + str(ashraeSkyClearness) + ';      !- Clearness {0.0 to 1.1}\n' + '\n'
+        
+        return ddStr
+    
+    def getDesignDayStrs(self, epwFileAddress, lb_preparation, lb_comfortModels):
+        """Calculate the 7 design days of the epw file and return them as a list of idf strings."""
+        dbTemp, dewPoint, rH, barPress, windDir, windSpeed = self.readEPWColumns(epwFileAddress)
+        hR, enthalpy, pP, sP = lb_comfortModels.calcHumidRatio(dbTemp, rH, barPress)
+        
+        wetBulb = [None] * len(dbTemp)
+        def calcWetBulb(i):
+            wetBulb[i] = lb_comfortModels.findWetBulb(dbTemp[i], rH[i], barPress[i])
+        tasks.Parallel.ForEach(range(len(dbTemp)), calcWetBulb)
+        
+        # Find the conditions for the most extreme hours in the epw.  These are the 7 extreme conditions we need:
+            # 1 - Winnter Design Day - Min Dry Bulb (Sensible Heating)
+            # 2 - Winter Design Day - Min Dew Point (Humidification)
+            # 3 - Winter Design Day = Max Wind Speed when temperature is less than 1 standard deviation of annual mean.
+            # 4 - Summer Design Day - Max Dry Bulb (Sensible Cooling)
+            # 5 - Summer Design Day - Max Wet Bulb (Dehumidification)
+            # 6 - Summer Design Day - Max Dew Point (Dehumidification)
+            # 7 - Summer Design Day - Max Enthalpy (Dehumidification)
+        # pairs are compared the same way they were sorted before so ties resolve the same
+        minDB, WBforMinDB = self.nthSmallest(34, zip(dbTemp, wetBulb)) # Design Condition 1
+        maxDB, WBforMaxDB = self.nthLargest(34, zip(dbTemp, wetBulb)) # Design Condition 4
+        minDP, DBforMinDP = self.nthSmallest(34, zip(dewPoint, dbTemp)) # Design Condition 2
+        maxDP, DBforMaxDP = self.nthLargest(34, zip(dewPoint, dbTemp)) # Design Condition 6
+        maxWB, DBforMaxWB = self.nthLargest(34, zip(wetBulb, dbTemp)) # Design Condition 5
+        maxEnth, DBforMaxEnth = self.nthLargest(34, zip(enthalpy, dbTemp))
+        maxEnth = int(maxEnth * 1000) # Design Condition 7
+        
+        coldStdDevTemp = self.nthSmallest(1384, dbTemp)
+        hotStdDevTemp = self.nthLargest(1384, dbTemp)
+        winSpBelowTemp = []
+        windDirBelowTemp = []
+        winSpAboveTemp = []
+        windDirAboveTemp = []
+        for i, tem in enumerate(dbTemp):
+            if tem < coldStdDevTemp:
+                winSpBelowTemp.append(windSpeed[i])
+                windDirBelowTemp.append(windDir[i])
+            elif tem > hotStdDevTemp:
+                winSpAboveTemp.append(windSpeed[i])
+                windDirAboveTemp.append(windDir[i])
+        coldMonWind = self.nthSmallest(922, winSpBelowTemp)
+        coldMonWinDir = int(sum(windDirBelowTemp)/len(windDirBelowTemp))
+        maxWind = self.nthLargest(4, winSpBelowTemp) # Design Condition 3
+        hotMonWind = self.nthSmallest(922, winSpAboveTemp)
+        hotMonWinDir = int(sum(windDirAboveTemp)/len(windDirAboveTemp))
+        
+        # Calculate a few other required values from the epw data.
+        # Like average annual pressure and coldest/hottest month.
+        # and average wind speed/direction during these months.
+        avgEpwParPress = int(sum(barPress)/len(barPress))
+        
+        monthOfHours = self.getMonthOfHours(lb_preparation)
+        binMonTemps = [[] for mon in range(12)]
+        for i, tem in enumerate(dbTemp):
+            binMonTemps[monthOfHours[i % 8760]].append(tem)
+        avgMonTemps = [sum(monTemps)/len(monTemps) for monTemps in binMonTemps]
+        
+        avgMonTempsSort, monNumsSort = zip(*sorted(zip(avgMonTemps, range(12))))
+        coldMonth = monNumsSort[0]
+        hotMonth = monNumsSort[-1]
+        allHotMonthTemps = binMonTemps[hotMonth]
+        dailyTempDiff = []
+        for i in range(0, len(allHotMonthTemps), 24):
+            day = allHotMonthTemps[i:i+24]
+            dailyTempDiff.append(max(day) - min(day))
+        hotDayDBTempRange = (int((sum(dailyTempDiff)/len(dailyTempDiff))*100))/100
+        
+        # Assemble a list of design condition strings to write into the ddy file.
+        ddStrs = []
+        ddStrs.append(self.writeDDObjStr('Ann Htg 99.6% Condns DB', 'WinterDesignDay', coldMonth+1, 21, minDB, 0, minDB, '', 'Wetbulb', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
+        ddStrs.append(self.writeDDObjStr('Ann Hum_n 99.6% Condns DP=>MCDB', 'WinterDesignDay', coldMonth+1, 21, DBforMinDP, 0, minDP, '', 'Dewpoint', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
+        ddStrs.append(self.writeDDObjStr('Ann Htg Wind 99.6% Condns WS=>MCDB', 'WinterDesignDay', coldMonth+1, 21, coldStdDevTemp, 0, coldStdDevTemp, '', 'Wetbulb', avgEpwParPress, maxWind, coldMonWinDir, 0))
+        
+        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DB=>MWB', 'SummerDesignDay', hotMonth+1, 21, maxDB, hotDayDBTempRange, WBforMaxDB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
+        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns WB=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxWB, hotDayDBTempRange, maxWB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
+        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DP=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxDP, hotDayDBTempRange, maxDP, '', 'Dewpoint', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
+        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns Enth=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxEnth, hotDayDBTempRange, '', maxEnth, 'Enthalpy', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
+        
+        return ddStrs
+    
+    def createDdyFromEPW(self, epwFileAddress, workingDir, lb_preparation, lb_comfortModels):
+        """Write the design days of the epw file to a ddy file in workingDir and return the path to the file.
+        
+        The design days are only calculated if they are not already cached for this epw file.
+        """
+        epwFileName = epwFileAddress.split('\\')[-1].split('.')[0]
+        ddyfile = workingDir + '\\' + epwFileName + '.ddy'
+        
+        cachedDdyFiles = self.getCachedDdyFilePaths(epwFileAddress)
+        for cachedDdyFile in cachedDdyFiles:
+            if os.path.isfile(cachedDdyFile):
+                if os.path.normcase(cachedDdyFile) != os.path.normcase(os.path.abspath(ddyfile)):
+                    shutil.copyfile(cachedDdyFile, ddyfile)
+                return ddyfile
+        
+        # Write the design day objects into a .ddy file.
+        ddyStr = "".join(self.getDesignDayStrs(epwFileAddress, lb_preparation, lb_comfortModels))
+        with open(ddyfile, "w") as ddyFile:
+            ddyFile.write(ddyStr)
+        
+        # cache the ddy file next to the epw or in the cache folder
+        for cachedDdyFile in cachedDdyFiles:
+            try:
+                if not os.path.isdir(os.path.dirname(cachedDdyFile)):
+                    os.makedirs(os.path.dirname(cachedDdyFile))
+                shutil.copyfile(ddyfile, cachedDdyFile)
+                break
+            except (IOError, OSError):
+                continue
+        
+        return ddyfile
+
+
 class hb_WriteRAD(object):
     
     def __init__(self, component = ghenv.Component):
@@ -1623,6 +3149,33 @@ class hb_WriteRAD(object):
         self.hb_DSLibPath = hb_folders["DSLibPath"]
         
         
+    def getSceneState(self, HBObjects, analysisRecipe, meshParameters, exportInteriorWalls):
+        """md5 hash of the Honeybee objects, the RAD material library and the export settings.
+        
+        Objects get a new ID every time the component that generates them runs, so the
+        ID and the values of the objects together with their bounding box change if the
+        scene changes.
+        """
+        sceneState = hashlib.md5()
+        sceneState.update("%r;%r;%r;" % (analysisRecipe.type, getattr(analysisRecipe, "northDegrees", 0), bool(exportInteriorWalls)))
+        for parameter in ("GridMinCount", "GridMaxCount", "GridAngle", "GridAspectRatio", "GridAmplification", \
+                          "MaximumEdgeLength", "MinimumEdgeLength", "Tolerance", "MinimumTolerance", \
+                          "RelativeTolerance", "SimplePlanes", "RefineGrid", "JaggedSeams"):
+            sceneState.update("%s=%r;" % (parameter, getattr(meshParameters, parameter, None)))
+        
+        for HBObj in HBObjects:
+            sceneState.update(sc.sticky["honeybee_Hive"].getObjectState(HBObj))
+            geometry = getattr(HBObj, "geometry", None)
+            if geometry != None:
+                bbox = geometry.GetBoundingBox(True)
+                sceneState.update("%s;%s;" % (bbox.Min, bbox.Max))
+        
+        materialLibrary = self.hb_RADMaterialAUX.radMaterialLibrary
+        for materialName in sorted(materialLibrary.keys()):
+            sceneState.update(materialName + ":" + materialLibrary[materialName].toRadString())
+        
+        return sceneState.hexdigest()
+    
     def writeRADAndMaterialFiles(self, originalHBObjects, subWorkingDir, radFileName, \
                                  analysisRecipe, meshParameters, exportInteriorWalls):
         
@@ -1640,6 +3193,7 @@ class hb_WriteRAD(object):
         simulationType = analysisRecipe.type
         
         radFileFullName = os.path.join(subWorkingDir, radFileName + '.rad')
+        materialFileName = subWorkingDir + "\\material_" + radFileName + '.rad'
         
         IESObjects = {}
         IESCount = 0    
@@ -1647,129 +3201,8 @@ class hb_WriteRAD(object):
         hb_hive = sc.sticky["honeybee_Hive"]()
         HBObjects = hb_hive.callFromHoneybeeHive(originalHBObjects)
         
-        geoRadFile = open(radFileFullName, 'w')
-        geoRadFile.write("#GENERATED BY HONEYBEE\n")
-        customRADMat = {} # dictionary to collect the custom material names
-        customMixFunRadMat = {} # dictionary to collect the custom mixfunc material names
-        surfaceList = []
-        rotateObjects = False
-        if len(HBObjects)!=0:
-            # if this is an annual analysis and north is not 0 rotate all Honeybee objects
-            if analysisRecipe.type == 2 and analysisRecipe.northDegrees!=0:
-                print "Rotating the scene for %d degrees"%analysisRecipe.northDegrees
-                
-                transform = rc.Geometry.Transform.Rotation(math.radians(analysisRecipe.northDegrees), \
-                            rc.Geometry.Point3d.Origin)
-                rotateObjects = True
-            
-            for objCount, HBObj in enumerate(HBObjects):
-                
-                if rotateObjects: HBObj.transform(transform, None, False)
-                
-                # check if the object is zone or a surface (?)
-                if HBObj.objectType == "HBZone":
-                    if HBObj.hasNonPlanarSrf or HBObj.hasInternalEdge:
-                        HBObj.prepareNonPlanarZone(meshParameters)
-                    
-                    for srf in HBObj.surfaces:
-                        # check if an interior wall
-                        if not exportInteriorWalls and self.hb_writeRADAUX.isSrfAirWall(srf):
-                            continue
-                        
-                        # if it is an interior wall and the other wall is already written
-                        # then don't write this wall
-                        if self.hb_writeRADAUX.isSrfInterior(srf) and srf.BCObject.name in surfaceList:
-                            continue
-                        
-                        surfaceList.append(srf.name)
-                        
-                        # collect the custom material informations
-                        if srf.RadMaterial!=None:
-                            customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(srf, customRADMat, customMixFunRadMat)
-                        # write the surfaces
-                        if srf.isPlanar and len(srf.childSrfs)<2:
-                            geoRadFile.write(self.RADSurface(srf))
-                        else:
-                            geoRadFile.write(self.RADNonPlanarSurface(srf))
-                        
-                        if srf.hasChild:
-                            # collect the custom material informations
-                            for childSrf in srf.childSrfs:
-                                
-                                if childSrf.RadMaterial!=None:
-                                    customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(childSrf, customRADMat, customMixFunRadMat)
-                            
-                            if not srf.isPlanar or len(srf.childSrfs) > 1:
-                                geoRadFile.write(self.RADNonPlanarChildSurface(srf))
-                            
-                            
-                elif HBObj.objectType == "HBSurface":
-                    
-                    # I should wrap this in a function as I'm using it multiple times with minor changes
-                    # collect the custom material informations
-                    if HBObj.RadMaterial!=None:
-                        try:
-                            customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(HBObj, customRADMat, customMixFunRadMat)
-                        except:
-                            msg = HBObj.RadMaterial + " is not defined in the material library! Add the material to library and try again."
-                            print msg
-                            self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
-                            return -1
-                            
-                    # check for material in child surfaces
-                    if not HBObj.isChild and HBObj.hasChild:
-                        # collect the custom material informations
-                        for childSrf in HBObj.childSrfs:
-                            if childSrf.RadMaterial!=None:
-                                try:
-                                    customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(childSrf, customRADMat, customMixFunRadMat)
-                                except:
-                                    msg = childSrf.RadMaterial + " is not defined in the material library! Add the material to library and try again."
-                                    print msg
-                                    self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
-                                    return -1                    
-
-                    if HBObj.isPlanar and (not HBObj.isChild and len(HBObj.childSrfs)<2):
-                        # check for rad material
-                        geoRadFile.write(self.RADSurface(HBObj))
-                    else:
-                        geoRadFile.write(self.RADNonPlanarSurface(HBObj))
-                        if not HBObj.isChild and HBObj.hasChild:
-                            geoRadFile.write(self.RADNonPlanarChildSurface(HBObj))
-                
-                elif HBObj.objectType == "HBIES":
-                    IESCount += 1
-                    IESObjcIsFine = True
-                    # check if the object has been move or scaled
-                    if HBObj.checkIfScaledOrRotated(originalHBObjects[objCount]):
-                        IESObjcIsFine = False
-                        msg = "IES luminaire " + HBObj.name + " is scaled or rotated" + \
-                              " and cannot be added to the scene."
-                        print msg
-                        self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
-                    
-                    # check if the material name is already exist
-                    if HBObj.name in customRADMat.keys():
-                        IESObjcIsFine = False
-                        msg = "IES luminaire " + HBObj.name + " cannot be added to the scene.\n" + \
-                                  "A material with the same name already exist."
-                        print msg
-                        self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
-                    
-                    # if it is all fine then write the geometry
-                    if IESObjcIsFine:
-                        IESName = HBObj.name + "_" + str(IESCount)
-                        geoRadFile.write( HBObj.getRADGeometryStr(IESName, originalHBObjects[objCount]))
-                        # downlight_light polygon downlight.d
-                        # add to IES Objects list so I can add the materials to the list later
-                        if HBObj.name not in IESObjects.keys():
-                            IESObjects[HBObj.name] = HBObj
-                    
-        geoRadFile.close()
-        
         ########################################################################
         ######################## GENERATE THE BASE RAD FILE ####################
-        materialFileName = subWorkingDir + "\\material_" + radFileName + '.rad'
         # This part should be fully replaced with the new method where I generate the materials from the 
         
         # 0.1 material string
@@ -1784,14 +3217,151 @@ class hb_WriteRAD(object):
             self.hb_RADMaterialAUX.getRADMaterialString('Exterior_Wall') + "\n" + \
             self.hb_RADMaterialAUX.getRADMaterialString('Interior_Wall') + "\n" + \
             "# end of generic materials definition(s)\n"
-    
-        with open(materialFileName, 'w') as matFile:
-            matFile.write(matStr)
-            matFile.write("\n# start of material(s) specific to this study (if any)\n")
+        
+        # hash the objects and the materials before generating the rad strings and
+        # only export the scene if it has changed so the frozen octree can be reused
+        sceneStateFile = os.path.join(subWorkingDir, radFileName + '.scn')
+        sceneState = self.getSceneState(HBObjects, analysisRecipe, meshParameters, exportInteriorWalls)
+        isSceneReady, sceneSt = self.hb_writeRADAUX.readSceneState(sceneStateFile, sceneState, \
+                                                                   [radFileFullName, materialFileName])
+        
+        if isSceneReady:
+            print "Geometry and materials have not changed. Reusing " + radFileFullName
+            if sceneSt != None and sceneSt < radParameters["_st_"]:
+                print "Found a trans material... " + \
+                      "Resetting st parameter from " + str(radParameters["_st_"]) + " to " + str(sceneSt)
+                radParameters["_st_"] = sceneSt
+        else:
+            if os.path.isfile(sceneStateFile): os.remove(sceneStateFile)
+            sceneSt = None
+            
+            # collect the geometry
+            geoRadFile = ["#GENERATED BY HONEYBEE\n"]
+            customRADMat = {} # dictionary to collect the custom material names
+            customMixFunRadMat = {} # dictionary to collect the custom mixfunc material names
+            surfaceList = set()
+            rotateObjects = False
+            if len(HBObjects)!=0:
+                # if this is an annual analysis and north is not 0 rotate all Honeybee objects
+                if analysisRecipe.type == 2 and analysisRecipe.northDegrees!=0:
+                    print "Rotating the scene for %d degrees"%analysisRecipe.northDegrees
+                    
+                    transform = rc.Geometry.Transform.Rotation(math.radians(analysisRecipe.northDegrees), \
+                                rc.Geometry.Point3d.Origin)
+                    rotateObjects = True
+                
+                for objCount, HBObj in enumerate(HBObjects):
+                    
+                    if rotateObjects: HBObj.transform(transform, None, False)
+                    
+                    # check if the object is zone or a surface (?)
+                    if HBObj.objectType == "HBZone":
+                        if HBObj.hasNonPlanarSrf or HBObj.hasInternalEdge:
+                            HBObj.prepareNonPlanarZone(meshParameters)
+                        
+                        for srf in HBObj.surfaces:
+                            # check if an interior wall
+                            if not exportInteriorWalls and self.hb_writeRADAUX.isSrfAirWall(srf):
+                                continue
+                            
+                            # if it is an interior wall and the other wall is already written
+                            # then don't write this wall
+                            if self.hb_writeRADAUX.isSrfInterior(srf) and srf.BCObject.name in surfaceList:
+                                continue
+                            
+                            surfaceList.add(srf.name)
+                            
+                            # collect the custom material informations
+                            if srf.RadMaterial!=None:
+                                customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(srf, customRADMat, customMixFunRadMat)
+                            # write the surfaces
+                            if srf.isPlanar and len(srf.childSrfs)<2:
+                                geoRadFile.append(self.RADSurface(srf))
+                            else:
+                                geoRadFile.append(self.RADNonPlanarSurface(srf))
+                            
+                            if srf.hasChild:
+                                # collect the custom material informations
+                                for childSrf in srf.childSrfs:
+                                    
+                                    if childSrf.RadMaterial!=None:
+                                        customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(childSrf, customRADMat, customMixFunRadMat)
+                                
+                                if not srf.isPlanar or len(srf.childSrfs) > 1:
+                                    geoRadFile.append(self.RADNonPlanarChildSurface(srf))
+                                
+                                
+                    elif HBObj.objectType == "HBSurface":
+                        
+                        # I should wrap this in a function as I'm using it multiple times with minor changes
+                        # collect the custom material informations
+                        if HBObj.RadMaterial!=None:
+                            try:
+                                customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(HBObj, customRADMat, customMixFunRadMat)
+                            except:
+                                msg = HBObj.RadMaterial + " is not defined in the material library! Add the material to library and try again."
+                                print msg
+                                self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
+                                return -1
+                                
+                        # check for material in child surfaces
+                        if not HBObj.isChild and HBObj.hasChild:
+                            # collect the custom material informations
+                            for childSrf in HBObj.childSrfs:
+                                if childSrf.RadMaterial!=None:
+                                    try:
+                                        customRADMat, customMixFunRadMat = self.hb_RADMaterialAUX.addRADMatToDocumentDict(childSrf, customRADMat, customMixFunRadMat)
+                                    except:
+                                        msg = childSrf.RadMaterial + " is not defined in the material library! Add the material to library and try again."
+                                        print msg
+                                        self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
+                                        return -1                    
+
+                        if HBObj.isPlanar and (not HBObj.isChild and len(HBObj.childSrfs)<2):
+                            # check for rad material
+                            geoRadFile.append(self.RADSurface(HBObj))
+                        else:
+                            geoRadFile.append(self.RADNonPlanarSurface(HBObj))
+                            if not HBObj.isChild and HBObj.hasChild:
+                                geoRadFile.append(self.RADNonPlanarChildSurface(HBObj))
+                    
+                    elif HBObj.objectType == "HBIES":
+                        IESCount += 1
+                        IESObjcIsFine = True
+                        # check if the object has been move or scaled
+                        if HBObj.checkIfScaledOrRotated(originalHBObjects[objCount]):
+                            IESObjcIsFine = False
+                            msg = "IES luminaire " + HBObj.name + " is scaled or rotated" + \
+                                  " and cannot be added to the scene."
+                            print msg
+                            self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
+                        
+                        # check if the material name is already exist
+                        if HBObj.name in customRADMat.keys():
+                            IESObjcIsFine = False
+                            msg = "IES luminaire " + HBObj.name + " cannot be added to the scene.\n" + \
+                                      "A material with the same name already exist."
+                            print msg
+                            self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
+                        
+                        # if it is all fine then write the geometry
+                        if IESObjcIsFine:
+                            IESName = HBObj.name + "_" + str(IESCount)
+                            geoRadFile.append( HBObj.getRADGeometryStr(IESName, originalHBObjects[objCount]))
+                            # downlight_light polygon downlight.d
+                            # add to IES Objects list so I can add the materials to the list later
+                            if HBObj.name not in IESObjects.keys():
+                                IESObjects[HBObj.name] = HBObj
+                        
+            self.hb_writeRADAUX.writeFileIfChanged(radFileFullName, "".join(geoRadFile))
+            
+            
+            matFile = [matStr]
+            matFile.append("\n# start of material(s) specific to this study (if any)\n")
             for radMatName in customRADMat.keys():
                 
                 try:
-                    matFile.write(self.hb_RADMaterialAUX.getRADMaterialString(radMatName) + "\n")
+                    matFile.append(self.hb_RADMaterialAUX.getRADMaterialString(radMatName) + "\n")
                 except:
                     # This is the case for void material
                     pass
@@ -1801,6 +3371,8 @@ class hb_WriteRAD(object):
                     # get the st value
                     st = self.hb_RADMaterialAUX.getSTForTransMaterials(radMatName)
 
+                    if sceneSt == None or st < sceneSt: sceneSt = st
+                    
                     if st < radParameters["_st_"]:
                         print "Found a trans material... " + \
                               "Resetting st parameter from " + str(radParameters["_st_"]) + " to " + str(st)
@@ -1808,21 +3380,26 @@ class hb_WriteRAD(object):
                     
             # write mixedfun if any
             for radMatName in customMixFunRadMat.keys():
-                matFile.write(self.hb_RADMaterialAUX.getRADMaterialString(radMatName) + "\n")
+                matFile.append(self.hb_RADMaterialAUX.getRADMaterialString(radMatName) + "\n")
             
             # write IES material if any
             if len(IESObjects.keys())!= 0:
                 for IESName in IESObjects.keys():
                     IESObj = IESObjects[IESName]
                     # write material file
-                    matFile.write(IESObj.materialStr)
+                    matFile.append(IESObj.materialStr)
                     
                     # add dat file to folder
                     datFileName = subWorkingDir + "\\" + IESName + '.dat'
                     with open(datFileName, "w") as outDat:
                         outDat.write(IESObj.datFile)
                     
-            matFile.write("# end of material(s) specific to this study (if any)\n")
+            matFile.append("# end of material(s) specific to this study (if any)\n")
+            self.hb_writeRADAUX.writeFileIfChanged(materialFileName, "".join(matFile))
+            
+            # IES luminaires write their own dat files so these scenes are always exported
+            if len(IESObjects) == 0:
+                self.hb_writeRADAUX.writeSceneState(sceneStateFile, sceneState, sceneSt)
     
         
         # export dayism shading geometries as radFiles
@@ -1920,21 +3497,28 @@ class hb_WriteRAD(object):
         numOfPoints = len(flattenTestPoints)
     
         if numOfCPUs > numOfPoints: numOfCPUs = numOfPoints
-
-        if numOfCPUs > 1:
-            ptsEachCpu = int(numOfPoints/(numOfCPUs))
-            remainder = numOfPoints%numOfCPUs
-        else:		
-            ptsEachCpu = numOfPoints		
-            remainder = 0
-    
-        lenOfPts = []
         
-        for cpuCount in range(numOfCPUs):		
-            if cpuCount < remainder:		
-                lenOfPts.append(ptsEachCpu+1)		
-            else:		
-                lenOfPts.append(ptsEachCpu)
+        # grid-based studies are striped between the CPUs so neighbouring
+        # points with similar cost (e.g. a deep room behind a complex facade)
+        # don't all end up in the same rtrace run. Annual studies stay in
+        # contiguous chunks since Daysim results are merged per CPU.
+        if analysisRecipe.type == 2:
+            pointsEachCPU = self.partitionTestPoints(numOfPoints, numOfCPUs, striped = False)
+        else:
+            pointsEachCPU = self.partitionTestPoints(numOfPoints, numOfCPUs)
+        
+        lenOfPts = [len(ptIndices) for ptIndices in pointsEachCPU]
+        
+        # write the order of the points so the results can be put back in the
+        # original order. Remove the file from older runs for contiguous chunks
+        ptmFileName = os.path.join(subWorkingDir, radFileName + '.ptm')
+        pointOrder = [ptCount for ptCount in self.lb_preparation.flattenList(pointsEachCPU)]
+        if pointOrder != range(numOfPoints):
+            with open(ptmFileName, "w") as ptmFile:
+                for ptCount in pointOrder:
+                    ptmFile.write(str(ptCount) + ", ")
+        elif os.path.isfile(ptmFileName):
+            os.remove(ptmFileName)
         
         testPtsEachCPU = []
         
@@ -1945,7 +3529,7 @@ class hb_WriteRAD(object):
             
             ptsFile = open(ptsFileName, "w")
 
-            for ptCount in range(sum(lenOfPts[:cpuCount]), sum(lenOfPts[:cpuCount+1])):
+            for ptCount in pointsEachCPU[cpuCount]:
                 ptsFile.write(self.hb_writeRADAUX.testPtsStr(flattenTestPoints[ptCount], flattenPtsNormals[ptCount]))
                 ptsForThisCPU.append(flattenTestPoints[ptCount])
 
@@ -1955,6 +3539,29 @@ class hb_WriteRAD(object):
             
         return testPtsEachCPU, lenOfPts
     
+    def partitionTestPoints(self, numOfPoints, numOfCPUs, striped = True):
+        """
+        Split test points between CPUs and return the list of point indices for each CPU.
+        
+        striped: if True points are assigned round-robin, otherwise in contiguous chunks.
+        """
+        if numOfCPUs < 1: numOfCPUs = 1
+        
+        if striped:
+            pointsEachCPU = [range(cpuCount, numOfPoints, numOfCPUs) \
+                             for cpuCount in range(numOfCPUs)]
+        
+        else:
+            ptsEachCpu, remainder = divmod(numOfPoints, numOfCPUs)
+            pointsEachCPU = []
+            startPt = 0
+            for cpuCount in range(numOfCPUs):
+                endPt = startPt + ptsEachCpu + (cpuCount < remainder)
+                pointsEachCPU.append(range(startPt, endPt))
+                startPt = endPt
+        
+        return pointsEachCPU
+    
     def writeBatchFiles(self, subWorkingDir, radFileName, radSkyFileName, \
                         radFileFullName, materialFileName, \
                         numOfCPUs, testPtsEachCPU, \
@@ -2136,15 +3743,17 @@ class hb_WriteRAD(object):
             
             # write OCT file
             # 3.2. oconv line
-            sceneRadFiles = [materialFileName, radSkyFileName, radFileFullName]
+            # the sky is added to a frozen octree of the scene which is reused if the scene hasn't changed
+            sceneRadFiles = [materialFileName, radFileFullName]
             
             if additionalRadFiles:
                 for additionalFile in additionalRadFiles:
                     if additionalFile!=None:
                         sceneRadFiles.append(additionalFile)
-                
-            OCTLine = self.hb_writeRADAUX.oconvLine(OCTFileName, sceneRadFiles)
-            if readyOCTFile ==None: batchFile.write(OCTLine)
+            
+            if readyOCTFile ==None:
+                OCTLine = self.hb_writeRADAUX.incrementalOconvLines(OCTFileName, sceneRadFiles, [radSkyFileName], subWorkingDir)
+                batchFile.write(OCTLine)
             
             if analysisRecipe.type == 0:
                 # add overture line in case it is an image-based analysis
@@ -2270,48 +3879,27 @@ class hb_WriteRAD(object):
                 batchFileNames: List of batch files
                 maxPRuns: max number of files to be ran in parallel (default = 0)
                 shell: set to True if you do NOT want to see the cmd window while the analysis is runnig
+                waitingTime: Not used anymore. The next batch file is executed as soon as a running one is done.
+            Returns:
+                A list of hb_Job objects with exit code, stderr and wall time of each batch file.
         """
-    
-        if not maxPRuns : maxPRuns = 1
-        maxPRuns = int(maxPRuns)
-        total = len(batchFileNames)
-        
-        if maxPRuns < 1: maxPRuns = 1
-        if maxPRuns > total: maxPRuns = total
-        
-        running = 0
-        done = False
-        jobs = []
-        pid = 0
         
+        pool = hb_ProcessPool(maxPRuns, shell = shell,
+                              cancelCallback = gh.GH_Document.IsEscapeKeyDown)
         try:
-            while not done:
-                if running < maxPRuns and pid < total:
-                    # execute the files
-                    jobs.append(subprocess.Popen(batchFileNames[pid].replace("\\", "/") , shell = shell))
-                    pid+=1
-                    time.sleep(waitingTime)
-                
-                # count how many jobs are running and how many are done
-                running = 0
-                finished = 0
-                for job in jobs:
-                    if job.poll() is None:
-                        #one job is still running
-                        running += 1
-                    else:
-                        finished += 1
-        
-                if running == maxPRuns:
-                    # wait for half a second
-                    #print "waiting..."
-                    time.sleep(waitingTime)
+            jobs = pool.run(batchFileNames)
+        except Exception, e:
+            pool.cancel()
+            print "Something went wrong: %s"%str(e)
+            return []
         
-                if finished ==  total:
-                    done = True
+        failedJobs = [job for job in jobs if not job.succeeded]
+        if pool.cancelled:
+            print "The analysis is cancelled by the user."
+        elif failedJobs:
+            print "Some of the batch files failed to run:\n" + pool.report(failedJobs)
         
-        except Exception, e:
-            print "Something went wrong: %s"%str(e) 
+        return jobs
     
     def runBatchFiles(self, initBatchFileName, batchFileNames, fileNames, \
                       pcompBatchFile, waitingTime, runInBackground = False):
@@ -2320,8 +3908,16 @@ class hb_WriteRAD(object):
         self.executeBatchFiles(batchFileNames, maxPRuns = len(batchFileNames), shell = runInBackground, waitingTime = waitingTime)
         
         if pcompBatchFile!="":
-            os.system(pcompBatchFile) # put all the files together
+            # put all the files together
+            self.executeBatchFiles([pcompBatchFile], maxPRuns = 1, shell = runInBackground, waitingTime = waitingTime)
         
+    def getShadingStateFromIllFile(self, illFile, radFileName):
+        """Return shading state of a .ill file (e.g. up, down, groupName_state_1)."""
+        fileName = os.path.splitext(os.path.basename(illFile))[0]
+        stateParts = fileName[len(radFileName) + 1:].split("_")
+        if stateParts[-1] in ("up", "down"): return stateParts[-1]
+        return "_".join(stateParts[:-1])
+    
     def collectResults(self, subWorkingDir, radFileName, numOfCPUs, analysisRecipe, expectedResultFiles):
         
         if analysisRecipe.type == 2:
@@ -2354,6 +3950,15 @@ class hb_WriteRAD(object):
                     numDc == numOfCPUs * numOfIllFiles /2):
                     print "Can't find the results for the study"
                     DSResultFilesAddress = []
+                
+                # write binary copy of .ill files for fast hourly and per sensor access
+                if getattr(analysisRecipe.DSParameters, "writeBinaryIll", False):
+                    for illFile in DSResultFilesAddress:
+                        try:
+                            hb_IllBinaryFile.convert(illFile, \
+                                self.getShadingStateFromIllFile(illFile, radFileName))
+                        except Exception, e:
+                            print "Failed to write binary copy of %s: %s"%(illFile, str(e))
             
             # check for results of annual glare analysis if any
             annualGlareResults = {}
@@ -2723,7 +4328,13 @@ class hb_WriteRADAUX(object):
                     
                     print "Results of the previous study are copied to " + backupFolder
                     
-                self.lb_preparation.nukedir(subWorkingDir, rmdir = False)
+                # keep the scene files so they are only exported again if the scene has changed
+                keepFiles = self.sceneCacheFiles(radFileName)
+                for fileName in os.listdir(subWorkingDir):
+                    if fileName in keepFiles: continue
+                    filePath = os.path.join(subWorkingDir, fileName)
+                    if os.path.isdir(filePath): shutil.rmtree(filePath)
+                    else: os.remove(filePath)
                 
             except Exception, e:
                 print 'Failed to remove the old directory.'
@@ -2809,24 +4420,8 @@ class hb_WriteRADAUX(object):
         elif not os.path.isfile(destinationFullpath): shutil.copyfile(inputFile, destinationFullpath)
     
     def RADLocation(self, epw_file):
-        epwfile = open(epw_file,"r")
-        headline = epwfile.readline()
-        csheadline = headline.split(',')
-        while 1>0: #remove empty cells from the end of the list if any
-            try: float(csheadline[-1]); break
-            except: csheadline.pop()
-        locName = ''
-        for hLine in range(1,4):
-            if csheadline[hLine] != '-':
-                locName = locName + csheadline[hLine].strip() + '_'
-        locName = locName[:-1].strip()
-        lat = csheadline[-4]
-        lngt = csheadline[-3]
-        timeZone = csheadline[-2]
-        elev = csheadline[-1].strip()
-        epwfile.close()
-        
-        return locName, lat, lngt, timeZone, elev
+        # locName, lat, lngt, timeZone, elev
+        return hb_EPWData.fromFile(epw_file).location
     
     def RADRadiationSky(self, projectName):
         return  "# start of sky definition for radiation studies\n" + \
@@ -3022,6 +4617,105 @@ class hb_WriteRADAUX(object):
         
         return line
     
+    def writeFileIfChanged(self, filePath, fileStr):
+        """Write the string to the file only if the content of the file is different.
+        
+        Returns True if the file has been written and False if it was already up to date.
+        """
+        if os.path.isfile(filePath):
+            with open(filePath, "r") as inf:
+                if hashlib.md5(inf.read()).hexdigest() == hashlib.md5(fileStr).hexdigest():
+                    return False
+        
+        tempFilePath = filePath + ".tmp"
+        with open(tempFilePath, "w") as outf:
+            outf.write(fileStr)
+        if os.path.isfile(filePath): os.remove(filePath)
+        os.rename(tempFilePath, filePath)
+        return True
+    
+    def sceneCacheFiles(self, radFileName):
+        """Names of the scene files that are kept when the study folder is cleaned.
+        
+        The files are only rewritten if the scene has changed. See readSceneState
+        and incrementalOconvLines.
+        """
+        fileNames = [radFileName + ".rad", "material_" + radFileName + ".rad", radFileName + ".scn"]
+        for octFileName in (radFileName + "_IMG", radFileName + "_RAD"):
+            fileNames.extend([octFileName + "_scene.oct", octFileName + "_scene.md5"])
+        return fileNames
+    
+    def readSceneState(self, sceneStateFile, sceneState, radFilesList):
+        """Check the scene state against the state that the scene files were written for.
+        
+        Returns:
+            isSceneReady: True if the state matches and all the scene files exist.
+            st: The st value of the trans materials of the scene or None.
+        """
+        if not os.path.isfile(sceneStateFile): return False, None
+        for address in radFilesList:
+            if not os.path.isfile(address): return False, None
+        
+        with open(sceneStateFile, "r") as inf:
+            lines = inf.read().split("\n")
+        
+        if lines[0].strip() != sceneState: return False, None
+        try: return True, float(lines[1])
+        except (IndexError, ValueError): return True, None
+    
+    def writeSceneState(self, sceneStateFile, sceneState, st = None):
+        """Write the scene state once the scene files are written. See readSceneState."""
+        with open(sceneStateFile, "w") as outf:
+            outf.write(sceneState + "\n")
+            if st != None: outf.write(repr(st) + "\n")
+    
+    def sceneHash(self, radFilesList, r = 1024 * 2):
+        """md5 hash of the oconv resolution, the names and the content of the scene files.
+        
+        Returns None if any of the files doesn't exist.
+        """
+        sceneHash = hashlib.md5(str(r))
+        for address in radFilesList:
+            if not os.path.isfile(address): return None
+            sceneHash.update(address)
+            with open(address, "rb") as inf:
+                sceneHash.update(hashlib.md5(inf.read()).digest())
+        return sceneHash.hexdigest()
+    
+    def incrementalOconvLines(self, octFileName, sceneRadFiles, skyRadFiles, subWorkingDir):
+        """oconv lines that add the sky to a frozen octree of the scene.
+        
+        The frozen octree of the scene files (materials and geometry) is kept in the
+        study folder, which keeps it when it is cleaned (see sceneCacheFiles), and is only
+        rebuilt if the content of the scene files has changed. The hash of the scene is
+        written next to the octree once oconv has succeeded.
+        """
+        r = 1024 * 2
+        sceneOctFileName = os.path.join(subWorkingDir, octFileName + "_scene")
+        hashFile = sceneOctFileName + ".md5"
+        
+        sceneHash = self.sceneHash(sceneRadFiles, r)
+        
+        lines = ""
+        isSceneReady = False
+        if sceneHash != None and os.path.isfile(sceneOctFileName + ".oct") and os.path.isfile(hashFile):
+            with open(hashFile, "r") as inf:
+                isSceneReady = inf.read().strip() == sceneHash
+        
+        if not isSceneReady:
+            if os.path.isfile(hashFile): os.remove(hashFile)
+            lines += self.oconvLine(sceneOctFileName, sceneRadFiles)
+            if sceneHash != None:
+                lines += "if not errorlevel 1 echo " + sceneHash + "> " + hashFile + "\n"
+        else:
+            print "Geometry and materials have not changed. Reusing " + sceneOctFileName + ".oct"
+        
+        skyFiles = ""
+        for address in skyRadFiles: skyFiles = skyFiles + address.replace("\\" , "/") + " "
+        lines += "oconv -f -i " + sceneOctFileName.replace("\\" , "/") + ".oct " + skyFiles + "> " + octFileName + ".oct\n"
+        
+        return lines
+    
     def overtureLine(self, view, projectName, viewName, radParameters, analysisType = 0):
         octFile = projectName + ".oct"
         ambFile = projectName + ".amb" #amb file is view independent and can be used globally
@@ -3553,6 +5247,553 @@ class hb_ReadAnnualResultsAux(object):
         
         return illFiles
 
+class hb_AnnualDaylightMetrics(object):
+    """
+    Calculate annual daylight metrics from Daysim .ill files.
+    
+    .ill files of the same study (one for each CPU) are read together row by row
+    and sensor values are concatenated in the order of the files. Unoccupied hours
+    are skipped before the values are parsed. Occupied rows are collected in blocks
+    of at most maxBlockValues values and each block is sorted per sensor so all the
+    thresholds are counted with a couple of bisections. Memory for the block is
+    independent of the number of sensors.
+    
+    Args:
+        illFiles: List of .ill files for the same shading state sorted by CPU.
+        occupancy: Optional Daysim occupancy file (*.csv), or a list of values
+            for each timestep. Timesteps with values larger than 0 are occupied.
+            Hourly values are expanded to the timestep of sub-hourly .ill files.
+            Default is all the timesteps.
+    
+    Usage:
+        metrics = hb_AnnualDaylightMetrics(illFiles, occFile)
+        DA, cDA, UDILess, UDIInRange, UDIMore = metrics.calculateMetrics(300)
+        sDA = metrics.getsDA(DA)
+    """
+    
+    maxBlockValues = 2097152
+    
+    def __init__(self, illFiles, occupancy = None):
+        self.illFiles = illFiles
+        if isinstance(occupancy, str):
+            occupancy = self.readOccupancyFile(occupancy)
+        self.occupancy = occupancy
+        self.occupiedHours = 0
+        self.sensorCount = 0
+    
+    @staticmethod
+    def readOccupancyFile(occFile):
+        """Read a Daysim occupancy file and return a list of True/False for each timestep."""
+        occupancy = []
+        with open(occFile, "r") as occInf:
+            for line in occInf:
+                if line.startswith("#") or not line.strip(): continue
+                occupancy.append(float(line.split(",")[3]) > 0)
+        return occupancy
+    
+    def getStepsPerHour(self):
+        """Number of .ill rows for each hour. Only the first two rows of the file are read."""
+        with open(self.illFiles[0], "r") as illInf:
+            hours = []
+            for line in illInf:
+                if not line.strip(): continue
+                # the first 3 values are month, day and hour
+                hours.append(float(line.split()[2]))
+                if len(hours) == 2: break
+        
+        if len(hours) < 2 or hours[1] <= hours[0]: return 1
+        return max(1, int(round(1 / (hours[1] - hours[0]))))
+    
+    def getOccupancyStep(self):
+        """Number of .ill rows for each value of the occupancy."""
+        if self.occupancy == None or len(self.occupancy) == 0: return 1
+        stepsPerHour = self.getStepsPerHour()
+        # hourly occupancy values for sub-hourly .ill files
+        if stepsPerHour > 1 and len(self.occupancy) < 8760 * stepsPerHour:
+            return stepsPerHour
+        return 1
+    
+    def isOccupied(self, hourCount):
+        if self.occupancy == None: return True
+        try: return bool(self.occupancy[hourCount])
+        except IndexError: return False
+    
+    def iterLines(self):
+        """Yield the lines of all the .ill files for each timestep."""
+        illFiles = [open(illFile, "r") for illFile in self.illFiles]
+        
+        try:
+            while True:
+                lines = [illFile.readline() for illFile in illFiles]
+                if not lines[0].strip(): break
+                yield lines
+        
+        finally:
+            for illFile in illFiles: illFile.close()
+    
+    def splitBySpace(self, pointCounts, spaceIllFiles):
+        """
+        Write the values of the .ill files to a separate .ill file for each space.
+        
+        Args:
+            pointCounts: Number of sensors in each space in the order of the sensors.
+            spaceIllFiles: Path to the new .ill file for each space.
+        """
+        bounds = []
+        start = 0
+        for pointCount in pointCounts:
+            bounds.append((start, start + pointCount))
+            start += pointCount
+        
+        spaceFiles = [open(illFile, "w") for illFile in spaceIllFiles]
+        
+        try:
+            for lines in self.iterLines():
+                # the first 3 values are month, day and hour
+                dateInfo = lines[0].split()[:3]
+                values = []
+                for line in lines:
+                    values.extend(line.split()[3:])
+                
+                # Daysim separates the date and the values with two spaces
+                dateStr = " ".join(dateInfo) + "  "
+                for spaceFile, (st, end) in itertools.izip(spaceFiles, bounds):
+                    spaceFile.write(dateStr + " ".join(values[st:end]) + "\n")
+        
+        finally:
+            for spaceFile in spaceFiles: spaceFile.close()
+    
+    def iterBlocks(self):
+        """Yield blocks of occupied rows. Each row is a list of values for all the sensors."""
+        occupancyStep = self.getOccupancyStep()
+        block = []
+        blockRows = None
+        self.occupiedHours = 0
+        for hourCount, lines in enumerate(self.iterLines()):
+            if not self.isOccupied(hourCount // occupancyStep): continue
+            
+            # the first 3 values are month, day and hour
+            row = []
+            for line in lines:
+                row.extend(map(float, line.split()[3:]))
+            
+            if blockRows == None:
+                self.sensorCount = len(row)
+                blockRows = max(1, self.maxBlockValues // max(1, self.sensorCount))
+            
+            block.append(row)
+            self.occupiedHours += 1
+            
+            if len(block) == blockRows:
+                yield block
+                block = []
+        
+        if block: yield block
+    
+    def countHours(self, thresholds, cDAThreshold = None):
+        """
+        Count number of occupied hours for each sensor against a list of thresholds.
+        
+        Returns:
+            lessThan: List of counts of hours less than each threshold.
+            lessOrEqual: List of counts of hours less than or equal to each threshold.
+            partialHours: Sum of value/cDAThreshold for hours less than cDAThreshold
+                for each sensor. Empty list if cDAThreshold is None.
+        """
+        lessThan = [None] * len(thresholds)
+        lessOrEqual = [None] * len(thresholds)
+        partialHours = None
+        
+        for block in self.iterBlocks():
+            if lessThan[0] == None:
+                for count in range(len(thresholds)):
+                    lessThan[count] = array('d', [0]) * self.sensorCount
+                    lessOrEqual[count] = array('d', [0]) * self.sensorCount
+                if cDAThreshold != None:
+                    partialHours = array('d', [0]) * self.sensorCount
+            
+            for sensorCount, values in enumerate(itertools.izip(*block)):
+                values = sorted(values)
+                for count, threshold in enumerate(thresholds):
+                    lessThan[count][sensorCount] += bisect.bisect_left(values, threshold)
+                    lessOrEqual[count][sensorCount] += bisect.bisect_right(values, threshold)
+                
+                if cDAThreshold != None:
+                    partialHours[sensorCount] += \
+                        sum(values[:bisect.bisect_left(values, cDAThreshold)]) / cDAThreshold
+        
+        if lessThan[0] == None:
+            # no occupied hours
+            lessThan = [[] for threshold in thresholds]
+            lessOrEqual = [[] for threshold in thresholds]
+        
+        return lessThan, lessOrEqual, partialHours or []
+    
+    def calculateMetrics(self, DAThreshold = 300, UDIMin = 100, UDIMax = 2000):
+        """
+        Calculate Daylight Autonomy, continuous Daylight Autonomy and Useful Daylight
+        Illuminance for each sensor as percentage of the occupied hours.
+        """
+        lessThan, lessOrEqual, partialHours = \
+            self.countHours([DAThreshold, UDIMin, UDIMax], DAThreshold)
+        
+        if self.occupiedHours == 0: return [], [], [], [], []
+        
+        toPercent = 100.0 / self.occupiedHours
+        hours = self.occupiedHours
+        
+        DA = [(hours - count) * toPercent for count in lessThan[0]]
+        cDA = [d + partial * toPercent for d, partial in zip(DA, partialHours)]
+        UDILess = [count * toPercent for count in lessThan[1]]
+        UDIMore = [(hours - count) * toPercent for count in lessOrEqual[2]]
+        UDIInRange = [100 - less - more for less, more in zip(UDILess, UDIMore)]
+        
+        return DA, cDA, UDILess, UDIInRange, UDIMore
+    
+    def calculateASE(self, threshold = 1000, hours = 250):
+        """
+        Calculate Annual Sunlight Exposure. The .ill files should only include direct sunlight.
+        
+        Returns:
+            ASE: Percentage of sensors that receive more than threshold for more than hours.
+            hoursOver: Number of occupied hours over the threshold for each sensor.
+        """
+        lessThan, lessOrEqual, partialHours = self.countHours([threshold])
+        hoursOver = [int(self.occupiedHours - count) for count in lessOrEqual[0]]
+        
+        if not hoursOver: return 0, []
+        
+        exposed = len([h for h in hoursOver if h > hours])
+        return 100.0 * exposed / len(hoursOver), hoursOver
+    
+    @staticmethod
+    def getsDA(DA, threshold = 50):
+        """Calculate Spatial Daylight Autonomy as percentage of sensors with DA >= threshold."""
+        if len(DA) == 0: return 0
+        return 100.0 * len([d for d in DA if d >= threshold]) / len(DA)
+
+class hb_IllBinaryFile(object):
+    """
+    Compact binary copy of a Daysim .ill file for fast random access.
+    
+    The file starts with a header (sensor count, number of hours and the shading
+    state) followed by float32 values for all the sensors hour by hour. Hourly
+    values are read with a single read and sensor values are read with a seek and
+    a read for each hour so only the values of the sensor are read from the disk.
+    
+    Args:
+        filePath: Path to the binary file (*.illb).
+    
+    Usage:
+        illb = hb_IllBinaryFile.fromIllFile(illFile)
+        sensorValues = illb.readSensor(12)
+        hourlyValues = illb.readHour(4000)
+    """
+    
+    magic = "HBILL"
+    version = 1
+    headerFormat = "<5sBII32s"
+    headerSize = struct.calcsize(headerFormat)
+    valueSize = struct.calcsize("<f")
+    
+    def __init__(self, filePath):
+        self.filePath = filePath
+        
+        with open(filePath, "rb") as illbFile:
+            header = illbFile.read(self.headerSize)
+        
+        if len(header) != self.headerSize:
+            raise ValueError("%s is not a valid binary .ill file."%filePath)
+        
+        magic, version, self.sensorCount, self.hourCount, shadingState = \
+            struct.unpack(self.headerFormat, header)
+        
+        if magic != self.magic or version != self.version:
+            raise ValueError("%s is not a valid binary .ill file."%filePath)
+        
+        self.shadingState = shadingState.rstrip("\0")
+    
+    @staticmethod
+    def getBinaryFilePath(illFile):
+        return os.path.splitext(illFile)[0] + ".illb"
+    
+    @classmethod
+    def convert(cls, illFile, shadingState = ""):
+        """Write the binary copy of a .ill file and return it as a hb_IllBinaryFile."""
+        illbFilePath = cls.getBinaryFilePath(illFile)
+        tempFilePath = illbFilePath + ".tmp"
+        
+        sensorCount = None
+        hourCount = 0
+        with open(illFile, "r") as illInf:
+            with open(tempFilePath, "wb") as illbFile:
+                # the header will be re-written once the number of hours is known
+                illbFile.write("\0" * cls.headerSize)
+                
+                for line in illInf:
+                    if line.startswith("#") or not line.strip(): continue
+                    
+                    # the first 3 values are month, day and hour
+                    values = array('f', map(float, line.split()[3:]))
+                    
+                    if sensorCount == None:
+                        sensorCount = len(values)
+                    elif len(values) != sensorCount:
+                        raise ValueError("Number of values at line %d of %s doesn't match the first line." \
+                                         %(hourCount + 1, illFile))
+                    
+                    if sys.byteorder != "little": values.byteswap()
+                    values.tofile(illbFile)
+                    hourCount += 1
+                
+                illbFile.seek(0)
+                illbFile.write(struct.pack(cls.headerFormat, cls.magic, cls.version, \
+                               sensorCount or 0, hourCount, str(shadingState)[:32]))
+        
+        if os.path.isfile(illbFilePath): os.remove(illbFilePath)
+        os.rename(tempFilePath, illbFilePath)
+        
+        return cls(illbFilePath)
+    
+    @classmethod
+    def fromIllFile(cls, illFile, convert = True):
+        """
+        Return the binary copy of a .ill file. Binary files which are older than the
+        .ill file are re-written. Return None if there is no binary file and convert
+        is False.
+        """
+        illbFilePath = cls.getBinaryFilePath(illFile)
+        
+        if os.path.isfile(illbFilePath) and \
+           os.path.getmtime(illbFilePath) >= os.path.getmtime(illFile):
+            try: return cls(illbFilePath)
+            except ValueError: pass
+        
+        if convert: return cls.convert(illFile)
+    
+    def readValues(self, illbFile, count):
+        return self.toValues(illbFile.read(count * self.valueSize), count)
+    
+    def toValues(self, data, count):
+        if len(data) != count * self.valueSize:
+            raise ValueError("%s is shorter than expected. Remove the file and try again."%self.filePath)
+        
+        values = array('f')
+        values.fromstring(data)
+        if sys.byteorder != "little": values.byteswap()
+        return values
+    
+    def readHour(self, hourIndex):
+        """Return values of all the sensors for an hour. hourIndex starts from 0."""
+        if not 0 <= hourIndex < self.hourCount:
+            raise IndexError("Hour index %d is out of range."%hourIndex)
+        
+        with open(self.filePath, "rb") as illbFile:
+            illbFile.seek(self.headerSize + self.valueSize * hourIndex * self.sensorCount)
+            return list(self.readValues(illbFile, self.sensorCount))
+    
+    def readSensor(self, sensorIndex):
+        """Return values of a sensor for all the hours. sensorIndex starts from 0."""
+        if not 0 <= sensorIndex < self.sensorCount:
+            raise IndexError("Sensor index %d is out of range."%sensorIndex)
+        
+        rowSize = self.valueSize * self.sensorCount
+        offset = self.headerSize + self.valueSize * sensorIndex
+        
+        data = []
+        with open(self.filePath, "rb") as illbFile:
+            for hourIndex in xrange(self.hourCount):
+                illbFile.seek(offset + hourIndex * rowSize)
+                data.append(illbFile.read(self.valueSize))
+        
+        return list(self.toValues("".join(data), self.hourCount))
+
+class hb_MicroclimateMatrix(object):
+    """
+    Hours x points result matrix of a microclimate map stored in a binary file.
+    
+    The file starts with a fixed header (point count, number of hours, the length
+    of the matrix header line and the size and modification time of the CSV file
+    that was written with the matrix) followed by the header line of the matrix
+    (data type and analysis period) and float32 values for all the points hour by
+    hour. Hours are read with a single seek and read so any part of an analysis
+    period can be read back without loading the whole matrix.
+    
+    Args:
+        filePath: Path to the binary file (*.hbmtx).
+    
+    Usage:
+        writer = hb_MicroclimateMatrix.openWriter(csvFile, header, pointCount)
+        writer.writeRows(rows)
+        mtx = writer.close()
+        hourlyValues = mtx.readHour(4000)
+        comfResultsMtx = mtx.toMatrix(range(24))
+    """
+    
+    magic = "HBMTX"
+    version = 2
+    headerFormat = "<5sBIIIQd"
+    headerSize = struct.calcsize(headerFormat)
+    
+    # matrices with more values than this are not kept in memory once they are written
+    maxInMemoryValues = 5000000
+    
+    def __init__(self, filePath):
+        self.filePath = filePath
+        
+        with open(filePath, "rb") as mtxFile:
+            header = mtxFile.read(self.headerSize)
+            
+            if len(header) != self.headerSize:
+                raise ValueError("%s is not a valid binary matrix file."%filePath)
+            
+            magic, version, self.pointCount, self.hourCount, headerLength, \
+                self.csvSize, self.csvMtime = struct.unpack(self.headerFormat, header)
+            
+            if magic != self.magic or version != self.version:
+                raise ValueError("%s is not a valid binary matrix file."%filePath)
+            
+            self.header = mtxFile.read(headerLength)
+        
+        self.dataOffset = self.headerSize + headerLength
+    
+    def __repr__(self):
+        return "Honeybee Microclimate Matrix: %s (%d points x %d hours)"%(self.header, self.pointCount, self.hourCount)
+    
+    @staticmethod
+    def getBinaryFilePath(resultFile):
+        return os.path.splitext(resultFile)[0] + ".hbmtx"
+    
+    @classmethod
+    def fromFile(cls, resultFile):
+        """
+        Return the binary matrix for a binary file or for a CSV result file that has an
+        up to date binary copy next to it. Return None if there is no binary matrix.
+        """
+        if resultFile.lower().endswith(".hbmtx"): return cls(resultFile)
+        
+        mtxFilePath = cls.getBinaryFilePath(resultFile)
+        if not os.path.isfile(mtxFilePath): return None
+        try: binaryMtx = cls(mtxFilePath)
+        except ValueError: return None
+        
+        # make sure the csv file hasn't changed since the binary copy was written
+        if os.path.isfile(resultFile):
+            if binaryMtx.csvSize != os.path.getsize(resultFile) or \
+               binaryMtx.csvMtime != os.path.getmtime(resultFile):
+                return None
+        return binaryMtx
+    
+    @classmethod
+    def openWriter(cls, csvFilePath, header, pointCount, writeCSV = True):
+        """Start a binary matrix next to csvFilePath and optionally the CSV file itself."""
+        return hb_MicroclimateMatrixWriter(cls, csvFilePath, header, pointCount, writeCSV)
+    
+    def readValues(self, mtxFile, count):
+        values = array('f')
+        values.fromfile(mtxFile, count)
+        if sys.byteorder != "little": values.byteswap()
+        return values
+    
+    def readHour(self, hourIndex):
+        """Return values of all the points for an hour. hourIndex starts from 0."""
+        if not 0 <= hourIndex < self.hourCount:
+            raise IndexError("Hour index %d is out of range."%hourIndex)
+        
+        with open(self.filePath, "rb") as mtxFile:
+            mtxFile.seek(self.dataOffset + 4 * hourIndex * self.pointCount)
+            return list(self.readValues(mtxFile, self.pointCount))
+    
+    def iterHours(self, hourIndices = None):
+        """Yield the values of all the points for each hour. hourIndices start from 0."""
+        if hourIndices == None: hourIndices = xrange(self.hourCount)
+        rowSize = 4 * self.pointCount
+        
+        with open(self.filePath, "rb") as mtxFile:
+            for hourIndex in hourIndices:
+                if not 0 <= hourIndex < self.hourCount:
+                    raise IndexError("Hour index %d is out of range."%hourIndex)
+                mtxFile.seek(self.dataOffset + hourIndex * rowSize)
+                yield list(self.readValues(mtxFile, self.pointCount))
+    
+    def toMatrix(self, hourIndices = None):
+        """Return the header and the hours as a comfResultsMtx list."""
+        return [self.header] + list(self.iterHours(hourIndices))
+
+
+class hb_MicroclimateMatrixWriter(object):
+    """
+    Write a microclimate matrix to the disk one block of hours at a time.
+    
+    Rows are appended to the binary matrix and to the CSV file as they are written so
+    only the current block of hours has to be kept in memory. Files are written to
+    temporary files and are renamed once the writer is closed.
+    """
+    
+    def __init__(self, matrixClass, csvFilePath, header, pointCount, writeCSV = True):
+        self.matrixClass = matrixClass
+        self.csvFilePath = csvFilePath
+        self.filePath = matrixClass.getBinaryFilePath(csvFilePath)
+        self.header = header
+        self.pointCount = pointCount
+        self.hourCount = 0
+        
+        self.mtxFile = open(self.filePath + ".tmp", "wb")
+        # the fixed header will be re-written once the number of hours is known
+        self.mtxFile.write("\0" * matrixClass.headerSize)
+        self.mtxFile.write(header)
+        
+        if writeCSV:
+            self.csvFile = open(csvFilePath + ".tmp", "wb")
+            self.csvFile.write(header + "\n")
+        else:
+            self.csvFile = None
+    
+    def writeRows(self, rows):
+        for row in rows:
+            if len(row) != self.pointCount:
+                raise ValueError("Number of values at hour %d doesn't match the number of points."%(self.hourCount + 1))
+            
+            values = array('f', row)
+            if sys.byteorder != "little": values.byteswap()
+            values.tofile(self.mtxFile)
+            
+            if self.csvFile != None:
+                self.csvFile.write(",".join([str(val) for val in row]) + "\n")
+            
+            self.hourCount += 1
+    
+    def close(self):
+        """Close the files and return the binary matrix as a hb_MicroclimateMatrix."""
+        # close the csv file first so its final size and modification time can be
+        # stored in the binary copy
+        csvSize, csvMtime = 0, 0
+        if self.csvFile != None:
+            self.csvFile.close()
+            if os.path.isfile(self.csvFilePath): os.remove(self.csvFilePath)
+            os.rename(self.csvFilePath + ".tmp", self.csvFilePath)
+            csvSize, csvMtime = os.path.getsize(self.csvFilePath), os.path.getmtime(self.csvFilePath)
+        
+        self.mtxFile.seek(0)
+        self.mtxFile.write(struct.pack(self.matrixClass.headerFormat, self.matrixClass.magic, \
+                           self.matrixClass.version, self.pointCount, self.hourCount, len(self.header), \
+                           csvSize, csvMtime))
+        self.mtxFile.close()
+        
+        if os.path.isfile(self.filePath): os.remove(self.filePath)
+        os.rename(self.filePath + ".tmp", self.filePath)
+        
+        return self.matrixClass(self.filePath)
+    
+    def abort(self):
+        """Close and remove the temporary files."""
+        for openFile in (self.mtxFile, self.csvFile):
+            if openFile == None: continue
+            openFile.close()
+            try: os.remove(openFile.name)
+            except: pass
+
+
 class hb_EnergySimulatioParameters(object):
     
     def readEPParams(self, EPParameters):
@@ -3879,15 +6120,15 @@ class EPMaterialAux(object):
         This function should work for materials, and counstructions
         """
         objectData = None
-        if objectName in sc.sticky ["honeybee_windowMaterialLib"].keys():
+        if objectName in sc.sticky ["honeybee_windowMaterialLib"]:
             objectData = sc.sticky ["honeybee_windowMaterialLib"][objectName]
-        elif objectName in sc.sticky ["honeybee_materialLib"].keys():
+        elif objectName in sc.sticky ["honeybee_materialLib"]:
             objectData = sc.sticky ["honeybee_materialLib"][objectName]
-        elif objectName in sc.sticky ["honeybee_constructionLib"].keys():
+        elif objectName in sc.sticky ["honeybee_constructionLib"]:
             objectData = sc.sticky ["honeybee_constructionLib"][objectName]
-        elif objectData in sc.sticky["honeybee_WindowPropLib"].keys():
+        elif objectData in sc.sticky["honeybee_WindowPropLib"]:
             objectData = sc.sticky["honeybee_WindowPropLib"][objectName]
-        elif objectName in sc.sticky["honeybee_SpectralDataLib"].keys():
+        elif objectName in sc.sticky["honeybee_SpectralDataLib"]:
             objectData = sc.sticky["honeybee_SpectralDataLib"][objectName]
         
         if objectData!=None:
@@ -4201,19 +6442,19 @@ class EPObjectsAux(object):
         
         objectName = objectName.upper()
         
-        if objectName in sc.sticky ["honeybee_windowMaterialLib"].keys():
+        if objectName in sc.sticky ["honeybee_windowMaterialLib"]:
             objectData = sc.sticky ["honeybee_windowMaterialLib"][objectName]
-        elif objectName in sc.sticky ["honeybee_materialLib"].keys():
+        elif objectName in sc.sticky ["honeybee_materialLib"]:
             objectData = sc.sticky ["honeybee_materialLib"][objectName]
-        elif objectName in sc.sticky ["honeybee_constructionLib"].keys():
+        elif objectName in sc.sticky ["honeybee_constructionLib"]:
             objectData = sc.sticky ["honeybee_constructionLib"][objectName]
-        elif objectName in sc.sticky["honeybee_ScheduleLib"].keys():
+        elif objectName in sc.sticky["honeybee_ScheduleLib"]:
             objectData = sc.sticky ["honeybee_ScheduleLib"][objectName]
-        elif objectName in sc.sticky["honeybee_ScheduleTypeLimitsLib"].keys():
+        elif objectName in sc.sticky["honeybee_ScheduleTypeLimitsLib"]:
             objectData = sc.sticky ["honeybee_ScheduleTypeLimitsLib"][objectName]
-        elif objectName in sc.sticky["honeybee_WindowPropLib"].keys():
+        elif objectName in sc.sticky["honeybee_WindowPropLib"]:
             objectData = sc.sticky["honeybee_WindowPropLib"][objectName]
-        elif objectName in sc.sticky["honeybee_SpectralDataLib"].keys():
+        elif objectName in sc.sticky["honeybee_SpectralDataLib"]:
             objectData = sc.sticky["honeybee_SpectralDataLib"][objectName]
         
         return objectData
@@ -4288,19 +6529,293 @@ class EPObjectsAux(object):
             component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warningMsg)
             return
 
+class hb_EPScheduleCompiler(object):
+    """Compile EnergyPlus schedules into annual hourly values.
+    
+    Schedules are compiled to 365 weeks of day profiles once and cached based on the
+    content of the schedule and all the schedules that it references. Zones that share
+    the same schedule resolve it only once and a schedule that is changed in the
+    library is compiled again.
+    
+    Supported types: Schedule:Year, Schedule:Week:Daily, Schedule:Day:Interval,
+    Schedule:Day:Hourly, Schedule:Constant and Schedule:Compact.
+    """
+    
+    # day types of a compiled week in the same order as Schedule:Week:Daily
+    dayTypes = ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', \
+                'holiday', 'summerdesignday', 'winterdesignday', 'customday1', 'customday2')
+    
+    compactDayTypes = {'alldays': range(12), 'weekdays': range(1, 6), 'weekends': [0, 6], \
+                       'holiday': [7], 'holidays': [7]}
+    
+    monthStartDays = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+    
+    zeroProfile = (0.0,) * 24
+    
+    # caches are shared between all the instances
+    compiledSchedules = {}
+    hourlyValues = {}
+    
+    def __init__(self):
+        self.hb_EPScheduleAUX = sc.sticky["honeybee_EPScheduleAUX"]()
+    
+    @classmethod
+    def clearCache(cls):
+        cls.compiledSchedules.clear()
+        cls.hourlyValues.clear()
+    
+    def getDayOfYear(self, month, day):
+        return self.monthStartDays[int(month) - 1] + int(day)
+    
+    def getTypeLimits(self, typeLimitName):
+        if not typeLimitName: return ()
+        schedule, comments = self.hb_EPScheduleAUX.getScheduleTypeLimitsDataByName(typeLimitName.upper(), ghenv.Component)
+        if schedule is None: return ()
+        return tuple(schedule)
+    
+    def getUnit(self, typeLimits):
+        """Return unit and numeric type from type limits data."""
+        try:
+            lowerLimit, upperLimit, numericType, unitType = typeLimits[1:]
+        except:
+            try: lowerLimit, upperLimit, numericType = typeLimits[1:]
+            except: numericType = "unknown"
+            unitType = "unknown"
+        
+        if unitType == "unknown": return numericType, numericType
+        return unitType, numericType
+    
+    def getContentKey(self, schName):
+        """Return a key that represents the content of a schedule and the schedules that it references.
+        
+        The key is (schedule values, type limits, key of referenced schedule 1, ...). None
+        is returned for schedules that are not in the library and for csv schedules.
+        """
+        if not schName: return None
+        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
+        if values is None or comments == "csv": return None
+        
+        scheduleType = values[0].lower()
+        typeLimits = ()
+        children = []
+        if scheduleType == "schedule:week:daily":
+            children = values[1:13]
+        elif len(values) > 1:
+            typeLimits = self.getTypeLimits(values[1])
+            if scheduleType == "schedule:year":
+                children = [values[5 * i + 2] for i in range((len(values) - 2) // 5)]
+        
+        key = [tuple(values), typeLimits]
+        for childName in children: key.append(self.getContentKey(childName))
+        return tuple(key)
+    
+    def toProfile(self, hourlyValues, numericType):
+        if numericType.strip().lower() == "district":
+            return tuple(map(int, hourlyValues))
+        return tuple(hourlyValues)
+    
+    def parseUntilHour(self, untilStr):
+        # "Until: 07:30" > 7 and "24:00" > 24
+        return min(int(untilStr.split(":")[-2].strip()), 24)
+    
+    def parseDaySchedule(self, values, scheduleType, numericType):
+        hourlyValues = [0.0] * 24
+        if scheduleType == "schedule:constant":
+            hourlyValues = [float(values[2])] * 24
+        elif scheduleType == "schedule:day:hourly":
+            for hour, value in enumerate(values[2:26]):
+                hourlyValues[hour] = float(value)
+        else:
+            # Schedule:Day:Interval
+            startHour = 0
+            for i in range((len(values) - 3) // 2):
+                endHour = self.parseUntilHour(values[2 * i + 3])
+                hourlyValues[startHour:endHour] = [float(values[2 * i + 4])] * (endHour - startHour)
+                startHour = endHour
+        
+        return self.toProfile(hourlyValues, numericType)
+    
+    def completeWeek(self, dayProfiles):
+        """Fill the missing days of the week with zeros and return a week tuple."""
+        week = list(dayProfiles)
+        for day in range(7):
+            if week[day] is None: week[day] = self.zeroProfile
+        return tuple(week)
+    
+    def parseCompactSchedule(self, values, numericType):
+        # each period is [last day of the period, profiles of the days]
+        periods = []
+        profile = None
+        startHour = endHour = 0
+        for field in values[2:]:
+            field = field.strip()
+            fieldLower = field.lower()
+            if fieldLower.startswith("through"):
+                month, day = field.split(":", 1)[1].strip().split("/")
+                periods.append([self.getDayOfYear(month, day), [None] * 12])
+            elif fieldLower.startswith("for"):
+                if len(periods) == 0: periods.append([365, [None] * 12])
+                dayProfiles = periods[-1][1]
+                profile = [0.0] * 24
+                startHour = endHour = 0
+                for dayType in fieldLower.split(":", 1)[1].split():
+                    if dayType == "allotherdays":
+                        days = [count for count, p in enumerate(dayProfiles) if p is None]
+                    elif dayType in self.compactDayTypes:
+                        days = self.compactDayTypes[dayType]
+                    elif dayType in self.dayTypes:
+                        days = [self.dayTypes.index(dayType)]
+                    else:
+                        days = []
+                    for day in days: dayProfiles[day] = profile
+            elif fieldLower.startswith("until"):
+                endHour = self.parseUntilHour(field)
+            elif fieldLower.startswith("interpolate") or profile is None:
+                continue
+            else:
+                profile[startHour:endHour] = [float(field)] * (endHour - startHour)
+                startHour = endHour
+        
+        yearWeeks = []
+        week = self.completeWeek([None] * 12)
+        for lastDay, dayProfiles in periods:
+            # convert the profiles to tuples once so days that share a profile still do
+            profiles = {}
+            for p in dayProfiles:
+                if p is not None and id(p) not in profiles:
+                    profiles[id(p)] = self.toProfile(p, numericType)
+            week = self.completeWeek([profiles.get(id(p)) for p in dayProfiles])
+            yearWeeks.extend([week] * (min(lastDay, 365) - len(yearWeeks)))
+        yearWeeks.extend([week] * (365 - len(yearWeeks)))
+        return yearWeeks
+    
+    def compileSchedule(self, schName, contentKey = None):
+        """Compile a schedule to 365 weeks.
+        
+        Returns:
+            (scheduleType, unit, yearWeeks) or None if the schedule cannot be found.
+            yearWeeks is a list of 365 weeks and each week is a tuple of 12 day profiles
+            in the order of dayTypes. Each day profile is a tuple of 24 hourly values.
+            Holiday, design day and custom day profiles can be None. yearWeeks is None
+            for schedule types that are not supported.
+        """
+        if contentKey is None:
+            contentKey = self.getContentKey(schName)
+            if contentKey is None: return None
+        
+        try:
+            return self.compiledSchedules[contentKey]
+        except KeyError:
+            pass
+        
+        values = contentKey[0]
+        scheduleType = values[0].lower()
+        unit, numericType = self.getUnit(contentKey[1])
+        yearWeeks = None
+        
+        if scheduleType == "schedule:year":
+            emptyWeek = self.completeWeek([None] * 12)
+            yearWeeks = [emptyWeek] * 365
+            for i, childKey in enumerate(contentKey[2:]):
+                compiledWeek = None
+                if childKey is not None:
+                    compiledWeek = self.compileSchedule(values[5 * i + 2], childKey)[2]
+                week = compiledWeek[0] if compiledWeek else emptyWeek
+                startDay = self.getDayOfYear(values[5 * i + 3], values[5 * i + 4])
+                endDay = self.getDayOfYear(values[5 * i + 5], values[5 * i + 6])
+                yearWeeks[startDay - 1:endDay] = [week] * (endDay - startDay + 1)
+        
+        elif scheduleType == "schedule:week:daily":
+            dayProfiles = []
+            for dayName, childKey in zip(values[1:13], contentKey[2:]):
+                profile = None
+                if childKey is not None:
+                    dayType, dayUnit, compiledDay = self.compileSchedule(dayName, childKey)
+                    if compiledDay:
+                        profile = compiledDay[0][0]
+                        if unit == "unknown": unit = dayUnit
+                dayProfiles.append(profile)
+            yearWeeks = [self.completeWeek(dayProfiles)] * 365
+        
+        elif scheduleType in ("schedule:day:interval", "schedule:day:hourly", "schedule:constant"):
+            profile = self.parseDaySchedule(values, scheduleType, numericType)
+            yearWeeks = [(profile,) * 12] * 365
+        
+        elif scheduleType == "schedule:compact":
+            yearWeeks = self.parseCompactSchedule(values, numericType)
+        
+        else:
+            print "Honeybee doesn't support " + scheduleType + " currently." + \
+                  "Email us the type and we will try to add it to Honeybee."
+        
+        compiled = scheduleType, unit, yearWeeks
+        self.compiledSchedules[contentKey] = compiled
+        return compiled
+    
+    def getHourlyValues(self, schName, startDayOfTheWeek = 0, holidays = None, daylightSaving = None):
+        """Get 8760 hourly values of a schedule.
+        
+        Args:
+            schName: Name of the schedule.
+            startDayOfTheWeek: Start day of the year from 0 - sunday to 6 - saturday.
+            holidays: An optional list of holidays as days of the year (1-365). The
+                holiday profile of the schedule is used for these days if it has one.
+            daylightSaving: An optional (startDay, endDay) as days of the year. The schedule
+                is shifted one hour earlier in this period. Use startDay > endDay for
+                the southern hemisphere.
+        Returns:
+            An array of 8760 floats or None if the schedule cannot be compiled.
+        """
+        contentKey = self.getContentKey(schName)
+        if contentKey is None: return None
+        
+        startDayOfTheWeek = int(startDayOfTheWeek) % 7
+        if holidays: holidays = tuple(sorted(set(map(int, holidays))))
+        else: holidays = ()
+        if daylightSaving: daylightSaving = tuple(map(int, daylightSaving))
+        else: daylightSaving = None
+        
+        cacheKey = contentKey, startDayOfTheWeek, holidays, daylightSaving
+        
+        if cacheKey not in self.hourlyValues:
+            yearWeeks = self.compileSchedule(schName, contentKey)[2]
+            if yearWeeks is None: return None
+            
+            holidays = set(holidays)
+            hourlyValues = array('d')
+            for day, week in enumerate(yearWeeks):
+                if day + 1 in holidays and week[7] is not None:
+                    hourlyValues.extend(week[7])
+                else:
+                    hourlyValues.extend(week[(day + startDayOfTheWeek) % 7])
+            
+            if daylightSaving:
+                startDay, endDay = daylightSaving
+                if startDay <= endDay: periods = [(startDay, endDay)]
+                else: periods = [(1, endDay), (startDay, 365)]
+                for startDay, endDay in periods:
+                    startHour, endHour = (startDay - 1) * 24, min(endDay * 24, 8759)
+                    hourlyValues[startHour:endHour] = hourlyValues[startHour + 1:endHour + 1]
+            
+            self.hourlyValues[cacheKey] = hourlyValues
+        
+        # return a copy so the cached values cannot be changed by the caller
+        return array('d', self.hourlyValues[cacheKey])
+
+
 class ReadEPSchedules(object):
     
     def __init__(self, schName, startDayOfTheWeek):
         self.hb_EPScheduleAUX = sc.sticky["honeybee_EPScheduleAUX"]()
         self.hb_EPObjectsAUX = sc.sticky["honeybee_EPObjectsAUX"]()
         self.lb_preparation = sc.sticky["ladybug_Preparation"]()
+        self.compiler = sc.sticky["honeybee_EPScheduleCompiler"]()
         self.schName = schName
         self.startDayOfTheWeek = startDayOfTheWeek
         self.count = 0
         self.startHOY = 1
         self.endHOY = 24
         self.unit = "unknown"
-        self.comapctKeywords = ['Weekdays', 'Weekends', 'Alldays', 'AllOtherDays', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
     
     def getScheduleTypeLimitsData(self, schName):
         
@@ -4315,38 +6830,30 @@ class ReadEPSchedules(object):
         
         self.unit = unitType
         if self.unit == "unknown":
-            self.unit = numericType
-        
-        return lowerLimit, upperLimit, numericType, unitType
-    
-    
-    def getDayEPScheduleValues(self, schName = None):
-        
-        if schName == None:
-            schName = self.schName
-            
-        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        typeLimitName = values[1]
-        lowerLimit, upperLimit, numericType, unitType = \
-                self.getScheduleTypeLimitsData(typeLimitName)
-                
-        numberOfDaySch = int((len(values) - 3) /2)
+            self.unit = numericType
         
-        hourlyValues = range(24)
-        startHour = 0
-        for i in range(numberOfDaySch):
-            value = float(values[2 * i + 4])
-            untilTime = map(int, values[2 * i + 3].split(":"))
-            endHour = int(untilTime[0] +  untilTime[1]/60)
-            for hour in range(startHour, endHour):
-                hourlyValues[hour] = value
-            
-            startHour = endHour
+        return lowerLimit, upperLimit, numericType, unitType
+    
+    def getYearWeeks(self, schName):
+        """Return the compiled 365 weeks of a schedule. See hb_EPScheduleCompiler."""
+        if schName == None: schName = self.schName
         
-        if numericType.strip().lower() == "district":
-            hourlyValues = map(int, hourlyValues)
-            
-        return hourlyValues
+        compiled = self.compiler.compileSchedule(schName)
+        if compiled is None or compiled[2] is None: return None
+        self.unit = compiled[1]
+        return compiled[2]
+    
+    def getHourlyValues(self, schName = None, holidays = None, daylightSaving = None):
+        """Return 8760 hourly values. See hb_EPScheduleCompiler.getHourlyValues."""
+        if schName == None: schName = self.schName
+        
+        if self.getYearWeeks(schName) is None: return []
+        return list(self.compiler.getHourlyValues(schName, self.startDayOfTheWeek, holidays, daylightSaving))
+    
+    def getDayEPScheduleValues(self, schName = None):
+        yearWeeks = self.getYearWeeks(schName)
+        if yearWeeks is None: return []
+        return list(yearWeeks[0][0])
     
     
     def getWeeklyEPScheduleValues(self, schName = None):
@@ -4359,176 +6866,45 @@ class ReadEPSchedules(object):
         'CustomDay1 Schedule:Day Name', 'CustomDay2 Schedule:Day Name']
         """
         
-        if schName == None:
-            schName = self.schName
-            
-        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        
         if self.count == 1:
             # set the last date of the schedule to one week
             self.endHOY = 24 * 7
         
-        sundaySchedule = self.getScheduleValues(values[1])
-        mondaySchedule = self.getScheduleValues(values[2])
-        tuesdaySchedule = self.getScheduleValues(values[3])
-        wednesdaySchedule = self.getScheduleValues(values[4])
-        thursdaySchedule = self.getScheduleValues(values[5])
-        fridaySchedule = self.getScheduleValues(values[6])
-        saturdaySchedule = self.getScheduleValues(values[7])
-        
-        holidaySchedule = self.getScheduleValues(values[8])
-        summerDesignDaySchedule = self.getScheduleValues(values[9])
-        winterDesignDaySchedule = self.getScheduleValues(values[10])
-        customDay1Schedule = self.getScheduleValues(values[11])
-        customDay2Schedule = self.getScheduleValues(values[12])
-        
-        hourlyValues = [sundaySchedule, mondaySchedule, tuesdaySchedule, \
-                       wednesdaySchedule, thursdaySchedule, fridaySchedule, \
-                       saturdaySchedule]
+        yearWeeks = self.getYearWeeks(schName)
+        if yearWeeks is None: return []
         
-        hourlyValues = hourlyValues[self.startDayOfTheWeek:] + \
-                       hourlyValues[:self.startDayOfTheWeek]
-        
-        return hourlyValues
+        week = yearWeeks[0]
+        return [list(week[(day + self.startDayOfTheWeek) % 7]) for day in range(7)]
     
     
-    def getConstantEPScheduleValues(self, schName):
+    def getConstantEPScheduleValues(self, schName = None):
         """
         'Schedule:Constant'
         ['Schedule Type', 'Schedule Type Limits Name', 'Hourly Value']
         """
-        
-        if schName == None:
-            schName = self.schName
-            
-        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        typeLimitName = values[1]
-        lowerLimit, upperLimit, numericType, unitType = \
-                self.getScheduleTypeLimitsData(typeLimitName)
-        
-        hourlyValues = [float(values[2])]
-        
-        if numericType.strip().lower() == "district":
-            hourlyValues = map(int, hourlyValues)
-        return scheduleConstant
+        return self.getDayEPScheduleValues(schName)
     
     
-    def getCompactEPScheduleValues(self, schName):
-        
-        if schName == None: schName = self.schName
-        
-        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        typeLimitName = values[1]
-        lowerLimit, upperLimit, numericType, unitType = \
-                self.getScheduleTypeLimitsData(typeLimitName)
-        
-        #Separate out the different periods.
-        totalValues = []
-        periodValues = []
-        headerDone = False
-        for val in values:
-            newPeriod = False
-            for word in self.comapctKeywords:
-                if word in val: newPeriod = True
-            if newPeriod == True:
-                if headerDone == True:
-                    totalValues.append(periodValues)
-                periodValues = [val]
-                headerDone = True
-            elif headerDone == True:
-                periodValues.append(val)
-        totalValues.append(periodValues)
-        
-        #For each day period, construct a day schedule.
-        dayType = []
-        dayValues = []
-        for dayVals in totalValues:
-            dayType.append(dayVals[0].title().split('For: ')[-1])
-            numberOfDaySch = int((len(dayVals) - 1) /2)
-            
-            hourlyValues = range(24)
-            startHour = 0
-            for i in range(numberOfDaySch):
-                value = float(dayVals[2 * i + 2])
-                untilTime = map(int, dayVals[2 * i + 1].split(":")[1:])
-                endHour = int(untilTime[0] +  untilTime[1]/60)
-                for hour in range(startHour, endHour):
-                    hourlyValues[hour] = value
-                
-                startHour = endHour
-            dayValues.append(hourlyValues)
-        
-        #Construct a week schedule from the day schedules.
-        #Map the dayTypes to the days of the week.
-        ['Weekdays', 'Weekends', 'Alldays', 'AllOtherDays', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        weekVals = [-1, -1, -1, -1, -1, -1, -1]
-        for typeCount, type in enumerate(dayType):
-            if type == 'Alldays':
-                for count, val in enumerate(weekVals):
-                    weekVals[count] = typeCount
-            elif type == 'Weekdays':
-                for count, val in enumerate(weekVals):
-                    if count < 6 and count != 0: weekVals[count] = typeCount
-            elif type == 'Weekends':
-                weekVals[0] = typeCount
-                weekVals[-1] = typeCount
-            elif type == 'Sunday': weekVals[0] = typeCount
-            elif type == 'Monday': weekVals[1] = typeCount
-            elif type == 'Tuesday': weekVals[2] = typeCount
-            elif type == 'Wednesday': weekVals[3] = typeCount
-            elif type == 'Thursday': weekVals[4] = typeCount
-            elif type == 'Friday': weekVals[5] = typeCount
-            elif type == 'Saturday': weekVals[6] = typeCount
-            elif type == 'Allotherdays':
-                for count, val in enumerate(weekVals):
-                    if val == -1: weekVals[count] = typeCount
-        
-        #Turn the week schedule into a year schedule.
-        hourlyValues = []
-        dayVals = []
-        dayofWeek = -1
-        for day in range(365):
-            if dayofWeek == 6: dayofWeek = 0
-            else: dayofWeek += 1
-            dayVals.append(weekVals[dayofWeek])
-        for day in dayVals:
-            hourlyValues.extend(dayValues[day])
-        
-        print hourlyValues
-        return hourlyValues
+    def getCompactEPScheduleValues(self, schName = None, holidays = None, daylightSaving = None):
+        return self.getHourlyValues(schName, holidays, daylightSaving)
     
     
-    def getYearlyEPScheduleValues(self, schName = None):
-        # place holder for 365 days
-        hourlyValues = range(365)
-        
+    def getYearlyEPScheduleValues(self, schName = None, holidays = None, daylightSaving = None):
         # update last day of schedule
         self.endHOY = 8760
         
-        if schName == None:
-            schName = self.schName
-        
-        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
+        hourlyValues = self.getHourlyValues(schName, holidays, daylightSaving)
         
-        # generate weekly schedules
-        numOfWeeklySchedules = int((len(values)-2)/5)
-        
-        for i in range(numOfWeeklySchedules):
-            weekDayScheduleName = values[5 * i + 2]
-            
-            startDay = int(self.lb_preparation.getJD(int(values[5 * i + 3]), int(values[5 * i + 4])))
-            endDay = int(self.lb_preparation.getJD(int(values[5 * i + 5]), int(values[5 * i + 6])))
-            
-            # 7 list for 7 days of the week
-            hourlyValuesForTheWeek = self.getScheduleValues(weekDayScheduleName)
-            
-            for day in range(startDay-1, endDay):
-                hourlyValues[day] = hourlyValuesForTheWeek[day%7]
-            
-        return hourlyValues
+        # 365 lists of 24 values
+        return [hourlyValues[day * 24:(day + 1) * 24] for day in range(len(hourlyValues) // 24)]
     
     
-    def getScheduleValues(self, schName = None):
+    def getScheduleValues(self, schName = None, holidays = None, daylightSaving = None):
+        """Return the values of a schedule.
+        
+        holidays and daylightSaving are only applied to Schedule:Year and Schedule:Compact
+        which return values for the whole year. See hb_EPScheduleCompiler.getHourlyValues.
+        """
         if schName == None:
             schName = self.schName
         if self.hb_EPObjectsAUX.isSchedule(schName):
@@ -4541,15 +6917,15 @@ class ReadEPSchedules(object):
             self.count += 1
             
             if scheduleType == "schedule:year":
-                hourlyValues = self.getYearlyEPScheduleValues(schName)
-            elif scheduleType == "schedule:day:interval":
+                hourlyValues = self.getYearlyEPScheduleValues(schName, holidays, daylightSaving)
+            elif scheduleType in ("schedule:day:interval", "schedule:day:hourly"):
                 hourlyValues = self.getDayEPScheduleValues(schName)
             elif scheduleType == "schedule:week:daily":
                 hourlyValues = self.getWeeklyEPScheduleValues(schName)
             elif scheduleType == "schedule:constant":
                 hourlyValues = self.getConstantEPScheduleValues(schName)
             elif scheduleType == "schedule:compact":
-                hourlyValues = self.getCompactEPScheduleValues(schName)
+                hourlyValues = self.getCompactEPScheduleValues(schName, holidays, daylightSaving)
             else:
                 print "Honeybee doesn't support " + scheduleType + " currently." + \
                       "Email us the type and we will try to add it to Honeybee."
@@ -4559,22 +6935,23 @@ class ReadEPSchedules(object):
             return hourlyValues
     
     def getHolidaySchedValues(self, schName = None):
+        # [[startDay, endDay, holiday values], ...] for the periods of the year
         hourlyValues = []
         if schName == None:
             schName = self.schName
         if self.hb_EPObjectsAUX.isSchedule(schName):
-            values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-            scheduleType = values[0].lower()
-            if scheduleType == "schedule:year":
-                # generate weekly schedules
-                numOfWeeklySchedules = int((len(values)-2)/5)
-                for i in range(numOfWeeklySchedules):
-                    weekDayScheduleName = values[5 * i + 2]
-                    startDay = int(self.lb_preparation.getJD(int(values[5 * i + 3]), int(values[5 * i + 4])))
-                    endDay = int(self.lb_preparation.getJD(int(values[5 * i + 5]), int(values[5 * i + 6])))
-                    weekValues, comments = self.hb_EPScheduleAUX.getScheduleDataByName(weekDayScheduleName.upper(), ghenv.Component)
-                    holidaySchedule = self.getScheduleValues(weekValues[8])
-                    hourlyValues.append([startDay,endDay,holidaySchedule])
+            yearWeeks = self.getYearWeeks(schName)
+            if yearWeeks is None: return hourlyValues
+            
+            lastWeek = period = None
+            for day, week in enumerate(yearWeeks):
+                if week is not lastWeek:
+                    lastWeek, period = week, None
+                    if week[7] is not None:
+                        period = [day + 1, day + 1, list(week[7])]
+                        hourlyValues.append(period)
+                elif period is not None:
+                    period[1] = day + 1
         
         return hourlyValues
 
@@ -8169,8 +10546,48 @@ class viewFactorInfo(object):
 
 class hb_Hive(object):
     
+    # attribute types that are included in the state of the objects
+    stateTypes = (str, unicode, int, long, float, bool, type(None))
+    
     class CopyClass(object):
         pass
+    
+    @classmethod
+    def getObjectState(cls, HBObject):
+        """Return a hash of the values of a Honeybee object and its surfaces.
+        
+        It is used to find out if an object that is shared with read only
+        components has been changed.
+        """
+        state = hashlib.md5()
+        HBObjects = [HBObject]
+        while HBObjects:
+            obj = HBObjects.pop()
+            for name, value in sorted(obj.__dict__.items()):
+                if isinstance(value, cls.stateTypes):
+                    state.update("%s=%r;" % (name, value))
+                elif name in ("surfaces", "childSrfs"):
+                    state.update("%s:%d;" % (name, len(value)))
+                    HBObjects.extend(value)
+        return state.hexdigest()
+    
+    def checkObjectState(self, baseKey, key, HBObject, readOnly = False):
+        """Make sure the objects that are shared with read only components are not changed.
+        
+        The state of the object is saved the first time it is called as read only and
+        is checked every time it is called after that.
+        """
+        if not sc.sticky.has_key('HBHiveStates'): sc.sticky['HBHiveStates'] = {}
+        states = sc.sticky['HBHiveStates'].setdefault(baseKey, {})
+        
+        if key not in states:
+            if readOnly: states[key] = self.getObjectState(HBObject)
+            return
+        
+        if states[key] != self.getObjectState(HBObject):
+            raise Exception("%s has been changed by a component that calls it as read only.\n" % getattr(HBObject, "name", key) + \
+                            "Recompute the component that has generated the object.")
+    
     def checkifTransformed(self, brep, HBO):
         """
         This method ensures that Honeybee objects are not rotated or moved
@@ -8219,6 +10636,8 @@ class hb_Hive(object):
             if baseKey in sc.sticky['HBHive']:
                 del(sc.sticky['HBHive'][baseKey])
             sc.sticky['HBHive'][baseKey] = {}
+            if sc.sticky.has_key('HBHiveStates') and baseKey in sc.sticky['HBHiveStates']:
+                del(sc.sticky['HBHiveStates'][baseKey])
     
         # create an empty dictionary for this component
         outGeometry = []
@@ -8279,21 +10698,36 @@ class hb_Hive(object):
         HBID = '{}#{}'.format(baseKey, key)
         return 'Honeybee View Factor Info - ' + HBID
     
-    def callFromHoneybeeHive(self, geometryList):
+    def callFromHoneybeeHive(self, geometryList, readOnly = False):
+        """Call Honeybee objects from memory.
+        
+        Objects are deep copied so the component can change them without changing
+        the objects of the upstream components.
+        
+        readOnly: Set to True if the component only reads the objects. The
+            objects in the hive are returned without copying and must not be
+            changed by the component. Objects that have been changed after they
+            are called as read only raise an exception.
+        """
+        if readOnly:
+            HBObjects = self.visualizeFromHoneybeeHive(geometryList)
+            for geometry, HBObject in zip(geometryList, HBObjects):
+                try:
+                    self.checkifTransformed(geometry, HBObject)
+                except:
+                    pass
+                
+                baseKey, key = self.getHiveKeys(geometry)
+                self.checkObjectState(baseKey, key, HBObject, readOnly = True)
+            return HBObjects
+        
         HBObjects = []
         for geometry in geometryList:
-            try:
-                hbkey = geometry.UserDictionary['HBID']
-            except:
-                hbkey = geometry.split(' ')[-1]
-            
-            if '#' not in hbkey:
-                raise Exception('Honeybee version mismatch! Update the input component.')
-                
-            baseKey, key = hbkey.split('#')[0], '#'.join(hbkey.split('#')[1:])
+            baseKey, key = self.getHiveKeys(geometry)
             
             if sc.sticky['HBHive'].has_key(baseKey):
                 HBObject = sc.sticky['HBHive'][baseKey][key]
+                self.checkObjectState(baseKey, key, HBObject)
                 
                 # make sure Honeybee object is not moved or rotated
                 try:
@@ -8368,18 +10802,23 @@ class hb_Hive(object):
                 
         return HBObjects
     
+    @staticmethod
+    def getHiveKeys(geometry):
+        """Return the component key and the object key of a Honeybee geometry."""
+        try:
+            hbkey = geometry.UserDictionary['HBID']
+        except:
+            hbkey = geometry.split(' ')[-1]
+        
+        if '#' not in hbkey:
+            raise Exception('Honeybee version mismatch! Update the input component.')
+        
+        return hbkey.split('#')[0], '#'.join(hbkey.split('#')[1:])
+    
     def visualizeFromHoneybeeHive(self, geometryList):
         HBObjects = []
         for geometry in geometryList:
-            try:
-                hbkey = geometry.UserDictionary['HBID']
-            except:
-                hbkey = geometry.split(' ')[-1]
-            
-            if '#' not in hbkey:
-                raise Exception('Honeybee version mismatch! Update the input component.')
-                
-            baseKey, key = hbkey.split('#')[0], '#'.join(hbkey.split('#')[1:])
+            baseKey, key = self.getHiveKeys(geometry)
             
             if sc.sticky['HBHive'].has_key(baseKey):
                 HBObjects.append(sc.sticky['HBHive'][baseKey][key])
@@ -8418,7 +10857,7 @@ class hb_RADParameters(object):
 
 class hb_DSParameters(object):
     
-    def __init__(self, outputUnits = [2], dynamicSHDGroup_1 = None,  dynamicSHDGroup_2 = None, RhinoViewsName = [] , adaptiveZone = False, dgp_imageSize = 250, onlyRunGlareAnalysis = True):
+    def __init__(self, outputUnits = [2], dynamicSHDGroup_1 = None,  dynamicSHDGroup_2 = None, RhinoViewsName = [] , adaptiveZone = False, dgp_imageSize = 250, onlyRunGlareAnalysis = True, writeBinaryIll = False):
         
         if len(outputUnits)!=0 and outputUnits[0]!=None: self.outputUnits = outputUnits
         else: self.outputUnits = [2]
@@ -8450,6 +10889,9 @@ class hb_DSParameters(object):
             if dynamicSHDGroup_1 != None: self.DShdR.append(dynamicSHDGroup_1)
             if dynamicSHDGroup_2 != None: self.DShdR.append(dynamicSHDGroup_2)
         
+        # write binary copy of .ill files after the study (*.illb)
+        self.writeBinaryIll = writeBinaryIll
+        
         # Number of ill files
         self.numOfIll = 1
         for shadingRecipe in self.DShdR:
@@ -8468,9 +10910,35 @@ class CalculateGridBasedDLAnalysisResults(object):
     calculate results of any grid based analysis
     analysisType: [0] illuminance, [1] radiation, [2] luminance, [3] daylight factor, [4] vertical sky component
     """
-    def __init__(self, resultFiles, analysisType):
+    def __init__(self, resultFiles, analysisType, pointOrder = None):
         self.analysisType = analysisType
         self.resultFiles = resultFiles
+        if pointOrder == None and len(resultFiles) != 0:
+            pointOrder = self.readPointOrder(resultFiles[0])
+        self.pointOrder = pointOrder
+    
+    @staticmethod
+    def readPointOrder(resultFile):
+        """Read the order of the points from .ptm file next to the result files if any."""
+        # result files are named as radFileName_cpuCount.res
+        fileName = os.path.basename(resultFile)
+        ptmFileName = os.path.join(os.path.dirname(resultFile), \
+                      "_".join(os.path.splitext(fileName)[0].split("_")[:-1]) + ".ptm")
+        
+        if not os.path.isfile(ptmFileName): return None
+        
+        with open(ptmFileName, "r") as ptmFile:
+            return map(int, ptmFile.read().split(",")[:-1])
+    
+    def sortResults(self, resultValues):
+        """Put the results back in the original order of the test points."""
+        if self.pointOrder == None or len(self.pointOrder) != len(resultValues):
+            return resultValues
+        
+        sortedValues = [None] * len(resultValues)
+        for value, ptCount in zip(resultValues, self.pointOrder):
+            sortedValues[ptCount] = value
+        return sortedValues
         
     def getResults(self):
         resultValues = []
@@ -8485,7 +10953,7 @@ class CalculateGridBasedDLAnalysisResults(object):
             elif studyType == 3 or studyType == 4:
                 resultValues.extend(self.readDFResult(resultFile))
         
-        return resultValues
+        return self.sortResults(resultValues)
     
     def readRadiationResult(self, resultFile):
         result = []
@@ -8528,6 +10996,657 @@ class SerializeObjects(object):
             self.data = pickle.load(inf)
 
 
+class hb_EPResultReader(object):
+    """
+    Read EnergyPlus result csv files column by column.
+
+    The heading of the file is parsed only once into a column index of
+    (variable, key, units, timestep) and only the requested columns are read
+    from the file into compact array('d') buffers.
+
+    The first time that columns are read, all the values are also written to a
+    binary sidecar cache next to the csv file (csvFilePath + '.hbcache') with a
+    small json index (csvFilePath + '.hbcache.json'). The cache is keyed on the
+    path, size and modification time of the csv file. As long as the csv file
+    doesn't change, later reads only seek and slice the requested columns out of
+    the cache instead of parsing the text file.
+
+    The cache stores the values as 8-byte doubles in blocks of rows. In each block
+    the values of each column are stored next to each other so a column can be read
+    with one seek per block.
+
+    Args:
+        csvFilePath: Path to an EnergyPlus result csv file (e.g. eplusout.csv).
+        useCache: Set to False to always read the values from the csv file. Default: True.
+    """
+
+    cacheVersion = 1
+    # maximum number of values that are kept in memory while the cache is written.
+    cacheBlockValues = 4194304
+
+    def __init__(self, csvFilePath, useCache = True):
+        self.csvFilePath = csvFilePath
+        self.useCache = useCache
+        self.cacheFilePath = csvFilePath + '.hbcache'
+        self.cacheIndexPath = self.cacheFilePath + '.json'
+        self.cacheIndex = None
+        self.header = []
+        self.columns = []
+        self.columnIndex = {}
+        # indices of the columns with empty cells among the columns that have been read
+        self.gapColumns = set()
+        if useCache:
+            self.cacheIndex = self.loadCacheIndex()
+        self.readHeader()
+
+    @staticmethod
+    def parseColumnHeader(column):
+        """Split an EnergyPlus csv column heading into (variable, key, units, timestep).
+
+        e.g. "ZONE1:Zone Mean Air Temperature [C](Hourly)" will be split into
+        ("Zone Mean Air Temperature", "ZONE1", "C", "Hourly").
+        """
+        column = column.strip()
+        timestep = ''
+        if column.endswith(')') and '(' in column:
+            column, timestep = column[:-1].rsplit('(', 1)
+        units = ''
+        if column.endswith(']') and '[' in column:
+            column, units = column[:-1].rsplit('[', 1)
+        column = column.strip()
+        if ':' in column:
+            key, variable = column.rsplit(':', 1)
+        else:
+            key, variable = '', column
+        return variable.strip(), key.strip(), units.strip(), timestep.strip()
+
+    def readHeader(self):
+        if self.cacheIndex:
+            self.header = self.cacheIndex["header"]
+        else:
+            with open(self.csvFilePath, 'r') as resultFile:
+                headerLine = resultFile.readline()
+            self.header = headerLine.rstrip('\r\n').split(',')
+
+        self.columns = [self.parseColumnHeader(column) for column in self.header]
+        self.columnIndex = {}
+        for columnCount, column in enumerate(self.columns):
+            variable, key, units, timestep = column
+            self.columnIndex.setdefault((variable.upper(), key.upper()), []).append(columnCount)
+
+    def findColumns(self, variable = None, key = None, timestep = None):
+        """Return indices of columns that match the input variable, key and timestep.
+
+        None matches everything. Matching is not case-sensitive.
+        """
+        indices = []
+        for columnCount, (colVariable, colKey, units, colTimestep) in enumerate(self.columns):
+            if variable is not None and colVariable.upper() != variable.upper(): continue
+            if key is not None and colKey.upper() != key.upper(): continue
+            if timestep is not None and colTimestep.upper() != timestep.upper(): continue
+            indices.append(columnCount)
+        return indices
+
+    def readColumns(self, columnIndices):
+        """Read the requested columns from the cache or from the result file.
+
+        Empty cells (e.g. monthly data in a file with hourly data) are skipped.
+
+        Returns:
+            A dictionary with column indices as keys and array('d') of values.
+        """
+        columnIndices = sorted(set(columnIndices))
+        if not columnIndices: return {}
+
+        if self.useCache and not self.cacheIndex:
+            try:
+                self.cacheIndex = self.writeCache()
+            except Exception, e:
+                # the folder may be read-only. Read the csv file instead.
+                print "Failed to write the result cache:\n" + `e`
+                self.cacheIndex = None
+
+        if self.cacheIndex:
+            return self.readColumnsFromCache(columnIndices)
+        else:
+            return self.readColumnsFromCsv(columnIndices)
+
+    def readColumn(self, columnIndex):
+        return self.readColumns([columnIndex])[columnIndex]
+
+    def hasGaps(self, columnIndex):
+        """Return True if the column had empty cells when it was read (e.g. monthly data in a file with hourly data)."""
+        return columnIndex in self.gapColumns
+
+    @staticmethod
+    def interleaveColumns(valueLists):
+        """Merge the values of several columns row by row in the order of the columns.
+
+        This is the order that the values are added in when a file is read line by line.
+        """
+        if len(valueLists) == 1: return valueLists[0]
+        return [value for row in itertools.izip_longest(*valueLists) for value in row if value is not None]
+
+    def readColumnsFromCsv(self, columnIndices):
+        data = dict((columnCount, array('d')) for columnCount in columnIndices)
+        appends = [(columnCount, data[columnCount].append) for columnCount in columnIndices]
+        rowCount = 0
+        with open(self.csvFilePath, 'r') as resultFile:
+            resultFile.readline()
+            for line in resultFile:
+                cells = line.split(',')
+                rowCount += 1
+                for columnCount, append in appends:
+                    try: append(float(cells[columnCount]))
+                    except (ValueError, IndexError): pass
+
+        for columnCount in columnIndices:
+            if len(data[columnCount]) != rowCount: self.gapColumns.add(columnCount)
+
+        return data
+
+    def readColumnsFromCache(self, columnIndices):
+        rowCount = self.cacheIndex["rowCount"]
+        blockRows = self.cacheIndex["blockRows"]
+        hasGaps = self.cacheIndex["hasGaps"]
+        numOfColumns = len(self.header)
+        byteswap = self.cacheIndex["byteorder"] != sys.byteorder
+        itemSize = array('d').itemsize
+
+        data = {}
+        with open(self.cacheFilePath, 'rb') as cacheFile:
+            for columnCount in columnIndices:
+                values = array('d')
+                for blockStart in range(0, rowCount, blockRows):
+                    rows = min(blockRows, rowCount - blockStart)
+                    cacheFile.seek(itemSize * (blockStart * numOfColumns + columnCount * rows))
+                    values.fromfile(cacheFile, rows)
+                if byteswap: values.byteswap()
+                if hasGaps[columnCount]:
+                    # NaN is used for empty cells in the cache
+                    values = array('d', (value for value in values if value == value))
+                    self.gapColumns.add(columnCount)
+                data[columnCount] = values
+
+        return data
+
+    def getCsvFileStamp(self):
+        return os.path.normcase(os.path.abspath(self.csvFilePath)), \
+            os.path.getsize(self.csvFilePath), os.path.getmtime(self.csvFilePath)
+
+    def loadCacheIndex(self):
+        """Return the cache index if the cache is valid for the current csv file."""
+        if not os.path.isfile(self.cacheIndexPath) or not os.path.isfile(self.cacheFilePath):
+            return None
+        try:
+            with open(self.cacheIndexPath, 'r') as indexFile:
+                cacheIndex = json.load(indexFile)
+
+            csvPath, csvSize, csvMtime = self.getCsvFileStamp()
+            if cacheIndex["version"] != self.cacheVersion or \
+                cacheIndex["csvFilePath"] != csvPath or \
+                cacheIndex["size"] != csvSize or \
+                cacheIndex["mtime"] != csvMtime:
+                return None
+
+            expectedSize = array('d').itemsize * cacheIndex["rowCount"] * len(cacheIndex["header"])
+            if os.path.getsize(self.cacheFilePath) != expectedSize:
+                return None
+        except:
+            return None
+
+        return cacheIndex
+
+    def writeCache(self):
+        """Parse the whole csv file once and write the binary cache and its index."""
+        csvPath, csvSize, csvMtime = self.getCsvFileStamp()
+        numOfColumns = len(self.header)
+        blockRows = max(1, self.cacheBlockValues // max(1, numOfColumns))
+        hasGaps = [False] * numOfColumns
+        nan = float('nan')
+        rowCount = 0
+
+        def writeBlock(block, cacheFile):
+            for columnValues in block:
+                columnValues.tofile(cacheFile)
+
+        tempFilePath = self.cacheFilePath + '.tmp'
+        with open(self.csvFilePath, 'r') as resultFile:
+            with open(tempFilePath, 'wb') as cacheFile:
+                resultFile.readline()
+                block = [array('d') for i in range(numOfColumns)]
+                blockCount = 0
+                for line in resultFile:
+                    cells = line.split(',')
+                    for columnCount in range(numOfColumns):
+                        try:
+                            value = float(cells[columnCount])
+                        except (ValueError, IndexError):
+                            value = nan
+                            hasGaps[columnCount] = True
+                        block[columnCount].append(value)
+                    rowCount += 1
+                    blockCount += 1
+                    if blockCount == blockRows:
+                        writeBlock(block, cacheFile)
+                        block = [array('d') for i in range(numOfColumns)]
+                        blockCount = 0
+                if blockCount:
+                    writeBlock(block, cacheFile)
+
+        if os.path.isfile(self.cacheFilePath): os.remove(self.cacheFilePath)
+        os.rename(tempFilePath, self.cacheFilePath)
+
+        cacheIndex = {"version": self.cacheVersion,
+                      "csvFilePath": csvPath,
+                      "size": csvSize,
+                      "mtime": csvMtime,
+                      "header": self.header,
+                      "rowCount": rowCount,
+                      "blockRows": blockRows,
+                      "hasGaps": hasGaps,
+                      "byteorder": sys.byteorder}
+        with open(self.cacheIndexPath, 'w') as indexFile:
+            json.dump(cacheIndex, indexFile)
+
+        return cacheIndex
+
+    @classmethod
+    def fromResultFile(cls, resultFilePath, useCache = True):
+        """Return a reader for an EnergyPlus result file.
+
+        An .eso file is streamed with hb_EPESOReader and an .sql file is read with
+        hb_EPSQLResultReader. Any other file is read as a csv file. If zones were
+        collapsed with zone multipliers, the reader is wrapped in
+        hb_EPZoneMultiplierReader to add the results of the collapsed zones.
+        """
+        reader = None
+        if resultFilePath.lower().endswith('.eso'):
+            reader = hb_EPESOReader(resultFilePath)
+        elif resultFilePath.lower().endswith('.sql'):
+            # the sql file is only used if it is asked for explicitly
+            reader = hb_EPSQLResultReader(resultFilePath)
+        if reader is None:
+            reader = cls(resultFilePath, useCache)
+        
+        # add the results of the zones that were collapsed with zone multipliers
+        zoneMap = hb_EPZoneMultipliers.loadMap(resultFilePath)
+        if zoneMap:
+            reader = hb_EPZoneMultiplierReader(reader, zoneMap)
+        return reader
+
+
+class hb_EPSQLResultReader(object):
+    """
+    Read EnergyPlus results from the SQLite output of the simulation (eplusout.sql).
+
+    The reader has the same interface as hb_EPResultReader. The header is made from
+    the ReportDataDictionary table in the same format as the heading of the csv file
+    (e.g. "ZONE1:Zone Mean Air Temperature [C](Hourly)") so the Read EP components
+    can analyze it the same way, and the values of each column are read with an
+    indexed query on the ReportData table. Unlike the csv file, the number of
+    columns is not limited.
+
+    Tabular reports can be read with readTabularData.
+
+    Args:
+        sqlFilePath: Path to an EnergyPlus sql file (e.g. eplusout.sql).
+    """
+
+    # the name of the reporting frequencies in the sql file and in the csv file
+    timestepNames = {'ZONE TIMESTEP': 'TimeStep', 'HVAC SYSTEM TIMESTEP': 'TimeStep',
+                     'DETAILED': 'Each Call', 'RUN PERIOD': 'RunPeriod'}
+
+    def __init__(self, sqlFilePath):
+        self.sqlFilePath = sqlFilePath
+        self.sqlite = self.getSqliteModule()
+        self.header = []
+        self.columns = []
+        self.columnIndex = {}
+        self.dataDictionaryIndices = []
+        self.readHeader()
+
+    @staticmethod
+    def getSqliteModule():
+        """Import sqlite3 or raise ImportError if it is not available."""
+        try:
+            import sqlite3
+        except ImportError:
+            # IronPython ships sqlite3 in a separate assembly
+            import clr
+            clr.AddReference("IronPython.SQLite")
+            import sqlite3
+        return sqlite3
+
+    def connect(self):
+        return self.sqlite.connect(self.sqlFilePath)
+
+    def readHeader(self):
+        conn = self.connect()
+        try:
+            rows = conn.execute("SELECT ReportDataDictionaryIndex, KeyValue, Name, Units, ReportingFrequency " + \
+                                "FROM ReportDataDictionary ORDER BY ReportDataDictionaryIndex").fetchall()
+        finally:
+            conn.close()
+
+        # the first column of the csv file is the date and time
+        self.header = ['Date/Time']
+        self.columns = [('Date/Time', '', '', '')]
+        self.dataDictionaryIndices = [None]
+        for dataIndex, key, variable, units, frequency in rows:
+            key = key or ''
+            units = units or ''
+            timestep = self.timestepNames.get(frequency.upper(), frequency)
+            if key: column = key + ':' + variable
+            else: column = variable
+            self.header.append(column + ' [' + units + '](' + timestep + ')')
+            self.columns.append((variable, key, units, timestep))
+            self.dataDictionaryIndices.append(dataIndex)
+
+        self.columnIndex = {}
+        for columnCount, column in enumerate(self.columns):
+            variable, key, units, timestep = column
+            self.columnIndex.setdefault((variable.upper(), key.upper()), []).append(columnCount)
+
+    def findColumns(self, variable = None, key = None, timestep = None):
+        """Return indices of columns that match the input variable, key and timestep.
+
+        None matches everything. Matching is not case-sensitive.
+        """
+        indices = []
+        for columnCount, (colVariable, colKey, units, colTimestep) in enumerate(self.columns):
+            if variable is not None and colVariable.upper() != variable.upper(): continue
+            if key is not None and colKey.upper() != key.upper(): continue
+            if timestep is not None and colTimestep.upper() != timestep.upper(): continue
+            indices.append(columnCount)
+        return indices
+
+    @staticmethod
+    def timeKey(date):
+        month, day, hour = date
+        return month * 10000 + day * 100 + hour
+
+    def readColumns(self, columnIndices, startDate = None, endDate = None):
+        """Read the values of the requested columns.
+
+        Values of the warmup days are not included, the same as the csv file.
+
+        Args:
+            columnIndices: Indices of the columns in the header.
+            startDate: Optional (month, day, hour) of the first value to be read.
+            endDate: Optional (month, day, hour) of the last value to be read.
+                If endDate is before startDate the period wraps around the end of the year.
+
+        Returns:
+            A dictionary with column indices as keys and array('d') of values.
+        """
+        columnIndices = sorted(set(columnIndices))
+        if not columnIndices: return {}
+
+        query = "SELECT ReportData.Value FROM ReportData " + \
+                "INNER JOIN Time ON ReportData.TimeIndex = Time.TimeIndex " + \
+                "WHERE ReportData.ReportDataDictionaryIndex = ? AND (Time.WarmupFlag IS NULL OR Time.WarmupFlag = 0)"
+        periodArgs = []
+        if startDate != None or endDate != None:
+            timeKey = "(Time.Month * 10000 + Time.Day * 100 + Time.Hour)"
+            start = self.timeKey(startDate or (1, 1, 0))
+            end = self.timeKey(endDate or (12, 31, 24))
+            if start <= end:
+                query += " AND " + timeKey + " BETWEEN ? AND ?"
+            else:
+                query += " AND NOT " + timeKey + " BETWEEN ? AND ?"
+                start, end = end + 1, start - 1
+            periodArgs = [start, end]
+        query += " ORDER BY ReportData.TimeIndex"
+
+        data = {}
+        conn = self.connect()
+        try:
+            for columnCount in columnIndices:
+                dataIndex = self.dataDictionaryIndices[columnCount]
+                if dataIndex == None:
+                    # date and time column
+                    data[columnCount] = array('d')
+                    continue
+                rows = conn.execute(query, [dataIndex] + periodArgs)
+                data[columnCount] = array('d', (row[0] for row in rows))
+        finally:
+            conn.close()
+
+        return data
+
+    def readColumn(self, columnIndex):
+        return self.readColumns([columnIndex])[columnIndex]
+
+    def hasGaps(self, columnIndex):
+        """Values are only stored for the timesteps of each variable so columns have no gaps."""
+        return False
+
+    def readReportData(self, variable = None, key = None, timestep = None, startDate = None, endDate = None):
+        """Read the values of a variable by zone (key) and time range.
+
+        Returns:
+            A dictionary with the csv style heading of each matching column as keys
+            and array('d') of values.
+        """
+        columnIndices = [c for c in self.findColumns(variable, key, timestep) if self.dataDictionaryIndices[c] != None]
+        data = self.readColumns(columnIndices, startDate, endDate)
+        return dict((self.header[columnCount], values) for columnCount, values in data.items())
+
+    def readTabularData(self, reportName, tableName = None, reportFor = None, rowName = None, columnName = None):
+        """Read the values of a tabular report (e.g. 'AnnualBuildingUtilityPerformanceSummary').
+
+        Returns:
+            A list of (reportFor, tableName, rowName, columnName, units, value). The values
+            are strings the same as in the html report.
+        """
+        query = "SELECT ReportForString, TableName, RowName, ColumnName, Units, Value " + \
+                "FROM TabularDataWithStrings WHERE ReportName = ?"
+        args = [reportName]
+        for field, value in (('TableName', tableName), ('ReportForString', reportFor),
+                             ('RowName', rowName), ('ColumnName', columnName)):
+            if value != None:
+                query += " AND " + field + " = ?"
+                args.append(value)
+
+        conn = self.connect()
+        try:
+            return [tuple(row) for row in conn.execute(query, args)]
+        finally:
+            conn.close()
+
+
+class hb_EPESOReader(object):
+    """
+    Stream EnergyPlus results from the .eso file of the simulation (eplusout.eso).
+
+    Only the data dictionary at the start of the file is parsed when the reader is
+    created. It has the same interface as hb_EPResultReader, with a header in the
+    format of the heading of the csv file (e.g. "ZONE1:Zone Mean Air Temperature [C](Hourly)"),
+    so the Read EP components can read the .eso file of models with more output
+    variables than the csv file can hold.
+
+    Values are streamed from the file and only the values of the requested report
+    ids are kept, in compact array('d') buffers. For daily, monthly and run period
+    variables only the value is read and the min and max columns are ignored,
+    the same as the csv file.
+
+    Args:
+        esoFilePath: Path to an EnergyPlus eso file (e.g. eplusout.eso).
+    """
+
+    # ids of the lines with the environment and the time stamps. Report ids start after these.
+    environmentId = '1'
+    timeStampIds = ('2', '3', '4', '5', '6')
+
+    def __init__(self, esoFilePath):
+        self.esoFilePath = esoFilePath
+        self.header = []
+        self.columns = []
+        self.columnIndex = {}
+        self.reportIds = []
+        self.readHeader()
+
+    @staticmethod
+    def parseDictionaryLine(line):
+        """Split a line of the data dictionary into (reportId, variable, key, units, timestep).
+
+        e.g. "8,1,ZONE1,Zone Mean Air Temperature [C] !Hourly" will be split into
+        ("8", "Zone Mean Air Temperature", "ZONE1", "C", "Hourly").
+        """
+        line = line.strip()
+        timestep = ''
+        if '!' in line:
+            line, timestep = line.split('!', 1)
+            timestep = timestep.split('[')[0].strip()
+        reportId, numOfFields, column = line.split(',', 2)
+        column = column.strip()
+        units = ''
+        if column.endswith(']') and '[' in column:
+            column, units = column[:-1].rsplit('[', 1)
+        if ',' in column:
+            key, variable = column.rsplit(',', 1)
+        else:
+            key, variable = '', column
+        return reportId.strip(), variable.strip(), key.strip(), units.strip(), timestep
+
+    def readHeader(self):
+        # the first column of the csv file is the date and time
+        self.header = ['Date/Time']
+        self.columns = [('Date/Time', '', '', '')]
+        self.reportIds = [None]
+
+        with open(self.esoFilePath, 'r') as esoFile:
+            esoFile.readline() # program version
+            for line in esoFile:
+                if line.startswith('End of Data Dictionary'): break
+                reportId = line.split(',', 1)[0]
+                if reportId == self.environmentId or reportId in self.timeStampIds: continue
+
+                reportId, variable, key, units, timestep = self.parseDictionaryLine(line)
+                if key: column = key + ':' + variable
+                else: column = variable
+                self.header.append(column + ' [' + units + '](' + timestep + ')')
+                self.columns.append((variable, key, units, timestep))
+                self.reportIds.append(reportId)
+
+        self.columnIndex = {}
+        for columnCount, column in enumerate(self.columns):
+            variable, key, units, timestep = column
+            self.columnIndex.setdefault((variable.upper(), key.upper()), []).append(columnCount)
+
+    def findColumns(self, variable = None, key = None, timestep = None):
+        """Return indices of columns that match the input variable, key and timestep.
+
+        None matches everything. Matching is not case-sensitive.
+        """
+        indices = []
+        for columnCount, (colVariable, colKey, units, colTimestep) in enumerate(self.columns):
+            if variable is not None and colVariable.upper() != variable.upper(): continue
+            if key is not None and colKey.upper() != key.upper(): continue
+            if timestep is not None and colTimestep.upper() != timestep.upper(): continue
+            indices.append(columnCount)
+        return indices
+
+    @staticmethod
+    def parseTimeStamp(cells):
+        """Return (month, day, hour, minute) of a time stamp line.
+
+        Daily, monthly and run period stamps are set to the end of their period.
+        Run period stamps don't have a month and are returned as None.
+        """
+        stampId = cells[0]
+        if stampId == '2':
+            return int(cells[2]), int(cells[3]), int(cells[5]), int(float(cells[7]))
+        elif stampId == '3':
+            return int(cells[2]), int(cells[3]), 24, 0
+        elif stampId == '4':
+            month = int(cells[2])
+            return month, (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)[month - 1], 24, 0
+        return None
+
+    def iterRecords(self, reportIds = None):
+        """Stream the values of the file as (reportId, timeStamp, value).
+
+        timeStamp is (month, day, hour, minute) of the last time stamp before the
+        value (see parseTimeStamp). If reportIds is given, the values of the other
+        report ids are skipped without being parsed.
+        """
+        if reportIds != None: reportIds = set(reportIds)
+        timeStamp = None
+        with open(self.esoFilePath, 'r') as esoFile:
+            for line in esoFile:
+                if line.startswith('End of Data Dictionary'): break
+            for line in esoFile:
+                reportId, sep, values = line.partition(',')
+                if reportId in self.timeStampIds:
+                    timeStamp = self.parseTimeStamp(line.rstrip().split(','))
+                elif reportId == self.environmentId:
+                    timeStamp = None
+                elif not sep:
+                    # End of Data
+                    break
+                elif reportIds == None or reportId in reportIds:
+                    yield reportId, timeStamp, float(values.split(',', 1)[0])
+
+    def readColumns(self, columnIndices, startDate = None, endDate = None):
+        """Read the values of the requested columns in one pass over the file.
+
+        Args:
+            columnIndices: Indices of the columns in the header.
+            startDate: Optional (month, day, hour) of the first value to be read.
+            endDate: Optional (month, day, hour) of the last value to be read.
+                If endDate is before startDate the period wraps around the end of the year.
+
+        Returns:
+            A dictionary with column indices as keys and array('d') of values.
+        """
+        columnIndices = sorted(set(columnIndices))
+        if not columnIndices: return {}
+
+        data = dict((columnCount, array('d')) for columnCount in columnIndices)
+        appends = {}
+        for columnCount in columnIndices:
+            reportId = self.reportIds[columnCount]
+            # the date and time column has no values
+            if reportId != None: appends.setdefault(reportId, []).append(data[columnCount].append)
+        if not appends: return data
+
+        isInPeriod = None
+        if startDate != None or endDate != None:
+            start = tuple(startDate or (1, 1, 0))
+            end = tuple(endDate or (12, 31, 24))
+            def isInPeriod(timeStamp):
+                if timeStamp == None: return True
+                date = timeStamp[:3]
+                if start <= end: return start <= date <= end
+                return date >= start or date <= end
+
+        for reportId, timeStamp, value in self.iterRecords(appends.keys()):
+            if isInPeriod != None and not isInPeriod(timeStamp): continue
+            for append in appends[reportId]: append(value)
+
+        return data
+
+    def readColumn(self, columnIndex):
+        return self.readColumns([columnIndex])[columnIndex]
+
+    def hasGaps(self, columnIndex):
+        """Values are only stored for the timesteps of each variable so columns have no gaps."""
+        return False
+
+    def readReportData(self, variable = None, key = None, timestep = None, startDate = None, endDate = None):
+        """Read the values of a variable by zone (key) and time range.
+
+        Returns:
+            A dictionary with the csv style heading of each matching column as keys
+            and array('d') of values.
+        """
+        columnIndices = [c for c in self.findColumns(variable, key, timestep) if self.reportIds[c] != None]
+        data = self.readColumns(columnIndices, startDate, endDate)
+        return dict((self.header[columnCount], values) for columnCount, values in data.items())
+
+
 class hb_hvacProperties(object):
     def __init__(self):
         
@@ -9617,16 +12736,25 @@ if checkIn.letItFly:
             EPLibs = HB_GetEPLibraries()
             
             try:
-                for pathCount, path in enumerate(libFilePaths):
-                    if "honeybee_Hive" not in sc.sticky:
-                        # This is first time loading so clean the library
-                        cleanLibs = True if pathCount == 0 else False
-                    else:
-                        cleanLibs = False
-                    if path.endswith('.csv'): isMatFile = True
-                    else: isMatFile = False
+                # load the parsed libraries from the snapshot if the files haven't changed
+                snapshotFile = os.path.join(os.path.dirname(libFilePaths[0]), "EPLibraries.snapshot")
+                snapshotKey = EPLibs.getSnapshotKey(libFilePaths)
+                
+                if EPLibs.importEPLibrariesFromSnapshot(snapshotFile, snapshotKey):
+                    print "Loading EP libraries from %s"%snapshotFile
+                else:
+                    for pathCount, path in enumerate(libFilePaths):
+                        if "honeybee_Hive" not in sc.sticky:
+                            # This is first time loading so clean the library
+                            cleanLibs = True if pathCount == 0 else False
+                        else:
+                            cleanLibs = False
+                        if path.endswith('.csv'): isMatFile = True
+                        else: isMatFile = False
+                        
+                        EPLibs.importEPLibrariesFromFile(path, isMatFile, cleanLibs, False, lazy = True)
                     
-                    EPLibs.importEPLibrariesFromFile(path, isMatFile, cleanLibs, False)                
+                    EPLibs.writeSnapshot(snapshotFile, snapshotKey)
                 
                 EPLibs.report()
                 sc.sticky["honeybee_materialLib"].update(EPLibs.getEPMaterials())
@@ -9654,6 +12782,7 @@ if checkIn.letItFly:
         sc.sticky["honeybee_EPScheduleAUX"] = EPScheduleAux
         sc.sticky["honeybee_EPObjectsAUX"] = EPObjectsAux
         sc.sticky["honeybee_ReadSchedules"] = ReadEPSchedules
+        sc.sticky["honeybee_EPScheduleCompiler"] = hb_EPScheduleCompiler
         sc.sticky["honeybee_BuildingProgramsLib"] = BuildingProgramsLib
         sc.sticky["honeybee_EPTypes"] = EPTypes()
         sc.sticky["honeybee_EPZone"] = EPZone
@@ -9684,13 +12813,25 @@ if checkIn.letItFly:
         sc.sticky["honeybee_DLAnalysisRecipe"] = DLAnalysisRecipe
         sc.sticky["honeybee_MeshToRAD"] = hb_MSHToRAD
         sc.sticky["honeybee_WriteRAD"] = hb_WriteRAD
+        sc.sticky["honeybee_ProcessPool"] = hb_ProcessPool
+        sc.sticky["honeybee_EPBatchRunner"] = hb_EPBatchRunner
+        sc.sticky["honeybee_EPRunCache"] = hb_EPRunCache
+        sc.sticky["honeybee_EPZoneMultipliers"] = hb_EPZoneMultipliers
+        sc.sticky["honeybee_EPWData"] = hb_EPWData
+        sc.sticky["honeybee_EPDesignDays"] = hb_EPDesignDays
         sc.sticky["honeybee_WriteRADAUX"] = hb_WriteRADAUX
         sc.sticky["honeybee_WriteDS"] = hb_WriteDS
         sc.sticky["honeybee_RADParameters"] = hb_RADParameters
         sc.sticky["honeybee_DSParameters"] = hb_DSParameters
         sc.sticky["honeybee_ReadAnnualResultsAux"] = hb_ReadAnnualResultsAux
+        sc.sticky["honeybee_AnnualDaylightMetrics"] = hb_AnnualDaylightMetrics
+        sc.sticky["honeybee_IllBinaryFile"] = hb_IllBinaryFile
+        sc.sticky["honeybee_MicroclimateMatrix"] = hb_MicroclimateMatrix
         sc.sticky["honeybee_EPParameters"] = hb_EnergySimulatioParameters
         sc.sticky["honeybee_SerializeObjects"] = SerializeObjects
+        sc.sticky["honeybee_EPResultReader"] = hb_EPResultReader
+        sc.sticky["honeybee_EPSQLResultReader"] = hb_EPSQLResultReader
+        sc.sticky["honeybee_EPESOReader"] = hb_EPESOReader
         sc.sticky["honeybee_GridBasedDLResults"] = CalculateGridBasedDLAnalysisResults
         sc.sticky["honeybee_DLAnalaysisTypes"] = {0: ["0: illuminance" , "lux"],
                                                   1: ["1: radiation" , "wh/m2"],
@@ -33,7 +33,7 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_Import Pts File"
 ghenv.Component.NickName = 'importPts'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
@@ -72,10 +72,26 @@ def main(ptsFileAddress):
     workingDir = os.path.dirname(ptsFileAddress[0])
     dirFiles = os.listdir(workingDir)
     ptnFileName = None
+    ptmFileName = None
     for fn in dirFiles:
-        if fn.endswith(".ptn"):
+        if fn.endswith(".ptn") and ptnFileName == None:
             ptnFileName = os.path.join(workingDir, fn)
-            break
+        elif fn.endswith(".ptm") and ptmFileName == None:
+            ptmFileName = os.path.join(workingDir, fn)
+    
+    # points are striped between the .pts files. put them back in order
+    if ptmFileName != None:
+        with open(ptmFileName, "r") as ptmInf:
+            pointOrder = map(int, ptmInf.read().split(",")[:-1])
+        
+        if len(pointOrder) == len(pointsF):
+            sortedPoints = [None] * len(pointsF)
+            sortedVectors = [None] * len(vectorsF)
+            for ptCount, orgCount in enumerate(pointOrder):
+                sortedPoints[orgCount] = pointsF[ptCount]
+                sortedVectors[orgCount] = vectorsF[ptCount]
+            pointsF[:] = sortedPoints
+            vectorsF[:] = sortedVectors
     
     if ptnFileName != None:
         with open(ptnFileName, "r") as ptnInf:
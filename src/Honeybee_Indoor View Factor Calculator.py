@@ -58,11 +58,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Indoor View Factor Calculator"
 ghenv.Component.NickName = 'IndoorViewFactor'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJUL_24_2017
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUN_25_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -76,7 +76,6 @@ from Grasshopper.Kernel.Data import GH_Path
 import Rhino as rc
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
-import operator
 import System.Threading.Tasks as tasks
 import time
 
@@ -124,7 +123,7 @@ def copyHBZoneData():
         zoneCentPts.append(HZone.GetBoundingBox(False).Center)
 
         #Copy some of the basic zone properties.
-        zone = hb_hive.visualizeFromHoneybeeHive([HZone])[0]
+        zone = hb_hive.callFromHoneybeeHive([HZone], readOnly = True)[0]
         zoneNames.append(zone.name)
         zoneNatVentArea.append(zone.windowOpeningArea)
         zoneVolumes.append(zone.getZoneVolume())
@@ -1214,52 +1213,209 @@ def checkViewResolution(viewResolution, lb_preparation):
 
     return newVecs, skyViewVecs, newVecsAreas, skyViewVecsAreas
 
-def allSame(items):
-    return all(x == items[0] for x in items)
+class MeshRayBVH(object):
+    """Bounding volume hierarchy over the triangles of a list of meshes.
+
+    The tree is built once for each zone and is shared by all of the test points
+    of that zone.  Queries only visit the boxes that a ray passes through so the
+    cost of a ray grows with log(triangles) instead of with the number of meshes.
+    Hits are reported with the index of the mesh in the list that built the tree.
+    The tree is read-only after it is built and can be queried from several threads.
+    """
+    leafSize = 4
+    bigNum = 1.0e30
+
+    def __init__(self, meshes):
+        items = []
+        for meshCount, mesh in enumerate(meshes):
+            if mesh == None: continue
+            verts = [(pt.X, pt.Y, pt.Z) for pt in mesh.Vertices]
+            for face in mesh.Faces:
+                items.append(self.makeTriangle(verts[face.A], verts[face.B], verts[face.C], meshCount))
+                if face.IsQuad:
+                    items.append(self.makeTriangle(verts[face.A], verts[face.C], verts[face.D], meshCount))
+
+        self.nodes = []
+        if len(items) != 0: self.build(items, 0, len(items))
+        self.triangles = [item[2] for item in items]
+
+    @staticmethod
+    def makeTriangle(a, b, c, meshIndex):
+        bounds = (min(a[0], b[0], c[0]), min(a[1], b[1], c[1]), min(a[2], b[2], c[2]), \
+                  max(a[0], b[0], c[0]), max(a[1], b[1], c[1]), max(a[2], b[2], c[2]))
+        centroid = ((a[0]+b[0]+c[0])/3, (a[1]+b[1]+c[1])/3, (a[2]+b[2]+c[2])/3)
+        triangle = (a[0], a[1], a[2], b[0]-a[0], b[1]-a[1], b[2]-a[2], c[0]-a[0], c[1]-a[1], c[2]-a[2], meshIndex)
+        return centroid, bounds, triangle
+
+    def build(self, items, start, end):
+        #Each node is [minX, minY, minZ, maxX, maxY, maxZ, splitAxis, leftChild, rightChild, firstTriangle, triangleCount].
+        bounds = [self.bigNum, self.bigNum, self.bigNum, -self.bigNum, -self.bigNum, -self.bigNum]
+        cMin = [self.bigNum, self.bigNum, self.bigNum]
+        cMax = [-self.bigNum, -self.bigNum, -self.bigNum]
+        for centroid, triBounds, triangle in items[start:end]:
+            for axis in range(3):
+                if triBounds[axis] < bounds[axis]: bounds[axis] = triBounds[axis]
+                if triBounds[axis+3] > bounds[axis+3]: bounds[axis+3] = triBounds[axis+3]
+                if centroid[axis] < cMin[axis]: cMin[axis] = centroid[axis]
+                if centroid[axis] > cMax[axis]: cMax[axis] = centroid[axis]
+
+        nodeIndex = len(self.nodes)
+        node = bounds + [0, -1, -1, start, end - start]
+        self.nodes.append(node)
+        if end - start <= self.leafSize: return nodeIndex
+
+        #Split the triangles at the median centroid along the longest axis.
+        extents = [cMax[axis] - cMin[axis] for axis in range(3)]
+        axis = extents.index(max(extents))
+        items[start:end] = sorted(items[start:end], key=lambda item: item[0][axis])
+        mid = (start + end) // 2
+        node[6] = axis
+        node[7] = self.build(items, start, mid)
+        node[8] = self.build(items, mid, end)
+        node[10] = 0
+        return nodeIndex
+
+    def castRay(self, ray, stopAtFirst=False, findAll=False):
+        origin = ray.Position
+        direction = ray.Direction
+        ox, oy, oz = origin.X, origin.Y, origin.Z
+        dx, dy, dz = direction.X, direction.Y, direction.Z
+        ix = 1.0/dx if dx != 0 else self.bigNum
+        iy = 1.0/dy if dy != 0 else self.bigNum
+        iz = 1.0/dz if dz != 0 else self.bigNum
+        dirSigns = (dx < 0, dy < 0, dz < 0)
+
+        bestT = self.bigNum
+        bestMesh = -1
+        hitMeshes = set()
+        nodes = self.nodes
+        triangles = self.triangles
+        stack = [0] if len(nodes) != 0 else []
+        while stack:
+            node = nodes[stack.pop()]
+
+            #Slab test of the ray against the box of the node.
+            t1 = (node[0] - ox) * ix
+            t2 = (node[3] - ox) * ix
+            if t1 > t2: t1, t2 = t2, t1
+            tNear, tFar = max(t1, 0), min(t2, bestT)
+            t1 = (node[1] - oy) * iy
+            t2 = (node[4] - oy) * iy
+            if t1 > t2: t1, t2 = t2, t1
+            if t1 > tNear: tNear = t1
+            if t2 < tFar: tFar = t2
+            t1 = (node[2] - oz) * iz
+            t2 = (node[5] - oz) * iz
+            if t1 > t2: t1, t2 = t2, t1
+            if t1 > tNear: tNear = t1
+            if t2 < tFar: tFar = t2
+            if tNear > tFar: continue
+
+            if node[10] == 0:
+                #Visit the child on the near side of the split first so that farther boxes can be skipped.
+                if dirSigns[node[6]]: stack.extend((node[7], node[8]))
+                else: stack.extend((node[8], node[7]))
+                continue
+
+            for x0, y0, z0, e1x, e1y, e1z, e2x, e2y, e2z, meshIndex in triangles[node[9]:node[9]+node[10]]:
+                #Moller-Trumbore ray-triangle intersection.
+                px = dy*e2z - dz*e2y
+                py = dz*e2x - dx*e2z
+                pz = dx*e2y - dy*e2x
+                det = e1x*px + e1y*py + e1z*pz
+                if det == 0: continue
+                invDet = 1.0/det
+                tx, ty, tz = ox - x0, oy - y0, oz - z0
+                u = (tx*px + ty*py + tz*pz) * invDet
+                if u < 0 or u > 1: continue
+                qx = ty*e1z - tz*e1y
+                qy = tz*e1x - tx*e1z
+                qz = tx*e1y - ty*e1x
+                v = (dx*qx + dy*qy + dz*qz) * invDet
+                if v < 0 or u + v > 1: continue
+                t = (e2x*qx + e2y*qy + e2z*qz) * invDet
+                if t < 0: continue
+
+                if stopAtFirst: return meshIndex
+                elif findAll: hitMeshes.add(meshIndex)
+                elif t < bestT or (t == bestT and meshIndex < bestMesh):
+                    bestT = t
+                    bestMesh = meshIndex
+
+        if findAll: return sorted(hitMeshes)
+        return bestMesh
+
+    def nearestHit(self, ray):
+        """Return the index of the first mesh that the ray hits or -1 if it hits nothing."""
+        return self.castRay(ray)
+
+    def anyHit(self, ray):
+        """Return True if the ray hits any of the meshes."""
+        return self.castRay(ray, stopAtFirst=True) != -1
+
+    def allHits(self, ray):
+        """Return the sorted indices of all meshes that the ray passes through."""
+        return self.castRay(ray, findAll=True)
+
+
+def projectPointViewFactors(point, viewVectors, srfTree, srfCount):
+    #Count the rays that see each surface first.
+    srfHits = [0] * srfCount
+    for vec in viewVectors:
+        srfIndex = srfTree.nearestHit(rc.Geometry.Ray3d(point, vec))
+        if srfIndex != -1: srfHits[srfIndex] += 1
+
+    #Divide by the total rays to get the view factor.
+    divisor = len(viewVectors)
+    return [hitCount/divisor for hitCount in srfHits]
 
 def parallel_projection(zoneSrfsMesh, viewVectors, pointList):
+    #Build the ray tree of the zone once for all of the points.
+    srfTree = MeshRayBVH(zoneSrfsMesh)
+    srfCount = len(zoneSrfsMesh)
+
     #Placeholder for the outcome of the parallel projection.
     pointIntList = []
     for point in pointList: pointIntList.append([])
 
-    #Keep track of the divisor.
-    divisor = len(viewVectors)
-
     def intersect(i):
-        point = pointList[i]
-        #Create the rays to be projected from each point.
-        pointRays = []
-        for vec in viewVectors: pointRays.append(rc.Geometry.Ray3d(point, vec))
-
-        #Create a list that will hold the intersection hits of each surface
-        srfHits = []
-        for srf in zoneSrfsMesh: srfHits.append([])
-
-        #Perform the intersection of the rays with the mesh.
-        pointIntersectList = []
-        for rayCount, ray in enumerate(pointRays):
-            pointIntersectList.append([])
-            for srf in zoneSrfsMesh:
-                intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                if intersect == -1: intersect = "N"
-                pointIntersectList[rayCount].append(intersect)
-
-        #Find the intersection that was the closest for each ray.
-        for list in pointIntersectList:
-            if allSame(list) == False:
-                minIndex, minValue = min(enumerate(list), key=operator.itemgetter(1))
-                srfHits[minIndex].append(1)
-
-        #Sum up the lists and divide by the total rays to get the view factor.
-        for hitList in srfHits:
-            pointIntList[i].append(sum(hitList)/divisor)
+        pointIntList[i] = projectPointViewFactors(pointList[i], viewVectors, srfTree, srfCount)
 
     tasks.Parallel.ForEach(range(len(pointList)), intersect)
 
     return pointIntList
 
 
+def projectPointSkyView(point, skyViewVecs, opaqueTree, windowTree, zoneWindowTransmiss, zoneHasWindows, zoneWindowNames):
+    finalViewCount = []
+    finalWindowNameCount = []
+    for vec in skyViewVecs:
+        ray = rc.Geometry.Ray3d(point, vec)
+        if opaqueTree.anyHit(ray):
+            #The ray has been blocked by an opaque surface.
+            finalViewCount.append(0)
+            finalWindowNameCount.append(0)
+        elif zoneHasWindows == 2:
+            finalViewCount.append(1) #This is the code to indicate that the point is outside and there is no need to calculate a window transmissivity.
+            finalWindowNameCount.append(0)
+        else:
+            #The ray is not blocked but it is hitting a window and so we need to factor in the window transmissivity.
+            transmiss = 1
+            winNameList = []
+            for winCount in windowTree.allHits(ray):
+                transmiss = transmiss * zoneWindowTransmiss[winCount]
+                winNameList.append(zoneWindowNames[winCount].upper())
+            finalViewCount.append(transmiss)
+            finalWindowNameCount.append(winNameList)
+
+    #Sum up the lists and divide by the total rays to get the view factor.
+    return sum(finalViewCount)/len(skyViewVecs), finalViewCount, finalWindowNameCount
+
 def parallel_skyProjection(zoneOpaqueMesh, skyViewVecs, skyViewVecsAreas, pointList, zoneWindowMesh, zoneWindowTransmiss, zoneHasWindows, zoneWindowNames):
+    #Build the ray trees of the zone once for all of the points.
+    opaqueTree = MeshRayBVH(zoneOpaqueMesh)
+    windowTree = MeshRayBVH(zoneWindowMesh)
+
     #Placeholder for the outcome of the parallel projection.
     pointIntList = []
     skyBlockedList = []
@@ -1269,58 +1425,8 @@ def parallel_skyProjection(zoneOpaqueMesh, skyViewVecs, skyViewVecsAreas, pointL
         skyBlockedList.append([])
         skyBlockWindowNameCount.append([])
 
-    #Keep track of the divisor.
-    divisor = len(skyViewVecs)
-
     def intersect(i):
-        point = pointList[i]
-        #Create the rays to be projected from each point.
-        pointRays = []
-        for vec in skyViewVecs: pointRays.append(rc.Geometry.Ray3d(point, vec))
-
-        #Perform the intersection of the rays with the opaque mesh.
-        pointIntersectList = []
-        for rayCount, ray in enumerate(pointRays):
-            pointIntersectList.append([])
-            for srf in zoneOpaqueMesh:
-                intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                if intersect == -1: pass
-                else: pointIntersectList[rayCount].append(1)
-
-        #See if the ray passed all of the context meshes.
-        finalIntersectList = []
-        for ray in pointRays:
-            finalIntersectList.append([])
-        for listCt, rayList in enumerate(pointIntersectList):
-            for intersect in rayList:
-                finalIntersectList[listCt].append(intersect)
-
-        finalViewCount = []
-        finalWindowNameCount = []
-        for rayListCount, rayList in enumerate(finalIntersectList):
-            if sum(rayList) == 0:
-                if zoneHasWindows == 2:
-                    finalViewCount.append(1)
-                    finalWindowNameCount.append(0)
-                else:
-                    transmiss = 1
-                    winNameList = []
-                    for winCount, winMesh in enumerate(zoneWindowMesh):
-                        intersect = rc.Geometry.Intersect.Intersection.MeshRay(winMesh, pointRays[rayListCount])
-                        if intersect == -1: pass
-                        else:
-                            transmiss = transmiss * zoneWindowTransmiss[winCount]
-                            winNameList.append(zoneWindowNames[winCount].upper())
-                    finalViewCount.append(transmiss)
-                    finalWindowNameCount.append(winNameList)
-            else:
-                finalViewCount.append(0)
-                finalWindowNameCount.append(0)
-
-        #Sum up the lists and divide by the total rays to get the view factor.
-        skyBlockedList[i] = finalViewCount
-        skyBlockWindowNameCount[i] = finalWindowNameCount
-        pointIntList[i] = sum(finalViewCount)/divisor
+        pointIntList[i], skyBlockedList[i], skyBlockWindowNameCount[i] = projectPointSkyView(pointList[i], skyViewVecs, opaqueTree, windowTree, zoneWindowTransmiss, zoneHasWindows, zoneWindowNames)
 
     tasks.Parallel.ForEach(range(len(pointList)), intersect)
 
@@ -1349,58 +1455,12 @@ def skyViewCalc(testPts, zoneOpaqueMesh, skyViewVecs, skyViewVecsAreas, zoneHasW
                 testPtSkyView.append([])
                 testPtSkyBlockedList.append([])
                 testPtBlockName.append([])
+                opaqueTree = MeshRayBVH(zoneOpaqueMesh[zoneCount])
+                windowTree = MeshRayBVH(zoneWindowMesh[zoneCount])
                 for pointCount, point in enumerate(pointList):
-                    #Make the list that will eventually hold the view factors of each surface.
-                    divisor = len(skyViewVecs)
-
-                    #Create the rays to be projected from each point.
-                    pointRays = []
-                    for vec in skyViewVecs: pointRays.append(rc.Geometry.Ray3d(point, vec))
-
-                    #Perform the intersection of the rays with the opaque mesh.
-                    pointIntersectList = []
-                    for rayCount, ray in enumerate(pointRays):
-                        pointIntersectList.append([])
-                        for srf in zoneOpaqueMesh[zoneCount]:
-                            intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                            if intersect == -1: pointIntersectList[rayCount].append(0)
-                            else: pointIntersectList[rayCount].append(1)
-
-                    #See if the ray passed all of the context meshes.
-                    finalIntersectList = []
-                    for ray in pointRays:
-                        finalIntersectList.append([])
-                    for listCt, rayList in enumerate(pointIntersectList):
-                        for intersect in rayList:
-                            finalIntersectList[listCt].append(intersect)
-
-                    finalViewCount = []
-                    finalWindowNameCount = []
-                    for rayListCount, rayList in enumerate(finalIntersectList):
-                        if sum(rayList) == 0:
-                            if zoneHasWindows[zoneCount] == 2:
-                                finalViewCount.append(1) #This is the code to indicate that the point is outside and there is no need to calculate a window transmissivity.
-                                finalWindowNameCount.append(0)
-                            else:
-                                #The ray is not blocked but it is hitting a window and so we need to factor in the window transmissivity.
-                                transmiss = 1
-                                winNameList = []
-                                for winCount, winMesh in enumerate(zoneWindowMesh[zoneCount]):
-                                    intersect = rc.Geometry.Intersect.Intersection.MeshRay(winMesh, pointRays[rayListCount])
-                                    if intersect == -1: pass
-                                    else:
-                                        transmiss = transmiss * zoneWindowTransmiss[zoneCount][winCount]
-                                        winNameList.append(zoneWindowNames[zoneCount][winCount].upper())
-                                finalViewCount.append(transmiss)
-                                finalWindowNameCount.append(winNameList)
-                        else:
-                            #The ray has been blocked by an opaque surface.
-                            finalViewCount.append(0)
-                            finalWindowNameCount.append(0)
-
-                    #Sum up the lists and divide by the total rays to get the view factor.
+                    skyView, finalViewCount, finalWindowNameCount = projectPointSkyView(point, skyViewVecs, opaqueTree, windowTree, zoneWindowTransmiss[zoneCount], zoneHasWindows[zoneCount], zoneWindowNames[zoneCount])
                     testPtSkyBlockedList[zoneCount].append(finalViewCount)
-                    testPtSkyView[zoneCount].append(sum(finalViewCount)/divisor)
+                    testPtSkyView[zoneCount].append(skyView)
                     testPtBlockName[zoneCount].append(finalWindowNameCount)
         else:
             testPtSkyView.append(0)
@@ -1419,39 +1479,9 @@ def main(testPts, zoneSrfsMesh, viewVectors, includeOutdoor):
             testPtViewFactor.append(viewFactors)
         else:
             testPtViewFactor.append([])
+            srfTree = MeshRayBVH(zoneSrfsMesh[zoneCount])
             for pointCount, point in enumerate(pointList):
-                #Make the list that will eventually hold the view factors of each surface.
-                testPtViewFactor[zoneCount].append([])
-                divisor = len(viewVectors)
-
-                #Create the rays to be projected from each point.
-                pointRays = []
-                for vec in viewVectors: pointRays.append(rc.Geometry.Ray3d(point, vec))
-
-                #Create a list that will hold the intersection hits of each surface
-                srfHits = []
-                for srf in zoneSrfsMesh[zoneCount]: srfHits.append([])
-
-                #Perform the intersection of the rays with the mesh.
-                pointIntersectList = []
-                for rayCount, ray in enumerate(pointRays):
-                    pointIntersectList.append([])
-                    for srf in zoneSrfsMesh[zoneCount]:
-                        intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                        if intersect == -1: intersect = "N"
-                        pointIntersectList[rayCount].append(intersect)
-
-                #Find the intersection that was the closest for each ray.
-                for list in pointIntersectList:
-                    try:
-                        if allSame(list) == False:
-                            minIndex, minValue = min(enumerate(list), key=operator.itemgetter(1))
-                            srfHits[minIndex].append(1)
-                    except: pass
-
-                #Sum up the lists and divide by the total rays to get the view factor.
-                for hitList in srfHits:
-                    testPtViewFactor[zoneCount][pointCount].append(sum(hitList)/divisor)
+                testPtViewFactor[zoneCount].append(projectPointViewFactors(point, viewVectors, srfTree, len(zoneSrfsMesh[zoneCount])))
 
 
     return testPtViewFactor
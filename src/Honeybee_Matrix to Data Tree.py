@@ -26,14 +26,14 @@ This component converts a comfort result matrix into a Grasshopper Data Tree wit
 Provided by Honeybee 0.0.62
     
     Args:
-        _comfResultsMtx: A matrix of comfort data that
+        _comfResultsMtx: A matrix of comfort data that comes out of the 'Honeybee_Microclimate Map Analysis', 'Honeybee_Read Microclimate Matrix' or 'Honeybee_Thermal Autonomy Analysis' component.  Binary matrices of large analyses are read one hour at a time.
     Returns:
         comfResultsTree: A Grasshopper Data Tree of comfort data with numerical float values.
 """
 
 ghenv.Component.Name = "Honeybee_Matrix to Data Tree"
 ghenv.Component.NickName = 'mtx2DataTree'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
@@ -44,23 +44,29 @@ import Grasshopper.Kernel as gh
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
+
+def getMatrixRows(comfResultsMtx):
+    #Large matrices from the Microclimate Map Analysis are binary matrices that are read one hour at a time.
+    if len(comfResultsMtx) == 1 and hasattr(comfResultsMtx[0], "iterHours"):
+        binaryMtx = comfResultsMtx[0]
+        return binaryMtx.header, binaryMtx.hourCount, binaryMtx.iterHours()
+    return comfResultsMtx[0], len(comfResultsMtx) - 1, comfResultsMtx[1:]
+
+
 comfResultsTree = DataTree[Object]()
 cullLast = False
 
 if _comfResultsMtx != [] and _comfResultsMtx[0] != None:
     try:
-        for bCount, dataList in enumerate(_comfResultsMtx):
-            p = GH_Path(bCount-1)
-            if bCount == 0:
-                if "Over-Heated Percent" in dataList or "Under-Heated Percent" in dataList or "Occupied Thermal Comfort Percent" in dataList or "Thermal Autonomy" in dataList:
-                    cullLast = True
-            elif cullLast == True and bCount == len(_comfResultsMtx)-1:
-                pass
-            else:
-                for item in dataList:
-                    comfResultsTree.Add(item, p)
+        header, hourCount, hourRows = getMatrixRows(_comfResultsMtx)
+        if "Over-Heated Percent" in header or "Under-Heated Percent" in header or "Occupied Thermal Comfort Percent" in header or "Thermal Autonomy" in header:
+            cullLast = True
+        for hCount, dataList in enumerate(hourRows):
+            if cullLast == True and hCount == hourCount-1: break
+            p = GH_Path(hCount)
+            for item in dataList:
+                comfResultsTree.Add(item, p)
     except:
         warn = 'Failed to convert the matrix.  Make sure that you are connecting up the Mtx and not another type of input.'
         print warn
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warn)
-
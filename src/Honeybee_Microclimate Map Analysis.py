@@ -35,7 +35,7 @@ Provided by Honeybee 0.0.62
         =============: ...
         analysisPeriodOrHOY_: An analysis period from the 'Ladybug Analysis Period' component or an hour of the analysis between 1 and 8760 for which you want to conduct the analysis. If no value is connected here, the component will run for only noon on the winter solstice.  A single HOY is used by default as longer analysis periods can take a very long time.
         =============: ...
-        writeResultFile_: Set to 1 or 'True' to have the component write all results into CSV result files and set to 0 or 'False' to not have the component write these files.  The default is set to 'True' as these simulations can be long and you usually want a copy of your results.  You may want to set it to 'False' if you are just scrolling through key hours and want the fastest run possible.  Set to 2 if you want the component to only write the results of the last two matrices (comfort results and degFromTarget).
+        writeResultFile_: Set to 1 or 'True' to have the component write all results into CSV result files and set to 0 or 'False' to not have the component write these files.  The default is set to 'True' as these simulations can be long and you usually want a copy of your results.  You may want to set it to 'False' if you are just scrolling through key hours and want the fastest run possible.  Set to 2 if you want the component to only write the results of the last two matrices (comfort results and degFromTarget).  Results are written to the files as they are computed, together with a binary copy of each file (*.hbmtx).  Large matrices are not kept in memory and the matrix outputs then hold the binary matrix, which can be plugged into the 'Honeybee_Visualize Microclimate Map' component.
         parallel_: Set to "True" to run the component using multiple CPUs.  This can dramatically decrease calculation time but can interfere with other intense computational processes that might be running on your machine.  For this reason, the default is set to 'False.'
         _runIt: Set boolean to "True" to run the component and generate files for an annual indoor comfort assessment.
     Returns:
@@ -57,11 +57,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Microclimate Map Analysis"
 ghenv.Component.NickName = 'MicroclimateMap'
-ghenv.Component.Message = 'VER 0.0.62\nAUG_12_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUN_07_2016
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -77,6 +77,7 @@ import Rhino as rc
 import scriptcontext as sc
 import math
 import os
+import itertools
 import System.Threading.Tasks as tasks
 
 
@@ -282,36 +283,87 @@ def processPrevailOutdoorTemp(prevailingOutdoorTemp, avgMonthOrRunMean):
     return prevailTemp, coldTimes
 
 
-def calculatePointMRT(srfTempDict, testPtsViewFactor, hour, originalHour, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, prevailingOutdoorTemp):
-    #Calculate the MRT for each point.
-    pointMRTValues = []
-    for zoneCount, pointList in enumerate(testPtsViewFactor):
-        if outdoorClac == False or zoneCount != len(testPtsViewFactor)-1:
-            pointMRTValues.append([])
+class MRTKernel(object):
+    """Batched mean radiant temperature calculation for all of the points of a map.
+
+    The view factors of each point are kept as sparse rows of (surface, view factor)
+    and the surface temperatures are raised to the fourth power once per surface and
+    hour instead of once per point.  Each block of hours is then computed as the
+    product of the points x surfaces view factor matrix and the surfaces x hours T^4
+    matrix, one point row at a time.
+    """
+    hourBlockSize = 168
+
+    def __init__(self, srfTempDict, testPtsViewFactor, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac):
+        self.zones = []
+        self.blockValues = {}
+        for zoneCount, pointList in enumerate(testPtsViewFactor):
+            isOutdoor = outdoorClac == True and zoneCount == len(testPtsViewFactor)-1
+            if isOutdoor: zoneSrfTempDict = outSrfTempDict
+            else: zoneSrfTempDict = srfTempDict
+            
+            pointRows = []
+            srfTemps = {}
             for pointViewFactor in pointList:
-                pointMRT = 0
-                for srfCount, srfView in enumerate(pointViewFactor):
-                    path  = str([zoneCount,srfCount])
-                    weightedSrfTemp = srfView*(math.pow((srfTempDict[path]["srfTemp"][hour] + 273.15),4))
-                    pointMRT = pointMRT+weightedSrfTemp
-                pointMRT = math.pow(pointMRT,0.25) - 273.15
-                pointMRTValues[zoneCount].append(round(pointMRT, 3))
+                row = [(srfCount, srfView) for srfCount, srfView in enumerate(pointViewFactor) if srfView != 0]
+                for srfCount, srfView in row:
+                    if srfCount not in srfTemps:
+                        srfTemps[srfCount] = zoneSrfTempDict[str([zoneCount,srfCount])]["srfTemp"]
+                pointRows.append(row)
+            
+            #The outdoor points also see the outdoor air for the part of their view that is not a surface.
+            if isOutdoor: viewSums = [sum(pointViewFactor) + outdoorNonSrfViewFac[ptCount] for ptCount, pointViewFactor in enumerate(pointList)]
+            else: viewSums = None
+            self.zones.append((pointRows, srfTemps, viewSums))
+    
+    def hourBlocks(self, hourCount):
+        return [range(start, min(start + self.hourBlockSize, hourCount)) for start in range(0, hourCount, self.hourBlockSize)]
+    
+    def calculateZoneBlock(self, zoneCount, hours, originalHours, outdoorNonSrfViewFac, outdoorTemp):
+        pointRows, srfTemps, viewSums = self.zones[zoneCount]
+        srfTemp4 = {}
+        for srfCount, temps in srfTemps.items():
+            srfTemp4[srfCount] = [math.pow(temps[hour] + 273.15, 4) for hour in hours]
+        if viewSums != None:
+            outTemp4 = [math.pow(outdoorTemp[hour] + 273.15, 4) for hour in originalHours]
+        
+        zoneValues = [None] * len(pointRows)
+        def pointMRT(ptCount):
+            weightedTemp4 = [0] * len(hours)
+            for srfCount, srfView in pointRows[ptCount]:
+                weightedTemp4 = [total + srfView*temp4 for total, temp4 in itertools.izip(weightedTemp4, srfTemp4[srfCount])]
+            if viewSums != None:
+                nonSrfView = outdoorNonSrfViewFac[ptCount]
+                viewSum = viewSums[ptCount]
+                weightedTemp4 = [(total + nonSrfView*temp4) / viewSum for total, temp4 in itertools.izip(weightedTemp4, outTemp4)]
+            zoneValues[ptCount] = [round(math.pow(total, 0.25) - 273.15, 3) for total in weightedTemp4]
+        
+        if parallel_ == True and len(pointRows) > 1:
+            tasks.Parallel.ForEach(range(len(pointRows)), pointMRT)
         else:
-            pointMRTValues.append([])
-            for ptCount, pointViewFactor in enumerate(pointList):
-                pointMRT = 0
-                for srfCount, srfView in enumerate(pointViewFactor):
-                    path  = str([zoneCount,srfCount])
-                    weightedSrfTemp = srfView*(math.pow((outSrfTempDict[path]["srfTemp"][hour]+273.15),4))
-                    pointMRT = pointMRT+weightedSrfTemp
-                
-                weightedSrfTemp = outdoorNonSrfViewFac[ptCount]*(math.pow((prevailingOutdoorTemp[originalHour]+273.15),4))
-                pointMRT = pointMRT+weightedSrfTemp
-                pointMRT = pointMRT / (sum(pointViewFactor) + outdoorNonSrfViewFac[ptCount])
-                pointMRT = math.pow(pointMRT,0.25) - 273.15
-                pointMRTValues[zoneCount].append(round(pointMRT, 3))
+            for ptCount in range(len(pointRows)): pointMRT(ptCount)
+        
+        return zoneValues
+    
+    def calculate(self, counts, HOYs, originalHOYs, outdoorNonSrfViewFac, outdoorTemp):
+        #Calculate the MRT of every point for a block of hours and keep it until the hours are processed.
+        hours = [HOYs[count]-1 for count in counts]
+        originalHours = [originalHOYs[count]-1 for count in counts]
+        blockZones = []
+        for zoneCount in range(len(self.zones)):
+            blockZones.append(self.calculateZoneBlock(zoneCount, hours, originalHours, outdoorNonSrfViewFac, outdoorTemp))
+        
+        blockValues = {}
+        for hourCount, count in enumerate(counts):
+            blockValues[count] = [[ptValues[hourCount] for ptValues in zoneValues] for zoneValues in blockZones]
+        self.blockValues = blockValues
+    
+    def getHourMRT(self, count):
+        return self.blockValues[count]
     
-    return pointMRTValues
+    @staticmethod
+    def calculateOperativeTemp(pointAirTempValues, pointMRTValues):
+        return [(airTemp + radTemp)/2 for airTemp, radTemp in itertools.izip(pointAirTempValues, pointMRTValues)]
 
 def computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac):
     #Build a new testPtBlockedVec that checks with the window transmissivity status.
@@ -737,7 +789,7 @@ def computeGroupedRoomProperties(testPtZoneWeights, testPtZoneNames, zoneInletIn
     return adjacentList, adjacentNameList, groupedInletArea, groupedZoneHeights, groupedGlzHeights, groupedWinCeilDiffs, groupedTotalVol
 
 
-def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, prevailingOutdoorTemp, ASHRAEorEN, comfClass, avgMonthOrRunMean, levelOfConditioning, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, dataAnalysisPeriod, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, outHorizInfrared, northAngle, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind):
+def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, prevailingOutdoorTemp, ASHRAEorEN, comfClass, avgMonthOrRunMean, levelOfConditioning, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, dataAnalysisPeriod, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, outHorizInfrared, northAngle, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream):
     #Set up matrices to be filled.
     radTempMtx = ['Radiant Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
     airTempMtx = ['Air Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
@@ -885,7 +937,7 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, prevailingOutdoorTemp)
+                pointMRTValues = mrtKernel.getHourMRT(count)
                 if sum(zoneHasWindows) != 0:
                     if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels)
                     else:
@@ -902,10 +954,7 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
                 airTempMtx[count+1] = pointAirTempValues
                 
                 #Compute the operative temperature.
-                pointOpTempValues = []
-                for ptCount, airTemp in enumerate(pointAirTempValues):
-                    pointOpTempValues.append((airTemp+pointMRTValues[ptCount])/2)
-                operativeTempMtx[count+1] = pointOpTempValues
+                operativeTempMtx[count+1] = mrtKernel.calculateOperativeTemp(pointAirTempValues, pointMRTValues)
                 
                 #Compute the wind speed.
                 pointWindSpeedValues = []
@@ -943,26 +992,34 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
                 degFromTargetMtx[count+1] = degFromTargetPointValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMap)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    #if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMap(hour)
+            #The radiant temperatures are computed for a whole block of hours before the hours of the block are processed.
+            mrtKernel = MRTKernel(srfTempDict, testPtsViewFactor, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac)
+            for blockCounts in mrtKernel.hourBlocks(len(HOYs)):
+                mrtKernel.calculate(blockCounts, HOYs, originalHOYs, outdoorNonSrfViewFac, prevailingOutdoorTemp)
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(blockCounts, climateMap)
+                else:
+                    for hour in blockCounts:
+                        #Ability to cancel with Esc
+                        #if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMap(hour)
+                
+                #Write the block to the result files.
+                resultStream.writeBlock([radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx], blockCounts)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
             ghenv.Component.AddRuntimeMessage(e, "The calculation has been terminated by the user!")
+            resultStream.abort()
             calcCancelled = True
         
         
         if calcCancelled == False:
-            return radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx
+            return resultStream.close([radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx])
         else:
             return -1
 
-def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, clothingLevel, metabolicRate, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, PPDComfortThresh, humidRatioUp, humidRatioLow, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind):
+def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, clothingLevel, metabolicRate, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, PPDComfortThresh, humidRatioUp, humidRatioLow, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream):
     #Set up matrices to be filled.
     radTempMtx = ['Radiant Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
     airTempMtx = ['Air Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
@@ -1081,7 +1138,7 @@ def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp)
+                pointMRTValues = mrtKernel.getHourMRT(count)
                 if sum(zoneHasWindows) != 0:
                     if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                     else:
@@ -1150,26 +1207,34 @@ def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 PMV_Mtx[count+1] = pmvPointValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMapPMV)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMapPMV(hour)
+            #The radiant temperatures are computed for a whole block of hours before the hours of the block are processed.
+            mrtKernel = MRTKernel(srfTempDict, testPtsViewFactor, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac)
+            for blockCounts in mrtKernel.hourBlocks(len(HOYs)):
+                mrtKernel.calculate(blockCounts, HOYs, originalHOYs, outdoorNonSrfViewFac, outDryBulbTemp)
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(blockCounts, climateMapPMV)
+                else:
+                    for hour in blockCounts:
+                        #Ability to cancel with Esc
+                        if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMapPMV(hour)
+                
+                #Write the block to the result files.
+                resultStream.writeBlock([radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx], blockCounts)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
             ghenv.Component.AddRuntimeMessage(e, "The calculation has been terminated by the user!")
+            resultStream.abort()
             calcCancelled = True
         
         
         if calcCancelled == False:
-            return radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx
+            return resultStream.close([radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx])
         else:
             return -1
 
-def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind):
+def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream):
     #Set up matrices to be filled.
     radTempMtx = ['Radiant Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
     airTempMtx = ['Air Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
@@ -1290,7 +1355,7 @@ def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNu
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp)
+                pointMRTValues = mrtKernel.getHourMRT(count)
                 if sum(zoneHasWindows) != 0:
                     if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                     else:
@@ -1355,26 +1420,34 @@ def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNu
                 DegFromNeutralMtx[count+1] = degNeutralPointValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMapUTCI)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMapUTCI(hour)
+            #The radiant temperatures are computed for a whole block of hours before the hours of the block are processed.
+            mrtKernel = MRTKernel(srfTempDict, testPtsViewFactor, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac)
+            for blockCounts in mrtKernel.hourBlocks(len(HOYs)):
+                mrtKernel.calculate(blockCounts, HOYs, originalHOYs, outdoorNonSrfViewFac, outDryBulbTemp)
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(blockCounts, climateMapUTCI)
+                else:
+                    for hour in blockCounts:
+                        #Ability to cancel with Esc
+                        if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMapUTCI(hour)
+                
+                #Write the block to the result files.
+                resultStream.writeBlock([radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx], blockCounts)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
             ghenv.Component.AddRuntimeMessage(e, "The calculation has been terminated by the user!")
+            resultStream.abort()
             calcCancelled = True
         
         
         if calcCancelled == False:
-            return radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx
+            return resultStream.close([radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx])
         else:
             return -1
 
-def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, bodyCharacteristics, climate, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind):
+def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtsViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, bodyCharacteristics, climate, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream):
     #Set up matrices to be filled.
     radTempMtx = ['Radiant Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
     airTempMtx = ['Air Temperature;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
@@ -1495,7 +1568,7 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp)
+                pointMRTValues = mrtKernel.getHourMRT(count)
                 if sum(zoneHasWindows) != 0:
                     if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                     else:
@@ -1559,390 +1632,96 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 PET_CategoryMtx[count+1] = petCategoryValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMapPET)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMapPET(hour)
+            #The radiant temperatures are computed for a whole block of hours before the hours of the block are processed.
+            mrtKernel = MRTKernel(srfTempDict, testPtsViewFactor, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac)
+            for blockCounts in mrtKernel.hourBlocks(len(HOYs)):
+                mrtKernel.calculate(blockCounts, HOYs, originalHOYs, outdoorNonSrfViewFac, outDryBulbTemp)
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(blockCounts, climateMapPET)
+                else:
+                    for hour in blockCounts:
+                        #Ability to cancel with Esc
+                        if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMapPET(hour)
+                
+                #Write the block to the result files.
+                resultStream.writeBlock([radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx], blockCounts)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
             ghenv.Component.AddRuntimeMessage(e, "The calculation has been terminated by the user!")
+            resultStream.abort()
             calcCancelled = True
         
         
         if calcCancelled == False:
-            return radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx
+            return resultStream.close([radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx])
         else:
             return -1
 
 
-def writeCSVAdapt(lb_preparation, directory, fileName, radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
+class ResultMatrixStream(object):
+    """Write the result matrices to the disk as each block of hours is computed.
+    
+    Each matrix with a result file is appended to its CSV file and to a binary copy
+    of it after every block.  Large matrices are then released from memory and the
+    component outputs the binary matrix in their place, which the 'Honeybee_Visualize
+    Microclimate Map' component reads one hour at a time.
+    """
+    
+    def __init__(self, hb_microclimateMatrix, resultFiles, hourCount):
+        self.hb_microclimateMatrix = hb_microclimateMatrix
+        self.resultFiles = resultFiles
+        self.hourCount = hourCount
+        self.writers = [None] * len(resultFiles)
+        self.keepInMemory = True
+    
+    def writeBlock(self, matrices, blockCounts):
+        for mtxCount, mtx in enumerate(matrices):
+            if self.resultFiles[mtxCount] == None: continue
+            rows = [mtx[count+1] for count in blockCounts]
+            if self.writers[mtxCount] == None:
+                pointCount = len(rows[0])
+                self.writers[mtxCount] = self.hb_microclimateMatrix.openWriter(self.resultFiles[mtxCount], mtx[0], pointCount)
+                self.keepInMemory = pointCount * self.hourCount <= self.hb_microclimateMatrix.maxInMemoryValues
+            self.writers[mtxCount].writeRows(rows)
+            
+            if self.keepInMemory == False:
+                for count in blockCounts: mtx[count+1] = None
+    
+    def close(self, matrices):
+        outputs = []
+        for mtxCount, mtx in enumerate(matrices):
+            if self.writers[mtxCount] == None:
+                outputs.append(mtx)
+                continue
+            binaryMtx = self.writers[mtxCount].close()
+            if self.keepInMemory == True: outputs.append(mtx)
+            else: outputs.append([binaryMtx])
+        
+        if self.keepInMemory == False:
+            print "The result matrices are too large to keep in memory and have been written to binary files next to the csv files."
+        
+        return outputs
     
-    #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    opTempFile = fileName + "OperativeTemp.csv"
-    adaptComfFile = fileName + "AdaptComf.csv"
-    degFromTargetFile = fileName + "DegFromTarget.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        operativeTempResult = os.path.join(workingDir, opTempFile)
-        opCSVfile = open(operativeTempResult, 'wb')
-        for lineCount, line in enumerate(operativeTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        operativeTempResult = None
-    
-    #Write the adaptive comfort result file.
-    adaptComfResult = os.path.join(workingDir, adaptComfFile)
-    comfCSVfile = open(adaptComfResult, 'wb')
-    for lineCount, line in enumerate(adaptComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    degFromTargetResult = os.path.join(workingDir, degFromTargetFile)
-    degCSVfile = open(degFromTargetResult, 'wb')
-    for lineCount, line in enumerate(degFromTargetMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, operativeTempResult, adaptComfResult, degFromTargetResult
+    def abort(self):
+        for writer in self.writers:
+            if writer != None: writer.abort()
 
 
-def writeCSVPMV(lb_preparation, directory, fileName, radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
+def getResultFiles(lb_preparation, directory, fileName, fileSuffixes):
+    #Create a list of csv files for the result matrices.  Matrices without a file are kept in memory only.
+    if writeResultFile_ == 0: return [None] * len(fileSuffixes)
     
     #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    SETFile = fileName + "SET.csv"
-    PPDFile = fileName + "PPD.csv"
-    PMVFile = fileName + "PMV.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        SET_Result = os.path.join(workingDir, SETFile)
-        opCSVfile = open(SET_Result, 'wb')
-        for lineCount, line in enumerate(SET_Mtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        SET_Result = None
-    
-    #Write the adaptive comfort result file.
-    PPD_Result = os.path.join(workingDir, PPDFile)
-    comfCSVfile = open(PPD_Result, 'wb')
-    for lineCount, line in enumerate(PMVComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    PMV_Result = os.path.join(workingDir, PMVFile)
-    degCSVfile = open(PMV_Result, 'wb')
-    for lineCount, line in enumerate(PMV_Mtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, SET_Result, PPD_Result, PMV_Result
-
-def writeCSVUTCI(lb_preparation, directory, fileName, radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
+    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory))
     
-    #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    UTCIFile = fileName + "UTCI.csv"
-    OutdoorComfFile = fileName + "OutdoorComf.csv"
-    DegFromNeutralFile = fileName + "DegFromTarget.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        UTCI_Result = os.path.join(workingDir, UTCIFile)
-        opCSVfile = open(UTCI_Result, 'wb')
-        for lineCount, line in enumerate(UTCI_Mtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        UTCI_Result = None
-    
-    #Write the adaptive comfort result file.
-    OutdoorComfResult = os.path.join(workingDir, OutdoorComfFile)
-    comfCSVfile = open(OutdoorComfResult, 'wb')
-    for lineCount, line in enumerate(OutdoorComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    DegFromNeutralResult = os.path.join(workingDir, DegFromNeutralFile)
-    degCSVfile = open(DegFromNeutralResult, 'wb')
-    for lineCount, line in enumerate(DegFromNeutralMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, UTCI_Result, OutdoorComfResult, DegFromNeutralResult
-
-def writeCSVPET(lb_preparation, directory, fileName, radTempMtx, airTempMtx, PET_Mtx, PETComfMtx, PETCategoryMtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
+    resultFiles = []
+    for count, suffix in enumerate(fileSuffixes):
+        if writeResultFile_ == 2 and count < 3: resultFiles.append(None)
+        else: resultFiles.append(os.path.join(workingDir, fileName + suffix + ".csv"))
     
-    #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    PETFile = fileName + "PET.csv"
-    PETComfFile = fileName + "PETComf.csv"
-    PETCategoryFile = fileName + "PETCategory.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        PET_Result = os.path.join(workingDir, PETFile)
-        opCSVfile = open(PET_Result, 'wb')
-        for lineCount, line in enumerate(PET_Mtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        PET_Result = None
-    
-    #Write the adaptive comfort result file.
-    PET_ComfResult = os.path.join(workingDir, PETComfFile)
-    comfCSVfile = open(PET_ComfResult, 'wb')
-    for lineCount, line in enumerate(PETComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    PET_CategoryResult = os.path.join(workingDir, PETCategoryFile)
-    degCSVfile = open(PET_CategoryResult, 'wb')
-    for lineCount, line in enumerate(PETCategoryMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, PET_Result, PET_ComfResult, PET_CategoryResult
+    return resultFiles
 
 
 #Import the classes, check the inputs, and generate default values for grid size if the user has given none.
@@ -1960,6 +1739,23 @@ else:
     w = gh.GH_RuntimeMessageLevel.Warning
     ghenv.Component.AddRuntimeMessage(w, "You should let the Ladybug fly first...")
 
+checkHB = True
+if not sc.sticky.has_key('honeybee_release'):
+    checkHB = False
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, "You should first let Honeybee fly...")
+else:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): checkHB = False
+        hb_microclimateMatrix = sc.sticky["honeybee_MicroclimateMatrix"]
+    except:
+        checkHB = False
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        "Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+
 
 #Check the type of comfort analysis recipe connected.
 recipeRecognized = False
@@ -1987,31 +1783,35 @@ manageOutput(comfortModel)
 
 #Check the data input.
 checkData = False
-if recipeRecognized == True and checkLB == True:
+if recipeRecognized == True and checkLB == True and checkHB == True:
     checkData, HOYs, analysisPeriod, fileName, directory = setDefaults(lb_defaultFolder, lb_preparation)
 
 if checkData == True and _runIt == True:
     if comfortModel == "Adaptive":
-        result = mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, prevailingOutdoorTemp, ASHRAEorEN, comfClass, avgMonthOrRunMean, levelOfConditioning, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, dataAnalysisPeriod, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, horizInfraredRadiation, northAngle, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
+        resultStream = ResultMatrixStream(hb_microclimateMatrix, getResultFiles(lb_preparation, directory, fileName, ["RadiantTemp", "AirTemp", "OperativeTemp", "AdaptComf", "DegFromTarget"]), len(HOYs))
+        result = mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, prevailingOutdoorTemp, ASHRAEorEN, comfClass, avgMonthOrRunMean, levelOfConditioning, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, dataAnalysisPeriod, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, horizInfraredRadiation, northAngle, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream)
         if result != -1:
             radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, operativeTempResult, adaptComfResult, degFromTargetResult = writeCSVAdapt(lb_preparation, directory, fileName, radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx)
+                radTempResult, airTempResult, operativeTempResult, adaptComfResult, degFromTargetResult = resultStream.resultFiles
     elif comfortModel == "PMV":
-        result = mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, clothingLevel, metabolicRate, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, PPDComfortThresh, humidRatioUp, humidRatioLow, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
+        resultStream = ResultMatrixStream(hb_microclimateMatrix, getResultFiles(lb_preparation, directory, fileName, ["RadiantTemp", "AirTemp", "SET", "PPD", "PMV"]), len(HOYs))
+        result = mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, clothingLevel, metabolicRate, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, PPDComfortThresh, humidRatioUp, humidRatioLow, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream)
         if result != -1:
             radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, SET_Result, PMVComfResult, PMV_Result = writeCSVPMV(lb_preparation, directory, fileName, radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx)
+                radTempResult, airTempResult, SET_Result, PMVComfResult, PMV_Result = resultStream.resultFiles
     elif comfortModel == "UTCI":
-        result = mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
+        resultStream = ResultMatrixStream(hb_microclimateMatrix, getResultFiles(lb_preparation, directory, fileName, ["RadiantTemp", "AirTemp", "UTCI", "OutdoorComf", "DegFromTarget"]), len(HOYs))
+        result = mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream)
         if result != -1:
             radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, UTCI_Result, OutdoorComfResult, DegFromNeutralResult = writeCSVUTCI(lb_preparation, directory, fileName, radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx)
+                radTempResult, airTempResult, UTCI_Result, OutdoorComfResult, DegFromNeutralResult = resultStream.resultFiles
     elif comfortModel == "PET":
-        result = mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, bodyCharacteristics, climate, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
+        resultStream = ResultMatrixStream(hb_microclimateMatrix, getResultFiles(lb_preparation, directory, fileName, ["RadiantTemp", "AirTemp", "PET", "PETComf", "PETCategory"]), len(HOYs))
+        result = mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, bodyCharacteristics, climate, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind, resultStream)
         if result != -1:
             radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, PET_Result, PET_ComfResult, PET_CategoryResult = writeCSVPET(lb_preparation, directory, fileName, radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx)
+                radTempResult, airTempResult, PET_Result, PET_ComfResult, PET_CategoryResult = resultStream.resultFiles
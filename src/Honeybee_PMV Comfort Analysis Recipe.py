@@ -67,11 +67,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_PMV Comfort Analysis Recipe"
 ghenv.Component.NickName = 'PMVComfRecipe'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJUL_24_2017
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUN_07_2016
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -468,16 +468,14 @@ def checkTheInputs():
         print warningM
         ghenv.Component.AddRuntimeMessage(w, warningM)
     else:
-        locationData = lb_preparation.epwLocation(_epwFile)
-        location = locationData[-1]
-        weatherData = lb_preparation.epwDataReader(_epwFile, locationData[0])
-        directNormalRadiation = weatherData[5]
-        diffuseHorizontalRadiation = weatherData[6]
-        globalHorizontalRadiation = weatherData[7]
-        horizInfraredRadiation = weatherData[12]
-        outDryBulbTemp = weatherData[0]
-        outRelHumid = weatherData[2]
-        outWindSpeed = weatherData[3]
+        epwData = sc.sticky["honeybee_EPWData"].fromFile(_epwFile)
+        directNormalRadiation = epwData.getLBData("directNormalRadiation")
+        diffuseHorizontalRadiation = epwData.getLBData("diffuseHorizontalRadiation")
+        globalHorizontalRadiation = epwData.getLBData("globalHorizontalRadiation")
+        horizInfraredRadiation = epwData.getLBData("horizontalInfraredRadiation")
+        outDryBulbTemp = epwData.getLBData("dryBulbTemperature")
+        outRelHumid = epwData.getLBData("relativeHumidity")
+        outWindSpeed = epwData.getLBData("windSpeed")
     
     #Separate out the _dirNormRad, the diffuse Horizontal rad, and the location  data.
     directSolarRad = []
@@ -490,11 +488,9 @@ def checkTheInputs():
         diffSolarRad = diffuseHorizontalRadiation[7:]
         globHorizRad = globalHorizontalRadiation[7:]
         horizInfraredRadiation = horizInfraredRadiation[7:]
-        locList = location.split('\n')
-        for line in locList:
-            if "Latitude" in line: latitude = float(line.split(',')[0])
-            elif "Longitude" in line: longitude = float(line.split(',')[0])
-            elif "Time Zone" in line: timeZone = float(line.split(',')[0])
+        latitude = epwData.latitude
+        longitude = epwData.longitude
+        timeZone = epwData.timeZone
     
     #Check to be sure that the number of mesh faces and test points match.
     checkData8 = True
@@ -38,11 +38,11 @@ Provided by Ladybug 0.0.45
 
 ghenv.Component.Name = "Honeybee_Re-run IDF"
 ghenv.Component.NickName = 'Re-Run IDF'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJUL_24_2016
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "0"
 
@@ -52,7 +52,6 @@ import os
 import shutil
 import Grasshopper.Kernel as gh
 import time
-import subprocess
 
 def checkTheInputs(idfFileName, epwWeatherFile):
     w = gh.GH_RuntimeMessageLevel.Warning
@@ -133,17 +132,12 @@ def writeBatchFile(workingDir, idfFilePath, epwFileAddress, EPDirectory):
     
     return batchFileAddress, newIDFPath, idfFileName
 
-def runCmd(batchFileAddress, shellKey = True):
-    batchFileAddress.replace("\\", "/")		
-    p = subprocess.Popen(["cmd /c ", batchFileAddress], shell=shellKey, stdout=subprocess.PIPE, stderr=subprocess.PIPE)		
-    out, err = p.communicate()
-
 def runBatchFile(batchFileAddress, runInBackground):
     #execute the batch file
-    if runInBackground > 1:		
-        runCmd(batchFileAddress)		
-    else:
-        os.system(batchFileAddress)
+    pool = sc.sticky["honeybee_ProcessPool"](shell = runInBackground > 1)
+    job = pool.run([batchFileAddress])[0]
+    if not job.succeeded:
+        print "Failed to run EnergyPlus batch file:\n" + pool.report([job])
 
 
 
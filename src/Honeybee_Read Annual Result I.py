@@ -46,11 +46,11 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_Read Annual Result I"
 ghenv.Component.NickName = 'readAnnualResultsI'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.57\nNOV_03_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
@@ -64,8 +64,6 @@ from Grasshopper.Kernel.Data import GH_Path
 import Rhino as rc
 import scriptcontext as sc
 import os
-import subprocess
-import time
 import shutil
 
 """
@@ -84,7 +82,7 @@ def getFilelength(fileName):
             pass
     return i + 1
 
-def executeBatchFiles(batchFileNames, maxPRuns = None, shell = False, waitingTime = 0.2):
+def executeBatchFiles(batchFileNames, maxPRuns = None, shell = False):
 
     """Run a number of batch files in parallel and
         wait to end of the analysis.
@@ -94,47 +92,21 @@ def executeBatchFiles(batchFileNames, maxPRuns = None, shell = False, waitingTim
             maxPRuns: max number of files to be ran in parallel (default = 0)
             shell: set to True if you do NOT want to see the cmd window while the analysis is runnig
     """
-
-    if not maxPRuns : maxPRuns = 1
-    maxPRuns = int(maxPRuns)
-    total = len(batchFileNames)
-    
-    if maxPRuns < 1: maxPRuns = 1
-    if maxPRuns > total: maxPRuns = total
-    
-    running = 0
-    done = False
-    jobs = []
-    pid = 0
     
+    pool = sc.sticky["honeybee_ProcessPool"](maxPRuns, shell = shell,
+                                             cancelCallback = gh.GH_Document.IsEscapeKeyDown)
     try:
-        while not done:
-            if running < maxPRuns and pid < total:
-                # execute the files
-                jobs.append(subprocess.Popen(batchFileNames[pid].replace("\\", "/") , shell = shell))
-                pid+=1
-                time.sleep(waitingTime)
-            
-            # count how many jobs are running and how many are done
-            running = 0
-            finished = 0
-            for job in jobs:
-                if job.poll() is None:
-                    #one job is still running
-                    running += 1
-                else:
-                    finished += 1
-    
-            if running == maxPRuns:
-                # wait for half a second
-                #print "waiting..."
-                time.sleep(waitingTime)
+        jobs = pool.run(batchFileNames)
+    except Exception, e:
+        pool.cancel()
+        print "Something went wrong: %s"%str(e)
+        return []
     
-            if finished ==  total:
-                done = True
+    failedJobs = [job for job in jobs if not job.succeeded]
+    if failedJobs:
+        print "Some of the batch files failed to run:\n" + pool.report(failedJobs)
     
-    except Exception, e:
-        print "Something went wrong: %s"%str(e) 
+    return jobs
 
 
 def convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress):
@@ -190,11 +162,8 @@ def convertEPScheduleToDSSchedule(scheduleName, folder):
           "daylight savings time is based on user input),,\n" + \
           "# month,day,time,occupancy (1=present/0=absent)\n"
 
-    readSchedules = sc.sticky["honeybee_ReadSchedules"](scheduleName, 0)
-    dailyValues  = readSchedules.getScheduleValues()
-        
-    hourlyValues = []
-    for values in dailyValues: hourlyValues.extend(values)
+    hourlyValues = sc.sticky["honeybee_EPScheduleCompiler"]().getHourlyValues(scheduleName, 0)
+    if hourlyValues is None: hourlyValues = []
     
     # create a temp folder inside folder will .ill files
     if not os.path.isdir(folder): os.mkdir(folder)
@@ -535,9 +504,8 @@ def main(illFilesAddress, testPts, testVecs, occFiles, lightingControlGroups, SH
                 #   break
     
 
-    # open all the available ill files and put them in the dictionary
-    illFilesDict = {}
-    newIllFilesDict = {}
+    # write the values of the ill files from all the cpus to new ill files for each space
+    annualDaylightMetrics = sc.sticky["honeybee_AnnualDaylightMetrics"]
     if firstRun:
         
         for shdGroupCounter, illFileList in originalIllFilesSorted.items():
@@ -546,39 +514,14 @@ def main(illFilesAddress, testPts, testVecs, occFiles, lightingControlGroups, SH
                 # create a place holder for new .ill files for each shading group
                 newIllFileNamesDict[shdGroupCounter] = []
                 
-                # open all the files for this shading state into memory
-                for counter, illFile in enumerate(illFileList[shadingStateCount]):
-                    illfile = open(illFile, "r")
-                    illFilesDict[counter] = illfile #put each ill file from each cpu separate/ I don't know why I have done this
-                
-                # open new ill files for each space and put them in the same directory
+                # new ill files for each space in the same directory
+                newIllFileNames = []
                 for spaceCount in range(numOfSpaces):
                     newIllFileName  = illFileList[shadingStateCount][0].split(".ill")[0] + "_space_" + str(spaceCount) + ".ill"
+                    newIllFileNames.append(newIllFileName)
                     newIllFileNamesDict[shdGroupCounter].append(newIllFileName) #collect new ill file names to calculate sDA
-                    
-                    newIllFile = open(newIllFileName, "w")
-                    newIllFilesDict[spaceCount] = newIllFile
-                
-                # all the files will have the same length of 8760 lines for the hours of the year
-                for line in range(8760):
-                    # merge the line from all the source file
-                    mergedLine = []
-                    for illFileKey in illFilesDict.keys():
-                        line = illFilesDict[illFileKey].readline()
-                        
-                        if illFileKey==0:
-                            dateInfo = line.strip().split(" ")[:4]
-                        mergedLine.extend(line.strip().split(" ")[4:])
                 
-                
-                    # write the values to the target files
-                    for illFileKey in newIllFilesDict.keys():
-                        line = " ".join(dateInfo + mergedLine[sum(numOfPtsInEachSpace[:illFileKey]):sum(numOfPtsInEachSpace[:illFileKey+1])])
-                        newIllFilesDict[illFileKey].write(line + "\n")
-                
-                # close all the opened files
-                for illFileKey in illFilesDict.keys(): illFilesDict[illFileKey].close()
-                for illFileKey in newIllFilesDict.keys(): newIllFilesDict[illFileKey].close()
+                annualDaylightMetrics(shadingStateFiles).splitBySpace(numOfPtsInEachSpace, newIllFileNames)
         
         
         # print numOfPtsInEachSpace
@@ -808,6 +751,20 @@ def main(illFilesAddress, testPts, testVecs, occFiles, lightingControlGroups, SH
 
     executeBatchFiles(fileNames, ncpus - 1, shell=runInBackground)
     
+    # calculate the metrics from the ill files of each space. Daysim's results are only
+    # used for studies with dynamic shadings as Daysim switches between the shading states.
+    metricsLists = []
+    if len(originalIllFilesSorted) == 1 and len(originalIllFilesSorted[0]) == 1:
+        for spaceCount, spaceIllFile in enumerate(newIllFileNamesDict[0][:numOfSpaces]):
+            try: occFileFullPath = occFiles[spaceCount]
+            except: occFileFullPath = occFiles[0]
+            
+            try: DLAIllumThreshold = float(DLAIllumThresholds[spaceCount])
+            except: DLAIllumThreshold = float(DLAIllumThresholds[0])
+            
+            metrics = annualDaylightMetrics([spaceIllFile], occFileFullPath)
+            metricsLists.append(metrics.calculateMetrics(DLAIllumThreshold, 100, 2000))
+    
     # calculate sDA    
     
     #sDADict = {}
@@ -889,7 +846,7 @@ def main(illFilesAddress, testPts, testVecs, occFiles, lightingControlGroups, SH
     try: overUDLILists = sorted(overUDLILists, key=lambda fileName: int(fileName.split(".")[-2].split("_")[-4]))
     except: pass
     
-    return None, [DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists]
+    return None, [DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists, metricsLists]
 
 def isAllNone(dataList):
     for item in dataList.AllData():
@@ -917,7 +874,7 @@ if _runIt and not isAllNone(_illFilesAddress) and not isAllNone(_testPoints):
             ghenv.Component.AddRuntimeMessage(w, msg)
             
         else:
-            DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists = results
+            DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists, metricsLists = results
             DLA = DataTree[Object]()
             UDLI_Less_100 = DataTree[Object]()    
             UDLI_100_2000 = DataTree[Object]()
@@ -935,23 +892,24 @@ if _runIt and not isAllNone(_illFilesAddress) and not isAllNone(_testPoints):
                             results.append(float(line.split("\t")[-1]))
                 return results
             
-            def getsDA(DLARes, threshold = 50):
-                moreThan = 0
-                for res in DLARes:
-                    if res >= threshold:
-                        moreThan += 1
-                return "%.2f"%((moreThan/len(DLARes)) * 100)
-            
+            getsDA = sc.sticky["honeybee_AnnualDaylightMetrics"].getsDA
             
             for branchNum in range(_testPoints.BranchCount):
                 p = GH_Path(branchNum)
-                DLARes = readDSStandardResults(DLALists[branchNum])
+                if metricsLists:
+                    DLARes, CDARes, underUDLIRes, inRangeUDLIRes, overUDLIRes = metricsLists[branchNum]
+                else:
+                    DLARes = readDSStandardResults(DLALists[branchNum])
+                    CDARes = readDSStandardResults(CDALists[branchNum])
+                    underUDLIRes = readDSStandardResults(underUDLILists[branchNum])
+                    inRangeUDLIRes = readDSStandardResults(inRangeUDLILists[branchNum])
+                    overUDLIRes = readDSStandardResults(overUDLILists[branchNum])
                 DLA.AddRange(DLARes, p)
-                UDLI_Less_100.AddRange(readDSStandardResults(underUDLILists[branchNum]), p)
-                UDLI_100_2000.AddRange(readDSStandardResults(inRangeUDLILists[branchNum]), p)
-                UDLI_More_2000.AddRange(readDSStandardResults(overUDLILists[branchNum]), p)
-                CDA.AddRange(readDSStandardResults(CDALists[branchNum]), p)
+                UDLI_Less_100.AddRange(underUDLIRes, p)
+                UDLI_100_2000.AddRange(inRangeUDLIRes, p)
+                UDLI_More_2000.AddRange(overUDLIRes, p)
+                CDA.AddRange(CDARes, p)
                 annualProfiles.Add(EPLSchLists[branchNum], p)
-                sDA.Add(getsDA(DLARes), p)
+                sDA.Add("%.2f"%getsDA(DLARes), p)
                 htmReport.Add(htmLists[branchNum], p)
                     
\ No newline at end of file
@@ -42,11 +42,11 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_Read Annual Result II"
 ghenv.Component.NickName = 'readAnnualResultsII'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
@@ -59,6 +59,7 @@ AddReference('Grasshopper')
 import Grasshopper.Kernel as gh
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
+import scriptcontext as sc
 
 
 def isAllNone(dataList):
@@ -66,7 +67,27 @@ def isAllNone(dataList):
         if item!=None: return False
     return True
 
-if _runIt and (testPts.DataCount!=0 or not isAllNone(testPts.AllData())) \
+def checkHoneybee():
+    if not sc.sticky.has_key('honeybee_release'):
+        msg = "You should first let Honeybee to fly..."
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, msg)
+        return False
+    
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): return False
+    except:
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        " Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, warning)
+        return False
+    
+    return True
+
+if _runIt and checkHoneybee() and (testPts.DataCount!=0 or not isAllNone(testPts.AllData())) \
    and resultFilesAddress and resultFilesAddress[0]!=None:
     
     numOfPts = 0
@@ -101,30 +122,23 @@ if _runIt and (testPts.DataCount!=0 or not isAllNone(testPts.AllData())) \
     if not maxThreshold: maxThreshold = float('+Inf')
     print 'Maximum threshold is set to ' + `maxThreshold`
     
-    underValues = [0] * numOfPts
-    values = [0] * numOfPts
-    overValues = [0] * numOfPts
-    
-    # number of study hours during a year
-    studyHours = ((lunchStHour - stHour) + (endHour - lunchEndHour)) * 365
-    
-    totalPtCount = 0
-    ptsCountSoFar = 0
-    for resultFile in resultFilesAddress:
-        result = open(resultFile, 'r')
-        for hour, line in enumerate(result):
-            line = line.replace('\n', '', 10)
-            lineSeg = line.Split(' ')
-            #if len(lineSeg)!= len(testPts) + 4: print 'ERROR!'
-            for ptCount, hourLuxValue in enumerate(lineSeg[4:]):
-                if hour == 0: totalPtCount += 1
-                if  stHour <= (hour + 1)%24 < lunchStHour or lunchEndHour <= (hour + 1)%24 < endHour:
-                    if float(hourLuxValue) <= minThreshold: underValues[ptsCountSoFar + ptCount] += 1
-                    elif minThreshold <= float(hourLuxValue) <= maxThreshold: values[ptsCountSoFar + ptCount] += 1
-                    elif maxThreshold <= float(hourLuxValue): overValues[ptsCountSoFar + ptCount] += 1
-        result.close()
-        ptsCountSoFar = ptsCountSoFar + (len(lineSeg) - 4)
-        
+    metrics = sc.sticky["honeybee_AnnualDaylightMetrics"](resultFilesAddress)
+    
+    # occupancy for each timestep of the ill files which can be sub-hourly
+    stepsPerHour = metrics.getStepsPerHour()
+    timestepCount = 8760 * stepsPerHour
+    metrics.occupancy = [stHour <= (step // stepsPerHour + 1)%24 < lunchStHour or \
+                         lunchEndHour <= (step // stepsPerHour + 1)%24 < endHour \
+                         for step in range(timestepCount)]
+    
+    lessThan, lessOrEqual, partialHours = metrics.countHours([minThreshold, maxThreshold])
+    
+    # number of study timesteps during a year
+    studyHours = max(1, metrics.occupiedHours)
+    
+    underValues = list(lessOrEqual[0])
+    values = [inRange - under for under, inRange in zip(lessOrEqual[0], lessOrEqual[1])]
+    overValues = [metrics.occupiedHours - inRange for inRange in lessOrEqual[1]]
     
     
     # Change values to %
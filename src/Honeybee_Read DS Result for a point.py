@@ -39,11 +39,11 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_Read DS Result for a point"
 ghenv.Component.NickName = 'readDSHourlyResults'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -101,6 +101,23 @@ def convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress):
 def main(illFilesAddress, testPoints, targetPoint, annualProfiles):
     msg = str.Empty
     
+    if not sc.sticky.has_key('honeybee_release'):
+        msg = "You should first let Honeybee to fly..."
+        return msg, None, []
+    
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component):
+            msg = "This component is not compatible with the current version of Honeybee."
+            return msg, None, []
+    except:
+        msg = "You need a newer version of Honeybee to use this compoent." + \
+        " Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        return msg, None, []
+    
+    hb_IllBinaryFile = sc.sticky["honeybee_IllBinaryFile"]
+    
     shadingProfiles = []
     shadingGroupsCount = 0 # assume there in no shading groups
     
@@ -240,11 +257,9 @@ def main(illFilesAddress, testPoints, targetPoint, annualProfiles):
     for shadingGroupCount in illFileSets.keys():
         for stateCount, targetIllFiles in enumerate(illFileSets[shadingGroupCount]):
             targetIllFile = targetIllFiles[targetListNumber]
-            result = open(targetIllFile, 'r')
-            for lineCount, line in enumerate(result):
-                hourLuxValue = line.strip().split(" ")[targetIndexNumber + 4]
-                illuminanceValues[shadingGroupCount][stateCount].append(float(hourLuxValue))
-            result.close()
+            # read the values from the binary copy of the file
+            illbFile = hb_IllBinaryFile.fromIllFile(targetIllFile)
+            illuminanceValues[shadingGroupCount][stateCount].extend(illbFile.readSensor(targetIndexNumber))
             
                 
     return msg, illuminanceValues, shadingProfiles[branch]
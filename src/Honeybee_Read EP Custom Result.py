@@ -29,7 +29,7 @@ The component is built to bring in any result that you desire from the csv using
 Provided by Honeybee 0.0.62
     
     Args:
-        _resultFileAddress: The result file address that comes out of the "Export to OpenStudio" component.
+        _resultFileAddress: The result file address that comes out of the "Export to OpenStudio" component.  This can also be the .sql or .eso file of the simulation. The .eso file is not limited in the number of output variables like the csv file. The .sql file is only read if its path is connected here.
         _keywords: keywords that will be used to bring in the results that you are interested in.  These words should be the name of the output that you are requesting or should correspond to words in the top row of the csv file.
     Returns:
         results: The result data from the csv file (formatted with a Ladybug header on it).
@@ -37,11 +37,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Read EP Custom Result"
 ghenv.Component.NickName = 'EPCustomResult'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "0"
 
@@ -153,44 +153,36 @@ if hbCheck and _resultFileAddress and _keywords and _resultFileAddress != None:
             keywords.append(word)
     
     try:
-        result = open(_resultFileAddress, 'r')
+        reader = sc.sticky["honeybee_EPResultReader"].fromResultFile(_resultFileAddress)
         
-        for lineCount, line in enumerate(result):
-            if lineCount == 0:
-                # PARSE THE FILE HEADING
-                colHeaders = []
-                for column in line.split(','):
-                    colHeaders.append(column)
-                # SEARCH THROUGH THE FILE HEADING
-                simOutputs = hb_EPMaterialAUX.searchListByKeyword(colHeaders, keywords)
-                simOutLower = []
-                for outp in simOutputs:
-                    simOutLower.append(outp.lower())
-                key = []
-                path = []
-                for outp in colHeaders:
-                    if outp.lower() in simOutLower:
-                        outpName = outp.split(' [')[0]
-                        timestep = outp.split('(')[-1].split(')')[0]
-                        units = outp.split('[')[-1].split(']')[0]
-                        makeHeader(results, resultCount, timestep, outpName, units)
-                        key.append(0)
-                        path.append(resultCount)
-                        resultCount += 1
-                    else:
-                        key.append(-1)
-                        path.append(-1)
+        # SEARCH THROUGH THE FILE HEADING
+        colHeaders = reader.header
+        simOutputs = hb_EPMaterialAUX.searchListByKeyword(colHeaders, keywords)
+        simOutLower = []
+        for outp in simOutputs:
+            simOutLower.append(outp.lower())
+        key = []
+        path = []
+        for outp, (variable, objName, units, timestep) in zip(colHeaders, reader.columns):
+            if outp.lower() in simOutLower:
+                if objName: outpName = objName + ":" + variable
+                else: outpName = variable
+                makeHeader(results, resultCount, timestep, outpName, units)
+                key.append(0)
+                path.append(resultCount)
+                resultCount += 1
             else:
-                for columnCount, column in enumerate(line.split(',')):
-                    p = GH_Path(int(path[columnCount]))
-                    
-                    if key[columnCount] != -1:
-                        results.Add(float(column), p)
-        result.close()
+                key.append(-1)
+                path.append(-1)
+        
+        # READ ONLY THE COLUMNS THAT MATCH THE KEYWORDS
+        columnData = reader.readColumns([columnCount for columnCount, k in enumerate(key) if k != -1])
+        for columnCount in sorted(columnData.keys()):
+            p = GH_Path(int(path[columnCount]))
+            for value in columnData[columnCount]:
+                results.Add(value, p)
         parseSuccess = True
     except:
-        try: result.close()
-        except: pass
         parseSuccess = False
         warn = 'Failed to parse the result file.'
         print warn
@@ -29,7 +29,7 @@ This component reads only the results related to zone ideal air and earth tube H
 Provided by Honeybee 0.0.62
     
     Args:
-        _resultFileAddress: The result file address that comes out of the WriteIDF component.
+        _resultFileAddress: The result file address that comes out of the WriteIDF component.  This can also be the .sql or .eso file of the simulation. The .eso file is not limited in the number of output variables like the csv file. The .sql file is only read if its path is connected here.
     Returns:
         sensibleCooling: The sensible energy removed by the ideal air cooling system for each zone in kWh.
         latentCooling: The latent energy removed by the ideal air cooling system for each zone in kWh.
@@ -44,11 +44,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Read EP HVAC Result"
 ghenv.Component.NickName = 'readEP_HVAC_Result'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "0"
 
@@ -61,6 +61,24 @@ import scriptcontext as sc
 import copy
 import os
 
+
+#Honeybee check.
+hbCheck = True
+if not sc.sticky.has_key('honeybee_release') == True:
+    hbCheck = False
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, "You should first let Honeybee fly...")
+else:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): hbCheck = False
+    except:
+        hbCheck = False
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        "Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+
 #Read the location and the analysis period info from the eio file, if there is one.
 #Also try to read the floor areas from this file to be used in EUI calculations.
 location = "NoLocation"
@@ -123,6 +141,10 @@ if _resultFileAddress:
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
 else: pass
 
+#Add the zones that were modeled with zone multipliers.
+if hbCheck and gotData == True:
+    zoneNameList, floorAreaList = sc.sticky["honeybee_EPZoneMultipliers"].expandZoneLists(_resultFileAddress, zoneNameList, floorAreaList)
+
 # Make data tree objects for all of the outputs.
 sensibleCooling = DataTree[Object]()
 latentCooling = DataTree[Object]()
@@ -175,160 +197,157 @@ def checkCentralSys(sysInt, sysType):
 
 
 # PARSE THE RESULT FILE.
-if _resultFileAddress and gotData == True:
+if hbCheck and _resultFileAddress and gotData == True:
     try:
-        result = open(_resultFileAddress, 'r')
+        reader = sc.sticky["honeybee_EPResultReader"].fromResultFile(_resultFileAddress)
         
-        for lineCount, line in enumerate(result):
-            if lineCount == 0:
-                #ANALYZE THE FILE HEADING
-                key = []; path = []
-                for columnCount, column in enumerate(line.split(',')):
-                    """
-                    if 'Zone Ideal Loads Supply Air Sensible Cooling Energy' in column:
-                        key.append(0)
-                        if 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS AIR SYSTEM')[0])
-                        makeHeader(sensibleCooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Sensible Cooling Energy", "kWh", True)
+        #ANALYZE THE FILE HEADING
+        key = []; path = []
+        for columnCount, (variable, objName, units, timestep) in enumerate(reader.columns):
+            """
+            if 'Zone Ideal Loads Supply Air Sensible Cooling Energy' in variable:
+                key.append(0)
+                if 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS AIR SYSTEM')[0])
+                makeHeader(sensibleCooling, int(path[columnCount]), zoneName, timestep, "Sensible Cooling Energy", "kWh", True)
+                dataTypeList[0] = True
+            
+            elif 'Zone Ideal Loads Supply Air Latent Cooling Energy' in variable:
+                key.append(1)
+                if 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS AIR SYSTEM')[0])
+                makeHeader(latentCooling, int(path[columnCount]), zoneName, timestep, "Latent Cooling Energy", "kWh", True)
+                dataTypeList[1] = True
+            
+            elif 'Zone Ideal Loads Supply Air Sensible Heating Energy' in variable:
+                key.append(2)
+                if 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS AIR SYSTEM')[0])
+                makeHeader(sensibleHeating, int(path[columnCount]), zoneName, timestep, "Sensible Heating Energy", "kWh", True)
+                dataTypeList[2] = True
+            
+            elif 'Zone Ideal Loads Supply Air Latent Heating Energy' in variable:
+                key.append(3)
+                if 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS AIR SYSTEM')[0])
+                makeHeader(latentHeating, int(path[columnCount]), zoneName, timestep, "Latent Heating Energy", "kWh", True)
+                dataTypeList[3] = True
+            """
+            if 'System Node Standard Density Volume Flow Rate' in variable:
+                if "RETURN" in objName or "OUTDOOR AIR" in objName or "ZONE AIR NODE" in objName:
+                    key.append(-1)
+                    path.append(-1)
+                else:
+                    if ' IDEAL LOADS SUPPLY INLET' in objName:
+                        key.append(4)
+                        zoneName = checkZone(" " + objName.split(' IDEAL LOADS SUPPLY INLET')[0])
+                        makeHeader(supplyVolFlow, int(path[columnCount]), zoneName, timestep, "Supply Air Standard Density Volume Flow Rate", "m3/s", True)
                         dataTypeList[0] = True
-                    
-                    elif 'Zone Ideal Loads Supply Air Latent Cooling Energy' in column:
-                        key.append(1)
-                        if 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS AIR SYSTEM')[0])
-                        makeHeader(latentCooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Latent Cooling Energy", "kWh", True)
-                        dataTypeList[1] = True
-                    
-                    elif 'Zone Ideal Loads Supply Air Sensible Heating Energy' in column:
-                        key.append(2)
-                        if 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS AIR SYSTEM')[0])
-                        makeHeader(sensibleHeating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Sensible Heating Energy", "kWh", True)
-                        dataTypeList[2] = True
-                    
-                    elif 'Zone Ideal Loads Supply Air Latent Heating Energy' in column:
-                        key.append(3)
-                        if 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS AIR SYSTEM')[0])
-                        makeHeader(latentHeating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Latent Heating Energy", "kWh", True)
-                        dataTypeList[3] = True
-                    """
-                    if 'System Node Standard Density Volume Flow Rate' in column:
-                        if "RETURN" in column or "OUTDOOR AIR" in column or "ZONE AIR NODE" in column:
+                    else:
+                        try:
+                            zoneName = checkCentralSys((" " + objName.split('NODE')[-1]), 0)
+                            centralSys = True
+                            makeHeader(supplyVolFlow, int(path[columnCount]), zoneName, timestep, "Supply Air Standard Density Volume Flow Rate", "m3/s", True)
+                            dataTypeList[0] = True
+                            key.append(4)
+                            print zoneName
+                        except:
                             key.append(-1)
                             path.append(-1)
-                        else:
-                            if ' IDEAL LOADS SUPPLY INLET' in column:
-                                key.append(4)
-                                zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS SUPPLY INLET')[0])
-                                makeHeader(supplyVolFlow, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Supply Air Standard Density Volume Flow Rate", "m3/s", True)
-                                dataTypeList[0] = True
-                            else:
-                                try:
-                                    zoneName = checkCentralSys((" " + column.split(":")[0].split('NODE')[-1]), 0)
-                                    centralSys = True
-                                    makeHeader(supplyVolFlow, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Supply Air Standard Density Volume Flow Rate", "m3/s", True)
-                                    dataTypeList[0] = True
-                                    key.append(4)
-                                    print zoneName
-                                except:
-                                    key.append(-1)
-                                    path.append(-1)
-                    
-                    elif 'System Node Temperature' in column:
-                        if "RETURN" in column or "OUTDOOR AIR" in column or "ZONE AIR NODE" in column:
+            
+            elif 'System Node Temperature' in variable:
+                if "RETURN" in objName or "OUTDOOR AIR" in objName or "ZONE AIR NODE" in objName:
+                    key.append(-1)
+                    path.append(-1)
+                else:
+                    if ' IDEAL LOADS SUPPLY INLET' in objName:
+                        key.append(5)
+                        zoneName = checkZone(" " + objName.split(' IDEAL LOADS SUPPLY INLET')[0])
+                        makeHeader(supplyAirTemp, int(path[columnCount]), zoneName, timestep, "Supply Air Temperature", "C", False)
+                        dataTypeList[1] = True
+                    else:
+                        try:
+                            zoneName = checkCentralSys((" " + objName.split('NODE')[-1]), 1)
+                            centralSys = True
+                            makeHeader(supplyAirTemp, int(path[columnCount]), zoneName, timestep, "Supply Air Temperature", "C", False)
+                            dataTypeList[1] = True
+                            key.append(5)
+                        except:
                             key.append(-1)
                             path.append(-1)
-                        else:
-                            if ' IDEAL LOADS SUPPLY INLET' in column:
-                                key.append(5)
-                                zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS SUPPLY INLET')[0])
-                                makeHeader(supplyAirTemp, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Supply Air Temperature", "C", False)
-                                dataTypeList[1] = True
-                            else:
-                                try:
-                                    zoneName = checkCentralSys((" " + column.split(":")[0].split('NODE')[-1]), 1)
-                                    centralSys = True
-                                    makeHeader(supplyAirTemp, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Supply Air Temperature", "C", False)
-                                    dataTypeList[1] = True
-                                    key.append(5)
-                                except:
-                                    key.append(-1)
-                                    path.append(-1)
-                    
-                    elif 'System Node Relative Humidity' in column:
-                        if "RETURN" in column or "OUTDOOR AIR" in column or "ZONE AIR NODE" in column:
+            
+            elif 'System Node Relative Humidity' in variable:
+                if "RETURN" in objName or "OUTDOOR AIR" in objName or "ZONE AIR NODE" in objName:
+                    key.append(-1)
+                    path.append(-1)
+                else:
+                    if ' IDEAL LOADS SUPPLY INLET' in objName:
+                        key.append(6)
+                        zoneName = checkZone(" " + objName.split(' IDEAL LOADS SUPPLY INLET')[0])
+                        makeHeader(supplyAirHumidity, int(path[columnCount]), zoneName, timestep, "Supply Air Relative Humidity", "%", False)
+                        dataTypeList[2] = True
+                    else:
+                        try:
+                            zoneName = checkCentralSys((" " + objName.split('NODE')[-1]), 2)
+                            centralSys = True
+                            makeHeader(supplyAirHumidity, int(path[columnCount]), zoneName, timestep, "Supply Air Relative Humidity", "%", False)
+                            dataTypeList[2] = True
+                            key.append(6)
+                        except:
                             key.append(-1)
                             path.append(-1)
-                        else:
-                            if ' IDEAL LOADS SUPPLY INLET' in column:
-                                key.append(6)
-                                zoneName = checkZone(" " + column.split(':')[0].split(' IDEAL LOADS SUPPLY INLET')[0])
-                                makeHeader(supplyAirHumidity, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Supply Air Relative Humidity", "%", False)
-                                dataTypeList[2] = True
-                            else:
-                                try:
-                                    zoneName = checkCentralSys((" " + column.split(":")[0].split('NODE')[-1]), 2)
-                                    centralSys = True
-                                    makeHeader(supplyAirHumidity, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Supply Air Relative Humidity", "%", False)
-                                    dataTypeList[2] = True
-                                    key.append(6)
-                                except:
-                                    key.append(-1)
-                                    path.append(-1)
-                    
-                    elif 'Zone Cooling Setpoint Not Met Time' in column:
-                        key.append(7)
-                        zoneName = checkZone(" " + column.split(':')[0])
-                        makeHeader(unmetHoursCooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Unmet Cooling hours", "hours", True)
-                        dataTypeList[3] = True
-                    
-                    elif 'Zone Heating Setpoint Not Met Time' in column:
-                        key.append(8)
-                        zoneName = checkZone(" " + column.split(':')[0])
-                        makeHeader(unmetHoursHeating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Unmet Heating hours", "hours", True)
-                        dataTypeList[4] = True
-                    
-                    else:
-                        key.append(-1)
-                        path.append(-1)
-                    
+            
+            elif 'Zone Cooling Setpoint Not Met Time' in variable:
+                key.append(7)
+                zoneName = checkZone(" " + objName)
+                makeHeader(unmetHoursCooling, int(path[columnCount]), zoneName, timestep, "Unmet Cooling hours", "hours", True)
+                dataTypeList[3] = True
+            
+            elif 'Zone Heating Setpoint Not Met Time' in variable:
+                key.append(8)
+                zoneName = checkZone(" " + objName)
+                makeHeader(unmetHoursHeating, int(path[columnCount]), zoneName, timestep, "Unmet Heating hours", "hours", True)
+                dataTypeList[4] = True
+            
             else:
-                for columnCount, column in enumerate(line.split(',')):
-                    p = GH_Path(int(path[columnCount]))
-                    
-                    if key[columnCount] == 0:
-                        sensibleCooling.Add((float(column)/3600000), p)
-                    elif key[columnCount] == 1:
-                        latentCooling.Add((float(column)/3600000), p)
-                    elif key[columnCount] == 2:
-                        sensibleHeating.Add((float(column)/3600000), p)
-                    elif key[columnCount] == 3:
-                        latentHeating.Add((float(column)/3600000), p)
-                    elif key[columnCount] == 4:
-                        supplyVolFlow.Add((float(column)), p)
-                    elif key[columnCount] == 5:
-                        supplyAirTemp.Add(float(column), p)
-                    elif key[columnCount] == 6:
-                        supplyAirHumidity.Add(float(column), p)
-                    elif key[columnCount] == 7:
-                        unmetHoursCooling.Add(float(column),p)
-                    elif key[columnCount] == 8:
-                        unmetHoursHeating.Add(float(column),p)
-                    
-        result.close()
+                key.append(-1)
+                path.append(-1)
+        
+        #READ ONLY THE COLUMNS THAT ARE NEEDED
+        columnData = reader.readColumns([columnCount for columnCount, k in enumerate(key) if k != -1])
+        for columnCount in sorted(columnData.keys()):
+            p = GH_Path(int(path[columnCount]))
+            values = columnData[columnCount]
+            
+            if key[columnCount] == 0:
+                for value in values: sensibleCooling.Add(value/3600000, p)
+            elif key[columnCount] == 1:
+                for value in values: latentCooling.Add(value/3600000, p)
+            elif key[columnCount] == 2:
+                for value in values: sensibleHeating.Add(value/3600000, p)
+            elif key[columnCount] == 3:
+                for value in values: latentHeating.Add(value/3600000, p)
+            elif key[columnCount] == 4:
+                for value in values: supplyVolFlow.Add(value, p)
+            elif key[columnCount] == 5:
+                for value in values: supplyAirTemp.Add(value, p)
+            elif key[columnCount] == 6:
+                for value in values: supplyAirHumidity.Add(value, p)
+            elif key[columnCount] == 7:
+                for value in values: unmetHoursCooling.Add(value, p)
+            elif key[columnCount] == 8:
+                for value in values: unmetHoursHeating.Add(value, p)
+        
         parseSuccess = True
     except:
-        try: result.close()
-        except: pass
         parseSuccess = False
         warn = 'Failed to parse the result file.  Check the folder of the file address you are plugging into this component and make sure that there is a .csv file in the folder. \n'+ \
                   'If there is no csv file or there is a file with no data in it (it is 0 kB), your simulation probably did not run correctly. \n' + \
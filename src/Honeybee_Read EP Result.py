@@ -29,7 +29,7 @@ This component reads only the results related to zones.  For results related to
 Provided by Honeybee 0.0.62
     
     Args:
-        _resultFileAddress: The result file address that comes out of the WriteIDF component.
+        _resultFileAddress: The result file address that comes out of the WriteIDF component.  This can also be the .sql or .eso file of the simulation. The .eso file is not limited in the number of output variables like the csv file. The .sql file is only read if its path is connected here.
     Returns:
         totalThermalLoad: The total thermal energy used by each zone in kWh.  This includes cooling and heating.
         thermalLoadBalance: The thermal energy used by each zone in kWh.  Heating values are positive while cooling values are negative.
@@ -55,11 +55,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Read EP Result"
 ghenv.Component.NickName = 'readEPResult'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nMAY_02_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nAPR_04_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "4"
 
@@ -72,6 +72,24 @@ import scriptcontext as sc
 import copy
 import os
 
+
+#Honeybee check.
+hbCheck = True
+if not sc.sticky.has_key('honeybee_release') == True:
+    hbCheck = False
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, "You should first let Honeybee fly...")
+else:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): hbCheck = False
+    except:
+        hbCheck = False
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        "Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+
 #Check to be sure that the files exist.
 csvExists = True
 if _resultFileAddress and _resultFileAddress != None:
@@ -144,6 +162,10 @@ if _resultFileAddress and csvExists == True:
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
 else: pass
 
+#Add the zones that were modeled with zone multipliers.
+if hbCheck and gotData == True:
+    zoneNameList, floorAreaList = sc.sticky["honeybee_EPZoneMultipliers"].expandZoneLists(_resultFileAddress, zoneNameList, floorAreaList)
+
 
 # Make data tree objects for all of the outputs.
 totalThermalLoad = DataTree[Object]()
@@ -292,408 +314,381 @@ for name in zoneNameList:
 
 
 # PARSE THE RESULT FILE.
-if _resultFileAddress and gotData == True and csvExists == True:
+if hbCheck and _resultFileAddress and gotData == True and csvExists == True:
     try:
-        result = open(_resultFileAddress, 'r')
+        reader = sc.sticky["honeybee_EPResultReader"].fromResultFile(_resultFileAddress)
         
-        for lineCount, line in enumerate(result):
-            if lineCount == 0:
-                #ANALYZE THE FILE HEADING
-                key = []; path = []
-                for columnCount, column in enumerate(line.split(',')):
-                    
-                    if 'Zone Ideal Loads Supply Air Total Cooling Energy' in column or 'Zone Ideal Loads Supply Air Sensible Cooling Energy' in column or 'Zone Ideal Loads Supply Air Latent Cooling Energy' in column or 'Chiller Electric Energy' in column or 'Cooling Coil Electric Energy' in column or 'Zone VRF Air Terminal Cooling Electric Energy' in column or 'VRF Heat Pump Cooling Electric Energy' in column:
-                        
-                        if 'Zone Ideal Loads Supply Air Total Cooling Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                            idealAirTrigger = True
-                        elif 'Zone Ideal Loads Supply Air Sensible Cooling Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                            idealAirTrigger = True
-                        elif 'IDEAL LOADS AIR SYSTEM' in column:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS AIR SYSTEM')[0])
-                            idealAirTrigger = True
-                        elif 'COIL COOLING DX SINGLE SPEED' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL COOLING DX SINGLE SPEED ')[-1], 'DX Cooling Coil')
-                            idealAirTrigger = False
-                        elif 'COIL COOLING DX TWO SPEED' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL COOLING DX TWO SPEED ')[-1], 'DX Cooling Coil')
-                            idealAirTrigger = False
-                        elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in column:
-                            zoneName = checkZSys(" " + ":".join(column.split(":")[:-1]).split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1], 'VRF Terminal Unit')
-                            idealAirTrigger = False
-                        elif 'VRF HEAT PUMP -' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('VRF HEAT PUMP - ')[-1], 5)
-                            idealAirTrigger = False
-                        elif 'COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT' in column and not 'DOAS' in column:
-                            zoneName = checkZSys(" " + ":".join(column.split(":")[:-1]).split('COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT ')[-1], 'Zone Heat Pump Coil')
-                            idealAirTrigger = False
-                        elif 'COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT' in column and 'DOAS' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT ')[-1], 'Heat Pump Coil', 2)
-                            idealAirTrigger = 2
-                        elif 'Chiller Electric Energy' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('CHILLER ELECTRIC EIR ')[-1], 0)
-                            idealAirTrigger = False
-                        else:
-                            zoneName = " " +column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                        
-                        try:
-                            if idealAirTrigger == True:
-                                makeHeader(cooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Cooling Load", energyUnit, True)
-                            else:
-                                makeHeader(cooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Cooling Electric Energy", energyUnit, True)
-                            dataTypeList[2] = True
-                            key.append(0)
-                        except:
-                            key.append(-1)
-                    
-                    elif 'Zone Ideal Loads Supply Air Total Heating Energy' in column or 'Zone Ideal Loads Supply Air Sensible Heating Energy' in column or 'Zone Ideal Loads Supply Air Latent Heating Energy' in column or 'Boiler Heating Energy' in column or 'Heating Coil Total Heating Energy' in column or 'Heating Coil Gas Energy' in column or 'Heating Coil Electric Energy' in column or 'Humidifier Electric Energy' in column or 'Zone VRF Air Terminal Heating Electric Energy' in column or 'VRF Heat Pump Heating Electric Energy' in column:
-                        notFound = False
-                        if 'Zone Ideal Loads Supply Air Total Heating Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                            idealAirTrigger = True
-                        elif 'IDEAL LOADS AIR SYSTEM' in column:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS AIR SYSTEM')[0])
-                            idealAirTrigger = True
-                        elif 'COIL HEATING DX SINGLE SPEED' in column and not 'Heating Coil Total Heating Energy' in column:
-                            zoneName = checkZSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING DX SINGLE SPEED ')[-1], 'DX Heating Coil')
-                            idealAirTrigger = 2
-                        elif 'COIL HEATING GAS' in column and not 'Heating Coil Electric Energy' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING GAS ')[-1], 'Gas Coil')
-                            idealAirTrigger = False
-                        elif 'COIL HEATING ELECTRIC' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING ELECTRIC ')[-1], 'Electric Coil')
-                            idealAirTrigger = 2
-                        elif 'COIL HEATING WATER TO AIR HEAT PUMP EQUATION FIT' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING WATER TO AIR HEAT PUMP EQUATION FIT ')[-1], 'Zone Heat Pump Coil', 2)
-                            idealAirTrigger = 2
-                        elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in column and not 'Heating Coil Total Heating Energy' in column:
-                            zoneName = checkZSys(" " + ":".join(column.split(":")[:-1]).split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1], 'VRF Terminal Unit')
-                            idealAirTrigger = 2
-                        elif 'VRF HEAT PUMP -' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('VRF HEAT PUMP - ')[-1], 5)
-                            idealAirTrigger = 2
-                        elif 'Boiler Heating Energy' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('BOILER HOT WATER ')[-1], 1)
-                            idealAirTrigger = False
-                        elif 'HUMIDIFIER STEAM ELECTRIC' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('HUMIDIFIER STEAM ELECTRIC ')[-1], 4)
-                            idealAirTrigger = 2
-                        elif 'Heating Coil Total Heating Energy' not in column and not 'COIL HEATING GAS' in column:
-                            zoneName = " " +column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                        else:
-                            zoneName = None
-                            path.append(0)
-                        
-                        try:
-                            if zoneName != None:
-                                if idealAirTrigger == True:
-                                    makeHeader(heating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Heating Load", energyUnit, True)
-                                elif idealAirTrigger == False:
-                                    makeHeader(heating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Heating Fuel Energy", energyUnit, False)
-                                else:
-                                    makeHeader(heating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Heating Electric Energy", energyUnit, False)
-                                dataTypeList[3] = True
-                                key.append(1)
-                            else:
-                                key.append(-1)
-                        except:
-                            key.append(-1)
-                    
-                    elif 'Zone Lights Electric Energy' in column:
-                        key.append(2)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(electricLight, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Electric Lighting Energy", energyUnit, True)
-                        dataTypeList[4] = True
-                    
-                    elif 'Zone Electric Equipment Electric Energy' in column:
-                        key.append(3)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(electricEquip, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Electric Equipment Energy", energyUnit, True)
-                        dataTypeList[5] = True
-                    
-                    elif 'Fan Electric Energy' in column:
-                        key.append(15)
-                        if 'FAN CONSTANT VOLUME' in column:
-                            centTrigger = True
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('FAN CONSTANT VOLUME ')[-1], 2)
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'FAN VARIABLE VOLUME' in column:
-                            fanNum = int(":".join(column.split(":")[:-1]).split('FAN VARIABLE VOLUME ')[-1])
-                            if centTrigger == True:
-                                fanNum = fanNum+len(zoneNameList)
-                            zoneName = checkCentralSys(" " + str(fanNum), 2)
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'FAN ON OFF' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('FAN ON OFF ')[-1])
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW'  in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(" FAN:")[:-1]).split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'Zone Ventilation Fan Electric Energy' in column:
-                            zoneName = checkZoneOther(dataIndex, " " + ":".join(column.split(":")[:-1]))
-                            makeHeaderAlt(fanElectric, path[columnCount], zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'Earth Tube Fan Electric Energy' in column:
-                            zoneName = checkZoneOther(dataIndex, " " + ":".join(column.split(":")[:-1]))
-                            makeHeaderAlt(fanElectric, path[columnCount], zoneName, column.split('(')[-1].split(')')[0], "Earth Tube Fan Electric Energy", energyUnit, False)
-                        else:
-                            zoneName = " " +column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        dataTypeList[6] = True
-                    
-                    elif 'Pump Electric Energy' in column:
-                        key.append(25)
-                        if 'PUMP CONSTANT SPEED' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('PUMP CONSTANT SPEED ')[-1])
-                            makeHeader(pumpElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Pump Electric Energy", energyUnit, True)
-                        elif 'PUMP VARIABLE SPEED' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('PUMP VARIABLE SPEED ')[-1], 3)
-                            makeHeader(pumpElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Pump Electric Energy", energyUnit, True)
-                        else:
-                            zoneName = " " + column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                            makeHeader(pumpElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Pump Electric Energy", energyUnit, True)
-                        dataTypeList[7] = True
-                    
-                    elif 'Zone People Total Heating Energy' in column or 'Zone People Sensible Heating Energy' in column or 'Zone People Latent Gain Energy' in column:
-                        key.append(4)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(peopleGains, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "People Energy", energyUnit, True)
-                        dataTypeList[8] = True
-                    
-                    elif 'Zone Windows Total Transmitted Solar Radiation Energy' in column:
-                        key.append(5)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(totalSolarGain, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Total Solar Gain", energyUnit, True)
-                        dataTypeList[9] = True
-                    
-                    elif 'Zone Ventilation Sensible Heat Loss Energy ' in column:
-                        key.append(6)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(natVentEnergy, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Natural Ventilation Energy", energyUnit, True)
-                        dataTypeList[12] = True
-                    
-                    elif 'Zone Ventilation Sensible Heat Gain Energy' in column:
-                        key.append(7)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                    
-                    elif 'Zone Ideal Loads Zone Total Heating Energy' in column or 'Zone Ideal Loads Zone Sensible Heating Energy' in column or 'Zone Ideal Loads Zone Latent Heating Energy' in column:
-                        key.append(23)
-                        if 'Zone Ideal Loads Zone Total Heating Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS')[0])
-                        zoneHeatingEnergy[int(path[-1])].append(zoneName)
-                        zoneHeatingEnergy[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Ideal Loads Zone Total Cooling Energy' in column or 'Zone Ideal Loads Zone Sensible Cooling Energy' in column or 'Zone Ideal Loads Zone Latent Cooling Energy' in column:
-                        key.append(24)
-                        if 'Zone Ideal Loads Zone Total Cooling Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS')[0])
-                        zoneCoolingEnergy[int(path[-1])].append(zoneName)
-                        zoneCoolingEnergy[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Infiltration Total Heat Loss Energy' in column or 'Zone Infiltration Sensible Heat Loss Energy' in column or 'Zone Infiltration Latent Heat Loss Energy' in column:
-                        key.append(8)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(infiltrationEnergy, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Infiltration Energy", energyUnit, True)
-                        dataTypeList[10] = True
-                    
-                    elif 'Zone Infiltration Total Heat Gain Energy' in column or 'Zone Infiltration Sensible Heat Gain Energy' in column or 'Zone Infiltration Latent Heat Gain Energy' in column:
-                        key.append(9)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                    
-                    elif 'Zone Operative Temperature' in column:
-                        key.append(10)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(operativeTemperature, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Operative Temperature", "C", False)
-                        dataTypeList[13] = True
-                    
-                    elif 'Zone Mean Air Temperature' in column:
-                        key.append(11)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(airTemperature, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Air Temperature", "C", False)
-                        dataTypeList[14] = True
-                    
-                    elif 'Zone Mean Radiant Temperature' in column:
-                        key.append(12)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(meanRadTemperature, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Radiant Temperature", "C", False)
-                        dataTypeList[15] = True
-                    
-                    elif 'Zone Air Relative Humidity' in column:
-                        key.append(13)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(relativeHumidity, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Relative Humidity", "%", False)
-                        dataTypeList[16] = True
-                    
-                    elif 'Zone Ventilation Standard Density Volume Flow Rate' in column:
-                        key.append(16)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        natVentFlow[int(path[-1])].append(zoneName)
-                        natVentFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Infiltration Standard Density Volume Flow Rate' in column:
-                        key.append(17)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        infiltrationFlow[int(path[-1])].append(zoneName)
-                        infiltrationFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Mechanical Ventilation Standard Density Volume Flow Rate' in column:
-                        key.append(22)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        mechSysAirFlow[int(path[-1])].append(zoneName)
-                        mechSysAirFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Earth Tube Air Flow Volume' in column:
-                        key.append(21)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        earthTubeFlow[int(path[-1])].append(zoneName)
-                        earthTubeFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Air Heat Balance Internal Convective Heat Gain Rate' in column:
-                        key.append(18)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        internalAirGain[int(path[-1])].append(zoneName)
-                        internalAirGain[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Air Heat Balance Surface Convection Rate' in column:
-                        key.append(19)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        surfaceAirGain[int(path[-1])].append(zoneName)
-                        surfaceAirGain[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Air Heat Balance System Air Transfer Rate' in column:
-                        key.append(20)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        systemAirGain[int(path[-1])].append(zoneName)
-                        systemAirGain[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif ('Zone' in column or 'Site' in column) and not "Setpoint Not Met Time" in column or "Pump Electric Energy" in column:
-                        if "Site" in column:
-                            zoneName = checkOther(column, otherCount)
-                            otherCount += 1
-                        elif not "System" in column and not "SYSTEM" in column and not "ZONEHVAC" in column:
-                            zoneName = checkZoneOther(dataIndex, (" " + ":".join(column.split(":")[:-1])))
-                        elif 'IDEAL LOADS' in column and not "Supply Air Sensible" in column and not "Supply Air Latent" in column:
-                            zoneName = checkZoneOther(dataIndex, (" " + column.split(" IDEAL LOADS")[0]))
-                        else: zoneName = None
-                        
-                        if zoneName != None:
-                            key.append(14)
-                            otherDataName = column.split(':')[-1].split(' [')[0].upper()
-                            if "ENERGY" in otherDataName or "GAIN" in otherDataName or "MASS" in otherDataName or "VOLUME" in otherDataName or "Loss" in otherDataName: normalizble = True
-                            else: normalizble = False
-                            makeHeaderAlt(otherZoneData, path[columnCount], zoneName, column.split('(')[-1].split(')')[0], column.split(':')[-1].split(' [')[0], column.split('[')[-1].split(']')[0], normalizble)
-                            dataTypeList[19] = True
+        #ANALYZE THE FILE HEADING
+        key = []; path = []
+        for columnCount, (variable, objName, units, timestep) in enumerate(reader.columns):
+            
+            if 'Zone Ideal Loads Supply Air Total Cooling Energy' in variable or 'Zone Ideal Loads Supply Air Sensible Cooling Energy' in variable or 'Zone Ideal Loads Supply Air Latent Cooling Energy' in variable or 'Chiller Electric Energy' in variable or 'Cooling Coil Electric Energy' in variable or 'Zone VRF Air Terminal Cooling Electric Energy' in variable or 'VRF Heat Pump Cooling Electric Energy' in variable:
+                
+                if 'Zone Ideal Loads Supply Air Total Cooling Energy' in variable and 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                    idealAirTrigger = True
+                elif 'Zone Ideal Loads Supply Air Sensible Cooling Energy' in variable and 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                    idealAirTrigger = True
+                elif 'IDEAL LOADS AIR SYSTEM' in objName:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS AIR SYSTEM')[0])
+                    idealAirTrigger = True
+                elif 'COIL COOLING DX SINGLE SPEED' in objName:
+                    zoneName = checkSys(" " + objName.split('COIL COOLING DX SINGLE SPEED ')[-1], 'DX Cooling Coil')
+                    idealAirTrigger = False
+                elif 'COIL COOLING DX TWO SPEED' in objName:
+                    zoneName = checkSys(" " + objName.split('COIL COOLING DX TWO SPEED ')[-1], 'DX Cooling Coil')
+                    idealAirTrigger = False
+                elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in objName:
+                    zoneName = checkZSys(" " + objName.split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1], 'VRF Terminal Unit')
+                    idealAirTrigger = False
+                elif 'VRF HEAT PUMP -' in objName:
+                    zoneName = checkCentralSys(" " + objName.split('VRF HEAT PUMP - ')[-1], 5)
+                    idealAirTrigger = False
+                elif 'COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT' in objName and not 'DOAS' in objName:
+                    zoneName = checkZSys(" " + objName.split('COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT ')[-1], 'Zone Heat Pump Coil')
+                    idealAirTrigger = False
+                elif 'COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT' in objName and 'DOAS' in objName:
+                    zoneName = checkSys(" " + objName.split('COIL COOLING WATER TO AIR HEAT PUMP EQUATION FIT ')[-1], 'Heat Pump Coil', 2)
+                    idealAirTrigger = 2
+                elif 'Chiller Electric Energy' in variable:
+                    zoneName = checkCentralSys(" " + objName.split('CHILLER ELECTRIC EIR ')[-1], 0)
+                    idealAirTrigger = False
+                else:
+                    zoneName = " " +objName
+                    checkCustomName(customCount)
+                    customCount+=1
+                
+                try:
+                    if idealAirTrigger == True:
+                        makeHeader(cooling, int(path[columnCount]), zoneName, timestep, "Cooling Load", energyUnit, True)
+                    else:
+                        makeHeader(cooling, int(path[columnCount]), zoneName, timestep, "Cooling Electric Energy", energyUnit, True)
+                    dataTypeList[2] = True
+                    key.append(0)
+                except:
+                    key.append(-1)
+            
+            elif 'Zone Ideal Loads Supply Air Total Heating Energy' in variable or 'Zone Ideal Loads Supply Air Sensible Heating Energy' in variable or 'Zone Ideal Loads Supply Air Latent Heating Energy' in variable or 'Boiler Heating Energy' in variable or 'Heating Coil Total Heating Energy' in variable or 'Heating Coil Gas Energy' in variable or 'Heating Coil Electric Energy' in variable or 'Humidifier Electric Energy' in variable or 'Zone VRF Air Terminal Heating Electric Energy' in variable or 'VRF Heat Pump Heating Electric Energy' in variable:
+                notFound = False
+                if 'Zone Ideal Loads Supply Air Total Heating Energy' in variable and 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                    idealAirTrigger = True
+                elif 'IDEAL LOADS AIR SYSTEM' in objName:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS AIR SYSTEM')[0])
+                    idealAirTrigger = True
+                elif 'COIL HEATING DX SINGLE SPEED' in objName and not 'Heating Coil Total Heating Energy' in variable:
+                    zoneName = checkZSys(" " + objName.split('COIL HEATING DX SINGLE SPEED ')[-1], 'DX Heating Coil')
+                    idealAirTrigger = 2
+                elif 'COIL HEATING GAS' in objName and not 'Heating Coil Electric Energy' in variable:
+                    zoneName = checkSys(" " + objName.split('COIL HEATING GAS ')[-1], 'Gas Coil')
+                    idealAirTrigger = False
+                elif 'COIL HEATING ELECTRIC' in objName:
+                    zoneName = checkSys(" " + objName.split('COIL HEATING ELECTRIC ')[-1], 'Electric Coil')
+                    idealAirTrigger = 2
+                elif 'COIL HEATING WATER TO AIR HEAT PUMP EQUATION FIT' in objName:
+                    zoneName = checkSys(" " + objName.split('COIL HEATING WATER TO AIR HEAT PUMP EQUATION FIT ')[-1], 'Zone Heat Pump Coil', 2)
+                    idealAirTrigger = 2
+                elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in objName and not 'Heating Coil Total Heating Energy' in variable:
+                    zoneName = checkZSys(" " + objName.split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1], 'VRF Terminal Unit')
+                    idealAirTrigger = 2
+                elif 'VRF HEAT PUMP -' in objName:
+                    zoneName = checkCentralSys(" " + objName.split('VRF HEAT PUMP - ')[-1], 5)
+                    idealAirTrigger = 2
+                elif 'Boiler Heating Energy' in variable:
+                    zoneName = checkCentralSys(" " + objName.split('BOILER HOT WATER ')[-1], 1)
+                    idealAirTrigger = False
+                elif 'HUMIDIFIER STEAM ELECTRIC' in objName:
+                    zoneName = checkCentralSys(" " + objName.split('HUMIDIFIER STEAM ELECTRIC ')[-1], 4)
+                    idealAirTrigger = 2
+                elif 'Heating Coil Total Heating Energy' not in variable and not 'COIL HEATING GAS' in objName:
+                    zoneName = " " +objName
+                    checkCustomName(customCount)
+                    customCount+=1
+                else:
+                    zoneName = None
+                    path.append(0)
+                
+                try:
+                    if zoneName != None:
+                        if idealAirTrigger == True:
+                            makeHeader(heating, int(path[columnCount]), zoneName, timestep, "Heating Load", energyUnit, True)
+                        elif idealAirTrigger == False:
+                            makeHeader(heating, int(path[columnCount]), zoneName, timestep, "Heating Fuel Energy", energyUnit, False)
                         else:
-                            key.append(-1)
-                            path.append(-1)
-                    
+                            makeHeader(heating, int(path[columnCount]), zoneName, timestep, "Heating Electric Energy", energyUnit, False)
+                        dataTypeList[3] = True
+                        key.append(1)
                     else:
                         key.append(-1)
-                        path.append(-1)
+                except:
+                    key.append(-1)
+            
+            elif 'Zone Lights Electric Energy' in variable:
+                key.append(2)
+                zoneName = checkZone(" " + objName)
+                makeHeader(electricLight, int(path[columnCount]), zoneName, timestep, "Electric Lighting Energy", energyUnit, True)
+                dataTypeList[4] = True
+            
+            elif 'Zone Electric Equipment Electric Energy' in variable:
+                key.append(3)
+                zoneName = checkZone(" " + objName)
+                makeHeader(electricEquip, int(path[columnCount]), zoneName, timestep, "Electric Equipment Energy", energyUnit, True)
+                dataTypeList[5] = True
+            
+            elif 'Fan Electric Energy' in variable:
+                key.append(15)
+                if 'FAN CONSTANT VOLUME' in objName:
+                    centTrigger = True
+                    zoneName = checkCentralSys(" " + objName.split('FAN CONSTANT VOLUME ')[-1], 2)
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'FAN VARIABLE VOLUME' in objName:
+                    fanNum = int(objName.split('FAN VARIABLE VOLUME ')[-1])
+                    if centTrigger == True:
+                        fanNum = fanNum+len(zoneNameList)
+                    zoneName = checkCentralSys(" " + str(fanNum), 2)
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'FAN ON OFF' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('FAN ON OFF ')[-1])
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in objName:
+                    zoneName = checkZoneSys(" " + objName.rsplit(" FAN", 1)[0].split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'Zone Ventilation Fan Electric Energy' in variable:
+                    zoneName = checkZoneOther(dataIndex, " " + objName)
+                    makeHeaderAlt(fanElectric, path[columnCount], zoneName, timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'Earth Tube Fan Electric Energy' in variable:
+                    zoneName = checkZoneOther(dataIndex, " " + objName)
+                    makeHeaderAlt(fanElectric, path[columnCount], zoneName, timestep, "Earth Tube Fan Electric Energy", energyUnit, False)
+                else:
+                    zoneName = " " +objName
+                    checkCustomName(customCount)
+                    customCount+=1
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, timestep, "Fan Electric Energy", energyUnit, False)
+                dataTypeList[6] = True
+            
+            elif 'Pump Electric Energy' in variable:
+                key.append(25)
+                if 'PUMP CONSTANT SPEED' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('PUMP CONSTANT SPEED ')[-1])
+                    makeHeader(pumpElectric, int(path[columnCount]), zoneName, timestep, "Pump Electric Energy", energyUnit, True)
+                elif 'PUMP VARIABLE SPEED' in objName:
+                    zoneName = checkCentralSys(" " + objName.split('PUMP VARIABLE SPEED ')[-1], 3)
+                    makeHeader(pumpElectric, int(path[columnCount]), zoneName, timestep, "Pump Electric Energy", energyUnit, True)
+                else:
+                    zoneName = " " + objName
+                    checkCustomName(customCount)
+                    customCount+=1
+                    makeHeader(pumpElectric, int(path[columnCount]), zoneName, timestep, "Pump Electric Energy", energyUnit, True)
+                dataTypeList[7] = True
+            
+            elif 'Zone People Total Heating Energy' in variable or 'Zone People Sensible Heating Energy' in variable or 'Zone People Latent Gain Energy' in variable:
+                key.append(4)
+                zoneName = checkZone(" " + objName)
+                makeHeader(peopleGains, int(path[columnCount]), zoneName, timestep, "People Energy", energyUnit, True)
+                dataTypeList[8] = True
+            
+            elif 'Zone Windows Total Transmitted Solar Radiation Energy' in variable:
+                key.append(5)
+                zoneName = checkZone(" " + objName)
+                makeHeader(totalSolarGain, int(path[columnCount]), zoneName, timestep, "Total Solar Gain", energyUnit, True)
+                dataTypeList[9] = True
+            
+            elif variable == 'Zone Ventilation Sensible Heat Loss Energy':
+                key.append(6)
+                zoneName = checkZone(" " + objName)
+                makeHeader(natVentEnergy, int(path[columnCount]), zoneName, timestep, "Natural Ventilation Energy", energyUnit, True)
+                dataTypeList[12] = True
+            
+            elif 'Zone Ventilation Sensible Heat Gain Energy' in variable:
+                key.append(7)
+                zoneName = checkZone(" " + objName)
+            
+            elif 'Zone Ideal Loads Zone Total Heating Energy' in variable or 'Zone Ideal Loads Zone Sensible Heating Energy' in variable or 'Zone Ideal Loads Zone Latent Heating Energy' in variable:
+                key.append(23)
+                if 'Zone Ideal Loads Zone Total Heating Energy' in variable and 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS')[0])
+                zoneHeatingEnergy[int(path[-1])].append(zoneName)
+                zoneHeatingEnergy[int(path[-1])].append(timestep)
+            
+            elif 'Zone Ideal Loads Zone Total Cooling Energy' in variable or 'Zone Ideal Loads Zone Sensible Cooling Energy' in variable or 'Zone Ideal Loads Zone Latent Cooling Energy' in variable:
+                key.append(24)
+                if 'Zone Ideal Loads Zone Total Cooling Energy' in variable and 'ZONE HVAC' in objName:
+                    zoneName = checkZoneSys(" " + objName.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + objName.split(' IDEAL LOADS')[0])
+                zoneCoolingEnergy[int(path[-1])].append(zoneName)
+                zoneCoolingEnergy[int(path[-1])].append(timestep)
+            
+            elif 'Zone Infiltration Total Heat Loss Energy' in variable or 'Zone Infiltration Sensible Heat Loss Energy' in variable or 'Zone Infiltration Latent Heat Loss Energy' in variable:
+                key.append(8)
+                zoneName = checkZone(" " + objName)
+                makeHeader(infiltrationEnergy, int(path[columnCount]), zoneName, timestep, "Infiltration Energy", energyUnit, True)
+                dataTypeList[10] = True
+            
+            elif 'Zone Infiltration Total Heat Gain Energy' in variable or 'Zone Infiltration Sensible Heat Gain Energy' in variable or 'Zone Infiltration Latent Heat Gain Energy' in variable:
+                key.append(9)
+                zoneName = checkZone(" " + objName)
+            
+            elif 'Zone Operative Temperature' in variable:
+                key.append(10)
+                zoneName = checkZone(" " + objName)
+                makeHeader(operativeTemperature, int(path[columnCount]), zoneName, timestep, "Operative Temperature", "C", False)
+                dataTypeList[13] = True
+            
+            elif 'Zone Mean Air Temperature' in variable:
+                key.append(11)
+                zoneName = checkZone(" " + objName)
+                makeHeader(airTemperature, int(path[columnCount]), zoneName, timestep, "Air Temperature", "C", False)
+                dataTypeList[14] = True
+            
+            elif 'Zone Mean Radiant Temperature' in variable:
+                key.append(12)
+                zoneName = checkZone(" " + objName)
+                makeHeader(meanRadTemperature, int(path[columnCount]), zoneName, timestep, "Radiant Temperature", "C", False)
+                dataTypeList[15] = True
+            
+            elif 'Zone Air Relative Humidity' in variable:
+                key.append(13)
+                zoneName = checkZone(" " + objName)
+                makeHeader(relativeHumidity, int(path[columnCount]), zoneName, timestep, "Relative Humidity", "%", False)
+                dataTypeList[16] = True
+            
+            elif 'Zone Ventilation Standard Density Volume Flow Rate' in variable:
+                key.append(16)
+                zoneName = checkZone(" " + objName)
+                natVentFlow[int(path[-1])].append(zoneName)
+                natVentFlow[int(path[-1])].append(timestep)
+            
+            elif 'Zone Infiltration Standard Density Volume Flow Rate' in variable:
+                key.append(17)
+                zoneName = checkZone(" " + objName)
+                infiltrationFlow[int(path[-1])].append(zoneName)
+                infiltrationFlow[int(path[-1])].append(timestep)
+            
+            elif 'Zone Mechanical Ventilation Standard Density Volume Flow Rate' in variable:
+                key.append(22)
+                zoneName = checkZone(" " + objName)
+                mechSysAirFlow[int(path[-1])].append(zoneName)
+                mechSysAirFlow[int(path[-1])].append(timestep)
+            
+            elif 'Earth Tube Air Flow Volume' in variable:
+                key.append(21)
+                zoneName = checkZone(" " + objName)
+                earthTubeFlow[int(path[-1])].append(zoneName)
+                earthTubeFlow[int(path[-1])].append(timestep)
+            
+            elif 'Zone Air Heat Balance Internal Convective Heat Gain Rate' in variable:
+                key.append(18)
+                zoneName = checkZone(" " + objName)
+                internalAirGain[int(path[-1])].append(zoneName)
+                internalAirGain[int(path[-1])].append(timestep)
+            
+            elif 'Zone Air Heat Balance Surface Convection Rate' in variable:
+                key.append(19)
+                zoneName = checkZone(" " + objName)
+                surfaceAirGain[int(path[-1])].append(zoneName)
+                surfaceAirGain[int(path[-1])].append(timestep)
+            
+            elif 'Zone Air Heat Balance System Air Transfer Rate' in variable:
+                key.append(20)
+                zoneName = checkZone(" " + objName)
+                systemAirGain[int(path[-1])].append(zoneName)
+                systemAirGain[int(path[-1])].append(timestep)
+            
+            elif ('Zone' in variable or 'Site' in variable) and not "Setpoint Not Met Time" in variable or "Pump Electric Energy" in variable:
+                if "Site" in variable:
+                    zoneName = checkOther(variable, otherCount)
+                    otherCount += 1
+                elif not "System" in variable and not "SYSTEM" in objName and not "ZONEHVAC" in objName:
+                    zoneName = checkZoneOther(dataIndex, (" " + objName))
+                elif 'IDEAL LOADS' in objName and not "Supply Air Sensible" in variable and not "Supply Air Latent" in variable:
+                    zoneName = checkZoneOther(dataIndex, (" " + objName.split(" IDEAL LOADS")[0]))
+                else: zoneName = None
+                
+                if zoneName != None:
+                    key.append(14)
+                    otherDataName = variable.upper()
+                    if "ENERGY" in otherDataName or "GAIN" in otherDataName or "MASS" in otherDataName or "VOLUME" in otherDataName or "Loss" in otherDataName: normalizble = True
+                    else: normalizble = False
+                    makeHeaderAlt(otherZoneData, path[columnCount], zoneName, timestep, variable, units, normalizble)
+                    dataTypeList[19] = True
+                else:
+                    key.append(-1)
+                    path.append(-1)
             
             else:
-                for columnCount, column in enumerate(line.split(',')):
-                    if key[columnCount] != 14:
-                        try: p = GH_Path(int(path[columnCount]))
-                        except: p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
-                    else:
-                        p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
-                    
-                    if key[columnCount] == 0:
-                        try: cooling.Add((float(column)/3600000), p)
-                        except: dataTypeList[2] = False
-                    elif key[columnCount] == 1:
-                        try: heating.Add((float(column)/3600000), p)
-                        except: dataTypeList[3] = False
-                    elif key[columnCount] == 2:
-                        try: electricLight.Add((float(column)/3600000), p)
-                        except: dataTypeList[4] = False
-                    elif key[columnCount] == 3:
-                        try: electricEquip.Add((float(column)/3600000), p)
-                        except: dataTypeList[5] = False
-                    elif key[columnCount] == 4:
-                        try: peopleGains.Add((float(column)/3600000), p)
-                        except: dataTypeList[6] = False
-                    elif key[columnCount] == 5:
-                        try: totalSolarGain.Add((float(column)/3600000), p)
-                        except: dataTypeList[7] = False
-                    elif key[columnCount] == 6:
-                        try: natVentEnergy.Add((((float(column))*(-1)/3600000) + ((float( line.split(',')[columnCount+1] ))/3600000)), p)
-                        except: dataTypeList[11] = False
-                    elif key[columnCount] == 7:
-                        pass
-                    elif key[columnCount] == 23:
-                        try: zoneHeatingEnergy[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 24:
-                        try: zoneCoolingEnergy[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 8:
-                        try: infiltrationEnergy.Add((((float(column))*(-1)/3600000) + ((float( line.split(',')[columnCount+1] ))/3600000)), p)
-                        except: dataTypeList[9] = False
-                    elif key[columnCount] == 9:
-                        pass
-                    elif key[columnCount] == 10:
-                        try: operativeTemperature.Add(float(column), p)
-                        except: dataTypeList[12] = False
-                    elif key[columnCount] == 11:
-                        try: airTemperature.Add(float(column), p)
-                        except: dataTypeList[13] = False
-                    elif key[columnCount] == 12:
-                        try: meanRadTemperature.Add(float(column), p)
-                        except: dataTypeList[14] = False
-                    elif key[columnCount] == 13:
-                        try: relativeHumidity.Add(float(column), p)
-                        except: dataTypeList[15] = False
-                    elif key[columnCount] == 14:
-                        try:
-                            otherZoneData.Add(float(column), p)
-                        except: pass
-                    elif key[columnCount] == 15:
-                        try: fanElectric.Add((float(column)/3600000), p)
-                        except: pass
-                    elif key[columnCount] == 25:
-                        try: pumpElectric.Add((float(column)/3600000), p)
-                        except: pass
-                    elif key[columnCount] == 16:
-                        try: natVentFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 17:
-                        try: infiltrationFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 22:
-                        try: mechSysAirFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 21:
-                        try: earthTubeFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 18:
-                        try: internalAirGain[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 19:
-                        try: surfaceAirGain[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 20:
-                        try: systemAirGain[int(path[columnCount])].append(float(column))
-                        except: pass
-                    
-        result.close()
+                key.append(-1)
+                path.append(-1)
+        
+        #READ ONLY THE COLUMNS THAT ARE NEEDED
+        # natural ventilation and infiltration energy also need the heat gain column next to the heat loss column.
+        columnsToRead = []
+        for columnCount, k in enumerate(key):
+            if k != -1: columnsToRead.append(columnCount)
+            if k == 6 or k == 8: columnsToRead.append(columnCount+1)
+        columnData = reader.readColumns(columnsToRead)
+        
+        # data trees and the factor to convert the values from J to kWh.
+        treeDict = {0: (cooling, 3600000), 1: (heating, 3600000), 2: (electricLight, 3600000),
+                    3: (electricEquip, 3600000), 4: (peopleGains, 3600000), 5: (totalSolarGain, 3600000),
+                    10: (operativeTemperature, 1), 11: (airTemperature, 1), 12: (meanRadTemperature, 1),
+                    13: (relativeHumidity, 1), 14: (otherZoneData, 1), 15: (fanElectric, 3600000),
+                    25: (pumpElectric, 3600000)}
+        # python lists that are collected by zone to be summed up later.
+        listDict = {23: zoneHeatingEnergy, 24: zoneCoolingEnergy, 16: natVentFlow, 17: infiltrationFlow,
+                    22: mechSysAirFlow, 21: earthTubeFlow, 18: internalAirGain, 19: surfaceAirGain,
+                    20: systemAirGain}
+        
+        # outputs that are not shown if a column has empty cells (e.g. monthly data in a file with hourly data).
+        dataTypeIndex = {0: 2, 1: 3, 2: 4, 3: 5, 4: 8, 5: 9, 6: 12, 8: 10, 10: 13, 11: 14, 12: 15, 13: 16}
+        
+        # values of the columns that are added to the same branch are interleaved row by row
+        # in the same order as they are in the file.
+        branches = []; branchValues = {}
+        for columnCount, k in enumerate(key):
+            if k == -1 or k == 7 or k == 9: continue
+            if k != 14:
+                try: p = GH_Path(int(path[columnCount]))
+                except: p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+            else:
+                p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+            values = columnData[columnCount]
+            
+            if k in dataTypeIndex:
+                if reader.hasGaps(columnCount) or ((k == 6 or k == 8) and reader.hasGaps(columnCount+1)):
+                    dataTypeList[dataTypeIndex[k]] = False
+            
+            if k in treeDict:
+                branch, factor = treeDict[k]
+                values = [value/factor for value in values]
+            elif k == 6 or k == 8:
+                branch = natVentEnergy if k == 6 else infiltrationEnergy
+                gainValues = columnData[columnCount+1]
+                values = [(-loss/3600000) + (gain/3600000) for loss, gain in zip(values, gainValues)]
+            elif k in listDict:
+                try: branch = listDict[k][int(path[columnCount])]
+                except: continue
+                p = None
+            else:
+                continue
+            
+            branchKey = id(branch), str(p)
+            if branchKey not in branchValues:
+                branches.append((branchKey, branch, p))
+                branchValues[branchKey] = []
+            branchValues[branchKey].append(values)
+        
+        for branchKey, branch, p in branches:
+            values = sc.sticky["honeybee_EPResultReader"].interleaveColumns(branchValues[branchKey])
+            if p == None: branch.extend(values)
+            else:
+                for value in values: branch.Add(value, p)
+        
         parseSuccess = True
     except:
-        try: result.close()
-        except: pass
         parseSuccess = False
         warn = 'Failed to parse the result file.  Check the folder of the file address you are plugging into this component and make sure that there is a .csv file in the folder. \n'+ \
                   'If there is a file with no data in it (it is 0 kB), your simulation probably did not run correctly. \n' + \
@@ -29,7 +29,7 @@ This component reads only the results related to surfaces.  For results related
 Provided by Honeybee 0.0.62
     
     Args:
-        _resultFileAddress: The result file address that comes out of the WriteIDF component.
+        _resultFileAddress: The result file address that comes out of the WriteIDF component.  This can also be the .sql or .eso file of the simulation. The .eso file is not limited in the number of output variables like the csv file. The .sql file is only read if its path is connected here.
         normBySrfArea_: Set to 'True' to normalize all surface energy data by the area of the suraces (note that the resulting units will be kWh/m2 as EnergyPlus runs in the metric system).  The default is set to "False."
     Returns:
         surfaceIndoorTemp: The indoor surface temperature of each surface (degrees Celcius).
@@ -46,11 +46,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Read EP Surface Result"
 ghenv.Component.NickName = 'readEPSrfResult'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJAN_17_2016
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "4"
 
@@ -64,6 +64,24 @@ import copy
 import os
 
 
+#Honeybee check.
+hbCheck = True
+if not sc.sticky.has_key('honeybee_release') == True:
+    hbCheck = False
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, "You should first let Honeybee fly...")
+else:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): hbCheck = False
+    except:
+        hbCheck = False
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        "Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+
+
 #Read the location and the analysis period info from the eio file, if there is one.
 #Also try to read the names of the zones and the surfaces from this file.
 location = "NoLocation"
@@ -187,6 +205,11 @@ if _resultFileAddress:
 else:
     gotSrfData =True
 
+#Add the zones and surfaces that were modeled with zone multipliers.
+if hbCheck and gotZoneData == True and gotSrfData == True:
+    zoneNameList, zoneSrfNameList, zoneSrfTypeList, zoneSrfAreaList = \
+        sc.sticky["honeybee_EPZoneMultipliers"].expandZoneLists(_resultFileAddress, zoneNameList, zoneSrfNameList, zoneSrfTypeList, zoneSrfAreaList)
+
 #If no surafce data was imported from the .eio file, give the user a warning and tell them that they cannot normalize by area.
 if gotSrfData == False:
     warning = 'No surface information was found in the imported .eio file adjacent to the .csv _resultFileAddress.'+ \
@@ -329,249 +352,256 @@ for zone in range(len(zoneSrfNameList)): dataIndex.append(0)
 
 
 # PARSE THE RESULT FILE.
-if _resultFileAddress and gotZoneData == True and gotSrfData == True:
+if hbCheck and _resultFileAddress and gotZoneData == True and gotSrfData == True:
     try:
-        result = open(_resultFileAddress, 'r')
+        reader = sc.sticky["honeybee_EPResultReader"].fromResultFile(_resultFileAddress)
         
-        for lineCount, line in enumerate(result):
-            if lineCount == 0:
-                #ANALYZE THE FILE HEADING
-                key = []; path = []; duplicateList = []; pieceNumList = []
-                for columnCount, column in enumerate(line.split(',')):
-                    srfName = column.split(':')[0]
-                    if 'Surface Inside Face Temperature' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 0)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1:
-                                makeHeaderGrafted(surfaceIndoorTemp, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Inner Surface Temperature", "C", False, typeName)
-                        else:
-                            path.append([InTemp])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(surfaceIndoorTemp, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Inner Surface Temperature", "C")
-                            InTemp += 1
-                        key.append(1)
-                        dataTypeList[0] = True
-                    
-                    elif 'Surface Outside Face Temperature' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 1)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1:
-                                makeHeaderGrafted(surfaceOutdoorTemp, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Outer Surface Temperature", "C", False, typeName)
-                        else:
-                            path.append([OutTemp])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(surfaceOutdoorTemp, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Outer Surface Temperature", "C")
-                            OutTemp += 1
-                        key.append(2)
-                        dataTypeList[1] = True
-                    
-                    elif 'Surface Average Face Conduction Heat Transfer Energy' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 2)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(opaqueEnergyFlow, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Surface Energy Loss/Gain", "kWh", True, typeName)
-                        else:
-                            path.append([opaConduct])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(opaqueEnergyFlow, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Surface Energy Loss/Gain", "kWh")
-                            opaConduct += 1
-                        key.append(3)
-                        dataTypeList[3] = True
-                    
-                    elif 'Surface Window Heat Gain Energy' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 3)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(glazEnergyFlow, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Surface Energy Loss/Gain", "kWh", True, typeName)
-                        else:
-                            path.append([glzGain])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(glazEnergyFlow, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Surface Energy Loss/Gain", "kWh")
-                            glzGain += 1
-                        key.append(4)
-                        dataTypeList[4] = True
-                    
-                    elif 'Surface Window Heat Loss Energy' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 4)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
+        #ANALYZE THE FILE HEADING
+        key = []; path = []; duplicateList = []; pieceNumList = []
+        for columnCount, (variable, objName, units, timestep) in enumerate(reader.columns):
+            srfName = objName
+            if 'Surface Inside Face Temperature' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 0)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1:
+                        makeHeaderGrafted(surfaceIndoorTemp, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Inner Surface Temperature", "C", False, typeName)
+                else:
+                    path.append([InTemp])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(surfaceIndoorTemp, int(path[columnCount]), srfName, timestep, "Inner Surface Temperature", "C")
+                    InTemp += 1
+                key.append(1)
+                dataTypeList[0] = True
+            
+            elif 'Surface Outside Face Temperature' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 1)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1:
+                        makeHeaderGrafted(surfaceOutdoorTemp, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Outer Surface Temperature", "C", False, typeName)
+                else:
+                    path.append([OutTemp])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(surfaceOutdoorTemp, int(path[columnCount]), srfName, timestep, "Outer Surface Temperature", "C")
+                    OutTemp += 1
+                key.append(2)
+                dataTypeList[1] = True
+            
+            elif 'Surface Average Face Conduction Heat Transfer Energy' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 2)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(opaqueEnergyFlow, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Surface Energy Loss/Gain", "kWh", True, typeName)
+                else:
+                    path.append([opaConduct])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(opaqueEnergyFlow, int(path[columnCount]), srfName, timestep, "Surface Energy Loss/Gain", "kWh")
+                    opaConduct += 1
+                key.append(3)
+                dataTypeList[3] = True
+            
+            elif 'Surface Window Heat Gain Energy' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 3)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(glazEnergyFlow, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Surface Energy Loss/Gain", "kWh", True, typeName)
+                else:
+                    path.append([glzGain])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(glazEnergyFlow, int(path[columnCount]), srfName, timestep, "Surface Energy Loss/Gain", "kWh")
+                    glzGain += 1
+                key.append(4)
+                dataTypeList[4] = True
+            
+            elif 'Surface Window Heat Loss Energy' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 4)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                else:
+                    path.append([glzLoss])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    glzLoss += 1
+                key.append(5)
+            
+            elif 'Surface Window Transmitted Beam Solar Radiation Energy' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 5)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(windowBeamEnergy, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Window Transmitted Beam Energy", "kWh", True, typeName)
+                else:
+                    path.append([glzBeamGain])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(windowBeamEnergy, int(path[columnCount]), srfName, timestep, "Window Transmitted Beam Energy", "kWh")
+                    glzBeamGain += 1
+                key.append(6)
+                dataTypeList[6] = True
+            
+            elif 'Surface Window Transmitted Diffuse Solar Radiation Energy' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 6)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(windowDiffEnergy, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Window Transmitted Diffuse Energy", "kWh", True, typeName)
+                else:
+                    path.append([glzDiffGain])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(windowDiffEnergy, int(path[columnCount]), srfName, timestep, "Window Transmitted Diffuse Energy", "kWh")
+                    glzDiffGain += 1
+                key.append(7)
+                dataTypeList[7] = True
+            
+            elif 'Surface Window Transmitted Solar Radiation Energy' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 7)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(windowTotalSolarEnergy, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Window Total Transmitted Solar Energy", "kWh", True, typeName)
+                else:
+                    path.append([glzTotalGain])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(windowTotalSolarEnergy, int(path[columnCount]), srfName, timestep, "Window Total Transmitted Solar Energy", "kWh")
+                    glzTotalGain += 1
+                key.append(8)
+                dataTypeList[5] = True
+            
+            elif 'Surface Window System Solar Transmittance' in variable:
+                if gotSrfData == True:
+                    srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 8)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    if pieceNum < 2 and path[columnCount] != -1: 
+                        makeHeaderGrafted(windowTransmissivity, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, "Surface Window System Solar Transmittance", "Fraction", True, typeName)
+                else:
+                    path.append([glzTransmiss])
+                    duplicateList.append(False)
+                    pieceNumList.append(1)
+                    makeHeader(windowTransmissivity, int(path[columnCount]), srfName, timestep, "Surface Window System Solar Transmittance", "Fraction")
+                    glzTransmiss += 1
+                key.append(10)
+                dataTypeList[8] = True
+            
+            elif 'Surface' in variable and not "Heat Balance Surface Convection Rate" in variable:
+                if gotSrfData == True:
+                    srfName, typeName = checkSrfNameOther(dataIndex, srfName)
+                    duplicateList.append(duplicate)
+                    pieceNumList.append(pieceNum)
+                    makeHeaderGrafted(otherSurfaceData, int(path[columnCount][0]), int(path[columnCount][1]), srfName, timestep, variable, units, True, typeName)
+                else:
+                    path.append([otherIndex])
+                    makeHeader(otherSurfaceData, int(path[columnCount]), srfName, timestep, variable, units,)
+                    otherIndex += 1
+                key.append(9)
+                dataTypeList[9] = True
+            
+            else:
+                key.append(-1)
+                path.append(-1)
+                duplicateList.append(-1)
+                pieceNumList.append(-1)
+        
+        #READ ONLY THE COLUMNS THAT ARE NEEDED
+        # glazing energy flow also needs the heat loss column next to the heat gain column.
+        columnsToRead = []
+        for columnCount, k in enumerate(key):
+            if path[columnCount] != -1: columnsToRead.append(columnCount)
+            if k == 4: columnsToRead.append(columnCount+1)
+        columnData = reader.readColumns(columnsToRead)
+        
+        for columnCount in range(len(key)):
+            if path[columnCount] != -1:
+                if gotSrfData == True and key[columnCount] != 9:
+                    duplicate = duplicateList[columnCount]
+                    pieceCount = pieceNumList[columnCount]
+                    p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+                    if normBySrf == True:
+                        try: srfArea = zoneSrfAreaList[int(path[columnCount][0])][int(path[columnCount][1])]
+                        except:
+                            srfArea = 1
+                            normAreaWorked = False
+                    else: srfArea = 1
+                elif gotSrfData == True and key[columnCount] == 9:
+                    p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+                    srfArea = 1
+                else:
+                    p = GH_Path(int(path[columnCount][0]))
+                    srfArea = 1
+
+                for rowCount, value in enumerate(columnData[columnCount]):
+                    if key[columnCount] == 1:
+                        if duplicate == False:
+                            surfaceIndoorTemp.Add(value, p)
                         else:
-                            path.append([glzLoss])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            glzLoss += 1
-                        key.append(5)
-                    
-                    elif 'Surface Window Transmitted Beam Solar Radiation Energy' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 5)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(windowBeamEnergy, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Window Transmitted Beam Energy", "kWh", True, typeName)
+                            if pieceCount == 1:
+                                srfPieceDataList[0][path[columnCount][0]][path[columnCount][1]].append(value)
+                            else:
+                                srfPieceDataList[0][path[columnCount][0]][path[columnCount][1]][rowCount] = \
+                                    (srfPieceDataList[0][path[columnCount][0]][path[columnCount][1]][rowCount] + value)/2
+                    elif key[columnCount] == 2:
+                        if duplicate == False:
+                            surfaceOutdoorTemp.Add(value, p)
                         else:
-                            path.append([glzBeamGain])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(windowBeamEnergy, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Window Transmitted Beam Energy", "kWh")
-                            glzBeamGain += 1
-                        key.append(6)
-                        dataTypeList[6] = True
-                    
-                    elif 'Surface Window Transmitted Diffuse Solar Radiation Energy' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 6)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(windowDiffEnergy, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Window Transmitted Diffuse Energy", "kWh", True, typeName)
+                            if pieceCount == 1:
+                                srfPieceDataList[1][path[columnCount][0]][path[columnCount][1]].append(value)
+                            else:
+                                srfPieceDataList[1][path[columnCount][0]][path[columnCount][1]][rowCount] = \
+                                    (srfPieceDataList[1][path[columnCount][0]][path[columnCount][1]][rowCount] + value)/2
+                    elif key[columnCount] == 3:
+                        if duplicate == False: opaqueEnergyFlow.Add((value/3600000)/srfArea, p)
                         else:
-                            path.append([glzDiffGain])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(windowDiffEnergy, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Window Transmitted Diffuse Energy", "kWh")
-                            glzDiffGain += 1
-                        key.append(7)
-                        dataTypeList[7] = True
-                    
-                    elif 'Surface Window Transmitted Solar Radiation Energy' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 7)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1: makeHeaderGrafted(windowTotalSolarEnergy, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Window Total Transmitted Solar Energy", "kWh", True, typeName)
+                            if pieceCount == 1: srfPieceDataList[2][path[columnCount][0]][path[columnCount][1]].append((value/3600000)/srfArea)
+                            else: srfPieceDataList[2][path[columnCount][0]][path[columnCount][1]][rowCount] = srfPieceDataList[2][path[columnCount][0]][path[columnCount][1]][rowCount] + (value/3600000)/srfArea
+                    elif key[columnCount] == 4:
+                        if duplicate == False: glazEnergyFlow.Add(((value/3600000) + ((columnData[columnCount+1][rowCount])*(-1)/3600000))/srfArea, p)
                         else:
-                            path.append([glzTotalGain])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(windowTotalSolarEnergy, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Window Total Transmitted Solar Energy", "kWh")
-                            glzTotalGain += 1
-                        key.append(8)
-                        dataTypeList[5] = True
-                    
-                    elif 'Surface Window System Solar Transmittance' in column:
-                        if gotSrfData == True:
-                            srfName, typeName, pieceNum, duplicate = checkSrfName(srfName, 8)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            if pieceNum < 2 and path[columnCount] != -1: 
-                                makeHeaderGrafted(windowTransmissivity, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], "Surface Window System Solar Transmittance", "Fraction", True, typeName)
+                            if pieceCount == 1: srfPieceDataList[3][path[columnCount][0]][path[columnCount][1]].append(((value/3600000) + ((columnData[columnCount+1][rowCount])*(-1)/3600000))/srfArea)
+                            else: srfPieceDataList[3][path[columnCount][0]][path[columnCount][1]][rowCount] = srfPieceDataList[3][path[columnCount][0]][path[columnCount][1]][rowCount] + ((value/3600000) + ((columnData[columnCount+1][rowCount])*(-1)/3600000))/srfArea
+                    elif key[columnCount] == 5:
+                        pass
+                    elif key[columnCount] == 6:
+                        if duplicate == False: windowBeamEnergy.Add((value/3600000)/srfArea, p)
                         else:
-                            path.append([glzTransmiss])
-                            duplicateList.append(False)
-                            pieceNumList.append(1)
-                            makeHeader(windowTransmissivity, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], "Surface Window System Solar Transmittance", "Fraction")
-                            glzTransmiss += 1
-                        key.append(10)
-                        dataTypeList[8] = True
-                    
-                    elif 'Surface' in column and not "Heat Balance Surface Convection Rate"  in column:
-                        if gotSrfData == True:
-                            srfName, typeName = checkSrfNameOther(dataIndex, srfName)
-                            duplicateList.append(duplicate)
-                            pieceNumList.append(pieceNum)
-                            makeHeaderGrafted(otherSurfaceData, int(path[columnCount][0]), int(path[columnCount][1]), srfName, column.split('(')[-1].split(')')[0], column.split(':')[-1].split(' [')[0], column.split('[')[-1].split(']')[0], True, typeName)
+                            if pieceCount == 1: srfPieceDataList[5][path[columnCount][0]][path[columnCount][1]].append((value/3600000)/srfArea)
+                            else: srfPieceDataList[5][path[columnCount][0]][path[columnCount][1]][rowCount] = srfPieceDataList[5][path[columnCount][0]][path[columnCount][1]][rowCount] + (value/3600000)/srfArea
+                    elif key[columnCount] == 7:
+                        if duplicate == False: windowDiffEnergy.Add((value/3600000)/srfArea, p)
                         else:
-                            path.append([otherIndex])
-                            makeHeader(otherSurfaceData, int(path[columnCount]), srfName, column.split('(')[-1].split(')')[0], column.split(':')[-1].split(' [')[0], column.split('[')[-1].split(']')[0],)
-                            otherIndex += 1
-                        key.append(9)
-                        dataTypeList[9] = True
-                    
-                    else:
-                        key.append(-1)
-                        path.append(-1)
-                        duplicateList.append(-1)
-                        pieceNumList.append(-1)
-            else:
-                for columnCount, column in enumerate(line.split(',')):
-                    if path[columnCount] != -1:
-                        if gotSrfData == True and key[columnCount] != 9:
-                            duplicate = duplicateList[columnCount]
-                            pieceCount = pieceNumList[columnCount]
-                            p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
-                            if normBySrf == True:
-                                try: srfArea = zoneSrfAreaList[int(path[columnCount][0])][int(path[columnCount][1])]
-                                except:
-                                    srfArea = 1
-                                    normAreaWorked = False
-                            else: srfArea = 1
-                        elif gotSrfData == True and key[columnCount] == 9:
-                            p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
-                            srfArea = 1
+                            if pieceCount == 1: srfPieceDataList[6][path[columnCount][0]][path[columnCount][1]].append((value/3600000)/srfArea)
+                            else: srfPieceDataList[6][path[columnCount][0]][path[columnCount][1]][rowCount] = srfPieceDataList[6][path[columnCount][0]][path[columnCount][1]][rowCount] + (value/3600000)/srfArea
+                    elif key[columnCount] == 8:
+                        if duplicate == False:
+                            windowTotalSolarEnergy.Add((value/3600000)/srfArea, p)
                         else:
-                            p = GH_Path(int(path[columnCount][0]))
-                            srfArea = 1
-                        
-                        if key[columnCount] == 1:
-                            if duplicate == False:
-                                surfaceIndoorTemp.Add(float(column), p)
-                            else:
-                                if pieceCount == 1:
-                                    srfPieceDataList[0][path[columnCount][0]][path[columnCount][1]].append(float(column))
-                                else:
-                                    srfPieceDataList[0][path[columnCount][0]][path[columnCount][1]][lineCount-1] = \
-                                        (srfPieceDataList[0][path[columnCount][0]][path[columnCount][1]][lineCount-1] + float(column))/2
-                        elif key[columnCount] == 2:
-                            if duplicate == False:
-                                surfaceOutdoorTemp.Add(float(column), p)
+                            if pieceCount == 1:
+                                srfPieceDataList[7][path[columnCount][0]][path[columnCount][1]].append((value/3600000)/srfArea)
                             else:
-                                if pieceCount == 1:
-                                    srfPieceDataList[1][path[columnCount][0]][path[columnCount][1]].append(float(column))
-                                else:
-                                    srfPieceDataList[1][path[columnCount][0]][path[columnCount][1]][lineCount-1] = \
-                                        (srfPieceDataList[1][path[columnCount][0]][path[columnCount][1]][lineCount-1] + float(column))/2
-                        elif key[columnCount] == 3:
-                            if duplicate == False: opaqueEnergyFlow.Add((float(column)/3600000)/srfArea, p)
-                            else:
-                                if pieceCount == 1: srfPieceDataList[2][path[columnCount][0]][path[columnCount][1]].append((float(column)/3600000)/srfArea)
-                                else: srfPieceDataList[2][path[columnCount][0]][path[columnCount][1]][lineCount-1] = srfPieceDataList[2][path[columnCount][0]][path[columnCount][1]][lineCount-1] + (float(column)/3600000)/srfArea
-                        elif key[columnCount] == 4:
-                            if duplicate == False: glazEnergyFlow.Add((((float(column))/3600000) + ((float( line.split(',')[columnCount+1] ))*(-1)/3600000))/srfArea, p)
-                            else:
-                                if pieceCount == 1: srfPieceDataList[3][path[columnCount][0]][path[columnCount][1]].append((((float(column))/3600000) + ((float( line.split(',')[columnCount+1] ))*(-1)/3600000))/srfArea)
-                                else: srfPieceDataList[3][path[columnCount][0]][path[columnCount][1]][lineCount-1] = srfPieceDataList[3][path[columnCount][0]][path[columnCount][1]][lineCount-1] + (((float(column))/3600000) + ((float( line.split(',')[columnCount+1] ))*(-1)/3600000))/srfArea
-                        elif key[columnCount] == 5:
-                            pass
-                        elif key[columnCount] == 6:
-                            if duplicate == False: windowBeamEnergy.Add(((float(column))/3600000)/srfArea, p)
-                            else:
-                                if pieceCount == 1: srfPieceDataList[5][path[columnCount][0]][path[columnCount][1]].append((float(column)/3600000)/srfArea)
-                                else: srfPieceDataList[5][path[columnCount][0]][path[columnCount][1]][lineCount-1] = srfPieceDataList[5][path[columnCount][0]][path[columnCount][1]][lineCount-1] + (float(column)/3600000)/srfArea
-                        elif key[columnCount] == 7:
-                            if duplicate == False: windowDiffEnergy.Add(((float(column))/3600000)/srfArea, p)
-                            else:
-                                if pieceCount == 1: srfPieceDataList[6][path[columnCount][0]][path[columnCount][1]].append((float(column)/3600000)/srfArea)
-                                else: srfPieceDataList[6][path[columnCount][0]][path[columnCount][1]][lineCount-1] = srfPieceDataList[6][path[columnCount][0]][path[columnCount][1]][lineCount-1] + (float(column)/3600000)/srfArea
-                        elif key[columnCount] == 8:
-                            if duplicate == False:
-                                windowTotalSolarEnergy.Add(((float(column))/3600000)/srfArea, p)
-                            else:
-                                if pieceCount == 1:
-                                    srfPieceDataList[7][path[columnCount][0]][path[columnCount][1]].append((float(column)/3600000)/srfArea)
-                                else:
-                                    srfPieceDataList[7][path[columnCount][0]][path[columnCount][1]][lineCount-1] = \
-                                        srfPieceDataList[7][path[columnCount][0]][path[columnCount][1]][lineCount-1] + (float(column)/3600000)/srfArea
-                        elif key[columnCount] == 10:
-                            if duplicate == False:
-                                windowTransmissivity.Add(float(column), p)
+                                srfPieceDataList[7][path[columnCount][0]][path[columnCount][1]][rowCount] = \
+                                    srfPieceDataList[7][path[columnCount][0]][path[columnCount][1]][rowCount] + (value/3600000)/srfArea
+                    elif key[columnCount] == 10:
+                        if duplicate == False:
+                            windowTransmissivity.Add(value, p)
+                        else:
+                            if pieceCount == 1:
+                                srfPieceDataList[8][path[columnCount][0]][path[columnCount][1]].append(value)
                             else:
-                                if pieceCount == 1:
-                                    srfPieceDataList[8][path[columnCount][0]][path[columnCount][1]].append(float(column))
-                                else:
-                                    srfPieceDataList[8][path[columnCount][0]][path[columnCount][1]][lineCount-1] = (srfPieceDataList[8][path[columnCount][0]][path[columnCount][1]][lineCount-1] + float(column))/2
-                        elif key[columnCount] == 9:
-                            otherSurfaceData.Add(float(column), p)
-                    
+                                srfPieceDataList[8][path[columnCount][0]][path[columnCount][1]][rowCount] = (srfPieceDataList[8][path[columnCount][0]][path[columnCount][1]][rowCount] + value)/2
+                    elif key[columnCount] == 9:
+                        otherSurfaceData.Add(value, p)
+        
         parseSuccess = True
     except Exception as e:
         print e
@@ -583,10 +613,8 @@ if _resultFileAddress and gotZoneData == True and gotSrfData == True:
                   'If you report this bug of reading the output on the GH forums, we should be able to fix this component to accept the output soon.'
         print warn
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warn)
-    finally:
-        result.close()
-        
-    
+
+
 #Check to make sure that the normalization by surface worked.
 if normAreaWorked == False:
     warn = 'Normalizing by surface area does not work if you have more than one type of otherSurfaceData.  All types after the first are not normailzed.'
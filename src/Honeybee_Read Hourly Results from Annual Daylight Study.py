@@ -40,11 +40,11 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_Read Hourly Results from Annual Daylight Study"
 ghenv.Component.NickName = 'readDSHourlyResults'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -52,6 +52,7 @@ except: pass
 
 
 import os
+import scriptcontext as sc
 from System import Object
 import Grasshopper.Kernel as gh
 from Grasshopper import DataTree
@@ -97,6 +98,23 @@ def convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress):
 def main(illFilesAddress, testPoints, HOY, annualProfiles):
     msg = str.Empty
     
+    if not sc.sticky.has_key('honeybee_release'):
+        msg = "You should first let Honeybee to fly..."
+        return msg, None, None
+    
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component):
+            msg = "This component is not compatible with the current version of Honeybee."
+            return msg, None, None
+    except:
+        msg = "You need a newer version of Honeybee to use this compoent." + \
+        " Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        return msg, None, None
+    
+    hb_IllBinaryFile = sc.sticky["honeybee_IllBinaryFile"]
+    
     shadingProfiles = []
     shadingGroupsCount = 0 # assume there in no shading groups
     
@@ -191,15 +209,10 @@ def main(illFilesAddress, testPoints, HOY, annualProfiles):
         for stateCount, resultFiles in enumerate(illFileSets[shadingGroupCount]):
             
             for resultFile in resultFiles:
-                result = open(resultFile, 'r')
-                for lineCount, line in enumerate(result):
-                    if lineCount == int(HOY-1):
-                       line = line.replace('\n', '', 10)
-                       lineSeg = line.Split(' ')
-                       for hourLuxValue in lineSeg[4:]:
-                           illuminanceValues[shadingGroupCount][stateCount].append(float(hourLuxValue))
-                           
-                result.close()
+                # read the values from the binary copy of the file
+                illbFile = hb_IllBinaryFile.fromIllFile(resultFile)
+                if 0 <= int(HOY-1) < illbFile.hourCount:
+                    illuminanceValues[shadingGroupCount][stateCount].extend(illbFile.readHour(int(HOY-1)))
     
     return msg, illuminanceValues, shadingProfiles
 
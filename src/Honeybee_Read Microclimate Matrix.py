@@ -28,12 +28,12 @@ Provided by Honeybee 0.0.62
     Args:
         _comfResultFileAddress: Any one of the result file addresses that comes out of the 'Honeybee_Microclimate Map Analysis' component or the 'Honeybee_Thermal Comfort Autonomy Analysis' component.
     Returns:
-        comfResultsMtx: A matrix of comfort data that can be plugged into the "Visualize Comfort Results" component.
+        comfResultsMtx: A matrix of comfort data that can be plugged into the "Visualize Comfort Results" component.  If the result file has a binary copy (*.hbmtx) and the matrix is too large to keep in memory, this is the binary matrix, which is read one hour at a time by the "Visualize Microclimate Map" component.
 """
 
 ghenv.Component.Name = "Honeybee_Read Microclimate Matrix"
 ghenv.Component.NickName = 'readMicroclimateMtx'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
@@ -41,14 +41,13 @@ ghenv.Component.AdditionalHelpFromDocStrings = "6"
 
 
 import Grasshopper.Kernel as gh
+import scriptcontext as sc
 
 
-comfResultsMtx = []
-
-if _comfResultFileAddress:
+def readCSVMatrix(resultFile):
+    comfResultsMtx = []
+    result = open(resultFile, 'r')
     try:
-        result = open(_comfResultFileAddress, 'r')
-        
         for lineCount, line in enumerate(result):
             if lineCount == 0: comfResultsMtx.append(line.split('\n')[0])
             else:
@@ -57,12 +56,37 @@ if _comfResultFileAddress:
                 for columnCount, column in enumerate(line.split(',')):
                     hourData.append(float(column))
                 comfResultsMtx.append(hourData)
+    finally:
         result.close()
+    
+    return comfResultsMtx
+
+
+def readBinaryMatrix(resultFile):
+    #Use the binary copy of the matrix if the Microclimate Map Analysis has written one.
+    if not sc.sticky.has_key("honeybee_MicroclimateMatrix"): return None
+    hb_microclimateMatrix = sc.sticky["honeybee_MicroclimateMatrix"]
+    binaryMtx = hb_microclimateMatrix.fromFile(resultFile)
+    if binaryMtx == None: return None
+    
+    #Large matrices are passed on as they are so that only the needed hours are read later.
+    if binaryMtx.pointCount * binaryMtx.hourCount > hb_microclimateMatrix.maxInMemoryValues:
+        return [binaryMtx]
+    elif resultFile.lower().endswith(".hbmtx"):
+        return binaryMtx.toMatrix()
+    else:
+        return None
+
+
+comfResultsMtx = []
+
+if _comfResultFileAddress:
+    try:
+        comfResultsMtx = readBinaryMatrix(_comfResultFileAddress)
+        if comfResultsMtx == None: comfResultsMtx = readCSVMatrix(_comfResultFileAddress)
     except:
-        try: result.close()
-        except: pass
+        comfResultsMtx = []
         warn = 'Failed to parse the result file.  The csv file might not have existed when connected or the simulation did not run correctly.'+ \
                   'Try reconnecting the _resultfileAddress to this component or re-running your simulation.'
         print warn
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warn)
-
@@ -39,7 +39,7 @@ Provided by Honeybee 0.0.62
 """
 ghenv.Component.Name = "Honeybee_Solve Adjacencies"
 ghenv.Component.NickName = 'solveAdjc'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "00 | Honeybee"
@@ -53,6 +53,9 @@ import Rhino as rc
 import scriptcontext as sc
 import Grasshopper.Kernel as gh
 import uuid
+import math
+import itertools
+import collections
 
 def shootIt(rayList, geometry, tol = 0.01, bounce =1):
    # shoot a list of rays from surface to geometry
@@ -175,6 +178,90 @@ def updateAdj(surface1, surface2, altConstruction, altBC, altWinConstr, tol):
                               '\t-> is adjacent to <-\t' + childSurface2.BCObject.name + '.'
         
 
+class AdjacencyIndex(object):
+    """Find the surfaces of other zones that can be adjacent to a surface.
+    
+    Planar surfaces are bucketed by the direction of their normal and the offset of
+    their plane, and each bucket keeps an R-tree of the bounding boxes of its surfaces.
+    A planar surface is only tested against the buckets that are coplanar with it and
+    face the opposite (or the same) direction. Non-planar surfaces are kept in a
+    separate R-tree and are always tested by bounding box.
+    """
+    planarityTolerance = 1e-3
+    
+    def __init__(self, HBZones, tol):
+        self.tol = tol
+        self.zoneSurfaces = []
+        self.boundingBoxes = {}
+        
+        allBBox = rc.Geometry.BoundingBox.Empty
+        for zoneCount, HBZone in enumerate(HBZones):
+            for srfCount, srf in enumerate(HBZone.surfaces):
+                bbox = srf.geometry.GetBoundingBox(True)
+                self.boundingBoxes[srf] = bbox
+                self.zoneSurfaces.append((zoneCount, srfCount, srf))
+                allBBox = rc.Geometry.BoundingBox.Union(allBBox, bbox)
+        
+        # measure offsets from the center of the model to keep them small
+        self.center = allBBox.Center
+        radius = allBBox.Diagonal.Length / 2
+        
+        # two normals within the angle tolerance differ less than the angle in each coordinate
+        self.normalStep = max(sc.doc.ModelAngleToleranceRadians, 1e-3)
+        # a point within tolerance of two planes with such normals can change its offset by this much
+        self.offsetStep = 1.5 * tol + 2 * sc.doc.ModelAbsoluteTolerance + \
+                          2 * self.planarityTolerance + self.normalStep * radius
+        
+        self.allTree = rc.Geometry.RTree()
+        self.nonPlanarTree = rc.Geometry.RTree()
+        self.planeTrees = {}
+        for srfId, (zoneCount, srfCount, srf) in enumerate(self.zoneSurfaces):
+            bbox = self.boundingBoxes[srf]
+            self.allTree.Insert(bbox, srfId)
+            if srf.isPlanar:
+                key = self.planeKey(srf.normalVector, srf.cenPt)
+                if key not in self.planeTrees: self.planeTrees[key] = rc.Geometry.RTree()
+                self.planeTrees[key].Insert(bbox, srfId)
+            else:
+                self.nonPlanarTree.Insert(bbox, srfId)
+    
+    def planeKey(self, normal, point, reverse = False):
+        normal = rc.Geometry.Vector3d(normal)
+        normal.Unitize()
+        if reverse: normal = -normal
+        offset = normal * (point - self.center)
+        return (int(math.floor(normal.X / self.normalStep + 0.5)),
+                int(math.floor(normal.Y / self.normalStep + 0.5)),
+                int(math.floor(normal.Z / self.normalStep + 0.5)),
+                int(math.floor(offset / self.offsetStep + 0.5)))
+    
+    def neighbourKeys(self, key):
+        for shift in itertools.product((-1, 0, 1), repeat = 4):
+            yield tuple(k + s for k, s in zip(key, shift))
+    
+    def candidateSurfaces(self, srf):
+        """Return (zoneIndex, surfaceIndex) of the surfaces that can be adjacent to srf in the order of the zones."""
+        searchBox = rc.Geometry.BoundingBox(self.boundingBoxes[srf].Min, self.boundingBoxes[srf].Max)
+        searchBox.Inflate(2 * self.tol + sc.doc.ModelAbsoluteTolerance)
+        
+        found = set()
+        def searchCallback(sender, e):
+            found.add(e.Id)
+        
+        if srf.isPlanar:
+            self.nonPlanarTree.Search(searchBox, searchCallback)
+            # opposite facing surfaces and surfaces facing the same direction
+            keys = set()
+            for reverse in (True, False):
+                keys.update(self.neighbourKeys(self.planeKey(srf.normalVector, srf.cenPt, reverse)))
+            for key in keys:
+                if key in self.planeTrees: self.planeTrees[key].Search(searchBox, searchCallback)
+        else:
+            self.allTree.Search(searchBox, searchCallback)
+        
+        return sorted(self.zoneSurfaces[srfId][:2] for srfId in found if self.zoneSurfaces[srfId][2] is not srf)
+
+
 def notTheSameZone(targetZone, testZone):
     if hasattr(testZone, 'cenPt')and hasattr(targetZone, 'cenPt'):
         return targetZone.name != testZone.name and targetZone.cenPt.DistanceTo(testZone.cenPt) > sc.doc.ModelAbsoluteTolerance
@@ -231,6 +318,9 @@ def main(HBZones, altConstruction, altWinConstr, altBC, tol, remCurrent):
                     srf.setBC('OUTDOORS')
                     srf.setBCObjectToOutdoors()
     
+    # index the surfaces so each surface is only tested against the surfaces that can touch it
+    adjacencyIndex = AdjacencyIndex(HBZoneObjects, tol)
+    
     # solve it zone by zone
     for testZone in HBZoneObjects:
         # mesh each surface and test if it will be adjacent to any surface
@@ -238,6 +328,14 @@ def main(HBZones, altConstruction, altWinConstr, altBC, tol, remCurrent):
         for srf in testZone.surfaces:
             #print srf.type, srf.BC 
             if srf.BC.upper() == 'OUTDOORS' or srf.BC.upper() == 'GROUND' or srf.BC.upper() == 'ADIABATIC':
+                # collect the candidate surfaces of the other zones
+                candidateSrfs = collections.OrderedDict()
+                for zoneCount, srfCount in adjacencyIndex.candidateSurfaces(srf):
+                    targetZone = HBZoneObjects[zoneCount]
+                    if notTheSameZone(targetZone, testZone):
+                        candidateSrfs.setdefault(zoneCount, []).append(targetZone.surfaces[srfCount])
+                if len(candidateSrfs) == 0: continue
+                
                 #Create a mesh of surface to use center points as test points
                 meshPar = rc.Geometry.MeshingParameters.Default
                 BrepMesh = rc.Geometry.Mesh.CreateFromBrep(srf.geometry, meshPar)[0]
@@ -256,33 +354,28 @@ def main(HBZones, altConstruction, altWinConstr, altBC, tol, remCurrent):
                     
                     raysDict[meshSrfCen] = rc.Geometry.Ray3d(meshSrfCen, srfNormal)
                 
-                for targetZone in HBZoneObjects:
-                    if notTheSameZone(targetZone, testZone):
-                        # check ray intersection to see if this zone is next to the surface
-                        if shootIt(raysDict.values(), [targetZone.geometry], tol + sc.doc.ModelAbsoluteTolerance):
-                            for surface in targetZone.surfaces:
-                                # check if z value of center points matches
-                                #print abs(surface.cenPt.Z - srf.cenPt.Z)
-                                #if abs(surface.cenPt.Z - srf.cenPt.Z) < tol:
-                                # check distance with the nearest point on each surface
-                                for pt in raysDict.keys():
-                                    if surface.geometry.ClosestPoint(pt).DistanceTo(pt) <= tol:
-                                        # extra check for normal direction
-                                        normalAngle = abs(rc.Geometry.Vector3d.VectorAngle(surface.normalVector, srf.normalVector))
-                                        revNormalAngle = abs(rc.Geometry.Vector3d.VectorAngle(surface.normalVector, -srf.normalVector))
-                                        #print normalAngle
-                                        #print revNormalAngle
-                                        if normalAngle==0  or revNormalAngle <= sc.doc.ModelAngleToleranceRadians:
-                                            print 'Surface ' + srf.name + ' which is a ' + srf.srfType[srf.type] + \
-                                                  '\t-> is adjacent to <-\t' + surface.name + ' which is a ' + \
-                                                  surface.srfType[surface.type] + '.'
-                                            
-                                            updateAdj(srf, surface, altConstruction, altBC, altWinConstr, tol)                                        
-                                            if surface.type == 4:
-                                                flowRate = updateZoneMixing(surface, testZone, targetZone)
-                                                print "Air has been mixed between " + testZone.name + " and " + targetZone.name + " with a flow rate of " + str(flowRate) + " m3/s."
-                                            
-                                            break
+                for zoneCount, targetSrfs in candidateSrfs.items():
+                    targetZone = HBZoneObjects[zoneCount]
+                    # check ray intersection to see if this zone is next to the surface
+                    if shootIt(raysDict.values(), [targetZone.geometry], tol + sc.doc.ModelAbsoluteTolerance):
+                        for surface in targetSrfs:
+                            # check distance with the nearest point on each surface
+                            for pt in raysDict.keys():
+                                if surface.geometry.ClosestPoint(pt).DistanceTo(pt) <= tol:
+                                    # extra check for normal direction
+                                    normalAngle = abs(rc.Geometry.Vector3d.VectorAngle(surface.normalVector, srf.normalVector))
+                                    revNormalAngle = abs(rc.Geometry.Vector3d.VectorAngle(surface.normalVector, -srf.normalVector))
+                                    if normalAngle==0  or revNormalAngle <= sc.doc.ModelAngleToleranceRadians:
+                                        print 'Surface ' + srf.name + ' which is a ' + srf.srfType[srf.type] + \
+                                              '\t-> is adjacent to <-\t' + surface.name + ' which is a ' + \
+                                              surface.srfType[surface.type] + '.'
+                                        
+                                        updateAdj(srf, surface, altConstruction, altBC, altWinConstr, tol)
+                                        if surface.type == 4:
+                                            flowRate = updateZoneMixing(surface, testZone, targetZone)
+                                            print "Air has been mixed between " + testZone.name + " and " + targetZone.name + " with a flow rate of " + str(flowRate) + " m3/s."
+                                        
+                                        break
     
     # add zones to memory
     ModifiedHBZones  = hb_hive.addToHoneybeeHive(HBZoneObjects, ghenv.Component)
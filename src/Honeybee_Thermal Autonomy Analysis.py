@@ -36,7 +36,7 @@ Provided by Honeybee 0.0.62
     
     Args:
         _comfResultsMtx: A comfort matrix (adaptive, PMV or Outdoor) output from either the 'Honeybee_Microclimate Map Analysis' component or the 'Honeybee_Read Microclimate Matrix' component.
-        _degOrPMVMtx: The degreeFromTargetMtx, PMV_Mtx, or DegFromNeutralMtx from either the 'Honeybee_Microclimate Map Analysis' component or the 'Honeybee_Read Microclimate Matrix' component.
+        _degOrPMVMtx: The degreeFromTargetMtx, PMV_Mtx, or DegFromNeutralMtx from either the 'Honeybee_Microclimate Map Analysis' component or the 'Honeybee_Read Microclimate Matrix' component.  Binary matrices from these components are read one block of hours at a time.
         _viewFactorMesh: The list of view factor meshes that comes out of the  "Honeybee_Indoor View Factor Calculator".
         _HBZones: The HBZones out of any of the HB components that generate or alter zones.  Note that these should ideally be the zones that are fed into the Run Energy Simulation component as surfaces may not align otherwise.  Zones read back into Grasshopper from the Import idf component will not align correctly with the EP Result data.
         _totalThermalEnergy_: The totalThermalEnergy output from the "Honeybee_Read EP Result" component.  If no data tree is connected here, it will be assumed that all zones are completely passive and only occupancy will be taken into accout for the Thermal Autonomy calculation.
@@ -64,11 +64,11 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Thermal Autonomy Analysis"
 ghenv.Component.NickName = 'ThermalAutonomy'
-ghenv.Component.Message = 'VER 0.0.62\nSEP_15_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.62\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -112,9 +112,10 @@ def recallHBZoneProperties(HOYs, occupancyThere):
     #Calls the zones and the libraries from the hive.
     hb_hive = sc.sticky["honeybee_Hive"]()
     HBScheduleList = sc.sticky["honeybee_ScheduleLib"].keys()
+    scheduleCompiler = sc.sticky["honeybee_EPScheduleCompiler"]()
     
     for zoneCount, HZone in enumerate(_HBZones):
-        zone = hb_hive.callFromHoneybeeHive([HZone])[0]
+        zone = hb_hive.callFromHoneybeeHive([HZone], readOnly = True)[0]
         zoneNames.append(zone.name)
         values = []
         if occupancyThere == False:
@@ -127,8 +128,8 @@ def recallHBZoneProperties(HOYs, occupancyThere):
                     ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
                     checkZones = False
                 else:
-                    readSchedules = sc.sticky["honeybee_ReadSchedules"](zoneOccSched, 0)
-                    values  = readSchedules.getScheduleValues()
+                    # zones that share a schedule get the same compiled values
+                    values = scheduleCompiler.getHourlyValues(zoneOccSched, 0) or []
             elif zoneOccSched.lower().endswith(".csv"):
                 # check if csv file exists.
                 if not os.path.isfile(zoneOccSched):
@@ -318,9 +319,10 @@ def checkTheInputs():
     #Check to be sure that the length of the mesh faces and result matrices match.
     checkData1 = False
     comfortType = ""
-    comfortType = _comfResultsMtx[0].split(" ")[0]
-    ptLen1 = len(_comfResultsMtx[1])
-    ptLen3 = len(_degOrPMVMtx[1])
+    comfHeader = getMatrixHeader(_comfResultsMtx)
+    comfortType = comfHeader.split(" ")[0]
+    ptLen1 = getMatrixPointCount(_comfResultsMtx)
+    ptLen3 = getMatrixPointCount(_degOrPMVMtx)
     meshFaceCount = []
     for mesh in _viewFactorMesh:
         meshFaceCount.append(mesh.Faces.Count)
@@ -333,8 +335,8 @@ def checkTheInputs():
     
     #Check the analysis period.
     try:
-        analysisPeriod1 = (int(_comfResultsMtx[0].split(";")[-2].split(",")[0].split("(")[-1]), int(_comfResultsMtx[0].split(";")[-2].split(",")[1].split(" ")[-1]), int(_comfResultsMtx[0].split(";")[-2].split(",")[-1].split(" ")[-1].split(")")[0]))
-        analysisPeriod2 = (int(_comfResultsMtx[0].split(";")[-1].split(",")[0].split("(")[-1]), int(_comfResultsMtx[0].split(";")[-1].split(",")[1].split(" ")[-1]), int(_comfResultsMtx[0].split(";")[-1].split(",")[-1].split(" ")[-1].split(")")[0]))
+        analysisPeriod1 = (int(comfHeader.split(";")[-2].split(",")[0].split("(")[-1]), int(comfHeader.split(";")[-2].split(",")[1].split(" ")[-1]), int(comfHeader.split(";")[-2].split(",")[-1].split(" ")[-1].split(")")[0]))
+        analysisPeriod2 = (int(comfHeader.split(";")[-1].split(",")[0].split("(")[-1]), int(comfHeader.split(";")[-1].split(",")[1].split(" ")[-1]), int(comfHeader.split(";")[-1].split(",")[-1].split(" ")[-1].split(")")[0]))
         analysisPeriod = [analysisPeriod1, analysisPeriod2]
     except:
         analysisPeriod = []
@@ -413,6 +415,92 @@ def checkTheInputs():
     return checkData, fileName, workingDir, _viewFactorMesh, analysisPeriod, totEnergyHeaders, totEnergyNumbersFinal, zoneNames, occupancySchList, comfortType, occupancyThreshold
 
 
+class ComfortAggregator(object):
+    """Compute the occupied comfort matrices of all points one block of hours at a time.
+    
+    For every hour, the occupancy and conditioning state of each zone is checked once
+    and mapped onto the points of the zone so that the comfort, autonomy, over-heated
+    and under-heated values of a whole row are built in one pass over the comfort and
+    degree rows.  Occupied values are integers and unoccupied values are 0.0 so that the
+    'Honeybee_Visualize Microclimate Map' component can recount the occupied hours of
+    any analysis period from the matrices without re-running this component.
+    """
+    hourBlockSize = 168
+    
+    def __init__(self, pointZoneList, occupancySchList, totEnergyNumbersMatched, occupancyThreshold):
+        self.pointZoneList = pointZoneList
+        self.occupancySchList = occupancySchList
+        self.totEnergyNumbersMatched = totEnergyNumbersMatched
+        self.occupancyThreshold = occupancyThreshold
+        self.zoneOccHours = [0] * len(occupancySchList)
+    
+    def zoneStates(self, count):
+        #0 = unoccupied, 1 = occupied without conditioning, 2 = occupied and conditioned.
+        states = []
+        for zoneCount, occSch in enumerate(self.occupancySchList):
+            if occSch[count] > self.occupancyThreshold:
+                self.zoneOccHours[zoneCount] += 1
+                if self.totEnergyNumbersMatched[zoneCount][count] > 0: states.append(2)
+                else: states.append(1)
+            else: states.append(0)
+        return states
+    
+    def calculateHour(self, states, comfRow, degRow):
+        pointStates = [states[pointZone] for pointZone in self.pointZoneList]
+        cells = zip(pointStates, comfRow, degRow)
+        occTCP = [(1 if comf > 0 else 0) if state else 0.0 for state, comf, deg in cells]
+        TA = [(1 if comf > 0 and state == 1 else 0) if state else 0.0 for state, comf, deg in cells]
+        OverHeated = [(1 if comf <= 0 and deg > 0 else 0) if state else 0.0 for state, comf, deg in cells]
+        UnderHeated = [(1 if comf <= 0 and deg <= 0 else 0) if state else 0.0 for state, comf, deg in cells]
+        return occTCP, TA, OverHeated, UnderHeated
+    
+    def calculate(self, comfResultsMtx, degOrPMVMtx, matrices, hourCount, parallel):
+        #Only the rows of the current block are read from the comfort matrices.
+        comfHourCount = min(getMatrixHourCount(comfResultsMtx), getMatrixHourCount(degOrPMVMtx))
+        for start in range(0, hourCount, self.hourBlockSize):
+            blockCounts = range(start, min(start + self.hourBlockSize, hourCount, comfHourCount))
+            if len(blockCounts) == 0: break
+            comfRows = readMatrixRows(comfResultsMtx, blockCounts)
+            degRows = readMatrixRows(degOrPMVMtx, blockCounts)
+            blockStates = [self.zoneStates(count) for count in blockCounts]
+            
+            def calcComf(blockCount):
+                rows = self.calculateHour(blockStates[blockCount], comfRows[blockCount], degRows[blockCount])
+                for mtx, row in zip(matrices, rows): mtx[blockCounts[blockCount]+1] = row
+            
+            if parallel == True and len(blockCounts) != 1:
+                tasks.Parallel.ForEach(range(len(blockCounts)), calcComf)
+            else:
+                for blockCount in range(len(blockCounts)): calcComf(blockCount)
+        
+        #Hours that are missing from the comfort matrices have no values.
+        for count in range(comfHourCount, hourCount):
+            for mtx in matrices: mtx[count+1] = []
+        
+        #Return the total occupied hours of each point.
+        return [self.zoneOccHours[pointZone] for pointZone in self.pointZoneList]
+
+
+def isBinaryMatrix(mtx):
+    return len(mtx) == 1 and hasattr(mtx[0], "iterHours")
+
+def getMatrixHeader(mtx):
+    if isBinaryMatrix(mtx): return mtx[0].header
+    return mtx[0]
+
+def getMatrixPointCount(mtx):
+    if isBinaryMatrix(mtx): return mtx[0].pointCount
+    return len(mtx[1])
+
+def getMatrixHourCount(mtx):
+    if isBinaryMatrix(mtx): return mtx[0].hourCount
+    return len(mtx) - 1
+
+def readMatrixRows(mtx, counts):
+    if isBinaryMatrix(mtx): return list(mtx[0].iterHours(counts))
+    return [mtx[count+1] for count in counts]
+
+
 def main(viewFactorMesh, analysisPeriod, totEnergyHeaders, totEnergyNumbers, zoneNames, occupancySchList, comfortType, occupancyThreshold):
     #Set up matrices to be filled.
     occTCP_Mtx = [comfortType + ' Occupied Thermal Comfort Percent;' + str(analysisPeriod[0]) + ";" + str(analysisPeriod[1])]
@@ -471,58 +559,9 @@ def main(viewFactorMesh, analysisPeriod, totEnergyHeaders, totEnergyNumbers, zon
         occupancySchList.append(additionalOccSchList)
         totEnergyNumbersMatched.append(additionalENumList)
     
-    #Make a list that tracks the total occupied hours for each of the points.
-    occHrsNum = []
-    for point in pointZoneList: occHrsNum.append(0)
-    
     #Finally, compute the matrices for each hour and point.
-    def calcComf(count):
-        occTCP = []
-        TA = []
-        OverHeated = []
-        UnderHeated = []
-        for pointCount, pointZone in enumerate(pointZoneList):
-            try:
-                _comfResultsMtx[count + 1][pointCount]
-                #Check to see if the point's zone is occupied.  Otheriswe, it does not count for anything.
-                if occupancySchList[pointZone][count] > occupancyThreshold:
-                    occHrsNum[pointCount] += 1
-                    #Check to see if the point is comfortable.
-                    if _comfResultsMtx[count + 1][pointCount] > 0:
-                        occTCP.append(1)
-                        OverHeated.append(0)
-                        UnderHeated.append(0)
-                        #Check to see if the point's zone is being conditioned.
-                        if totEnergyNumbersMatched[pointZone][count] > 0: TA.append(0)
-                        else: TA.append(1)
-                    else:
-                        occTCP.append(0)
-                        TA.append(0)
-                        if _degOrPMVMtx[count + 1][pointCount] > 0:
-                            OverHeated.append(1)
-                            UnderHeated.append(0)
-                        else:
-                            OverHeated.append(0)
-                            UnderHeated.append(1)
-                else:
-                    occTCP.append(0.0)
-                    TA.append(0.0)
-                    OverHeated.append(0.0)
-                    UnderHeated.append(0.0)
-            except:
-                pass
-        
-        occTCP_Mtx[count+1] = occTCP
-        TA_Mtx[count+1] = TA
-        OverHeatedMtx[count+1] = OverHeated
-        UnderHeatedMtx[count+1] = UnderHeated
-    
-    #Run through every hour of the analysis to fill up the matrices.
-    #if parallel_ == True and len(occupancySchList[0]) != 1:
-    #    tasks.Parallel.ForEach(range(len(occupancySchList[0])), calcComf)
-    #else:
-    for hour in range(len(occupancySchList[0])):
-        calcComf(hour)
+    aggregator = ComfortAggregator(pointZoneList, occupancySchList, totEnergyNumbersMatched, occupancyThreshold)
+    occHrsNum = aggregator.calculate(_comfResultsMtx, _degOrPMVMtx, [occTCP_Mtx, TA_Mtx, OverHeatedMtx, UnderHeatedMtx], len(occupancySchList[0]), parallel_)
     
     # Add the total occupied hours to the matrix (to be used to help calculate comfort autonomy).
     occTCP_Mtx.append(occHrsNum)
@@ -27,7 +27,7 @@ Use this component to produce a colored mesh from a comfResultsMtx.
 Provided by Honeybee 0.0.62
     
     Args:
-        _comfResultsMtx: Any matrix output from the 'Honeybee_Microclimate Map Analysis' component, the 'Honeybee_Thermal Comfort Autonomy Analysis' component, or the 'Honeybee_Read Microclimate Matrix' component.
+        _comfResultsMtx: Any matrix output from the 'Honeybee_Microclimate Map Analysis' component, the 'Honeybee_Thermal Comfort Autonomy Analysis' component, or the 'Honeybee_Read Microclimate Matrix' component.  Binary matrices are read one hour at a time so only the hours of the analysisPeriod_ are loaded.
         _viewFactorMesh: The list of view factor meshes that comes out of the  "Honeybee_Indoor View Factor Calculator".  These will be colored with result data.
         ===========: ...
         analysisPeriod_: Note that that connecting a value to 'stepOfSimulation_' will override this input.
@@ -49,7 +49,7 @@ Provided by Honeybee 0.0.62
 
 ghenv.Component.Name = "Honeybee_Visualize Microclimate Map"
 ghenv.Component.NickName = 'VisualizeMicroclimate'
-ghenv.Component.Message = 'VER 0.0.62\nJUL_28_2017'
+ghenv.Component.Message = 'VER 0.0.62\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
@@ -68,6 +68,7 @@ from Grasshopper.Kernel.Data import GH_Path
 import Rhino as rc
 import scriptcontext as sc
 import math
+import itertools
 
 
 w = gh.GH_RuntimeMessageLevel.Warning
@@ -99,9 +100,9 @@ def checkTheInputs():
     #Check to be sure that the length of the test points and the mesh faces match.
     checkData2 = False
     dataType = None
-    if len(_comfResultsMtx) > 0 and len(viewFactorMesh) > 0:
-        dataType = _comfResultsMtx[0].split(";")[0]
-        ptLen1 = len(_comfResultsMtx[1])
+    if len(comfResultsMtx) > 0 and len(viewFactorMesh) > 0:
+        dataType = comfResultsMtx[0].split(";")[0]
+        ptLen1 = comfResultsMtx.pointCount
         meshFaceCount = []
         for mesh in viewFactorMesh:
             meshFaceCount.append(mesh.Faces.Count)
@@ -115,21 +116,21 @@ def checkTheInputs():
     
     #Check the analysis period.
     try:
-        analysisPeriod1 = (int(_comfResultsMtx[0].split(";")[-2].split(",")[0].split("(")[-1]), int(_comfResultsMtx[0].split(";")[-2].split(",")[1].split(" ")[-1]), int(_comfResultsMtx[0].split(";")[-2].split(",")[-1].split(" ")[-1].split(")")[0]))
-        analysisPeriod2 = (int(_comfResultsMtx[0].split(";")[-1].split(",")[0].split("(")[-1]), int(_comfResultsMtx[0].split(";")[-1].split(",")[1].split(" ")[-1]), int(_comfResultsMtx[0].split(";")[-1].split(",")[-1].split(" ")[-1].split(")")[0]))
+        analysisPeriod1 = (int(comfResultsMtx[0].split(";")[-2].split(",")[0].split("(")[-1]), int(comfResultsMtx[0].split(";")[-2].split(",")[1].split(" ")[-1]), int(comfResultsMtx[0].split(";")[-2].split(",")[-1].split(" ")[-1].split(")")[0]))
+        analysisPeriod2 = (int(comfResultsMtx[0].split(";")[-1].split(",")[0].split("(")[-1]), int(comfResultsMtx[0].split(";")[-1].split(",")[1].split(" ")[-1]), int(comfResultsMtx[0].split(";")[-1].split(",")[-1].split(" ")[-1].split(")")[0]))
         analysisPeriod = [analysisPeriod1, analysisPeriod2]
     except:
         analysisPeriod = []
-    if _comfResultsMtx[0].split(";")[-2] == "(1, 1, 1)" and _comfResultsMtx[0].split(";")[-1] == "(12, 31, 24)": annualData = True
+    if comfResultsMtx[0].split(";")[-2] == "(1, 1, 1)" and comfResultsMtx[0].split(";")[-1] == "(12, 31, 24)": annualData = True
     else: annualData = False
-    if len(_comfResultsMtx[1:]) == 1: simStepPossible = False
+    if len(comfResultsMtx) == 2: simStepPossible = False
     else: simStepPossible = True
     
     #Check the HOY to be sure that it is in the counds of the matrix.
     checkData3 = True
     try:
         if not stepOfSimulation_ == None:
-            if stepOfSimulation_ <=0 or stepOfSimulation_ > len(_comfResultsMtx):
+            if stepOfSimulation_ <=0 or stepOfSimulation_ > len(comfResultsMtx):
                 checkData3 = False
                 warning = "stepOfSimulation_ is outside the bounds of the comfResultsMTX."
                 print warning
@@ -178,45 +179,69 @@ def restoreInputOutput():
         ghenv.Component.Params.Input[input].Description = inputsDict[input][1]
 
 
+class ComfResultsMatrix(object):
+    """Read a comfResultsMtx list and a binary matrix from the 'Honeybee_Microclimate Map Analysis' component the same way.
+    
+    The hours of a binary matrix are only read from the disk when they are requested.
+    """
+    
+    def __init__(self, comfResultsMtx):
+        if len(comfResultsMtx) == 1 and hasattr(comfResultsMtx[0], "iterHours"):
+            self.binaryMtx = comfResultsMtx[0]
+            self.matrix = None
+            self.rowCount = self.binaryMtx.hourCount + 1
+            self.pointCount = self.binaryMtx.pointCount
+        else:
+            self.binaryMtx = None
+            self.matrix = comfResultsMtx
+            self.rowCount = len(comfResultsMtx)
+            try: self.pointCount = len(comfResultsMtx[1])
+            except: self.pointCount = 0
+    
+    def __len__(self):
+        return self.rowCount
+    
+    def __getitem__(self, index):
+        if self.binaryMtx == None: return self.matrix[index]
+        if index < 0: index = index + self.rowCount
+        if index == 0: return self.binaryMtx.header
+        return self.binaryMtx.readHour(index - 1)
+    
+    def iterRows(self, rowIndices):
+        if self.binaryMtx == None:
+            for rowIndex in rowIndices: yield self.matrix[rowIndex]
+        else:
+            for row in self.binaryMtx.iterHours([rowIndex - 1 for rowIndex in rowIndices]): yield row
+
+
+def sumRows(rows, pointCount, countOccupied):
+    #Sum up the values of each point and count the occupied hours of each point without holding all of the rows in memory.
+    totals = [0] * pointCount
+    occHours = [0] * pointCount
+    rowCount = 0
+    for row in rows:
+        totals = [total + pointVal for total, pointVal in itertools.izip(totals, row)]
+        if countOccupied == True:
+            occHours = [occ + 1 if isinstance(pointVal, int) else occ for occ, pointVal in itertools.izip(occHours, row)]
+        rowCount += 1
+    
+    return totals, occHours, rowCount
+
+
 def computeComfValues(comfResultsMtx, analysisP, comfMtxAnalysisP, stepOfSimulation, annualData, simStepPossible, occDataType, percentOrTotal, totalAble, lb_preparation):
     #Create a list to be filled with values of comfort.
     comfortFactorVals = []
     
+    #Find the rows of the matrix that should be used and the occupied hours to divide each summed point by.
+    occHoursRow = None
     if stepOfSimulation != None and simStepPossible == True:
-        comfortFactorVals = comfResultsMtx[stepOfSimulation]
+        return comfResultsMtx[stepOfSimulation]
     elif len(analysisP) > 0 and analysisP != comfMtxAnalysisP and annualData == True:
         #Get the HOYs of the analysis period
         HOYS, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisP, 1)
         
         #Pick out just the hours that are in the analysis period.
-        newcomfResultsMtx = []
-        for lineCount, line in enumerate(comfResultsMtx):
-            if lineCount in HOYS: newcomfResultsMtx.append(line)
-        
-        #Transpose the matrix
-        newcomfResultsMtx2 = zip(*newcomfResultsMtx)
-        
-        if percentOrTotal == False and totalAble == True:
-            for lineCount, line in enumerate(newcomfResultsMtx2):
-                comfortFactorVals.append(sum(line))
-        else:
-            #If the dataType is meant to be divided by occupie hours, recompute the occupied hours for the analysis period.
-            occMtxInit = []
-            for val in comfResultsMtx[1]: occMtxInit.append(0)
-            if occDataType == True:
-                for line in newcomfResultsMtx:
-                    for ptCt, pointVal in enumerate(line):
-                        if isinstance(pointVal, int): occMtxInit[ptCt] += 1
-            occMtx = [occMtxInit]
-            
-            #Compute the total percentage of comfortable hours.
-            if occDataType == False:
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/len(line))
-            else:
-                occMtx2 = zip(*occMtx)
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/occMtx2[lineCount][0])
+        rowIndices = sorted([hour for hour in set(HOYS) if hour < len(comfResultsMtx)])
     elif len(analysisP) > 0 and analysisP != comfMtxAnalysisP and annualData == False and simStepPossible == True:
         #Check the data anlysis period and subtract the start day from each of the HOYs.
         HOYS, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisP, 1)
@@ -227,65 +252,38 @@ def computeComfValues(comfResultsMtx, analysisP, comfMtxAnalysisP, stepOfSimulat
         #Check to see if the hours of the requested analysis period are in the comfResultsMtx.
         periodsAlign = True
         for hour in HOYS:
-            if hour < 0: periodsAlign = False
-            try: comfResultsMtx[hour]
-            except: periodsAlign = False
+            if hour < 0 or hour >= len(comfResultsMtx): periodsAlign = False
         
         if periodsAlign == False:
             warning = 'The analysis period of the confResultsMtx and that which is plugged into this component do not align.'
             print warning
             ghenv.Component.AddRuntimeMessage(w, warning)
-        else:
-            
-            #Pick out just the hours that are in the analysis period.
-            newcomfResultsMtx = []
-            for lineCount, line in enumerate(comfResultsMtx):
-                if lineCount in HOYS:
-                    newcomfResultsMtx.append(line)
-            
-            #Transpose the matrix
-            newcomfResultsMtx2 = zip(*newcomfResultsMtx)
-            
-            if percentOrTotal == False and totalAble == True:
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line))
-            else:
-                #If the dataType is meant to be divided by occupie hours, recompute the occupied hours for the analysis period.
-                occMtxInit = []
-                for val in comfResultsMtx[1]: occMtxInit.append(0)
-                if occDataType == True:
-                    for line in newcomfResultsMtx:
-                        for ptCt, pointVal in enumerate(line):
-                            if isinstance(pointVal, int): occMtxInit[ptCt] += 1
-                occMtx = [occMtxInit]
-                
-                #Compute the total percentage of comfortable hours.
-                if occDataType == False:
-                    for lineCount, line in enumerate(newcomfResultsMtx2):
-                        comfortFactorVals.append(sum(line)/len(line))
-                else:
-                    occMtx2 = zip(*occMtx)
-                    for lineCount, line in enumerate(newcomfResultsMtx2):
-                        comfortFactorVals.append(sum(line)/occMtx2[lineCount][0])
-    else:
-        #Transpose the matrix
-        if occDataType == False: newcomfResultsMtx1 = comfResultsMtx[1:]
-        else: newcomfResultsMtx1 = comfResultsMtx[1:-1]
-        newcomfResultsMtx2 = zip(*newcomfResultsMtx1)
+            return comfortFactorVals
         
-        if percentOrTotal == False and totalAble == True:
-            for lineCount, line in enumerate(newcomfResultsMtx2):
-                comfortFactorVals.append(sum(line))
+        #Pick out just the hours that are in the analysis period.
+        rowIndices = sorted(set(HOYS))
+    else:
+        #Use all of the hours.
+        if occDataType == False: rowIndices = range(1, len(comfResultsMtx))
         else:
-            #Compute the average across the hours.
-            if occDataType == False:
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/len(line))
-            else:
-                occMtx = [comfResultsMtx[-1]]
-                occMtx2 = zip(*occMtx)
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/occMtx2[lineCount][0])
+            rowIndices = range(1, len(comfResultsMtx)-1)
+            occHoursRow = comfResultsMtx[-1]
+    
+    #If the dataType is meant to be divided by occupied hours, recompute the occupied hours for the analysis period.
+    countOccupied = occDataType == True and occHoursRow == None and not (percentOrTotal == False and totalAble == True)
+    totals, occHours, rowCount = sumRows(comfResultsMtx.iterRows(rowIndices), comfResultsMtx.pointCount, countOccupied)
+    if occHoursRow == None: occHoursRow = occHours
+    
+    if percentOrTotal == False and totalAble == True:
+        comfortFactorVals = totals
+    elif occDataType == False:
+        #Compute the average across the hours.
+        for total in totals:
+            comfortFactorVals.append(total/rowCount)
+    else:
+        #Compute the total percentage of comfortable hours.
+        for ptCount, total in enumerate(totals):
+            comfortFactorVals.append(total/occHoursRow[ptCount])
     
     
     return comfortFactorVals
@@ -477,6 +475,7 @@ simStepPossible = True
 totalAble = True
 if len(_comfResultsMtx) > 0 and len(_viewFactorMesh) > 0:
     if _comfResultsMtx[0] != None and _viewFactorMesh[0] != None:
+        comfResultsMtx = ComfResultsMatrix(_comfResultsMtx)
         checkData, viewFactorMesh, dataType, annualData, simStepPossible, analysisPeriod, occDataType, totalAble = checkTheInputs()
 
 if annualData == False or simStepPossible == False or totalAble == False:
@@ -495,7 +494,7 @@ if runIt_ == None: runIt = True
 else: runIt = runIt_
 
 if checkData == True and runIt == True:
-    resultValues = computeComfValues(_comfResultsMtx, analysisPeriod_, analysisPeriod, stepOfSimulation_, annualData, simStepPossible, occDataType, percentOrTotal_, totalAble, lb_preparation)
+    resultValues = computeComfValues(comfResultsMtx, analysisPeriod_, analysisPeriod, stepOfSimulation_, annualData, simStepPossible, occDataType, percentOrTotal_, totalAble, lb_preparation)
     if resultValues != []:
         resultValuesInit, resultColorsInit, resultMeshInit, legendInit, legendBasePt = main(resultValues, viewFactorMesh, dataType, lb_preparation, lb_visualization, legendPar_, analysisPeriod, simStepPossible, annualData, percentOrTotal_)
         